@@ -0,0 +1 @@
+"""Common utilities of the benchmarks."""
@@ -0,0 +1,212 @@
+"""
+Synthetic corpora for the benchmarks.
+
+Documents are generated offline from a seeded random generator, so every run
+benchmarks the same texts. Each document mixes filler words of its language
+with PII values, which are valid for the recognizers detecting them
+(e.g. credit card numbers pass the Luhn checksum).
+"""
+
+import random
+import string
+from typing import Callable, Dict, Iterable, List
+
+import pandas as pd
+
+LANGUAGES = ["en", "es", "pl"]
+
+_FILLER_WORDS = {
+    "en": (
+        "the customer called about an order that was delivered to the wrong "
+        "address last week and asked for a refund because the package arrived "
+        "damaged please contact our support team with the following details "
+        "regarding your account and we will process the request shortly"
+    ).split(),
+    "es": (
+        "el cliente llamó por un pedido que fue entregado en la dirección "
+        "equivocada la semana pasada y pidió un reembolso porque el paquete "
+        "llegó dañado por favor contacte a nuestro equipo de soporte con los "
+        "siguientes datos de su cuenta y procesaremos la solicitud pronto"
+    ).split(),
+    "pl": (
+        "klient zadzwonił w sprawie zamówienia które zostało dostarczone pod "
+        "zły adres w zeszłym tygodniu i poprosił o zwrot pieniędzy ponieważ "
+        "paczka dotarła uszkodzona prosimy o kontakt z naszym zespołem wsparcia "
+        "podając następujące dane konta a wniosek zostanie wkrótce rozpatrzony"
+    ).split(),
+}
+
+_FIRST_NAMES = ["john", "maria", "wei", "fatima", "lukas", "ana", "piotr", "sara"]
+_LAST_NAMES = ["smith", "garcia", "chen", "khan", "novak", "silva", "kowalski"]
+_DOMAINS = ["example.com", "example.org", "mail.example.net", "contoso.com"]
+
+
+def _digits(rng: random.Random, count: int) -> str:
+    return "".join(rng.choice(string.digits) for _ in range(count))
+
+
+def _luhn_check_digit(number: str) -> str:
+    total = 0
+    for index, digit in enumerate(reversed(number)):
+        value = int(digit)
+        if index % 2 == 0:
+            value *= 2
+            if value > 9:
+                value -= 9
+        total += value
+    return str((10 - total % 10) % 10)
+
+
+def _email(rng: random.Random) -> str:
+    return (
+        f"{rng.choice(_FIRST_NAMES)}.{rng.choice(_LAST_NAMES)}"
+        f"{rng.randint(1, 99)}@{rng.choice(_DOMAINS)}"
+    )
+
+
+def _phone(rng: random.Random) -> str:
+    area, line = rng.randint(201, 989), rng.randint(0, 9999)
+    formats = ["({}) 555-{:04d}", "{}-555-{:04d}", "+1 {} 555 {:04d}"]
+    return rng.choice(formats).format(area, line)
+
+
+def _credit_card(rng: random.Random) -> str:
+    number = "4" + _digits(rng, 14)
+    return number + _luhn_check_digit(number)
+
+
+def _ip_address(rng: random.Random) -> str:
+    return ".".join(str(rng.randint(1, 254)) for _ in range(4))
+
+
+def _url(rng: random.Random) -> str:
+    return f"https://www.{rng.choice(_LAST_NAMES)}{rng.randint(1, 999)}.com/orders"
+
+
+def _iban(rng: random.Random) -> str:
+    bban = _digits(rng, 18)
+    # Country code DE -> 1314, followed by the placeholder check digits 00
+    check_digits = 98 - int(bban + "131400") % 97
+    return f"DE{check_digits:02d}{bban}"
+
+
+def _date(rng: random.Random) -> str:
+    day, month, year = rng.randint(1, 28), rng.randint(1, 12), rng.randint(1950, 2024)
+    return f"{day:02d}/{month:02d}/{year}"
+
+
+def _us_ssn(rng: random.Random) -> str:
+    return f"{rng.randint(100, 665)}-{rng.randint(10, 99)}-{rng.randint(1000, 9999)}"
+
+
+def _es_nif(rng: random.Random) -> str:
+    number = rng.randint(10000000, 99999999)
+    return f"{number}{'TRWAGMYFPDXBNJZSQVHLCKE'[number % 23]}"
+
+
+def _pl_pesel(rng: random.Random) -> str:
+    number = f"{rng.randint(50, 99)}{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}"
+    number += _digits(rng, 4)
+    weights = [1, 3, 7, 9, 1, 3, 7, 9, 1, 3]
+    total = sum(int(digit) * weight for digit, weight in zip(number, weights))
+    return number + str((10 - total % 10) % 10)
+
+
+_PII_GENERATORS: Dict[str, Callable[[random.Random], str]] = {
+    "EMAIL_ADDRESS": _email,
+    "PHONE_NUMBER": _phone,
+    "CREDIT_CARD": _credit_card,
+    "IP_ADDRESS": _ip_address,
+    "URL": _url,
+    "IBAN_CODE": _iban,
+    "DATE_TIME": _date,
+}
+
+_LANGUAGE_PII_GENERATORS: Dict[str, Dict[str, Callable[[random.Random], str]]] = {
+    "en": {"US_SSN": _us_ssn},
+    "es": {"ES_NIF": _es_nif},
+    "pl": {"PL_PESEL": _pl_pesel},
+}
+
+
+def _get_generators(language: str) -> List[Callable[[random.Random], str]]:
+    generators = {**_PII_GENERATORS, **_LANGUAGE_PII_GENERATORS.get(language, {})}
+    return list(generators.values())
+
+
+def generate_document(
+    size: int, pii_density: float, language: str = "en", seed: int = 42
+) -> str:
+    """
+    Generate a document of filler words and PII values.
+
+    :param size: Approximate length of the document in characters
+    :param pii_density: Fraction of the words which are PII values
+    :param language: Language of the filler words, one of LANGUAGES
+    :param seed: Seed of the random generator
+    """
+    rng = random.Random(f"{seed}-{language}-{size}-{pii_density}")
+    words = _FILLER_WORDS[language]
+    generators = _get_generators(language)
+
+    tokens = []
+    length = 0
+    sentence_length = 0
+    while length < size:
+        if rng.random() < pii_density:
+            token = rng.choice(generators)(rng)
+        else:
+            token = rng.choice(words)
+        sentence_length += 1
+        if sentence_length == 12:
+            token += "."
+            sentence_length = 0
+        tokens.append(token)
+        length += len(token) + 1
+
+    return " ".join(tokens)
+
+
+def generate_corpus(
+    count: int, size: int, pii_density: float, language: str = "en", seed: int = 42
+) -> List[str]:
+    """
+    Generate a list of documents.
+
+    :param count: Number of documents
+    :param size: Approximate length of each document in characters
+    :param pii_density: Fraction of the words which are PII values
+    :param language: Language of the filler words, one of LANGUAGES
+    :param seed: Seed of the random generator
+    """
+    return [
+        generate_document(size, pii_density, language, seed=seed + index)
+        for index in range(count)
+    ]
+
+
+def generate_dataframe(rows: int, seed: int = 42) -> pd.DataFrame:
+    """
+    Generate a table of customer records, with one PII entity per column.
+
+    :param rows: Number of rows
+    :param seed: Seed of the random generator
+    """
+    rng = random.Random(seed)
+    return pd.DataFrame(
+        {
+            "id": list(range(rows)),
+            "email": [_email(rng) for _ in range(rows)],
+            "phone": [_phone(rng) for _ in range(rows)],
+            "credit_card": [_credit_card(rng) for _ in range(rows)],
+            "ip_address": [_ip_address(rng) for _ in range(rows)],
+            "comment": [
+                generate_document(80, 0, "en", seed=seed + row) for row in range(rows)
+            ],
+        }
+    )
+
+
+def count_chars(texts: Iterable[str]) -> int:
+    """Return the total length of the texts, used to report throughput."""
+    return sum(len(text) for text in texts)
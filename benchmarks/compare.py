@@ -0,0 +1,110 @@
+"""
+Compare the throughput of a benchmark run to a baseline run.
+
+Both runs are JSON files written by pytest-benchmark (`--benchmark-json`).
+Throughput is measured in characters per second for benchmarks reporting
+the number of characters they process, and in operations per second otherwise.
+Exits with a non-zero status if a benchmark is slower than the baseline
+by more than the allowed regression.
+
+Usage: python compare.py baseline.json results.json [--max-regression 10]
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, List, Optional, Tuple
+
+
+def load_throughputs(path: str, statistic: str = "median") -> Dict[str, float]:
+    """
+    Load the throughput of each benchmark of a pytest-benchmark JSON file.
+
+    :param path: Path of the JSON file
+    :param statistic: The timing statistic to compute the throughput from
+    :return: Benchmark full name -> throughput
+    """
+    with open(path, encoding="utf-8") as f:
+        results = json.load(f)
+
+    throughputs = {}
+    for benchmark in results["benchmarks"]:
+        seconds = benchmark["stats"][statistic]
+        units = benchmark.get("extra_info", {}).get("chars", 1)
+        throughputs[benchmark["fullname"]] = units / seconds if seconds else 0.0
+    return throughputs
+
+
+def compare(
+    baseline: Dict[str, float], current: Dict[str, float], max_regression: float
+) -> Tuple[List[Tuple[str, Optional[float], Optional[float], Optional[float]]], bool]:
+    """
+    Compare the throughputs of two runs.
+
+    :param baseline: Throughputs of the baseline run
+    :param current: Throughputs of the current run
+    :param max_regression: Maximum allowed throughput decrease, in percent
+    :return: The rows of the comparison (name, baseline, current, change in percent),
+    and whether any benchmark regressed more than allowed
+    """
+    rows = []
+    regressed = False
+    for name in sorted(set(baseline) | set(current)):
+        before, after = baseline.get(name), current.get(name)
+        change = None
+        if before and after is not None:
+            change = (after - before) / before * 100
+            regressed = regressed or change < -max_regression
+        rows.append((name, before, after, change))
+    return rows, regressed
+
+
+def _format(value: Optional[float], suffix: str = "") -> str:
+    return "-" if value is None else f"{value:,.1f}{suffix}"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Compare two benchmark runs and print the throughput changes."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("baseline", help="pytest-benchmark JSON of the baseline")
+    parser.add_argument("current", help="pytest-benchmark JSON to compare")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=10.0,
+        help="Maximum allowed throughput decrease, in percent (default: 10)",
+    )
+    parser.add_argument(
+        "--statistic",
+        default="median",
+        choices=["min", "median", "mean"],
+        help="Timing statistic used to compute the throughput (default: median)",
+    )
+    args = parser.parse_args(argv)
+
+    rows, regressed = compare(
+        load_throughputs(args.baseline, args.statistic),
+        load_throughputs(args.current, args.statistic),
+        args.max_regression,
+    )
+
+    width = max([len(row[0]) for row in rows] + [len("benchmark")])
+    print(f"{'benchmark':<{width}}  {'baseline':>16}  {'current':>16}  {'change':>9}")
+    for name, before, after, change in rows:
+        marker = " !" if change is not None and change < -args.max_regression else ""
+        print(
+            f"{name:<{width}}  {_format(before):>16}  {_format(after):>16}  "
+            f"{_format(change, '%'):>9}{marker}"
+        )
+
+    if regressed:
+        print(
+            f"Throughput regressed by more than {args.max_regression}% "
+            f"for benchmarks marked with !"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""Pytest fixtures of the benchmarks."""
+
+import platform
+from importlib import metadata
+
+import pytest
+from common.corpus import LANGUAGES
+from presidio_analyzer import AnalyzerEngine
+from presidio_analyzer.nlp_engine import NlpEngineProvider, SpacyNlpEngine
+from presidio_anonymizer import AnonymizerEngine
+
+PACKAGES = [
+    "presidio-analyzer",
+    "presidio-anonymizer",
+    "presidio-structured",
+    "spacy",
+    "regex",
+    "pandas",
+]
+
+
+def pytest_addoption(parser):
+    """Add the command line options of the benchmarks."""
+    parser.addoption(
+        "--nlp-conf-file",
+        default=None,
+        help="NLP engine configuration file (see NlpEngineProvider). "
+        "By default, blank spaCy models are used, so the benchmarks measure "
+        "Presidio without the NER models, and run offline.",
+    )
+
+
+def pytest_benchmark_update_machine_info(config, machine_info):
+    """Store the versions of the benchmarked packages with the results."""
+    versions = {}
+    for package in PACKAGES:
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+    machine_info["packages"] = versions
+    machine_info["nlp_conf_file"] = config.getoption("--nlp-conf-file")
+    machine_info["python_implementation"] = platform.python_implementation()
+
+
+@pytest.fixture(scope="session")
+def nlp_engine(request, tmp_path_factory):
+    """NLP engine of the benchmarked analyzers."""
+    conf_file = request.config.getoption("--nlp-conf-file")
+    if conf_file:
+        return NlpEngineProvider(conf_file=conf_file).create_engine()
+
+    import spacy
+
+    models = []
+    for language in LANGUAGES:
+        model_path = tmp_path_factory.mktemp("models") / language
+        spacy.blank(language).to_disk(model_path)
+        models.append({"lang_code": language, "model_name": str(model_path)})
+    return SpacyNlpEngine(models=models)
+
+
+@pytest.fixture(scope="session")
+def analyzer_engine(nlp_engine):
+    """Analyzer supporting all corpus languages, with its recognizers loaded."""
+    analyzer = AnalyzerEngine(nlp_engine=nlp_engine, supported_languages=LANGUAGES)
+    analyzer.warm_up()
+    return analyzer
+
+
+@pytest.fixture(scope="session")
+def anonymizer_engine():
+    """Anonymizer with the default operators."""
+    return AnonymizerEngine()
@@ -0,0 +1,144 @@
+import random
+
+import pytest
+from presidio_analyzer import (
+    AnalyzerEngine,
+    BatchAnalyzerEngine,
+    EntityRecognizer,
+    RecognizerResult,
+)
+
+from common.corpus import LANGUAGES, count_chars, generate_corpus, generate_document
+
+SIZES = [1000, 10000]
+DENSITIES = [0.01, 0.1]
+
+# Recognizers benchmarked individually, on a 10k characters English document
+RECOGNIZER_TEXT = generate_document(10000, 0.05, "en")
+
+
+def _set_throughput(benchmark, texts):
+    benchmark.extra_info["texts"] = len(texts)
+    benchmark.extra_info["chars"] = count_chars(texts)
+
+
+def _recognizer_names():
+    from presidio_analyzer import RecognizerRegistry
+
+    registry = RecognizerRegistry()
+    registry.load_predefined_recognizers(languages=["en"])
+    return sorted(recognizer.name for recognizer in registry.recognizers)
+
+
+@pytest.mark.analyzer
+@pytest.mark.parametrize("recognizer_name", _recognizer_names())
+def test_recognizer(benchmark, analyzer_engine, recognizer_name):
+    recognizer = next(
+        recognizer
+        for recognizer in analyzer_engine.get_recognizers(language="en")
+        if recognizer.name == recognizer_name
+    )
+    nlp_artifacts = analyzer_engine.nlp_engine.process_text(RECOGNIZER_TEXT, "en")
+
+    _set_throughput(benchmark, [RECOGNIZER_TEXT])
+    benchmark(
+        recognizer.analyze,
+        RECOGNIZER_TEXT,
+        recognizer.supported_entities,
+        nlp_artifacts,
+    )
+
+
+@pytest.mark.analyzer
+def test_remove_duplicates(benchmark, analyzer_engine):
+    text = generate_document(10000, 0.5, "en")
+    nlp_artifacts = analyzer_engine.nlp_engine.process_text(text, "en")
+    results = [
+        result
+        for recognizer in analyzer_engine.get_recognizers(language="en")
+        for result in recognizer.analyze(
+            text, recognizer.supported_entities, nlp_artifacts
+        )
+    ]
+
+    benchmark.extra_info["results"] = len(results)
+    benchmark(EntityRecognizer.remove_duplicates, results)
+
+
+def _generate_overlapping_results(size, seed=42):
+    """Results resembling those of a dense document, e.g. a log dump."""
+    rng = random.Random(seed)
+    results = []
+    for i in range(size):
+        start = i * 20 + rng.randint(0, 10)
+        results.append(
+            RecognizerResult(
+                entity_type=rng.choice(["IP_ADDRESS", "DATE_TIME", "PHONE_NUMBER"]),
+                start=start,
+                end=start + rng.randint(5, 30),
+                score=rng.choice([0.3, 0.5, 0.6, 0.85, 0.95]),
+            )
+        )
+    return results
+
+
+@pytest.mark.analyzer
+@pytest.mark.parametrize("size", [1000, 5000])
+def test_remove_duplicates_overlapping(benchmark, size):
+    results = _generate_overlapping_results(size)
+
+    benchmark.extra_info["results"] = len(results)
+    benchmark(EntityRecognizer.remove_duplicates, results)
+
+
+@pytest.mark.analyzer
+@pytest.mark.parametrize("density", DENSITIES)
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("language", LANGUAGES)
+def test_analyze(benchmark, analyzer_engine, language, size, density):
+    text = generate_document(size, density, language)
+
+    _set_throughput(benchmark, [text])
+    benchmark(analyzer_engine.analyze, text, language=language)
+
+
+@pytest.mark.analyzer
+def test_analyze_combined_pattern_matching(benchmark, nlp_engine):
+    analyzer = AnalyzerEngine(
+        nlp_engine=nlp_engine,
+        supported_languages=LANGUAGES,
+        combined_pattern_matching=True,
+    )
+    analyzer.warm_up(languages=["en"])
+    text = generate_document(10000, 0.05, "en")
+
+    _set_throughput(benchmark, [text])
+    benchmark(analyzer.analyze, text, language="en")
+
+
+@pytest.mark.analyzer
+@pytest.mark.batch
+@pytest.mark.parametrize("batch_size", [1, 50])
+def test_batch_analyze_iterator(benchmark, analyzer_engine, batch_size):
+    batch_analyzer = BatchAnalyzerEngine(analyzer_engine=analyzer_engine)
+    texts = generate_corpus(200, 200, 0.1, "en")
+
+    _set_throughput(benchmark, texts)
+    benchmark(
+        batch_analyzer.analyze_iterator, texts, language="en", batch_size=batch_size
+    )
+
+
+@pytest.mark.analyzer
+@pytest.mark.batch
+def test_batch_analyze_dict(benchmark, analyzer_engine):
+    batch_analyzer = BatchAnalyzerEngine(analyzer_engine=analyzer_engine)
+    texts = generate_corpus(200, 200, 0.1, "en")
+    records = {
+        "id": list(range(len(texts))),
+        "comment": texts,
+        "details": {"notes": texts[:50], "owner": texts[0]},
+    }
+
+    _set_throughput(benchmark, texts + texts[:50] + texts[:1])
+    benchmark(lambda: list(batch_analyzer.analyze_dict(records, language="en")))
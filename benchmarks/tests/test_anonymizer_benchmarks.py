@@ -0,0 +1,86 @@
+import random
+
+import pytest
+from presidio_anonymizer import BatchAnonymizerEngine
+from presidio_anonymizer.entities import OperatorConfig, RecognizerResult
+
+from common.corpus import LANGUAGES, count_chars, generate_corpus, generate_document
+
+OPERATORS = {
+    "replace": OperatorConfig("replace"),
+    "mask": OperatorConfig(
+        "mask", {"masking_char": "*", "chars_to_mask": 4, "from_end": True}
+    ),
+    "hash": OperatorConfig("hash", {"hash_type": "sha256"}),
+    "encrypt": OperatorConfig("encrypt", {"key": "WmZq4t7w!z%C&F)J"}),
+}
+
+
+def _set_throughput(benchmark, texts):
+    benchmark.extra_info["texts"] = len(texts)
+    benchmark.extra_info["chars"] = count_chars(texts)
+
+
+@pytest.mark.anonymizer
+@pytest.mark.parametrize("operator", sorted(OPERATORS))
+@pytest.mark.parametrize("density", [0.01, 0.1])
+def test_anonymize(benchmark, analyzer_engine, anonymizer_engine, density, operator):
+    text = generate_document(10000, density, "en")
+    analyzer_results = analyzer_engine.analyze(text, language="en")
+
+    _set_throughput(benchmark, [text])
+    benchmark(
+        anonymizer_engine.anonymize,
+        text,
+        analyzer_results,
+        operators={"DEFAULT": OPERATORS[operator]},
+    )
+
+
+@pytest.mark.anonymizer
+@pytest.mark.parametrize("count", [100, 1000])
+def test_anonymize_overlapping_results(benchmark, anonymizer_engine, count):
+    text = generate_document(count * 10, 0, "en")
+    rng = random.Random(count)
+    analyzer_results = []
+    for _ in range(count):
+        start = rng.randrange(len(text) - 20)
+        analyzer_results.append(
+            RecognizerResult(
+                entity_type=rng.choice(["PERSON", "LOCATION", "PHONE_NUMBER"]),
+                start=start,
+                end=start + rng.randint(1, 20),
+                score=round(rng.random(), 2),
+            )
+        )
+
+    benchmark.extra_info["results"] = count
+    benchmark(anonymizer_engine.anonymize, text, analyzer_results)
+
+
+@pytest.mark.analyzer
+@pytest.mark.anonymizer
+@pytest.mark.parametrize("density", [0.01, 0.1])
+@pytest.mark.parametrize("language", LANGUAGES)
+def test_analyze_and_anonymize(
+    benchmark, analyzer_engine, anonymizer_engine, language, density
+):
+    text = generate_document(10000, density, language)
+
+    def analyze_and_anonymize():
+        analyzer_results = analyzer_engine.analyze(text, language=language)
+        return anonymizer_engine.anonymize(text, analyzer_results)
+
+    _set_throughput(benchmark, [text])
+    benchmark(analyze_and_anonymize)
+
+
+@pytest.mark.anonymizer
+@pytest.mark.batch
+def test_batch_anonymize_list(benchmark, analyzer_engine, anonymizer_engine):
+    batch_anonymizer = BatchAnonymizerEngine(anonymizer_engine=anonymizer_engine)
+    texts = generate_corpus(200, 200, 0.1, "en")
+    analyzer_results = [analyzer_engine.analyze(text, language="en") for text in texts]
+
+    _set_throughput(benchmark, texts)
+    benchmark(batch_anonymizer.anonymize_list, texts, analyzer_results)
@@ -0,0 +1,41 @@
+import pytest
+from presidio_anonymizer.entities import OperatorConfig
+from presidio_structured import PandasAnalysisBuilder, StructuredEngine
+
+from common.corpus import count_chars, generate_dataframe
+
+OPERATORS = {
+    "DEFAULT": OperatorConfig("replace"),
+    "EMAIL_ADDRESS": OperatorConfig("hash", {"hash_type": "sha256"}),
+    "CREDIT_CARD": OperatorConfig(
+        "mask", {"masking_char": "*", "chars_to_mask": 12, "from_end": False}
+    ),
+}
+
+
+def _set_throughput(benchmark, df):
+    benchmark.extra_info["rows"] = len(df)
+    benchmark.extra_info["chars"] = count_chars(df.astype(str).values.ravel())
+
+
+@pytest.mark.structured
+@pytest.mark.parametrize("sample_size", [None, 20])
+def test_generate_analysis(benchmark, analyzer_engine, sample_size):
+    df = generate_dataframe(200)
+    analysis_builder = PandasAnalysisBuilder(analyzer=analyzer_engine)
+
+    _set_throughput(benchmark, df if sample_size is None else df.head(sample_size))
+    benchmark(analysis_builder.generate_analysis, df, n=sample_size, language="en")
+
+
+@pytest.mark.structured
+@pytest.mark.parametrize("rows", [1000, 10000])
+def test_anonymize_dataframe(benchmark, analyzer_engine, rows):
+    df = generate_dataframe(rows)
+    analysis = PandasAnalysisBuilder(analyzer=analyzer_engine).generate_analysis(
+        df, n=100, language="en"
+    )
+    engine = StructuredEngine()
+
+    _set_throughput(benchmark, df)
+    benchmark(engine.anonymize, df, analysis, dict(OPERATORS))
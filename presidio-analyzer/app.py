@@ -1,11 +1,12 @@
 """REST API server for analyzer."""
 
+import hashlib
 import json
 import logging
 import os
 from logging.config import fileConfig
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Tuple
 
 from flask import Flask, Response, jsonify, request
 from presidio_analyzer import AnalyzerEngine, AnalyzerEngineProvider, AnalyzerRequest
@@ -27,6 +28,16 @@ WELCOME_MESSAGE = r"""
 """
 
 
+def get_config_fingerprint(*conf_files: Optional[str]) -> str:
+    """Hash the paths and contents of the configuration files of the engine."""
+    hasher = hashlib.sha256()
+    for conf_file in conf_files:
+        hasher.update(repr(conf_file).encode())
+        if conf_file:
+            hasher.update(Path(conf_file).read_bytes())
+    return hasher.hexdigest()
+
+
 class Server:
     """HTTP Server for calling Presidio Analyzer."""
 
@@ -39,13 +50,38 @@ class Server:
         analyzer_conf_file = os.environ.get("ANALYZER_CONF_FILE")
         nlp_engine_conf_file = os.environ.get("NLP_CONF_FILE")
         recognizer_registry_conf_file = os.environ.get("RECOGNIZER_REGISTRY_CONF_FILE")
+        snapshot_file = os.environ.get("ANALYZER_SNAPSHOT_FILE")
 
         self.logger.info("Starting analyzer engine")
-        self.engine: AnalyzerEngine = AnalyzerEngineProvider(
-            analyzer_engine_conf_file=analyzer_conf_file,
-            nlp_engine_conf_file=nlp_engine_conf_file,
-            recognizer_registry_conf_file=recognizer_registry_conf_file,
-        ).create_engine()
+        snapshot_fingerprint = get_config_fingerprint(
+            analyzer_conf_file, nlp_engine_conf_file, recognizer_registry_conf_file
+        )
+        self.engine: Optional[AnalyzerEngine] = None
+        if snapshot_file and Path(snapshot_file).exists():
+            self.logger.info(f"Loading analyzer engine snapshot {snapshot_file}")
+            try:
+                self.engine = AnalyzerEngine.load_snapshot(
+                    snapshot_file, fingerprint=snapshot_fingerprint
+                )
+            except Exception as e:
+                self.logger.warning(
+                    f"Failed to load analyzer snapshot, rebuilding the engine: {e}"
+                )
+        if self.engine is None:
+            self.engine = AnalyzerEngineProvider(
+                analyzer_engine_conf_file=analyzer_conf_file,
+                nlp_engine_conf_file=nlp_engine_conf_file,
+                recognizer_registry_conf_file=recognizer_registry_conf_file,
+            ).create_engine()
+            self.engine.warm_up()
+            if snapshot_file:
+                self.logger.info(f"Saving analyzer engine snapshot {snapshot_file}")
+                try:
+                    self.engine.save_snapshot(
+                        snapshot_file, fingerprint=snapshot_fingerprint
+                    )
+                except Exception as e:
+                    self.logger.warning(f"Failed to save analyzer snapshot: {e}")
         self.logger.info(WELCOME_MESSAGE)
 
         @self.app.route("/health")
@@ -1,24 +1,53 @@
-# isort: skip_file
-"""Presidio analyzer package."""
+"""
+Presidio analyzer package.
 
+Classes are imported on first access (PEP 562), so importing the package
+doesn't import the NLP packages, which are only needed by the NLP engines.
+"""
+
+import importlib
 import logging
+from typing import Any, List
+
+# Class name -> module defining it
+_MODULES = {
+    "AnalysisExplanation": "presidio_analyzer.analysis_explanation",
+    "RecognizerResult": "presidio_analyzer.recognizer_result",
+    "DictAnalyzerResult": "presidio_analyzer.dict_analyzer_result",
+    "EntityRecognizer": "presidio_analyzer.entity_recognizer",
+    "LocalRecognizer": "presidio_analyzer.local_recognizer",
+    "Pattern": "presidio_analyzer.pattern",
+    "PatternRecognizer": "presidio_analyzer.pattern_recognizer",
+    "CombinedPatternMatcher": "presidio_analyzer.combined_pattern_matcher",
+    "RemoteRecognizer": "presidio_analyzer.remote_recognizer",
+    "RecognizerRegistry": "presidio_analyzer.recognizer_registry",
+    "AnalyzerResultCache": "presidio_analyzer.analyzer_result_cache",
+    "MetricsRecorder": "presidio_analyzer.metrics_recorder",
+    "InMemoryMetricsRecorder": "presidio_analyzer.metrics_recorder",
+    "PrometheusMetricsRecorder": "presidio_analyzer.metrics_recorder",
+    "OpenTelemetryMetricsRecorder": "presidio_analyzer.metrics_recorder",
+    "AnalyzerEngine": "presidio_analyzer.analyzer_engine",
+    "AnalyzerEngineProvider": "presidio_analyzer.analyzer_engine_provider",
+    "BatchAnalyzerEngine": "presidio_analyzer.batch_analyzer_engine",
+    "AnalyzerRequest": "presidio_analyzer.analyzer_request",
+    "PresidioAnalyzerUtils": "presidio_analyzer.analyzer_utils",
+    "ContextAwareEnhancer": "presidio_analyzer.context_aware_enhancers",
+    "LemmaContextAwareEnhancer": "presidio_analyzer.context_aware_enhancers",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_MODULES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
 
-from presidio_analyzer.analysis_explanation import AnalysisExplanation
-from presidio_analyzer.recognizer_result import RecognizerResult
-from presidio_analyzer.dict_analyzer_result import DictAnalyzerResult
-from presidio_analyzer.entity_recognizer import EntityRecognizer
-from presidio_analyzer.local_recognizer import LocalRecognizer
-from presidio_analyzer.pattern import Pattern
-from presidio_analyzer.pattern_recognizer import PatternRecognizer
-from presidio_analyzer.remote_recognizer import RemoteRecognizer
-from presidio_analyzer.recognizer_registry import RecognizerRegistry
-from presidio_analyzer.analyzer_engine import AnalyzerEngine
-from presidio_analyzer.batch_analyzer_engine import BatchAnalyzerEngine
-from presidio_analyzer.analyzer_request import AnalyzerRequest
-from presidio_analyzer.analyzer_utils import PresidioAnalyzerUtils
-from presidio_analyzer.context_aware_enhancers import ContextAwareEnhancer
-from presidio_analyzer.context_aware_enhancers import LemmaContextAwareEnhancer
-from presidio_analyzer.analyzer_engine_provider import AnalyzerEngineProvider
 
 # Define default loggers behavior
 
@@ -44,9 +73,15 @@ __all__ = [
     "EntityRecognizer",
     "LocalRecognizer",
     "PatternRecognizer",
+    "CombinedPatternMatcher",
     "RemoteRecognizer",
     "RecognizerRegistry",
     "AnalyzerEngine",
+    "AnalyzerResultCache",
+    "MetricsRecorder",
+    "InMemoryMetricsRecorder",
+    "PrometheusMetricsRecorder",
+    "OpenTelemetryMetricsRecorder",
     "AnalyzerRequest",
     "ContextAwareEnhancer",
     "LemmaContextAwareEnhancer",
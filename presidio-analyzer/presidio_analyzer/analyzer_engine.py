@@ -1,28 +1,152 @@
+import asyncio
+import copy
+import hashlib
 import json
 import logging
-from collections import Counter
-from typing import List, Optional
+import pickle
+import threading
+import time
+import weakref
+from collections import Counter, defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import partial
+from importlib import metadata
+from pathlib import Path
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import regex as re
 
 from presidio_analyzer import (
+    AnalyzerResultCache,
+    CombinedPatternMatcher,
     EntityRecognizer,
+    PatternRecognizer,
     RecognizerResult,
+    RemoteRecognizer,
 )
 from presidio_analyzer.app_tracer import AppTracer
 from presidio_analyzer.context_aware_enhancers import (
     ContextAwareEnhancer,
     LemmaContextAwareEnhancer,
 )
+from presidio_analyzer.metrics_recorder import (
+    CONTEXT_ENHANCEMENT_DURATION,
+    NLP_DURATION,
+    NO_OP_METRICS_RECORDER,
+    RECOGNIZER_DURATION,
+    RECOGNIZER_RESULTS,
+    REQUEST_DURATION,
+    MetricsRecorder,
+    use_metrics_recorder,
+)
 from presidio_analyzer.nlp_engine import NlpArtifacts, NlpEngine, NlpEngineProvider
 from presidio_analyzer.recognizer_registry import (
     RecognizerRegistry,
     RecognizerRegistryProvider,
 )
+from presidio_analyzer.regex_time_budget import RegexTimeBudget, use_regex_time_budget
 
 logger = logging.getLogger("presidio-analyzer")
 
 
+class _RecognizerDeadlines:
+    """
+    Deadlines of the recognizers of a request, for `recognizer_timeout`.
+
+    Each recognizer gets `timeout` seconds from when it starts running.
+    Recognizers which haven't started are dropped once no recognizer
+    of the request started or finished for `timeout` seconds,
+    e.g. when all the workers are held by recognizers which overran.
+
+    :param timeout: Time in seconds given to each recognizer
+    """
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self._start_times = {}
+        self._last_progress = time.monotonic()
+        self._lock = threading.Lock()
+
+    def start(self, key: str) -> None:
+        """Record that a recognizer started running."""
+        with self._lock:
+            self._start_times[key] = self._last_progress = time.monotonic()
+
+    def finish(self) -> None:
+        """Record that a recognizer finished running."""
+        with self._lock:
+            self._last_progress = time.monotonic()
+
+    def track(self, key: str, function: Callable) -> Callable:
+        """Wrap a function, recording when it starts and finishes."""
+
+        def run(*args, **kwargs):
+            self.start(key)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.finish()
+
+        return run
+
+    def get_expired(self, keys: Iterable[str]) -> Tuple[List[str], Optional[float]]:
+        """
+        Return the recognizers past their deadline.
+
+        :param keys: The recognizers still running or waiting to run
+        :return: The expired recognizers, and the time in seconds until
+        the next deadline of the others (None if all expired)
+        """
+        now = time.monotonic()
+        expired = []
+        remaining = []
+        with self._lock:
+            for key in keys:
+                start_time = self._start_times.get(key, self._last_progress)
+                if start_time + self.timeout <= now:
+                    expired.append(key)
+                else:
+                    remaining.append(start_time + self.timeout - now)
+
+        return expired, min(remaining) if remaining else None
+
+
+@dataclass
+class _AnalysisRequest:
+    """State of an `analyze` request, shared by `analyze` and `analyze_async`."""
+
+    text: str
+    language: str
+    correlation_id: Optional[str]
+    score_threshold: Optional[float]
+    return_decision_process: Optional[bool]
+    context: Optional[List[str]]
+    allow_list: Optional[List[str]]
+    allow_list_match: Optional[str]
+    regex_flags: Optional[int]
+    start_time: Optional[float] = None
+    cache_key: Optional[Tuple] = None
+    recognizers: Optional[List[EntityRecognizer]] = None
+    entities: Optional[List[str]] = None
+    nlp_artifacts: Optional[NlpArtifacts] = None
+    recognizers_results: Optional[
+        List[Tuple[EntityRecognizer, List[RecognizerResult]]]
+    ] = None
+    # The results of the request, once processed or read from the cache
+    results: Optional[List[RecognizerResult]] = None
+
+
 class AnalyzerEngine:
     """
     Entry point for Presidio Analyzer.
@@ -43,8 +167,46 @@ class AnalyzerEngine:
     :param context_aware_enhancer: instance of type ContextAwareEnhancer for enhancing
     confidence score based on context words, (LemmaContextAwareEnhancer will be created
     by default if None passed)
+    :param combined_pattern_matching: bool, whether the patterns of all pattern
+    recognizers should be matched in a single pass over the text,
+    instead of running each pattern separately.
+    See `CombinedPatternMatcher` for more details.
+    :param max_workers: Number of threads used to run recognizers concurrently
+    within a single `analyze` call. If None, recognizers run sequentially.
+    Call `close`, or use the engine as a context manager, to release the threads.
+    :param recognizer_timeout: Maximum time in seconds given to each recognizer
+    when running concurrently (`max_workers` is set), measured from when it starts.
+    Results of recognizers which did not finish in time are dropped.
+    Python threads can't be stopped, so recognizers which overran keep running
+    and holding a worker until they finish. Recognizers waiting for a worker
+    are dropped if none becomes available for `recognizer_timeout` seconds.
+    Also applies to `analyze_async`.
+    :param max_remote_requests: Maximum number of concurrent requests to
+    remote recognizers (`RemoteRecognizer`) made by `analyze_async`,
+    across all calls running on the same event loop. If None, unlimited.
+    :param result_cache: instance of type AnalyzerResultCache, used to return
+    the results of texts which were already analyzed with the same parameters
+    without running the NLP pipeline and recognizers again.
+    Requests with ad-hoc recognizers or precomputed nlp_artifacts are not cached,
+    nor are any requests when `log_decision_process` is set.
+    :param metrics: instance of type MetricsRecorder, receiving the timings
+    of the NLP engine, recognizers, patterns and context enhancement,
+    and the number of matches and validations of each pattern.
+    If None, no metrics are recorded.
+    :param regex_timeout: Maximum time in seconds for matching each regex pattern,
+    for pattern recognizers which don't define their own `regex_timeout`.
+    Patterns exceeding it are skipped, and reported in the logs, the metrics
+    and the decision process. If None, unlimited.
+    :param regex_request_timeout: Maximum time in seconds for matching the regex
+    patterns of a request. Patterns still running or not started when it's
+    exhausted are skipped and reported as timed out. If None, unlimited.
     """
 
+    # Text processed by the NLP engine in `warm_up`
+    WARM_UP_TEXT = "My name is John Smith, I live in London. Call me at 212-555-5555"
+
+    SNAPSHOT_FORMAT_VERSION = 2
+
     def __init__(
         self,
         registry: RecognizerRegistry = None,
@@ -54,6 +216,14 @@ class AnalyzerEngine:
         default_score_threshold: float = 0,
         supported_languages: List[str] = None,
         context_aware_enhancer: Optional[ContextAwareEnhancer] = None,
+        combined_pattern_matching: bool = False,
+        max_workers: Optional[int] = None,
+        recognizer_timeout: Optional[float] = None,
+        max_remote_requests: Optional[int] = None,
+        result_cache: Optional[AnalyzerResultCache] = None,
+        metrics: Optional[MetricsRecorder] = None,
+        regex_timeout: Optional[float] = None,
+        regex_request_timeout: Optional[float] = None,
     ):
         if not supported_languages:
             supported_languages = ["en"]
@@ -109,6 +279,61 @@ class AnalyzerEngine:
             context_aware_enhancer = LemmaContextAwareEnhancer()
 
         self.context_aware_enhancer = context_aware_enhancer
+        self.combined_pattern_matching = combined_pattern_matching
+
+        self.max_workers = max_workers
+        self.recognizer_timeout = recognizer_timeout
+        self._executor = None
+        if max_workers:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="presidio-analyzer"
+            )
+
+        self.max_remote_requests = max_remote_requests
+        # asyncio semaphores are bound to an event loop, so one is kept per loop
+        self._remote_semaphores = weakref.WeakKeyDictionary()
+
+        self.result_cache = result_cache
+
+        self.metrics = metrics if metrics is not None else NO_OP_METRICS_RECORDER
+
+        self.regex_timeout = regex_timeout
+        self.regex_request_timeout = regex_request_timeout
+
+    def close(self) -> None:
+        """
+        Shut down the thread pool running the recognizers (see `max_workers`).
+
+        Recognizers still running past their timeout are not waited for.
+        The engine can still be used afterwards, running recognizers sequentially.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def __enter__(self) -> "AnalyzerEngine":
+        """Return the engine, closed when exiting the context (see `close`)."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the engine (see `close`)."""
+        self.close()
+
+    def __getstate__(self) -> dict:
+        """Return the state of the engine, without its thread pool and semaphores."""
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        state["_remote_semaphores"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore the engine, creating a new thread pool (see `max_workers`)."""
+        self.__dict__.update(state)
+        if self.max_workers:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="presidio-analyzer"
+            )
+        self._remote_semaphores = weakref.WeakKeyDictionary()
 
     def get_recognizers(self, language: Optional[str] = None) -> List[EntityRecognizer]:
         """
@@ -138,12 +363,178 @@ class AnalyzerEngine:
         :param language: Return only entities supported in a specific language.
         :return: List of entity names
         """
-        recognizers = self.get_recognizers(language=language)
-        supported_entities = []
-        for recognizer in recognizers:
-            supported_entities.extend(recognizer.get_supported_entities())
+        languages = [language] if language else self.supported_languages
+        return self.registry.get_supported_entities(languages=languages)
+
+    def warm_up(
+        self,
+        languages: Optional[List[str]] = None,
+        regex_flags: Optional[int] = re.DOTALL | re.MULTILINE | re.IGNORECASE,
+    ) -> None:
+        """
+        Prepare the engine so that the first requests are not slower than others.
+
+        Loads all recognizers, compiles the regexes of all pattern recognizers
+        (and the combined pattern matchers, if enabled),
+        builds the registry's lookup structures and runs the NLP pipeline once.
+
+        :param languages: The languages to prepare, or None for all supported languages
+        :param regex_flags: The regex flags requests will use (see `analyze`)
+        """
+        for language in languages or self.supported_languages:
+            recognizers = self.registry.get_recognizers(
+                language=language, all_fields=True
+            )
+            self._load_recognizers(recognizers)
+
+            combined = []
+            if self.combined_pattern_matching:
+                combined = [
+                    recognizer
+                    for recognizer in recognizers
+                    if CombinedPatternMatcher.is_combinable(recognizer)
+                ]
+                self.registry.get_combined_pattern_matcher(recognizers)
+
+            for recognizer in recognizers:
+                if not isinstance(recognizer, PatternRecognizer):
+                    continue
+                flags = (
+                    recognizer.global_regex_flags
+                    if recognizer in combined
+                    else regex_flags or recognizer.global_regex_flags
+                )
+                for pattern in recognizer.patterns:
+                    PatternRecognizer._get_compiled_regex(pattern, flags)
+
+            self.registry.get_supported_entities(languages=[language])
+            self.nlp_engine.process_text(self.WARM_UP_TEXT, language)
+
+        logger.info("Analyzer engine warmed up")
+
+    def save_snapshot(
+        self,
+        path: Union[str, Path],
+        include_nlp_models: bool = False,
+        fingerprint: Optional[str] = None,
+    ) -> None:
+        """
+        Save the engine to a file, to be restored using `load_snapshot`.
+
+        The snapshot holds the recognizer registry, the NLP engine
+        and the engine's configuration,
+        so that restoring it skips reading and resolving configuration files.
+        Compiled regexes aren't stored: patterns are compiled again
+        when used after restoring, or by `load_snapshot` when warming up.
+        The snapshot is a pickle file, only load snapshots from trusted sources.
+        Recognizers holding unpicklable state (e.g. remote service clients)
+        can't be saved.
+
+        :param path: The snapshot file path
+        :param include_nlp_models: Whether to store the NLP models in the snapshot.
+        If False, the models are loaded by the NLP engine when restored.
+        :param fingerprint: Identifies the configuration the engine was built from
+        (e.g. a hash of the configuration files), checked by `load_snapshot`.
+        The installed presidio-analyzer version is always stored and checked.
+        """
+        nlp_engine = self.nlp_engine
+        if not include_nlp_models and getattr(nlp_engine, "nlp", None) is not None:
+            nlp_engine = copy.copy(nlp_engine)
+            nlp_engine.nlp = None
+
+        result_cache = None
+        if self.result_cache:
+            result_cache = {
+                "max_size": self.result_cache.max_size,
+                "ttl": self.result_cache.ttl,
+            }
+
+        snapshot = {
+            "format_version": self.SNAPSHOT_FORMAT_VERSION,
+            "presidio_version": self._get_presidio_version(),
+            "fingerprint": fingerprint,
+            "registry": self.registry,
+            "nlp_engine": nlp_engine,
+            "result_cache": result_cache,
+            "engine_kwargs": {
+                "app_tracer": self.app_tracer,
+                "log_decision_process": self.log_decision_process,
+                "default_score_threshold": self.default_score_threshold,
+                "supported_languages": self.supported_languages,
+                "context_aware_enhancer": self.context_aware_enhancer,
+                "combined_pattern_matching": self.combined_pattern_matching,
+                "max_workers": self.max_workers,
+                "recognizer_timeout": self.recognizer_timeout,
+                "max_remote_requests": self.max_remote_requests,
+                "regex_timeout": self.regex_timeout,
+                "regex_request_timeout": self.regex_request_timeout,
+            },
+        }
+        with open(path, "wb") as snapshot_file:
+            pickle.dump(snapshot, snapshot_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load_snapshot(
+        cls,
+        path: Union[str, Path],
+        warm_up: bool = True,
+        metrics: Optional[MetricsRecorder] = None,
+        fingerprint: Optional[str] = None,
+    ) -> "AnalyzerEngine":
+        """
+        Create an engine from a snapshot saved using `save_snapshot`.
+
+        The snapshot is a pickle file, only load snapshots from trusted sources.
+        Raises ValueError if the snapshot is stale: saved by another
+        presidio-analyzer version, or with another fingerprint.
+
+        :param path: The snapshot file path
+        :param warm_up: Whether to call `warm_up` on the restored engine
+        :param metrics: The metrics recorder of the restored engine,
+        metrics recorders are not stored in snapshots
+        :param fingerprint: The fingerprint the snapshot must have been saved with
+        (see `save_snapshot`). If None, the fingerprint isn't checked.
+        """
+        with open(path, "rb") as snapshot_file:
+            snapshot = pickle.load(snapshot_file)
+
+        if snapshot.get("format_version") != cls.SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported snapshot format version {snapshot.get('format_version')}"
+                f", expected {cls.SNAPSHOT_FORMAT_VERSION}"
+            )
+        if snapshot["presidio_version"] != cls._get_presidio_version():
+            raise ValueError(
+                f"Snapshot saved by presidio-analyzer {snapshot['presidio_version']}"
+                f", installed version is {cls._get_presidio_version()}"
+            )
+        if fingerprint is not None and snapshot["fingerprint"] != fingerprint:
+            raise ValueError(
+                "Snapshot fingerprint doesn't match, "
+                "the engine configuration changed since it was saved"
+            )
 
-        return list(set(supported_entities))
+        result_cache = None
+        if snapshot["result_cache"]:
+            result_cache = AnalyzerResultCache(**snapshot["result_cache"])
+
+        engine = cls(
+            registry=snapshot["registry"],
+            nlp_engine=snapshot["nlp_engine"],
+            result_cache=result_cache,
+            metrics=metrics,
+            **snapshot["engine_kwargs"],
+        )
+        if warm_up:
+            engine.warm_up()
+        return engine
+
+    @staticmethod
+    def _get_presidio_version() -> Optional[str]:
+        try:
+            return metadata.version("presidio-analyzer")
+        except metadata.PackageNotFoundError:
+            return None
 
     def analyze(
         self,
@@ -199,6 +590,439 @@ class AnalyzerEngine:
         [type: PHONE_NUMBER, start: 19, end: 31, score: 0.85]
         """  # noqa: E501
 
+        request = self._start_analysis(
+            text=text,
+            language=language,
+            entities=entities,
+            correlation_id=correlation_id,
+            score_threshold=score_threshold,
+            return_decision_process=return_decision_process,
+            ad_hoc_recognizers=ad_hoc_recognizers,
+            context=context,
+            allow_list=allow_list,
+            allow_list_match=allow_list_match,
+            regex_flags=regex_flags,
+            nlp_artifacts=nlp_artifacts,
+        )
+        if request.results is None:
+            request.recognizers_results = self._run_recognizers(
+                text=text,
+                entities=request.entities,
+                nlp_artifacts=request.nlp_artifacts,
+                recognizers=request.recognizers,
+                correlation_id=correlation_id,
+            )
+
+        return self._finish_analysis(request)
+
+    async def analyze_async(
+        self,
+        text: str,
+        language: str,
+        entities: Optional[List[str]] = None,
+        correlation_id: Optional[str] = None,
+        score_threshold: Optional[float] = None,
+        return_decision_process: Optional[bool] = False,
+        ad_hoc_recognizers: Optional[List[EntityRecognizer]] = None,
+        context: Optional[List[str]] = None,
+        allow_list: Optional[List[str]] = None,
+        allow_list_match: Optional[str] = "exact",
+        regex_flags: Optional[int] = re.DOTALL | re.MULTILINE | re.IGNORECASE,
+        nlp_artifacts: Optional[NlpArtifacts] = None,
+    ) -> List[RecognizerResult]:
+        """
+        Find PII entities in text without blocking the event loop.
+
+        Same as `analyze`, for use in asyncio applications.
+        CPU-bound work (NLP pipeline, local recognizers, post-processing)
+        runs on the engine's thread pool (see `max_workers`),
+        or on the event loop's default executor if the engine has no pool.
+        Remote recognizers are awaited using `RemoteRecognizer.analyze_async`,
+        limited to `max_remote_requests` concurrent requests.
+
+        :param text: the text to analyze
+        :param language: the language of the text
+        :param entities: List of PII entities that should be looked for in the text.
+        If entities=None then all entities are looked for.
+        :param correlation_id: cross call ID for this request
+        :param score_threshold: A minimum value for which
+        to return an identified entity
+        :param return_decision_process: Whether the analysis decision process steps
+        returned in the response.
+        :param ad_hoc_recognizers: List of recognizers which will be used only
+        for this specific request.
+        :param context: List of context words to enhance confidence score if matched
+        with the recognized entity's recognizer context
+        :param allow_list: List of words that the user defines as being allowed to keep
+        in the text
+        :param allow_list_match: How the allow_list should be interpreted;
+        either as "exact" or as "regex".
+        :param regex_flags: regex flags to be used for when allow_list_match is "regex"
+        :param nlp_artifacts: precomputed NlpArtifacts
+        :return: an array of the found entities in the text
+
+        :example:
+
+        >>> import asyncio
+        >>> from presidio_analyzer import AnalyzerEngine
+
+        >>> analyzer = AnalyzerEngine()
+        >>> results = asyncio.run(analyzer.analyze_async(text='My phone number is 212-555-5555', entities=['PHONE_NUMBER'], language='en')) # noqa D501
+        >>> print(results)
+        [type: PHONE_NUMBER, start: 19, end: 31, score: 0.85]
+        """  # noqa: E501
+
+        loop = asyncio.get_running_loop()
+        request = await loop.run_in_executor(
+            self._executor,
+            partial(
+                self._start_analysis,
+                text=text,
+                language=language,
+                entities=entities,
+                correlation_id=correlation_id,
+                score_threshold=score_threshold,
+                return_decision_process=return_decision_process,
+                ad_hoc_recognizers=ad_hoc_recognizers,
+                context=context,
+                allow_list=allow_list,
+                allow_list_match=allow_list_match,
+                regex_flags=regex_flags,
+                nlp_artifacts=nlp_artifacts,
+            ),
+        )
+        if request.results is None:
+            request.recognizers_results = await self._run_recognizers_async(
+                text=text,
+                entities=request.entities,
+                nlp_artifacts=request.nlp_artifacts,
+                recognizers=request.recognizers,
+                correlation_id=correlation_id,
+            )
+
+        return await loop.run_in_executor(
+            self._executor, self._finish_analysis, request
+        )
+
+    def _start_analysis(
+        self,
+        text: str,
+        language: str,
+        entities: Optional[List[str]],
+        correlation_id: Optional[str],
+        score_threshold: Optional[float],
+        return_decision_process: Optional[bool],
+        ad_hoc_recognizers: Optional[List[EntityRecognizer]],
+        context: Optional[List[str]],
+        allow_list: Optional[List[str]],
+        allow_list_match: Optional[str],
+        regex_flags: Optional[int],
+        nlp_artifacts: Optional[NlpArtifacts],
+    ) -> "_AnalysisRequest":
+        """
+        Prepare an `analyze` request, up to running the recognizers.
+
+        Returns the cached results of the request if there are any.
+        Otherwise, selects the recognizers and runs the NLP pipeline.
+        Takes the same parameters as `analyze`.
+        """
+        request = _AnalysisRequest(
+            text=text,
+            language=language,
+            correlation_id=correlation_id,
+            score_threshold=score_threshold,
+            return_decision_process=return_decision_process,
+            context=context,
+            allow_list=allow_list,
+            allow_list_match=allow_list_match,
+            regex_flags=regex_flags,
+        )
+        if self.metrics.enabled:
+            request.start_time = time.perf_counter()
+
+        if not nlp_artifacts:
+            request.cache_key = self._get_cache_key(
+                text=text,
+                language=language,
+                entities=entities,
+                score_threshold=score_threshold,
+                return_decision_process=return_decision_process,
+                ad_hoc_recognizers=ad_hoc_recognizers,
+                context=context,
+                allow_list=allow_list,
+                allow_list_match=allow_list_match,
+                regex_flags=regex_flags,
+            )
+            if request.cache_key is not None:
+                request.results = self.result_cache.get(request.cache_key)
+                if request.results is not None:
+                    return request
+
+        request.recognizers, request.entities = self._get_recognizers_and_entities(
+            language=language, entities=entities, ad_hoc_recognizers=ad_hoc_recognizers
+        )
+
+        # run the nlp pipeline over the given text, store the results in
+        # a NlpArtifacts instance. Only the artifacts needed by the
+        # recognizers and context enhancer are computed.
+        if not nlp_artifacts:
+            nlp_artifacts = self._process_text(
+                text, language, self._get_required_nlp_artifacts(request.recognizers)
+            )
+        request.nlp_artifacts = nlp_artifacts
+
+        if self.log_decision_process:
+            self.app_tracer.trace(
+                correlation_id, "nlp artifacts:" + nlp_artifacts.to_json()
+            )
+
+        return request
+
+    def _finish_analysis(self, request: "_AnalysisRequest") -> List[RecognizerResult]:
+        """
+        Complete an `analyze` request, once its recognizers ran.
+
+        Processes the results of the recognizers and caches them,
+        unless the request's results were cached.
+        """
+        if request.results is None:
+            request.results = self._process_results(
+                text=request.text,
+                recognizers_results=request.recognizers_results,
+                nlp_artifacts=request.nlp_artifacts,
+                recognizers=request.recognizers,
+                correlation_id=request.correlation_id,
+                score_threshold=request.score_threshold,
+                return_decision_process=request.return_decision_process,
+                context=request.context,
+                allow_list=request.allow_list,
+                allow_list_match=request.allow_list_match,
+                regex_flags=request.regex_flags,
+            )
+            if request.cache_key is not None:
+                self.result_cache.set(request.cache_key, request.results)
+
+        if request.start_time is not None:
+            self._record_request_duration(request.language, request.start_time)
+
+        return request.results
+
+    async def _run_recognizers_async(
+        self,
+        text: str,
+        entities: List[str],
+        nlp_artifacts: NlpArtifacts,
+        recognizers: List[EntityRecognizer],
+        correlation_id: Optional[str] = None,
+    ) -> List[Tuple[EntityRecognizer, List[RecognizerResult]]]:
+        """
+        Run the recognizers over the text without blocking the event loop.
+
+        Same as `_run_recognizers`, awaiting remote recognizers
+        and running the others on the thread pool.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._load_recognizers, recognizers)
+
+        regex_time_budget = self._create_regex_time_budget()
+        combined_results = await loop.run_in_executor(
+            self._executor,
+            self._run_combined_pattern_matcher,
+            text,
+            recognizers,
+            regex_time_budget,
+        )
+
+        to_run = [rec for rec in recognizers if rec.id not in combined_results]
+        deadlines = None
+        if self.recognizer_timeout is not None:
+            deadlines = _RecognizerDeadlines(self.recognizer_timeout)
+        tasks = {}
+        for rec in to_run:
+            if isinstance(rec, RemoteRecognizer):
+                coroutine = self._analyze_remote_async(
+                    rec,
+                    text=text,
+                    entities=entities,
+                    nlp_artifacts=nlp_artifacts,
+                    deadlines=deadlines,
+                )
+            else:
+                analyze_recognizer = self._analyze_recognizer
+                if deadlines is not None:
+                    analyze_recognizer = deadlines.track(rec.id, analyze_recognizer)
+                coroutine = loop.run_in_executor(
+                    self._executor,
+                    partial(
+                        analyze_recognizer,
+                        rec,
+                        text=text,
+                        entities=entities,
+                        nlp_artifacts=nlp_artifacts,
+                        regex_time_budget=regex_time_budget,
+                    ),
+                )
+            tasks[rec.id] = asyncio.ensure_future(coroutine)
+
+        timed_out = set()
+        if tasks:
+            try:
+                if deadlines is None:
+                    await asyncio.wait(tasks.values())
+                else:
+                    timed_out = await self._wait_for_tasks(tasks, deadlines)
+            except asyncio.CancelledError:
+                for task in tasks.values():
+                    task.cancel()
+                raise
+
+        recognizers_results = {}
+        for rec in to_run:
+            if rec.id in timed_out:
+                self._log_recognizer_timeout(rec, correlation_id)
+                continue
+            recognizers_results[rec.id] = tasks[rec.id].result()
+
+        self._report_regex_timeouts(regex_time_budget, correlation_id)
+
+        recognizers_results.update(combined_results)
+        return [
+            (rec, recognizers_results[rec.id])
+            for rec in recognizers
+            if rec.id in recognizers_results
+        ]
+
+    async def _analyze_remote_async(
+        self,
+        recognizer: RemoteRecognizer,
+        text: str,
+        entities: List[str],
+        nlp_artifacts: NlpArtifacts,
+        deadlines: Optional[_RecognizerDeadlines] = None,
+    ) -> List[RecognizerResult]:
+        """Await a remote recognizer, limited by `max_remote_requests`."""
+        if not self.max_remote_requests:
+            return await self._analyze_remote_tracked_async(
+                recognizer,
+                text=text,
+                entities=entities,
+                nlp_artifacts=nlp_artifacts,
+                deadlines=deadlines,
+            )
+
+        loop = asyncio.get_running_loop()
+        semaphore = self._remote_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_remote_requests)
+            self._remote_semaphores[loop] = semaphore
+
+        async with semaphore:
+            return await self._analyze_remote_tracked_async(
+                recognizer,
+                text=text,
+                entities=entities,
+                nlp_artifacts=nlp_artifacts,
+                deadlines=deadlines,
+            )
+
+    async def _analyze_remote_tracked_async(
+        self,
+        recognizer: RemoteRecognizer,
+        text: str,
+        entities: List[str],
+        nlp_artifacts: NlpArtifacts,
+        deadlines: Optional[_RecognizerDeadlines],
+    ) -> List[RecognizerResult]:
+        """Await a remote recognizer, recording when it starts and finishes."""
+        if deadlines is not None:
+            deadlines.start(recognizer.id)
+        try:
+            return await self._analyze_remote_recognizer_async(
+                recognizer, text=text, entities=entities, nlp_artifacts=nlp_artifacts
+            )
+        finally:
+            if deadlines is not None:
+                deadlines.finish()
+
+    async def _analyze_remote_recognizer_async(
+        self,
+        recognizer: RemoteRecognizer,
+        text: str,
+        entities: List[str],
+        nlp_artifacts: NlpArtifacts,
+    ) -> List[RecognizerResult]:
+        """Await a remote recognizer, recording its duration."""
+        if not self.metrics.enabled:
+            return await recognizer.analyze_async(
+                text=text, entities=entities, nlp_artifacts=nlp_artifacts
+            )
+
+        start_time = time.perf_counter()
+        with use_metrics_recorder(self.metrics):
+            results = await recognizer.analyze_async(
+                text=text, entities=entities, nlp_artifacts=nlp_artifacts
+            )
+        self.metrics.record_duration(
+            RECOGNIZER_DURATION,
+            time.perf_counter() - start_time,
+            {"recognizer": recognizer.name},
+        )
+        return results
+
+    def _get_cache_key(
+        self,
+        text: str,
+        language: str,
+        entities: Optional[List[str]] = None,
+        correlation_id: Optional[str] = None,
+        score_threshold: Optional[float] = None,
+        return_decision_process: Optional[bool] = False,
+        ad_hoc_recognizers: Optional[List[EntityRecognizer]] = None,
+        context: Optional[List[str]] = None,
+        allow_list: Optional[List[str]] = None,
+        allow_list_match: Optional[str] = "exact",
+        regex_flags: Optional[int] = re.DOTALL | re.MULTILINE | re.IGNORECASE,
+    ) -> Optional[Tuple]:
+        """
+        Return the result cache key of an `analyze` request.
+
+        Takes the same parameters as `analyze`, except nlp_artifacts.
+        Requests aren't cached when the decision process is logged,
+        so every request is traced.
+        :return: The key, or None if there is no cache or the request can't be cached.
+        """
+        if self.result_cache is None or ad_hoc_recognizers or self.log_decision_process:
+            return None
+
+        text_hash = hashlib.blake2b(
+            text.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+        return (
+            text_hash,
+            language,
+            tuple(sorted(entities)) if entities else None,
+            score_threshold,
+            bool(return_decision_process),
+            tuple(context) if context else None,
+            tuple(allow_list) if allow_list else None,
+            allow_list_match,
+            regex_flags,
+            self.registry.recognizers_key,
+        )
+
+    def _get_recognizers_and_entities(
+        self,
+        language: str,
+        entities: Optional[List[str]],
+        ad_hoc_recognizers: Optional[List[EntityRecognizer]],
+    ) -> Tuple[List[EntityRecognizer], List[str]]:
+        """
+        Return the recognizers to run for a request, and the requested entities.
+
+        :param language: the language of the text
+        :param entities: The requested entities, or None for all entities
+        :param ad_hoc_recognizers: Recognizers used only for this request
+        """
         all_fields = not entities
 
         recognizers = self.registry.get_recognizers(
@@ -213,36 +1037,78 @@ class AnalyzerEngine:
             # over all recognizers
             entities = self.get_supported_entities(language=language)
 
-        # run the nlp pipeline over the given text, store the results in
-        # a NlpArtifacts instance
-        if not nlp_artifacts:
-            nlp_artifacts = self.nlp_engine.process_text(text, language)
+        return recognizers, entities
 
-        if self.log_decision_process:
-            self.app_tracer.trace(
-                correlation_id, "nlp artifacts:" + nlp_artifacts.to_json()
-            )
+    def _get_required_nlp_artifacts(
+        self, recognizers: List[EntityRecognizer]
+    ) -> Optional[Set[str]]:
+        """
+        Return the NLP artifacts needed by the recognizers and context enhancer.
 
-        results = []
+        :param recognizers: The recognizers of the request
+        :return: A set of artifacts, or None if all artifacts are needed
+        """
+        required_artifacts = set()
         for recognizer in recognizers:
-            # Lazy loading of the relevant recognizers
-            if not recognizer.is_loaded:
-                recognizer.load()
-                recognizer.is_loaded = True
+            if recognizer.required_nlp_artifacts is None:
+                return None
+            required_artifacts.update(recognizer.required_nlp_artifacts)
 
-            # analyze using the current recognizer and append the results
-            current_results = recognizer.analyze(
-                text=text, entities=entities, nlp_artifacts=nlp_artifacts
-            )
+        enhancer_artifacts = self.context_aware_enhancer.get_required_nlp_artifacts(
+            recognizers
+        )
+        if enhancer_artifacts is None:
+            return None
+        required_artifacts.update(enhancer_artifacts)
+
+        return required_artifacts
+
+    def _process_results(
+        self,
+        text: str,
+        recognizers_results: List[Tuple[EntityRecognizer, List[RecognizerResult]]],
+        nlp_artifacts: NlpArtifacts,
+        recognizers: List[EntityRecognizer],
+        correlation_id: Optional[str],
+        score_threshold: Optional[float],
+        return_decision_process: Optional[bool],
+        context: Optional[List[str]],
+        allow_list: Optional[List[str]],
+        allow_list_match: Optional[str],
+        regex_flags: Optional[int],
+    ) -> List[RecognizerResult]:
+        """
+        Merge the recognizers' results, enhance them using context and filter them.
+
+        See `analyze` for the description of the parameters.
+        """
+        results = []
+        for recognizer, current_results in recognizers_results:
+            if self.metrics.enabled:
+                self.metrics.increment(
+                    RECOGNIZER_RESULTS,
+                    len(current_results) if current_results else 0,
+                    {"recognizer": recognizer.name},
+                )
             if current_results:
                 # add recognizer name to recognition metadata inside results
                 # if not exists
                 self.__add_recognizer_id_if_not_exists(current_results, recognizer)
                 results.extend(current_results)
 
-        results = self._enhance_using_context(
-            text, results, nlp_artifacts, recognizers, context
-        )
+        if self.metrics.enabled:
+            start_time = time.perf_counter()
+            with use_metrics_recorder(self.metrics):
+                results = self._enhance_using_context(
+                    text, results, nlp_artifacts, recognizers, context
+                )
+            self.metrics.record_duration(
+                CONTEXT_ENHANCEMENT_DURATION, time.perf_counter() - start_time
+            )
+        else:
+            results = self._enhance_using_context(
+                text, results, nlp_artifacts, recognizers, context
+            )
 
         if self.log_decision_process:
             self.app_tracer.trace(
@@ -264,6 +1130,326 @@ class AnalyzerEngine:
 
         return results
 
+    def _run_recognizers(
+        self,
+        text: str,
+        entities: List[str],
+        nlp_artifacts: NlpArtifacts,
+        recognizers: List[EntityRecognizer],
+        correlation_id: Optional[str] = None,
+    ) -> List[Tuple[EntityRecognizer, List[RecognizerResult]]]:
+        """
+        Run the recognizers over the text, sequentially or using the thread pool.
+
+        :param text: The text to analyze
+        :param entities: The requested entities
+        :param nlp_artifacts: The nlp artifacts of the text
+        :param recognizers: The recognizers to run
+        :param correlation_id: cross call ID for this request
+        :return: A list of (recognizer, results) in the order of the recognizers.
+        Recognizers which timed out are omitted.
+        """
+        self._load_recognizers(recognizers)
+        regex_time_budget = self._create_regex_time_budget()
+        combined_results = self._run_combined_pattern_matcher(
+            text, recognizers, regex_time_budget
+        )
+
+        to_run = [rec for rec in recognizers if rec.id not in combined_results]
+
+        if not self._executor or len(to_run) < 2:
+            recognizers_results = {
+                rec.id: self._analyze_recognizer(
+                    rec,
+                    text=text,
+                    entities=entities,
+                    nlp_artifacts=nlp_artifacts,
+                    regex_time_budget=regex_time_budget,
+                )
+                for rec in to_run
+            }
+        else:
+            analyze_recognizer = self._analyze_recognizer
+            deadlines = None
+            if self.recognizer_timeout is not None:
+                deadlines = _RecognizerDeadlines(self.recognizer_timeout)
+            futures = {
+                rec.id: self._executor.submit(
+                    analyze_recognizer
+                    if deadlines is None
+                    else deadlines.track(rec.id, analyze_recognizer),
+                    rec,
+                    text=text,
+                    entities=entities,
+                    nlp_artifacts=nlp_artifacts,
+                    regex_time_budget=regex_time_budget,
+                )
+                for rec in to_run
+            }
+            if self.recognizer_timeout is None:
+                wait(futures.values())
+                timed_out = set()
+            else:
+                timed_out = self._wait_for_futures(futures, deadlines)
+
+            recognizers_results = {}
+            for rec in to_run:
+                if rec.id in timed_out:
+                    self._log_recognizer_timeout(rec, correlation_id)
+                    continue
+                recognizers_results[rec.id] = futures[rec.id].result()
+
+        self._report_regex_timeouts(regex_time_budget, correlation_id)
+
+        recognizers_results.update(combined_results)
+        return [
+            (rec, recognizers_results[rec.id])
+            for rec in recognizers
+            if rec.id in recognizers_results
+        ]
+
+    @staticmethod
+    def _wait_for_futures(
+        futures: Dict[str, Future], deadlines: _RecognizerDeadlines
+    ) -> Set[str]:
+        """
+        Wait for the recognizers running on the thread pool, up to their deadlines.
+
+        :param futures: Recognizer id -> future running the recognizer
+        :param deadlines: The deadlines of the recognizers
+        :return: The ids of the recognizers which timed out
+        """
+        timed_out = set()
+        pending = dict(futures)
+        while True:
+            pending = {
+                key: future for key, future in pending.items() if not future.done()
+            }
+            expired, wait_time = deadlines.get_expired(pending)
+            for key in expired:
+                # Only stops recognizers which haven't started
+                pending.pop(key).cancel()
+                timed_out.add(key)
+            if not pending:
+                return timed_out
+            wait(pending.values(), timeout=wait_time, return_when=FIRST_COMPLETED)
+
+    @staticmethod
+    async def _wait_for_tasks(
+        tasks: Dict[str, asyncio.Future], deadlines: _RecognizerDeadlines
+    ) -> Set[str]:
+        """
+        Await the recognizer tasks, up to their deadlines.
+
+        :param tasks: Recognizer id -> task running the recognizer
+        :param deadlines: The deadlines of the recognizers
+        :return: The ids of the recognizers which timed out
+        """
+        timed_out = set()
+        pending = dict(tasks)
+        while True:
+            pending = {key: task for key, task in pending.items() if not task.done()}
+            expired, wait_time = deadlines.get_expired(pending)
+            for key in expired:
+                # Threads running a recognizer keep running until it returns
+                pending.pop(key).cancel()
+                timed_out.add(key)
+            if not pending:
+                return timed_out
+            await asyncio.wait(
+                pending.values(), timeout=wait_time, return_when=FIRST_COMPLETED
+            )
+
+    @staticmethod
+    def _load_recognizers(recognizers: List[EntityRecognizer]) -> None:
+        """Lazy loading of the relevant recognizers."""
+        for recognizer in recognizers:
+            if not recognizer.is_loaded:
+                recognizer.load()
+                recognizer.is_loaded = True
+
+    def _run_combined_pattern_matcher(
+        self,
+        text: str,
+        recognizers: List[EntityRecognizer],
+        regex_time_budget: Optional[RegexTimeBudget] = None,
+    ) -> Dict[str, List[RecognizerResult]]:
+        """
+        Run the combinable pattern recognizers in a single pass, if enabled.
+
+        :param text: The text to analyze
+        :param recognizers: The recognizers of the request
+        :param regex_time_budget: The regex time budget of the request
+
+        :return: A dictionary of recognizer id to its results,
+        for the recognizers which were matched
+        """
+        if not self.combined_pattern_matching:
+            return {}
+
+        pattern_matcher = self.registry.get_combined_pattern_matcher(recognizers)
+        if not pattern_matcher:
+            return {}
+        with use_metrics_recorder(self.metrics), use_regex_time_budget(
+            regex_time_budget
+        ):
+            return pattern_matcher.analyze(text)
+
+    def _process_text(
+        self, text: str, language: str, required_artifacts: Optional[Set[str]]
+    ) -> NlpArtifacts:
+        """Run the NLP engine over the text, recording its duration."""
+        if not self.metrics.enabled:
+            return self.nlp_engine.process_text_partial(
+                text, language, required_artifacts
+            )
+
+        start_time = time.perf_counter()
+        with use_metrics_recorder(self.metrics):
+            nlp_artifacts = self.nlp_engine.process_text_partial(
+                text, language, required_artifacts
+            )
+        self.metrics.record_duration(
+            NLP_DURATION,
+            time.perf_counter() - start_time,
+            {"language": language, "nlp_engine": type(self.nlp_engine).__name__},
+        )
+        return nlp_artifacts
+
+    def _process_batch(
+        self,
+        texts: Iterable[str],
+        language: str,
+        required_artifacts: Optional[Set[str]],
+        batch_size: Optional[int] = None,
+    ) -> Iterator[Tuple[str, NlpArtifacts]]:
+        """Run the NLP engine over a batch of texts, recording its durations."""
+        nlp_artifacts_batch = self.nlp_engine.process_batch_partial(
+            texts=texts,
+            language=language,
+            required_artifacts=required_artifacts,
+            batch_size=batch_size,
+        )
+        if not self.metrics.enabled:
+            return nlp_artifacts_batch
+        return self._record_nlp_durations(nlp_artifacts_batch, language)
+
+    def _record_nlp_durations(
+        self, nlp_artifacts_batch: Iterator[Tuple[str, NlpArtifacts]], language: str
+    ) -> Iterator[Tuple[str, NlpArtifacts]]:
+        """Record the time taken to produce each item of a batch."""
+        labels = {"language": language, "nlp_engine": type(self.nlp_engine).__name__}
+        nlp_artifacts_batch = iter(nlp_artifacts_batch)
+        while True:
+            start_time = time.perf_counter()
+            try:
+                item = next(nlp_artifacts_batch)
+            except StopIteration:
+                return
+            self.metrics.record_duration(
+                NLP_DURATION, time.perf_counter() - start_time, labels
+            )
+            yield item
+
+    def _analyze_recognizer(
+        self,
+        recognizer: EntityRecognizer,
+        text: str,
+        entities: List[str],
+        nlp_artifacts: NlpArtifacts,
+        regex_time_budget: Optional[RegexTimeBudget] = None,
+    ) -> List[RecognizerResult]:
+        """
+        Run a recognizer over the text, recording its duration.
+
+        The engine's metrics recorder and the request's regex time budget
+        are made available to the recognizer (see `get_metrics_recorder`
+        and `get_regex_time_budget`), in the thread running it.
+        """
+        if not self.metrics.enabled:
+            if regex_time_budget is None:
+                return recognizer.analyze(
+                    text=text, entities=entities, nlp_artifacts=nlp_artifacts
+                )
+            with use_regex_time_budget(regex_time_budget):
+                return recognizer.analyze(
+                    text=text, entities=entities, nlp_artifacts=nlp_artifacts
+                )
+
+        start_time = time.perf_counter()
+        with use_metrics_recorder(self.metrics), use_regex_time_budget(
+            regex_time_budget
+        ):
+            results = recognizer.analyze(
+                text=text, entities=entities, nlp_artifacts=nlp_artifacts
+            )
+        self.metrics.record_duration(
+            RECOGNIZER_DURATION,
+            time.perf_counter() - start_time,
+            {"recognizer": recognizer.name},
+        )
+        return results
+
+    def _create_regex_time_budget(self) -> Optional[RegexTimeBudget]:
+        """
+        Create the regex time budget of a request.
+
+        :return: The budget, or None if regex matching is unlimited
+        and timeouts don't need to be reported in the decision process
+        """
+        if (
+            self.regex_timeout is None
+            and self.regex_request_timeout is None
+            and not self.log_decision_process
+        ):
+            return None
+
+        return RegexTimeBudget(
+            pattern_timeout=self.regex_timeout,
+            request_timeout=self.regex_request_timeout,
+        )
+
+    def _report_regex_timeouts(
+        self,
+        regex_time_budget: Optional[RegexTimeBudget],
+        correlation_id: Optional[str],
+    ) -> None:
+        """Add the patterns which timed out and their input to the decision process."""
+        if regex_time_budget is None or not self.log_decision_process:
+            return
+
+        for timeout in regex_time_budget.timeouts:
+            self.app_tracer.trace(
+                correlation_id,
+                "regex timeout: "
+                + json.dumps(
+                    {
+                        "recognizer": timeout.recognizer,
+                        "pattern": timeout.pattern,
+                        "timeout": timeout.timeout,
+                        "text": timeout.text,
+                    }
+                ),
+            )
+
+    def _record_request_duration(self, language: str, start_time: float) -> None:
+        self.metrics.record_duration(
+            REQUEST_DURATION, time.perf_counter() - start_time, {"language": language}
+        )
+
+    def _log_recognizer_timeout(
+        self, recognizer: EntityRecognizer, correlation_id: Optional[str]
+    ) -> None:
+        logger.warning(
+            "Recognizer %s did not finish within %s seconds, dropping its results",
+            recognizer.name,
+            self.recognizer_timeout,
+        )
+        if self.log_decision_process:
+            self.app_tracer.trace(
+                correlation_id, f"recognizer timed out: {recognizer.name}"
+            )
+
     def _enhance_using_context(
         self,
         text: str,
@@ -286,13 +1472,24 @@ class AnalyzerEngine:
         """
         results = []
 
-        for recognizer in recognizers:
-            recognizer_results = [
-                r
-                for r in raw_results
-                if r.recognition_metadata[RecognizerResult.RECOGNIZER_IDENTIFIER_KEY]
-                == recognizer.id
+        results_by_recognizer = defaultdict(list)
+        for r in raw_results:
+            recognizer_id = r.recognition_metadata[
+                RecognizerResult.RECOGNIZER_IDENTIFIER_KEY
             ]
+            results_by_recognizer[recognizer_id].append(r)
+
+        for recognizer in recognizers:
+            recognizer_results = list(results_by_recognizer.get(recognizer.id, []))
+
+            # Skip recognizers which don't implement context enhancement
+            if (
+                type(recognizer).enhance_using_context
+                is EntityRecognizer.enhance_using_context
+            ):
+                results.extend(recognizer_results)
+                continue
+
             other_recognizer_results = [
                 r
                 for r in raw_results
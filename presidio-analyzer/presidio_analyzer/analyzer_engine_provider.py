@@ -4,7 +4,7 @@ from typing import Any, Dict, List, Optional, Union
 
 import yaml
 
-from presidio_analyzer import AnalyzerEngine, RecognizerRegistry
+from presidio_analyzer import AnalyzerEngine, AnalyzerResultCache, RecognizerRegistry
 from presidio_analyzer.nlp_engine import NlpEngine, NlpEngineProvider
 from presidio_analyzer.recognizer_registry import RecognizerRegistryProvider
 
@@ -75,6 +75,22 @@ class AnalyzerEngineProvider:
         nlp_engine = self._load_nlp_engine()
         supported_languages = self.configuration.get("supported_languages", ["en"])
         default_score_threshold = self.configuration.get("default_score_threshold", 0)
+        combined_pattern_matching = self.configuration.get(
+            "combined_pattern_matching", False
+        )
+        max_workers = self.configuration.get("max_workers")
+        recognizer_timeout = self.configuration.get("recognizer_timeout")
+        max_remote_requests = self.configuration.get("max_remote_requests")
+        regex_timeout = self.configuration.get("regex_timeout")
+        regex_request_timeout = self.configuration.get("regex_request_timeout")
+
+        result_cache = None
+        result_cache_size = self.configuration.get("result_cache_size")
+        if result_cache_size:
+            result_cache = AnalyzerResultCache(
+                max_size=result_cache_size,
+                ttl=self.configuration.get("result_cache_ttl"),
+            )
 
         registry = self._load_recognizer_registry(
             supported_languages=supported_languages, nlp_engine=nlp_engine
@@ -85,6 +101,13 @@ class AnalyzerEngineProvider:
             registry=registry,
             supported_languages=supported_languages,
             default_score_threshold=default_score_threshold,
+            combined_pattern_matching=combined_pattern_matching,
+            max_workers=max_workers,
+            recognizer_timeout=recognizer_timeout,
+            max_remote_requests=max_remote_requests,
+            result_cache=result_cache,
+            regex_timeout=regex_timeout,
+            regex_request_timeout=regex_request_timeout,
         )
 
         return analyzer
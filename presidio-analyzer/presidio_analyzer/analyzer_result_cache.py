@@ -0,0 +1,91 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional
+
+from presidio_analyzer import RecognizerResult
+
+
+class AnalyzerResultCache:
+    """
+    Bounded LRU cache of analysis results, with an optional time to live.
+
+    Used by `AnalyzerEngine` to skip the NLP pipeline and the recognizers
+    for texts which were already analyzed with the same parameters.
+    Results are deep copied when stored and when returned,
+    so callers can modify them freely. The cache is thread safe.
+
+    :param max_size: Maximum number of entries. When full,
+    the least recently used entry is evicted.
+    :param ttl: Time in seconds after which an entry expires.
+    If None, entries never expire.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: Optional[float] = None):
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive integer")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+        # key -> (expiry time, results)
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[List[RecognizerResult]]:
+        """
+        Return a copy of the results cached for the key, or None on a miss.
+
+        :param key: The cache key
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is not None:
+                if entry[0] < time.monotonic():
+                    del self._entries[key]
+                    entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            results = entry[1]
+
+        return copy.deepcopy(results)
+
+    def set(self, key: Hashable, results: List[RecognizerResult]) -> None:
+        """
+        Store a copy of the results for the key.
+
+        :param key: The cache key
+        :param results: The results to cache
+        """
+        expiry = time.monotonic() + self.ttl if self.ttl is not None else None
+        results = copy.deepcopy(results)
+
+        with self._lock:
+            self._entries[key] = (expiry, results)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return the number of hits, misses and entries of the cache."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+            }
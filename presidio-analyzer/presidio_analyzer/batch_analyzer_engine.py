@@ -1,11 +1,23 @@
+import asyncio
 import logging
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
-from presidio_analyzer import AnalyzerEngine, DictAnalyzerResult, RecognizerResult
+from presidio_analyzer import (
+    AnalyzerEngine,
+    AnalyzerEngineProvider,
+    DictAnalyzerResult,
+    RecognizerResult,
+)
 from presidio_analyzer.nlp_engine import NlpArtifacts
 
 logger = logging.getLogger("presidio-analyzer")
 
+# Engines created by worker processes, per provider configuration
+_worker_engines: Dict[str, "BatchAnalyzerEngine"] = {}
+
 
 class BatchAnalyzerEngine:
     """
@@ -16,18 +28,37 @@ class BatchAnalyzerEngine:
 
     :param: analyzer_engine: AnalyzerEngine instance to use
     for handling the values in those collections.
+    :param analyzer_engine_provider: AnalyzerEngineProvider used to create
+    the analyzer engine, and the engines of worker processes when
+    analyzing with `n_process` > 1 or with an `executor`.
     """
 
-    def __init__(self, analyzer_engine: Optional[AnalyzerEngine] = None):
+    # Number of texts sent to a worker process at once, if batch_size isn't set
+    DEFAULT_CHUNK_SIZE = 100
+
+    # Number of texts analyzed at once by analyze_iterator_async
+    DEFAULT_MAX_CONCURRENCY = 100
+
+    def __init__(
+        self,
+        analyzer_engine: Optional[AnalyzerEngine] = None,
+        analyzer_engine_provider: Optional[AnalyzerEngineProvider] = None,
+    ):
         self.analyzer_engine = analyzer_engine
+        self.analyzer_engine_provider = analyzer_engine_provider
         if not analyzer_engine:
-            self.analyzer_engine = AnalyzerEngine()
+            if analyzer_engine_provider:
+                self.analyzer_engine = analyzer_engine_provider.create_engine()
+            else:
+                self.analyzer_engine = AnalyzerEngine()
 
     def analyze_iterator(
         self,
         texts: Iterable[Union[str, bool, float, int]],
         language: str,
         batch_size: Optional[int] = None,
+        n_process: int = 1,
+        executor: Optional[Executor] = None,
         **kwargs,
     ) -> List[List[RecognizerResult]]:
         """
@@ -36,29 +67,281 @@ class BatchAnalyzerEngine:
         :param texts: An list containing strings to be analyzed.
         :param language: Input language
         :param batch_size: Batch size to process in a single iteration
+        (default value depends on the nlp engine implementation)
+        :param n_process: Number of worker processes to shard the texts across.
+        Each worker creates its own AnalyzerEngine using `analyzer_engine_provider`.
+        :param executor: An existing executor (e.g. ProcessPoolExecutor)
+        to shard the texts across, instead of creating one with `n_process` workers.
+        When passing an executor, set `n_process` to its number of workers,
+        as it bounds the number of chunks in flight.
         :param kwargs: Additional parameters for the `AnalyzerEngine.analyze` method.
+        """
+
+        return list(
+            self.analyze_stream(
+                texts=texts,
+                language=language,
+                batch_size=batch_size,
+                n_process=n_process,
+                executor=executor,
+                **kwargs,
+            )
+        )
+
+    def analyze_stream(
+        self,
+        texts: Iterable[Union[str, bool, float, int]],
+        language: str,
+        batch_size: Optional[int] = None,
+        n_process: int = 1,
+        executor: Optional[Executor] = None,
+        **kwargs,
+    ) -> Iterator[List[RecognizerResult]]:
+        """
+        Lazily analyze an iterable of strings, yielding the results of each text.
+
+        Texts are read from the iterable only as needed: at most one NLP batch
+        (or a bounded number of chunks when using worker processes) is held
+        in memory, so arbitrarily large iterators (e.g. file lines,
+        database cursors) can be analyzed in constant memory.
+
+        :param texts: An iterable of strings to be analyzed.
+        :param language: Input language
+        :param batch_size: Batch size to process in a single iteration
         (default value depends on the nlp engine implementation)
+        :param n_process: Number of worker processes to shard the texts across.
+        See `analyze_iterator`.
+        :param executor: An existing executor to shard the texts across.
+        See `analyze_iterator`.
+        :param kwargs: Additional parameters for the `AnalyzerEngine.analyze` method.
+        :return: An iterator of the results of each text, in input order.
         """
 
         # validate types
         texts = self._validate_types(texts)
 
+        if n_process > 1 or executor:
+            yield from self._analyze_in_workers(
+                texts=texts,
+                language=language,
+                batch_size=batch_size,
+                n_process=n_process,
+                executor=executor,
+                **kwargs,
+            )
+            return
+
+        if self.analyzer_engine.result_cache is not None:
+            yield from self._analyze_stream_cached(
+                texts=texts, language=language, batch_size=batch_size, **kwargs
+            )
+            return
+
         # Process the texts as batch for improved performance
         nlp_artifacts_batch: Iterator[Tuple[str, NlpArtifacts]] = (
-            self.analyzer_engine.nlp_engine.process_batch(
-                texts=texts, language=language, batch_size=batch_size
+            self.analyzer_engine._process_batch(
+                texts=texts,
+                language=language,
+                required_artifacts=self._get_required_nlp_artifacts(language, kwargs),
+                batch_size=batch_size,
             )
         )
 
-        list_results = []
         for text, nlp_artifacts in nlp_artifacts_batch:
-            results = self.analyzer_engine.analyze(
+            yield self.analyzer_engine.analyze(
                 text=str(text), nlp_artifacts=nlp_artifacts, language=language, **kwargs
             )
 
-            list_results.append(results)
+    def _analyze_stream_cached(
+        self,
+        texts: Iterable[Union[str, bool, float, int]],
+        language: str,
+        batch_size: Optional[int],
+        **kwargs,
+    ) -> Iterator[List[RecognizerResult]]:
+        """
+        Analyze the texts using the analyzer engine's result cache.
+
+        Texts with cached results skip the NLP batch entirely.
+        Texts are read in chunks of `batch_size` (or `DEFAULT_CHUNK_SIZE`),
+        so the look-ahead is bounded even when all the texts are cached.
+        Results are yielded in input order.
+        """
+        analyzer_engine = self.analyzer_engine
+        result_cache = analyzer_engine.result_cache
+        required_artifacts = self._get_required_nlp_artifacts(language, kwargs)
+
+        chunk_size = batch_size if batch_size else self.DEFAULT_CHUNK_SIZE
+        texts = iter(texts)
+        while True:
+            chunk = list(islice(texts, chunk_size))
+            if not chunk:
+                return
+
+            cache_keys = [
+                analyzer_engine._get_cache_key(
+                    text=str(text), language=language, **kwargs
+                )
+                for text in chunk
+            ]
+            cached_results = [
+                result_cache.get(cache_key) if cache_key is not None else None
+                for cache_key in cache_keys
+            ]
+
+            # Lazy, so the cached results before the first uncached text
+            # are yielded before the NLP batch runs
+            nlp_artifacts_batch: Iterator[Tuple[str, NlpArtifacts]] = iter(
+                analyzer_engine._process_batch(
+                    texts=[
+                        text
+                        for text, results in zip(chunk, cached_results)
+                        if results is None
+                    ],
+                    language=language,
+                    required_artifacts=required_artifacts,
+                    batch_size=batch_size,
+                )
+            )
+
+            for cache_key, results in zip(cache_keys, cached_results):
+                if results is not None:
+                    yield results
+                    continue
 
-        return list_results
+                text, nlp_artifacts = next(nlp_artifacts_batch)
+                results = analyzer_engine.analyze(
+                    text=str(text),
+                    nlp_artifacts=nlp_artifacts,
+                    language=language,
+                    **kwargs,
+                )
+                if cache_key is not None:
+                    result_cache.set(cache_key, results)
+                yield results
+
+    def _get_required_nlp_artifacts(
+        self, language: str, analyze_kwargs: Dict[str, Any]
+    ) -> Optional[Set[str]]:
+        """Return the NLP artifacts needed for analyze calls with these kwargs."""
+        recognizers, _ = self.analyzer_engine._get_recognizers_and_entities(
+            language=language,
+            entities=analyze_kwargs.get("entities"),
+            ad_hoc_recognizers=analyze_kwargs.get("ad_hoc_recognizers"),
+        )
+        return self.analyzer_engine._get_required_nlp_artifacts(recognizers)
+
+    def _analyze_in_workers(
+        self,
+        texts: Iterable[Union[str, bool, float, int]],
+        language: str,
+        batch_size: Optional[int],
+        n_process: int,
+        executor: Optional[Executor],
+        **kwargs,
+    ) -> Iterator[List[RecognizerResult]]:
+        """
+        Shard the texts in chunks across worker processes.
+
+        Results are yielded in input order. Only a bounded number of chunks
+        is in flight at any time, so the input is never fully materialized.
+        """
+        if not self.analyzer_engine_provider:
+            raise ValueError(
+                "Analyzing in multiple processes requires an "
+                "analyzer_engine_provider, used to create each worker's engine"
+            )
+
+        own_executor = executor is None
+        if own_executor:
+            executor = ProcessPoolExecutor(
+                max_workers=n_process,
+                initializer=_get_worker_engine,
+                initargs=(self.analyzer_engine_provider,),
+            )
+
+        chunk_size = batch_size if batch_size else self.DEFAULT_CHUNK_SIZE
+        max_in_flight = 2 * max(n_process, 1)
+        texts = iter(texts)
+        pending = deque()
+        try:
+            while True:
+                chunk = list(islice(texts, chunk_size))
+                if not chunk:
+                    break
+                pending.append(
+                    executor.submit(
+                        _analyze_chunk_in_worker,
+                        self.analyzer_engine_provider,
+                        chunk,
+                        language,
+                        batch_size,
+                        kwargs,
+                    )
+                )
+                if len(pending) >= max_in_flight:
+                    yield from pending.popleft().result()
+
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+            if own_executor:
+                executor.shutdown()
+
+    async def analyze_iterator_async(
+        self,
+        texts: Iterable[Union[str, bool, float, int]],
+        language: str,
+        max_concurrency: Optional[int] = DEFAULT_MAX_CONCURRENCY,
+        **kwargs,
+    ) -> List[List[RecognizerResult]]:
+        """
+        Analyze an iterable of strings concurrently, without blocking the event loop.
+
+        Each text is analyzed using `AnalyzerEngine.analyze_async`,
+        so remote recognizers of different texts overlap.
+
+        :param texts: An iterable of strings to be analyzed.
+        :param language: Input language
+        :param max_concurrency: Maximum number of texts analyzed at once.
+        Texts are read from the iterable as the previous ones are analyzed.
+        If None, all texts are read and analyzed at once.
+        :param kwargs: Additional parameters for
+        the `AnalyzerEngine.analyze_async` method.
+        :return: The results of each text, in input order.
+        """
+
+        texts = self._validate_types(texts)
+
+        async def analyze_text(text: Union[str, bool, float, int]):
+            return await self.analyzer_engine.analyze_async(
+                text=str(text), language=language, **kwargs
+            )
+
+        if not max_concurrency:
+            return list(await asyncio.gather(*[analyze_text(text) for text in texts]))
+
+        results: List[Optional[List[RecognizerResult]]] = []
+
+        async def analyze_texts() -> None:
+            # Each worker takes the next text once it analyzed the previous one
+            for text in texts:
+                index = len(results)
+                results.append(None)
+                results[index] = await analyze_text(text)
+
+        workers = [
+            asyncio.ensure_future(analyze_texts()) for _ in range(max_concurrency)
+        ]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+        return results
 
     def analyze_dict(
         self,
@@ -145,3 +428,34 @@ class BatchAnalyzerEngine:
             k.replace(f"{key}.", "") for k in keys_to_skip if k.startswith(key)
         ]
         return new_keys_to_skip
+
+
+def _get_worker_engine(provider: AnalyzerEngineProvider) -> BatchAnalyzerEngine:
+    """Return the engine of the current worker process, creating it if needed."""
+    key = repr(
+        (
+            provider.configuration,
+            provider.nlp_engine_conf_file,
+            provider.recognizer_registry_conf_file,
+        )
+    )
+    if key not in _worker_engines:
+        logger.info("Creating analyzer engine for worker process")
+        _worker_engines[key] = BatchAnalyzerEngine(
+            analyzer_engine=provider.create_engine()
+        )
+    return _worker_engines[key]
+
+
+def _analyze_chunk_in_worker(
+    provider: AnalyzerEngineProvider,
+    texts: List[Union[str, bool, float, int]],
+    language: str,
+    batch_size: Optional[int],
+    kwargs: Dict[str, Any],
+) -> List[List[RecognizerResult]]:
+    """Analyze a chunk of texts using the worker process's engine."""
+    batch_analyzer = _get_worker_engine(provider)
+    return batch_analyzer.analyze_iterator(
+        texts=texts, language=language, batch_size=batch_size, **kwargs
+    )
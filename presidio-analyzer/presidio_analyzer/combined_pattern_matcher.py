@@ -0,0 +1,320 @@
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import regex as re
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+from presidio_analyzer import (
+    EntityRecognizer,
+    Pattern,
+    PatternRecognizer,
+    RecognizerResult,
+)
+
+logger = logging.getLogger("presidio-analyzer")
+
+
+class CombinedPatternMatcher:
+    """
+    Match the patterns of multiple pattern recognizers using one pass over the text.
+
+    All patterns are compiled into a single RE2 automaton (`re2.Set`),
+    which finds in one linear pass which of the patterns have matches in the text.
+    Only those patterns are then matched using the `regex` module,
+    and each match is dispatched to its recognizer for validation,
+    so the results are identical to running each recognizer separately.
+
+    As RE2 does not support the full `regex` syntax, each pattern is translated
+    into a relaxed version which matches everything the original pattern matches
+    (e.g. lookarounds and word boundaries are dropped).
+    Patterns which cannot be translated are always matched.
+
+    Requires the `google-re2` package. If it is not installed,
+    all patterns are matched one by one.
+
+    :param recognizers: The pattern recognizers to match.
+    Use `CombinedPatternMatcher.is_combinable` to filter out recognizers
+    which implement their own `analyze` logic.
+    """
+
+    # Memory budget for the RE2 automaton, large enough for hundreds of patterns
+    MAX_MEMORY = 256 << 20
+
+    # Flags which have an RE2 equivalent
+    SUPPORTED_FLAGS = re.IGNORECASE | re.MULTILINE | re.DOTALL | re.UNICODE
+    INLINE_FLAGS = {"i": re.IGNORECASE, "m": re.MULTILINE, "s": re.DOTALL, "u": 0}
+
+    # Translation of `regex` shorthand classes into RE2 classes
+    # matching at least the same (Unicode) characters
+    WORD_CHARACTERS = r"\pL\pN\pM\p{Pc}\p{So}\p{Cf}"
+    SPACE_CHARACTERS = r"\t-\r\x{1C}-\x{20}\x{85}\x{180E}\p{Z}"
+    SHORTHAND_CLASSES = {
+        "d": r"\p{Nd}",
+        "w": WORD_CHARACTERS,
+        "s": SPACE_CHARACTERS,
+    }
+    ANY_CHARACTER = "(?s:.)"
+
+    _INLINE_FLAGS_REGEX = re.compile(r"(?<!\\)\(\?([a-zA-Z]+)\)")
+    _LOOKAROUND_PREFIXES = ("(?=", "(?!", "(?<=", "(?<!")
+
+    def __init__(self, recognizers: List[PatternRecognizer]):
+        self.recognizers = recognizers
+
+        # Each entry holds a recognizer and one of its patterns
+        self._entries: List[Tuple[PatternRecognizer, Pattern]] = [
+            (recognizer, pattern)
+            for recognizer in recognizers
+            for pattern in recognizer.patterns
+        ]
+
+        self._prefilter = None
+        self._prefilter_entries: List[int] = []
+        self._unfiltered_entries: List[int] = list(range(len(self._entries)))
+
+        if not re2:
+            logger.warning(
+                "google-re2 is not installed, patterns will be matched separately. "
+                "Install google-re2 to match all patterns in a single pass."
+            )
+        elif self._entries:
+            self._compile_prefilter()
+
+    @staticmethod
+    def is_combinable(recognizer: EntityRecognizer) -> bool:
+        """
+        Return True if the recognizer's patterns can be matched by this class.
+
+        Only pattern recognizers which rely on the default `analyze` logic
+        (patterns + validate_result / invalidate_result) are combinable.
+
+        :param recognizer: The recognizer to check
+        """
+        return (
+            isinstance(recognizer, PatternRecognizer)
+            and type(recognizer).analyze is PatternRecognizer.analyze
+            and bool(recognizer.patterns)
+        )
+
+    def analyze(self, text: str) -> Dict[str, List[RecognizerResult]]:
+        """
+        Match all patterns over the text and dispatch matches to their recognizers.
+
+        :param text: The text to analyze
+        :return: A dictionary of recognizer id to the list of results
+        found by this recognizer
+        """
+        candidate_entries = set(self._unfiltered_entries)
+        candidate_entries.update(self._get_prefilter_matches(text))
+
+        results = {recognizer.id: [] for recognizer in self.recognizers}
+        for entry_index in sorted(candidate_entries):
+            recognizer, pattern = self._entries[entry_index]
+            flags = recognizer.global_regex_flags
+            results[recognizer.id].extend(
+                recognizer._analyze_pattern(text, pattern, flags)
+            )
+
+        return {
+            recognizer_id: EntityRecognizer.remove_duplicates(recognizer_results)
+            for recognizer_id, recognizer_results in results.items()
+        }
+
+    def _get_prefilter_matches(self, text: str) -> List[int]:
+        """Return the entries which might have a match in the text."""
+        if not self._prefilter:
+            return []
+
+        try:
+            matches = self._prefilter.Match(text)
+        except UnicodeEncodeError:
+            # e.g. text containing lone surrogates, match all patterns instead
+            return self._prefilter_entries
+
+        if not matches:
+            return []
+        return [self._prefilter_entries[match] for match in matches]
+
+    def _compile_prefilter(self) -> None:
+        options = re2.Options()
+        options.max_mem = self.MAX_MEMORY
+        options.log_errors = False
+        prefilter = re2.Set.SearchSet(options)
+
+        unfiltered_entries = []
+        for entry_index, (recognizer, pattern) in enumerate(self._entries):
+            re2_regex = self._to_re2_regex(pattern.regex, recognizer.global_regex_flags)
+            if re2_regex is None:
+                unfiltered_entries.append(entry_index)
+                continue
+
+            try:
+                prefilter.Add(re2_regex)
+            except re2.error:
+                logger.debug(
+                    "Pattern %s of %s is not supported by RE2, "
+                    "it will be matched separately",
+                    pattern.name,
+                    recognizer.name,
+                )
+                unfiltered_entries.append(entry_index)
+                continue
+
+            self._prefilter_entries.append(entry_index)
+
+        if not self._prefilter_entries:
+            return
+
+        prefilter.Compile()
+        self._prefilter = prefilter
+        self._unfiltered_entries = unfiltered_entries
+
+        logger.debug(
+            "Compiled %s patterns into a single RE2 automaton, "
+            "%s patterns will be matched separately",
+            len(self._prefilter_entries),
+            len(self._unfiltered_entries),
+        )
+
+    @classmethod
+    def _to_re2_regex(cls, regex: str, flags: Optional[int]) -> Optional[str]:
+        """
+        Translate a regex into an RE2 regex matching a superset of its matches.
+
+        :param regex: The pattern's regex
+        :param flags: The flags the regex is compiled with
+        :return: The RE2 regex, or None if the regex could not be translated
+        """
+        if flags is None or flags & ~cls.SUPPORTED_FLAGS:
+            return None
+
+        # Inline flags apply to the entire pattern in the `regex` module
+        for inline_flags in cls._INLINE_FLAGS_REGEX.findall(regex):
+            for flag in inline_flags:
+                if flag not in cls.INLINE_FLAGS:
+                    return None
+                flags |= cls.INLINE_FLAGS[flag]
+        regex = cls._INLINE_FLAGS_REGEX.sub("", regex)
+
+        # `{,n}` is a quantifier in `regex` but a literal in RE2
+        if "{," in regex:
+            return None
+
+        translated = []
+        i = 0
+        while i < len(regex):
+            char = regex[i]
+            if char == "\\":
+                escape = regex[i : i + 2]
+                i += 2
+                if escape in (r"\b", r"\B"):
+                    continue
+                translated.append(cls._translate_escape(escape, in_class=False))
+            elif char == "[":
+                class_end = cls._find_class_end(regex, i)
+                if class_end is None:
+                    return None
+                translated.append(cls._translate_class(regex[i : class_end + 1]))
+                i = class_end + 1
+            elif regex.startswith(cls._LOOKAROUND_PREFIXES, i):
+                group_end = cls._find_group_end(regex, i)
+                if group_end is None:
+                    return None
+                i = group_end + 1
+            elif char == "$":
+                translated.append("(?m:$)")
+                i += 1
+            else:
+                translated.append(char)
+                i += 1
+
+        prefix = "(?m"
+        if flags & re.IGNORECASE:
+            prefix += "i"
+        if flags & re.DOTALL:
+            prefix += "s"
+        return f"{prefix}){''.join(translated)}"
+
+    @classmethod
+    def _translate_escape(cls, escape: str, in_class: bool) -> str:
+        escaped_char = escape[1:]
+        if escaped_char in cls.SHORTHAND_CLASSES:
+            translated = cls.SHORTHAND_CLASSES[escaped_char]
+            return translated if in_class else f"[{translated}]"
+        if escaped_char.lower() in cls.SHORTHAND_CLASSES:
+            # Negated shorthand classes are approximated with any character
+            return cls.ANY_CHARACTER
+        if escaped_char == "Z":
+            return r"\z"
+        return escape
+
+    @classmethod
+    def _translate_class(cls, char_class: str) -> str:
+        negated = char_class.startswith("[^")
+        body = char_class[2:-1] if negated else char_class[1:-1]
+
+        translated = []
+        i = 0
+        while i < len(body):
+            if body[i] == "\\":
+                escape = body[i : i + 2]
+                i += 2
+                escaped_char = escape[1:]
+                if escaped_char.lower() in cls.SHORTHAND_CLASSES:
+                    if negated or escaped_char not in cls.SHORTHAND_CLASSES:
+                        # Can't express the exact set, approximate with any character
+                        return cls.ANY_CHARACTER
+                translated.append(cls._translate_escape(escape, in_class=True))
+            else:
+                translated.append(body[i])
+                i += 1
+
+        return f"[{'^' if negated else ''}{''.join(translated)}]"
+
+    @staticmethod
+    def _find_class_end(regex: str, start: int) -> Optional[int]:
+        i = start + 1
+        if regex.startswith("^", i):
+            i += 1
+        # A closing bracket right after the opening one is a literal
+        if regex.startswith("]", i):
+            i += 1
+        while i < len(regex):
+            if regex[i] == "\\":
+                i += 2
+                continue
+            if regex[i] == "[":
+                # Nested sets are not supported
+                return None
+            if regex[i] == "]":
+                return i
+            i += 1
+        return None
+
+    @classmethod
+    def _find_group_end(cls, regex: str, start: int) -> Optional[int]:
+        depth = 0
+        i = start
+        while i < len(regex):
+            char = regex[i]
+            if char == "\\":
+                i += 2
+                continue
+            if char == "[":
+                class_end = cls._find_class_end(regex, i)
+                if class_end is None:
+                    return None
+                i = class_end + 1
+                continue
+            if char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+                if depth == 0:
+                    return i
+            i += 1
+        return None
@@ -1,6 +1,6 @@
 import logging
 from abc import abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Set
 
 from presidio_analyzer import EntityRecognizer, RecognizerResult
 from presidio_analyzer.nlp_engine import NlpArtifacts
@@ -64,3 +64,15 @@ class ContextAwareEnhancer:
         :param context: list of context words
         """
         return raw_results
+
+    def get_required_nlp_artifacts(
+        self, recognizers: List[EntityRecognizer]
+    ) -> Optional[Set[str]]:
+        """
+        Return the NLP artifacts needed to enhance the results of the recognizers.
+
+        :param recognizers: the recognizers of the current request
+        :return: A set of artifacts (e.g. NlpArtifacts.LEMMAS),
+        or None if unknown, in which case all artifacts are computed.
+        """
+        return None
@@ -1,6 +1,7 @@
 import copy
 import logging
-from typing import List, Optional
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Set
 
 from presidio_analyzer import EntityRecognizer, RecognizerResult
 from presidio_analyzer.context_aware_enhancers import ContextAwareEnhancer
@@ -9,6 +10,60 @@ from presidio_analyzer.nlp_engine import NlpArtifacts
 logger = logging.getLogger("presidio-analyzer")
 
 
+class _ContextIndex:
+    """
+    Lookup structures over the tokens and lemmas of a text.
+
+    Built once per request, so that finding the token of a match and
+    the keywords around it don't scan the tokens of the text for each result.
+
+    :param nlp_artifacts: The NLP artifacts of the text
+    """
+
+    def __init__(self, nlp_artifacts: NlpArtifacts):
+        self.token_starts = list(nlp_artifacts.tokens_indices)
+        self.token_ends = [
+            start + len(token)
+            for start, token in zip(self.token_starts, nlp_artifacts.tokens)
+        ]
+
+        # Positions of the lemmas which are keywords, and their lower case form
+        keywords = set(nlp_artifacts.keywords)
+        self.keyword_positions = []
+        self.keyword_lemmas = []
+        for i, lemma in enumerate(nlp_artifacts.lemmas):
+            lower_lemma = lemma.lower()
+            if lower_lemma in keywords:
+                self.keyword_positions.append(i)
+                self.keyword_lemmas.append(lower_lemma)
+
+    def find_token(self, start: int) -> Optional[int]:
+        """
+        Return the index of the first token starting at or covering the offset.
+
+        :param start: Character offset in the text
+        :return: The token index, or None if there is no such token
+        """
+        index = bisect_right(self.token_ends, start)
+        first_at_start = bisect_left(self.token_starts, start)
+        if (
+            first_at_start < len(self.token_starts)
+            and self.token_starts[first_at_start] == start
+        ):
+            index = min(index, first_at_start)
+        return index if index < len(self.token_starts) else None
+
+    def get_keywords_backward(self, index: int, count: int) -> List[str]:
+        """Return the last `count` keywords at or before a token, nearest first."""
+        end = bisect_right(self.keyword_positions, index)
+        return self.keyword_lemmas[max(0, end - count) : end][::-1]
+
+    def get_keywords_forward(self, index: int, count: int) -> List[str]:
+        """Return the first `count` keywords at or after a token."""
+        start = bisect_left(self.keyword_positions, index)
+        return self.keyword_lemmas[start : start + count]
+
+
 class LemmaContextAwareEnhancer(ContextAwareEnhancer):
     """
     A class representing a lemma based context aware enhancer logic.
@@ -66,8 +121,9 @@ class LemmaContextAwareEnhancer(ContextAwareEnhancer):
         :param context: list of context words
         """  # noqa D205 D400
 
-        # create a deep copy of the results object, so we can manipulate it
-        results = copy.deepcopy(raw_results)
+        # Results are copied only when their score is updated,
+        # so the raw results are not modified
+        results = list(raw_results)
 
         # create recognizer context dictionary
         recognizers_dict = {recognizer.id: recognizer for recognizer in recognizers}
@@ -83,7 +139,10 @@ class LemmaContextAwareEnhancer(ContextAwareEnhancer):
             logger.warning("NLP artifacts were not provided")
             return results
 
-        for result in results:
+        # Built on the first result requiring context
+        context_index = None
+
+        for i, result in enumerate(results):
             recognizer = None
             # get recognizer matching the result, if found.
             if (
@@ -123,8 +182,14 @@ class LemmaContextAwareEnhancer(ContextAwareEnhancer):
             # extract lemmatized context from the surrounding of the match
             word = text[result.start : result.end]
 
+            if context_index is None and nlp_artifacts.tokens:
+                context_index = _ContextIndex(nlp_artifacts)
+
             surrounding_words = self._extract_surrounding_words(
-                nlp_artifacts=nlp_artifacts, word=word, start=result.start
+                nlp_artifacts=nlp_artifacts,
+                word=word,
+                start=result.start,
+                context_index=context_index,
             )
 
             # combine other sources of context with surrounding words
@@ -134,6 +199,10 @@ class LemmaContextAwareEnhancer(ContextAwareEnhancer):
                 surrounding_words, recognizer.context
             )
             if supportive_context_word != "":
+                result = copy.copy(result)
+                result.analysis_explanation = copy.copy(result.analysis_explanation)
+                results[i] = result
+
                 result.score += self.context_similarity_factor
                 result.score = max(result.score, self.min_score_with_context_similarity)
                 result.score = min(result.score, ContextAwareEnhancer.MAX_SCORE)
@@ -146,6 +215,20 @@ class LemmaContextAwareEnhancer(ContextAwareEnhancer):
                 result.analysis_explanation.set_improved_score(result.score)
         return results
 
+    def get_required_nlp_artifacts(
+        self, recognizers: List[EntityRecognizer]
+    ) -> Optional[Set[str]]:
+        """
+        Return the NLP artifacts needed to enhance the results of the recognizers.
+
+        Lemmas are only needed if any of the recognizers has context words.
+
+        :param recognizers: the recognizers of the current request
+        """
+        if any(recognizer.context for recognizer in recognizers):
+            return {NlpArtifacts.LEMMAS}
+        return set()
+
     @staticmethod
     def _find_supportive_word_in_context(
         context_list: List[str], recognizer_context_list: List[str]
@@ -165,19 +248,22 @@ class LemmaContextAwareEnhancer(ContextAwareEnhancer):
         # If the context list is empty, no need to continue
         if context_list is None or recognizer_context_list is None:
             return word
+        if not context_list:
+            return word
+
+        # Searching the joined keywords finds the same substrings as
+        # searching each keyword, as long as the separator isn't searched for
+        separator = "\x00"
+        joined_context = separator.join(context_list)
 
         for predefined_context_word in recognizer_context_list:
             # result == true only if any of the predefined context words
             # is found exactly or as a substring in any of the collected
             # context words
-            result = next(
-                (
-                    True
-                    for keyword in context_list
-                    if predefined_context_word in keyword
-                ),
-                False,
-            )
+            if separator in predefined_context_word:
+                result = any(predefined_context_word in kw for kw in context_list)
+            else:
+                result = predefined_context_word in joined_context
             if result:
                 logger.debug("Found context keyword '%s'", predefined_context_word)
                 word = predefined_context_word
@@ -186,7 +272,11 @@ class LemmaContextAwareEnhancer(ContextAwareEnhancer):
         return word
 
     def _extract_surrounding_words(
-        self, nlp_artifacts: NlpArtifacts, word: str, start: int
+        self,
+        nlp_artifacts: NlpArtifacts,
+        word: str,
+        start: int,
+        context_index: Optional[_ContextIndex] = None,
     ) -> List[str]:
         """Extract words surrounding another given word.
 
@@ -198,6 +288,8 @@ class LemmaContextAwareEnhancer(ContextAwareEnhancer):
                               execution on a given text
         :param word: The word to look for context around
         :param start: The start index of the word in the original text
+        :param context_index: Lookup structures over nlp_artifacts,
+                              created if not provided
         """
         if not nlp_artifacts.tokens:
             logger.info("Skipping context extraction due to lack of NLP artifacts")
@@ -206,131 +298,35 @@ class LemmaContextAwareEnhancer(ContextAwareEnhancer):
             # context
             return [""]
 
-        # Get the already prepared words in the given text, in their
-        # LEMMATIZED version
-        lemmatized_keywords = nlp_artifacts.keywords
+        if context_index is None:
+            context_index = _ContextIndex(nlp_artifacts)
 
         # since the list of tokens is not necessarily aligned
         # with the actual index of the match, we look for the
         # token index which corresponds to the match
-        token_index = self._find_index_of_match_token(
-            word, start, nlp_artifacts.tokens, nlp_artifacts.tokens_indices
-        )
-
-        # index i belongs to the PII entity, take the preceding n words
-        # and the successing m words into a context list
-
-        backward_context = self._add_n_words_backward(
-            token_index,
-            self.context_prefix_count,
-            nlp_artifacts.lemmas,
-            lemmatized_keywords,
-        )
-        forward_context = self._add_n_words_forward(
-            token_index,
-            self.context_suffix_count,
-            nlp_artifacts.lemmas,
-            lemmatized_keywords,
-        )
-
-        context_list = []
-        context_list.extend(backward_context)
-        context_list.extend(forward_context)
-        context_list = list(set(context_list))
-        logger.debug("Context list is: %s", " ".join(context_list))
-        return context_list
-
-    @staticmethod
-    def _find_index_of_match_token(
-        word: str,
-        start: int,
-        tokens,
-        tokens_indices: List[int],  # noqa ANN001
-    ) -> int:
-        found = False
-        # we use the known start index of the original word to find the actual
-        # token at that index, we are not checking for equivilance since the
-        # token might be just a substring of that word (e.g. for phone number
-        # 555-124564 the first token might be just '555' or for a match like '
-        # rocket' the actual token will just be 'rocket' hence the misalignment
-        # of indices)
-        # Note: we are iterating over the original tokens (not the lemmatized)
-        i = -1
-        for i, token in enumerate(tokens, 0):
-            # Either we found a token with the exact location, or
-            # we take a token which its characters indices covers
-            # the index we are looking for.
-            if (tokens_indices[i] == start) or (start < tokens_indices[i] + len(token)):
-                # found the interesting token, the one that around it
-                # we take n words, we save the matching lemma
-                found = True
-                break
-
-        if not found:
+        token_index = context_index.find_token(start)
+        if token_index is None:
             raise ValueError(
                 "Did not find word '" + word + "' "
                 "in the list of tokens although it "
                 "is expected to be found"
             )
-        return i
 
-    @staticmethod
-    def _add_n_words(
-        index: int,
-        n_words: int,
-        lemmas: List[str],
-        lemmatized_filtered_keywords: List[str],
-        is_backward: bool,
-    ) -> List[str]:
-        """
-        Prepare a string of context words.
-
-        Return a list of words which surrounds a lemma at a given index.
-        The words will be collected only if exist in the filtered array
-
-        :param index: index of the lemma that its surrounding words we want
-        :param n_words: number of words to take
-        :param lemmas: array of lemmas
-        :param lemmatized_filtered_keywords: the array of filtered
-               lemmas from the original sentence,
-        :param is_backward: if true take the preceeding words, if false,
-                            take the successing words
-        """
-        i = index
-        context_words = []
-        # The entity itself is no interest to us...however we want to
-        # consider it anyway for cases were it is attached with no spaces
-        # to an interesting context word, so we allow it and add 1 to
-        # the number of collected words
-
-        # collect at most n words (in lower case)
-        remaining = n_words + 1
-        while 0 <= i < len(lemmas) and remaining > 0:
-            lower_lemma = lemmas[i].lower()
-            if lower_lemma in lemmatized_filtered_keywords:
-                context_words.append(lower_lemma)
-                remaining -= 1
-            i = i - 1 if is_backward else i + 1
-        return context_words
-
-    def _add_n_words_forward(
-        self,
-        index: int,
-        n_words: int,
-        lemmas: List[str],
-        lemmatized_filtered_keywords: List[str],
-    ) -> List[str]:
-        return self._add_n_words(
-            index, n_words, lemmas, lemmatized_filtered_keywords, False
+        # index i belongs to the PII entity, take the preceding n words
+        # and the successing m words into a context list.
+        # The entity itself is included, for cases were it is attached
+        # with no spaces to an interesting context word
+        context_list = []
+        context_list.extend(
+            context_index.get_keywords_backward(
+                token_index, self.context_prefix_count + 1
+            )
         )
-
-    def _add_n_words_backward(
-        self,
-        index: int,
-        n_words: int,
-        lemmas: List[str],
-        lemmatized_filtered_keywords: List[str],
-    ) -> List[str]:
-        return self._add_n_words(
-            index, n_words, lemmas, lemmatized_filtered_keywords, True
+        context_list.extend(
+            context_index.get_keywords_forward(
+                token_index, self.context_suffix_count + 1
+            )
         )
+        context_list = list(set(context_list))
+        logger.debug("Context list is: %s", " ".join(context_list))
+        return context_list
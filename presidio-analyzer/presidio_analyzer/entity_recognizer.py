@@ -1,6 +1,8 @@
 import logging
 from abc import abstractmethod
-from typing import Dict, List, Optional
+from bisect import bisect_right
+from collections import defaultdict
+from typing import Dict, FrozenSet, List, Optional
 
 from presidio_analyzer import RecognizerResult
 from presidio_analyzer.nlp_engine import NlpArtifacts
@@ -32,6 +34,11 @@ class EntityRecognizer:
     MIN_SCORE = 0
     MAX_SCORE = 1.0
 
+    # The NLP artifacts (e.g. NlpArtifacts.ENTITIES) this recognizer reads.
+    # Used by the AnalyzerEngine to skip NLP pipeline components which
+    # no recognizer needs. None means unknown, so all artifacts are computed.
+    required_nlp_artifacts: Optional[FrozenSet[str]] = None
+
     def __init__(
         self,
         supported_entities: List[str],
@@ -169,30 +176,47 @@ class EntityRecognizer:
         Remove duplicate results.
 
         Remove duplicates in case the two results
-        have identical start and ends and types.
+        have identical start and ends and types,
+        and results contained in a result of the same type
+        with an equal or higher score.
         :param results: List[RecognizerResult]
         :return: List[RecognizerResult]
         """
         results = list(set(results))
         results = sorted(results, key=lambda x: (-x.score, x.start, -(x.end - x.start)))
-        filtered_results = []
 
-        for result in results:
+        # A result is removed if a result of the same type which precedes it
+        # in the sort order contains it. Results of each type are scanned in
+        # that order, keeping a Fenwick tree over the start offsets seen so far
+        # which holds the maximal end among results starting at or before
+        # each offset, so each containment check takes O(log n).
+        results_by_type = defaultdict(list)
+        for index, result in enumerate(results):
             if result.score == 0:
                 continue
-
-            to_keep = result not in filtered_results  # equals based comparison
-            if to_keep:
-                for filtered in filtered_results:
-                    # If result is contained in one of the other results
-                    if (
-                        result.contained_in(filtered)
-                        and result.entity_type == filtered.entity_type
-                    ):
-                        to_keep = False
-                        break
-
-            if to_keep:
-                filtered_results.append(result)
-
-        return filtered_results
+            results_by_type[result.entity_type].append(index)
+
+        kept_indices = []
+        for indices in results_by_type.values():
+            starts = sorted({results[index].start for index in indices})
+            max_ends = [-1] * (len(starts) + 1)
+
+            for index in indices:
+                result = results[index]
+                position = bisect_right(starts, result.start)
+
+                i = position
+                max_end = -1
+                while i > 0:
+                    max_end = max(max_end, max_ends[i])
+                    i -= i & -i
+                if max_end >= result.end:
+                    continue
+
+                kept_indices.append(index)
+                i = position
+                while i < len(max_ends):
+                    max_ends[i] = max(max_ends[i], result.end)
+                    i += i & -i
+
+        return [results[index] for index in sorted(kept_indices)]
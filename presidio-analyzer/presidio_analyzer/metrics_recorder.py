@@ -0,0 +1,326 @@
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import prometheus_client
+except ImportError:
+    prometheus_client = None
+
+try:
+    from opentelemetry import metrics as otel_metrics
+except ImportError:
+    otel_metrics = None
+
+# Metrics recorded by the analyzer and their labels
+# Total time of an `analyze` call (language)
+REQUEST_DURATION = "analyzer_request_duration_seconds"
+# Time spent in the NLP engine (language, nlp_engine)
+NLP_DURATION = "analyzer_nlp_duration_seconds"
+# Time spent in each recognizer's `analyze` (recognizer)
+RECOGNIZER_DURATION = "analyzer_recognizer_duration_seconds"
+# Results returned by each recognizer (recognizer)
+RECOGNIZER_RESULTS = "analyzer_recognizer_results_total"
+# Time spent matching and validating each pattern (recognizer, pattern)
+PATTERN_DURATION = "analyzer_pattern_duration_seconds"
+# Regex matches of each pattern, before validation (recognizer, pattern)
+PATTERN_MATCHES = "analyzer_pattern_matches_total"
+# Results of `validate_result` and `invalidate_result` (recognizer, pattern, outcome)
+PATTERN_VALIDATIONS = "analyzer_pattern_validations_total"
+# Patterns skipped after exceeding their time budget (recognizer, pattern)
+PATTERN_TIMEOUTS = "analyzer_pattern_timeouts_total"
+# Time spent enhancing the results using context words
+CONTEXT_ENHANCEMENT_DURATION = "analyzer_context_enhancement_duration_seconds"
+
+
+class MetricsRecorder:
+    """
+    Receives the timings and counts measured while analyzing texts.
+
+    This base class discards all metrics, and is the default recorder.
+    Subclasses set `enabled` to True and implement `record_duration`
+    and `increment`, e.g. to export the metrics to a monitoring system.
+    Measurements are only taken when the recorder is enabled,
+    so the default recorder adds no timing overhead.
+    Recorders may be called concurrently from multiple threads.
+    """
+
+    enabled = False
+
+    def record_duration(
+        self, name: str, seconds: float, labels: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Record the duration of an operation.
+
+        :param name: The metric name, e.g. PATTERN_DURATION
+        :param seconds: The duration in seconds
+        :param labels: The labels of the measurement, e.g. the recognizer name
+        """
+
+    def increment(
+        self, name: str, value: int = 1, labels: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Increment a counter.
+
+        :param name: The metric name, e.g. PATTERN_MATCHES
+        :param value: The value to add to the counter
+        :param labels: The labels of the measurement, e.g. the recognizer name
+        """
+
+
+NO_OP_METRICS_RECORDER = MetricsRecorder()
+
+_current_metrics_recorder: ContextVar[MetricsRecorder] = ContextVar(
+    "presidio_metrics_recorder", default=NO_OP_METRICS_RECORDER
+)
+
+
+def get_metrics_recorder() -> MetricsRecorder:
+    """
+    Return the metrics recorder of the `analyze` call currently running.
+
+    Can be used by recognizers to record their own metrics.
+    Returns the no-op recorder when called outside of an `analyze` call.
+    """
+    return _current_metrics_recorder.get()
+
+
+@contextmanager
+def use_metrics_recorder(metrics: MetricsRecorder) -> Iterator[None]:
+    """
+    Set the recorder returned by `get_metrics_recorder` within the context.
+
+    :param metrics: The metrics recorder to use
+    """
+    token = _current_metrics_recorder.set(metrics)
+    try:
+        yield
+    finally:
+        _current_metrics_recorder.reset(token)
+
+
+def _labels_key(labels: Optional[Dict[str, str]]) -> Tuple[Tuple[str, str], ...]:
+    return tuple(sorted(labels.items())) if labels else ()
+
+
+class InMemoryMetricsRecorder(MetricsRecorder):
+    """
+    Metrics recorder aggregating the metrics in memory.
+
+    Useful for profiling and tests, e.g. to find the patterns
+    taking most of the time:
+
+    >>> metrics = InMemoryMetricsRecorder()
+    >>> analyzer = AnalyzerEngine(metrics=metrics)
+    >>> analyzer.analyze(text, language="en")
+    >>> metrics.get_durations(PATTERN_DURATION)[:5]
+    """
+
+    enabled = True
+
+    def __init__(self):
+        # (name, labels) -> [count, total, max]
+        self._durations: Dict[Tuple, List[float]] = {}
+        # (name, labels) -> count
+        self._counters: Dict[Tuple, int] = {}
+        self._lock = threading.Lock()
+
+    def record_duration(
+        self, name: str, seconds: float, labels: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Add the duration to the aggregated durations of the metric and labels."""
+        key = (name, _labels_key(labels))
+        with self._lock:
+            stats = self._durations.get(key)
+            if stats is None:
+                self._durations[key] = [1, seconds, seconds]
+                return
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = max(stats[2], seconds)
+
+    def increment(
+        self, name: str, value: int = 1, labels: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Increment the counter of the metric and labels."""
+        key = (name, _labels_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def get_durations(self, name: str) -> List[Dict]:
+        """
+        Return the aggregated durations of a metric, slowest first.
+
+        :param name: The metric name
+        :return: A list of dictionaries with the labels, count,
+        total and max duration of each label combination
+        """
+        with self._lock:
+            durations = [
+                {
+                    "labels": dict(labels),
+                    "count": stats[0],
+                    "total": stats[1],
+                    "max": stats[2],
+                }
+                for (metric_name, labels), stats in self._durations.items()
+                if metric_name == name
+            ]
+        return sorted(durations, key=lambda duration: -duration["total"])
+
+    def get_count(self, name: str, labels: Optional[Dict[str, str]] = None) -> int:
+        """
+        Return the value of a counter, summed over the counters matching the labels.
+
+        :param name: The metric name
+        :param labels: Labels the counters should have. If None, all counters
+        of the metric are summed.
+        """
+        labels = labels or {}
+        with self._lock:
+            return sum(
+                value
+                for (metric_name, counter_labels), value in self._counters.items()
+                if metric_name == name
+                and labels.items() <= dict(counter_labels).items()
+            )
+
+    def clear(self) -> None:
+        """Remove all recorded metrics."""
+        with self._lock:
+            self._durations.clear()
+            self._counters.clear()
+
+
+class PrometheusMetricsRecorder(MetricsRecorder):
+    """
+    Metrics recorder exporting the metrics using `prometheus_client`.
+
+    Durations are exported as histograms and counts as counters,
+    named `<namespace>_<metric name>`.
+
+    :param registry: The Prometheus registry to register the metrics in.
+    If None, the default registry is used.
+    :param namespace: Prefix of the metric names
+    :param buckets: Histogram buckets of the durations, in seconds
+    """
+
+    enabled = True
+
+    DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5)
+
+    def __init__(
+        self,
+        registry: Optional["prometheus_client.CollectorRegistry"] = None,
+        namespace: str = "presidio",
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        if not prometheus_client:
+            raise ImportError(
+                "prometheus_client is not installed, "
+                "install it to use PrometheusMetricsRecorder"
+            )
+
+        self.registry = registry if registry is not None else prometheus_client.REGISTRY
+        self.namespace = namespace
+        self.buckets = buckets
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def record_duration(
+        self, name: str, seconds: float, labels: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Observe the duration in the histogram of the metric."""
+        histogram = self._get_metric(prometheus_client.Histogram, name, labels)
+        if labels:
+            histogram = histogram.labels(**labels)
+        histogram.observe(seconds)
+
+    def increment(
+        self, name: str, value: int = 1, labels: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Increment the counter of the metric."""
+        counter = self._get_metric(prometheus_client.Counter, name, labels)
+        if labels:
+            counter = counter.labels(**labels)
+        counter.inc(value)
+
+    def _get_metric(self, metric_type: type, name: str, labels: Optional[Dict]):
+        metric = self._metrics.get(name)
+        if metric is not None:
+            return metric
+
+        with self._lock:
+            if name not in self._metrics:
+                kwargs = {}
+                if metric_type is prometheus_client.Histogram:
+                    kwargs["buckets"] = self.buckets
+                self._metrics[name] = metric_type(
+                    name,
+                    name.replace("_", " "),
+                    labelnames=sorted(labels) if labels else (),
+                    namespace=self.namespace,
+                    registry=self.registry,
+                    **kwargs,
+                )
+            return self._metrics[name]
+
+
+class OpenTelemetryMetricsRecorder(MetricsRecorder):
+    """
+    Metrics recorder exporting the metrics using the OpenTelemetry metrics API.
+
+    Durations are recorded in histograms and counts in counters,
+    named `<namespace>.<metric name>`, with the labels as attributes.
+
+    :param meter: The OpenTelemetry meter creating the instruments.
+    If None, a meter is obtained from the global meter provider.
+    :param namespace: Prefix of the instrument names
+    """
+
+    enabled = True
+
+    def __init__(
+        self,
+        meter: Optional["otel_metrics.Meter"] = None,
+        namespace: str = "presidio",
+    ):
+        if not otel_metrics:
+            raise ImportError(
+                "opentelemetry-api is not installed, "
+                "install it to use OpenTelemetryMetricsRecorder"
+            )
+
+        self.meter = meter if meter is not None else otel_metrics.get_meter("presidio")
+        self.namespace = namespace
+        self._instruments = {}
+        self._lock = threading.Lock()
+
+    def record_duration(
+        self, name: str, seconds: float, labels: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Record the duration in the histogram of the metric."""
+        histogram = self._get_instrument(self.meter.create_histogram, name, "s")
+        histogram.record(seconds, attributes=labels)
+
+    def increment(
+        self, name: str, value: int = 1, labels: Optional[Dict[str, str]] = None
+    ) -> None:
+        """Add the value to the counter of the metric."""
+        counter = self._get_instrument(self.meter.create_counter, name, "1")
+        counter.add(value, attributes=labels)
+
+    def _get_instrument(self, create_instrument, name: str, unit: str):
+        instrument = self._instruments.get(name)
+        if instrument is not None:
+            return instrument
+
+        with self._lock:
+            if name not in self._instruments:
+                self._instruments[name] = create_instrument(
+                    f"{self.namespace}.{name}", unit=unit
+                )
+            return self._instruments[name]
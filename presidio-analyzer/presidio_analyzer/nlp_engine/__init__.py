@@ -1,17 +1,48 @@
-"""NLP engine package. Performs text pre-processing."""
+"""
+NLP engine package. Performs text pre-processing.
 
-from .ner_model_configuration import NerModelConfiguration
-from .nlp_artifacts import NlpArtifacts
-from .nlp_engine import NlpEngine
-from .spacy_nlp_engine import SpacyNlpEngine
-from .stanza_nlp_engine import StanzaNlpEngine
-from .transformers_nlp_engine import TransformersNlpEngine
+Modules are imported on first access (PEP 562), so NLP packages
+(e.g. spaCy, stanza or transformers) are only imported by the engines using them.
+"""
+
+import importlib
+from typing import Any, List
+
+# Class name -> module defining it
+_MODULES = {
+    "CompactEntity": "compact_nlp_artifacts",
+    "CompactNlpArtifacts": "compact_nlp_artifacts",
+    "CompactTokens": "compact_nlp_artifacts",
+    "NerModelConfiguration": "ner_model_configuration",
+    "NlpArtifacts": "nlp_artifacts",
+    "NlpEngine": "nlp_engine",
+    "SpacyNlpEngine": "spacy_nlp_engine",
+    "StanzaNlpEngine": "stanza_nlp_engine",
+    "TransformersNlpEngine": "transformers_nlp_engine",
+    "NlpEngineProvider": "nlp_engine_provider",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{_MODULES[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
 
-from .nlp_engine_provider import NlpEngineProvider  # isort:skip
 
 __all__ = [
     "NerModelConfiguration",
     "NlpArtifacts",
+    "CompactEntity",
+    "CompactNlpArtifacts",
+    "CompactTokens",
     "NlpEngine",
     "SpacyNlpEngine",
     "StanzaNlpEngine",
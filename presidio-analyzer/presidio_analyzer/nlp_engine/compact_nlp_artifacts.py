@@ -0,0 +1,147 @@
+import sys
+from array import array
+from typing import (
+    TYPE_CHECKING,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from presidio_analyzer.nlp_engine.nlp_artifacts import NlpArtifacts
+
+if TYPE_CHECKING:
+    from spacy.tokens import Doc, Span
+
+
+class CompactEntity(NamedTuple):
+    """
+    An entity identified by the NLP pipeline.
+
+    Exposes the attributes of spaCy's `Span` used by recognizers.
+    """
+
+    label_: str
+    start_char: int
+    end_char: int
+    text: str
+
+
+class CompactTokens(Sequence):
+    """
+    The tokens of a text, stored as arrays of character offsets into the text.
+
+    Tokens are returned as `str`, not as spaCy `Token` objects,
+    so only their text is available. Slicing returns a list of `str`.
+
+    :param text: The text the tokens were extracted from
+    :param starts: Start offset of each token
+    :param ends: End offset of each token
+    """
+
+    def __init__(self, text: str, starts: array, ends: array):
+        self.text = text
+        self.starts = starts
+        self.ends = ends
+
+    def __len__(self) -> int:  # noqa D105
+        return len(self.starts)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:  # noqa D105
+        if isinstance(index, slice):
+            text = self.text
+            return [
+                text[start:end]
+                for start, end in zip(self.starts[index], self.ends[index])
+            ]
+        return self.text[self.starts[index] : self.ends[index]]
+
+    def __iter__(self) -> Iterator[str]:  # noqa D105
+        text = self.text
+        for start, end in zip(self.starts, self.ends):
+            yield text[start:end]
+
+
+class CompactNlpArtifacts(NlpArtifacts):
+    """
+    NlpArtifacts which don't retain the objects created by the NLP pipeline.
+
+    Instead of the spaCy `Doc` and `Span` objects, tokens are stored as
+    arrays of offsets into the text (`CompactTokens`, returning tokens as `str`),
+    lemmas are interned and entities are `CompactEntity` tuples.
+    Used to reduce memory usage when many artifacts are held at once,
+    e.g. when analyzing large batches.
+
+    :param entities: Identified entities
+    :param tokens: Tokenized text
+    :param lemmas: List of lemmas in text
+    :param nlp_engine: NlpEngine object
+    :param language: Text language
+    :param scores: Entity confidence scores
+    """
+
+    def __init__(
+        self,
+        entities: List[CompactEntity],
+        tokens: CompactTokens,
+        lemmas: List[str],
+        nlp_engine: "NlpEngine",  # noqa F821
+        language: str,
+        scores: Optional[List[float]] = None,
+    ):
+        super().__init__(
+            entities=entities,
+            tokens=tokens,
+            tokens_indices=tokens.starts,
+            lemmas=lemmas,
+            nlp_engine=nlp_engine,
+            language=language,
+            scores=scores,
+        )
+
+    @classmethod
+    def from_doc(
+        cls,
+        doc: "Doc",
+        entities: List["Span"],
+        nlp_engine: "NlpEngine",  # noqa F821
+        language: str,
+        scores: Optional[List[float]] = None,
+    ) -> "CompactNlpArtifacts":
+        """
+        Create compact artifacts from a spaCy Doc and its entities.
+
+        :param doc: The spaCy Doc
+        :param entities: The entities extracted from the Doc
+        :param nlp_engine: NlpEngine object
+        :param language: Text language
+        :param scores: Entity confidence scores
+        """
+        starts = array("q")
+        ends = array("q")
+        lemmas = []
+        for token in doc:
+            starts.append(token.idx)
+            ends.append(token.idx + len(token))
+            lemmas.append(sys.intern(token.lemma_))
+
+        compact_entities = [
+            CompactEntity(
+                label_=entity.label_,
+                start_char=entity.start_char,
+                end_char=entity.end_char,
+                text=entity.text,
+            )
+            for entity in entities
+        ]
+
+        return cls(
+            entities=compact_entities,
+            tokens=CompactTokens(doc.text, starts, ends),
+            lemmas=lemmas,
+            nlp_engine=nlp_engine,
+            language=language,
+            scores=scores,
+        )
@@ -1,7 +1,8 @@
 import json
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from spacy.tokens import Doc, Span
+if TYPE_CHECKING:
+    from spacy.tokens import Doc, Span
 
 
 class NlpArtifacts:
@@ -20,10 +21,14 @@ class NlpArtifacts:
     :param scores: Entity confidence scores
     """
 
+    # Kinds of artifacts, used to declare which artifacts a component needs
+    ENTITIES = "entities"
+    LEMMAS = "lemmas"
+
     def __init__(
         self,
-        entities: List[Span],
-        tokens: Doc,
+        entities: List["Span"],
+        tokens: "Doc",
         tokens_indices: List[int],
         lemmas: List[str],
         nlp_engine: "NlpEngine",  # noqa F821
@@ -34,10 +39,26 @@ class NlpArtifacts:
         self.tokens = tokens
         self.lemmas = lemmas
         self.tokens_indices = tokens_indices
-        self.keywords = self.set_keywords(nlp_engine, lemmas, language)
         self.nlp_engine = nlp_engine
+        self.language = language
         self.scores = scores if scores else [0.85] * len(entities)
 
+        # Keywords are only needed for context enhancement, computed on first access
+        self._keywords: Optional[List[str]] = None
+
+    @property
+    def keywords(self) -> List[str]:
+        """Return the keywords of the text (see `set_keywords`)."""
+        if self._keywords is None:
+            self._keywords = self.set_keywords(
+                self.nlp_engine, self.lemmas, self.language
+            )
+        return self._keywords
+
+    @keywords.setter
+    def keywords(self, keywords: List[str]) -> None:
+        self._keywords = keywords
+
     @staticmethod
     def set_keywords(
         nlp_engine,
@@ -51,22 +72,18 @@ class NlpArtifacts:
         """
         if not nlp_engine:
             return []
-        keywords = [
-            k.lower()
-            for k in lemmas
-            if not nlp_engine.is_stopword(k, language)
-            and not nlp_engine.is_punct(k, language)
-            and k != "-PRON-"
-            and k != "be"
-        ]
-
-        # best effort, try even further to break tokens into sub tokens,
-        # this can result in reducing false negatives
-        keywords = [i.split(":") for i in keywords]
-
-        # splitting the list can, if happened, will result in list of lists,
-        # we flatten the list
-        keywords = [item for sublist in keywords for item in sublist]
+        keywords = []
+        for lemma in lemmas:
+            if lemma == "-PRON-" or lemma == "be":
+                continue
+            if nlp_engine.is_stopword(lemma, language) or nlp_engine.is_punct(
+                lemma, language
+            ):
+                continue
+
+            # best effort, try even further to break tokens into sub tokens,
+            # this can result in reducing false negatives
+            keywords.extend(lemma.lower().split(":"))
         return keywords
 
     def to_json(self) -> str:
@@ -76,10 +93,17 @@ class NlpArtifacts:
 
         # Ignore NLP engine as it's not serializable currently
         del return_dict["nlp_engine"]
+        del return_dict["language"]
+        del return_dict["_keywords"]
+        return_dict["keywords"] = self.keywords
 
         # Converting spaCy tokens and spans to string as they are not serializable
         if "tokens" in return_dict:
-            return_dict["tokens"] = [token.text for token in self.tokens]
+            return_dict["tokens"] = [
+                getattr(token, "text", token) for token in self.tokens
+            ]
+        if "tokens_indices" in return_dict:
+            return_dict["tokens_indices"] = list(self.tokens_indices)
         if "entities" in return_dict:
             return_dict["entities"] = [entity.text for entity in self.entities]
         if "scores" in return_dict:
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Iterable, Iterator, List, Optional, Tuple
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
 
 from presidio_analyzer.nlp_engine import NlpArtifacts
 
@@ -37,6 +37,40 @@ class NlpEngine(ABC):
         Returns a tuple of (text, NlpArtifacts)
         """
 
+    def process_text_partial(
+        self, text: str, language: str, required_artifacts: Optional[Set[str]]
+    ) -> NlpArtifacts:
+        """
+        Execute only the parts of the NLP pipeline needed for the required artifacts.
+
+        Engines which can't skip parts of their pipeline run all of it.
+
+        :param text: The text to process
+        :param language: The language of the text
+        :param required_artifacts: The artifacts needed by the caller
+        (e.g. NlpArtifacts.ENTITIES, NlpArtifacts.LEMMAS), or None for all artifacts.
+        Artifacts which are not required may be left empty.
+        """
+        return self.process_text(text, language)
+
+    def process_batch_partial(
+        self,
+        texts: Iterable[str],
+        language: str,
+        required_artifacts: Optional[Set[str]],
+        batch_size: Optional[int] = None,
+        **kwargs,  # noqa ANN003
+    ) -> Iterator[Tuple[str, NlpArtifacts]]:
+        """
+        Execute only the parts of the NLP pipeline needed, on a batch of texts.
+
+        See `process_text_partial`.
+        Returns a tuple of (text, NlpArtifacts)
+        """
+        return self.process_batch(
+            texts=texts, language=language, batch_size=batch_size, **kwargs
+        )
+
     @abstractmethod
     def is_stopword(self, word: str, language: str) -> bool:
         """
@@ -1,16 +1,11 @@
 import logging
 from pathlib import Path
-from typing import Dict, Optional, Tuple, Union
+from typing import Dict, Iterable, Optional, Tuple, Type, Union
 
 import yaml
 
-from presidio_analyzer.nlp_engine import (
-    NerModelConfiguration,
-    NlpEngine,
-    SpacyNlpEngine,
-    StanzaNlpEngine,
-    TransformersNlpEngine,
-)
+from presidio_analyzer import nlp_engine as nlp_engine_package
+from presidio_analyzer.nlp_engine import NerModelConfiguration, NlpEngine
 
 logger = logging.getLogger("presidio-analyzer")
 
@@ -32,21 +27,23 @@ class NlpEngineProvider:
     :param conf_file: Path to yaml file containing nlp engine configuration.
     """
 
+    # Engines available by default, by name. They are imported only when used,
+    # as importing an engine imports its NLP package.
+    DEFAULT_NLP_ENGINES = {
+        "spacy": "SpacyNlpEngine",
+        "stanza": "StanzaNlpEngine",
+        "transformers": "TransformersNlpEngine",
+    }
+
     def __init__(
         self,
         nlp_engines: Optional[Tuple] = None,
         conf_file: Optional[Union[Path, str]] = None,
         nlp_configuration: Optional[Dict] = None,
     ):
-        if not nlp_engines:
-            nlp_engines = (SpacyNlpEngine, StanzaNlpEngine, TransformersNlpEngine)
-
-        self.nlp_engines = {
-            engine.engine_name: engine for engine in nlp_engines if engine.is_available
-        }
-        logger.debug(
-            f"Loaded these available nlp engines: {list(self.nlp_engines.keys())}"
-        )
+        self._nlp_engines = None
+        if nlp_engines:
+            self._nlp_engines = self._get_available_engines(nlp_engines)
 
         if conf_file and nlp_configuration:
             raise ValueError(
@@ -64,6 +61,37 @@ class NlpEngineProvider:
             logger.debug(f"Reading default conf file from {conf_file}")
             self.nlp_configuration = self._read_nlp_conf(conf_file)
 
+    @property
+    def nlp_engines(self) -> Dict[str, Type[NlpEngine]]:
+        """Return the available NLP engine classes by engine name."""
+        if self._nlp_engines is None:
+            self._nlp_engines = self._get_available_engines(
+                getattr(nlp_engine_package, class_name)
+                for class_name in self.DEFAULT_NLP_ENGINES.values()
+            )
+        return self._nlp_engines
+
+    @staticmethod
+    def _get_available_engines(nlp_engines: Iterable) -> Dict[str, Type[NlpEngine]]:
+        available_engines = {
+            engine.engine_name: engine for engine in nlp_engines if engine.is_available
+        }
+        logger.debug(
+            f"Loaded these available nlp engines: {list(available_engines.keys())}"
+        )
+        return available_engines
+
+    def _get_nlp_engine_class(self, nlp_engine_name: str) -> Optional[Type[NlpEngine]]:
+        """Return the class of an available NLP engine, importing only that engine."""
+        if self._nlp_engines is None:
+            class_name = self.DEFAULT_NLP_ENGINES.get(nlp_engine_name)
+            if not class_name:
+                return None
+            engine = getattr(nlp_engine_package, class_name)
+            return engine if engine.is_available else None
+
+        return self._nlp_engines.get(nlp_engine_name)
+
     def create_engine(self) -> NlpEngine:
         """Create an NLP engine instance."""
         if (
@@ -77,13 +105,13 @@ class NlpEngineProvider:
                 "(list of model_name for each lang_code)."
             )
         nlp_engine_name = self.nlp_configuration["nlp_engine_name"]
-        if nlp_engine_name not in self.nlp_engines:
+        nlp_engine_class = self._get_nlp_engine_class(nlp_engine_name)
+        if not nlp_engine_class:
             raise ValueError(
                 f"NLP engine '{nlp_engine_name}' is not available. "
                 "Make sure you have all required packages installed"
             )
         try:
-            nlp_engine_class = self.nlp_engines[nlp_engine_name]
             nlp_models = self.nlp_configuration["models"]
 
             ner_model_configuration = self.nlp_configuration.get(
@@ -94,8 +122,16 @@ class NlpEngineProvider:
                     ner_model_configuration
                 )
 
+            engine_kwargs = {}
+            if "compact_artifacts" in self.nlp_configuration:
+                engine_kwargs["compact_artifacts"] = self.nlp_configuration[
+                    "compact_artifacts"
+                ]
+
             engine = nlp_engine_class(
-                models=nlp_models, ner_model_configuration=ner_model_configuration
+                models=nlp_models,
+                ner_model_configuration=ner_model_configuration,
+                **engine_kwargs,
             )
             engine.load()
             logger.info(
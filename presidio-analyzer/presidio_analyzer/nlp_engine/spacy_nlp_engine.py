@@ -1,12 +1,18 @@
 import logging
 from pathlib import Path
-from typing import Dict, Iterator, List, Optional, Tuple, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 import spacy
+from spacy.lang import lex_attrs
 from spacy.language import Language
 from spacy.tokens import Doc, Span
 
-from presidio_analyzer.nlp_engine import NerModelConfiguration, NlpArtifacts, NlpEngine
+from presidio_analyzer.nlp_engine import (
+    CompactNlpArtifacts,
+    NerModelConfiguration,
+    NlpArtifacts,
+    NlpEngine,
+)
 
 logger = logging.getLogger("presidio-analyzer")
 
@@ -23,10 +29,26 @@ class SpacyNlpEngine(NlpEngine):
     engine_name = "spacy"
     is_available = bool(spacy)
 
+    # Pipeline components producing only a specific artifact,
+    # skipped by the partial processing methods when it isn't required
+    ARTIFACT_COMPONENTS = {
+        NlpArtifacts.ENTITIES: ("ner", "entity_ruler", "span_ruler", "hf_token_pipe"),
+        NlpArtifacts.LEMMAS: (
+            "tagger",
+            "morphologizer",
+            "attribute_ruler",
+            "lemmatizer",
+            "trainable_lemmatizer",
+        ),
+    }
+    # Pipeline components whose output isn't used by Presidio
+    UNUSED_COMPONENTS = ("parser", "senter")
+
     def __init__(
         self,
         models: Optional[List[Dict[str, str]]] = None,
         ner_model_configuration: Optional[NerModelConfiguration] = None,
+        compact_artifacts: bool = False,
     ):
         """
         Initialize a wrapper on spaCy functionality.
@@ -35,6 +57,8 @@ class SpacyNlpEngine(NlpEngine):
         For example: models = [{"lang_code": "en", "model_name": "en_core_web_lg"}]
         :param ner_model_configuration: Parameters for the NER model.
         See conf/spacy.yaml for an example
+        :param compact_artifacts: If True, return CompactNlpArtifacts,
+        which don't retain the spaCy Doc, to reduce memory usage.
         """
         if not models:
             models = [{"lang_code": "en", "model_name": "en_core_web_lg"}]
@@ -43,9 +67,13 @@ class SpacyNlpEngine(NlpEngine):
         if not ner_model_configuration:
             ner_model_configuration = NerModelConfiguration()
         self.ner_model_configuration = ner_model_configuration
+        self.compact_artifacts = compact_artifacts
 
         self.nlp = None
 
+        # Stop words of each language, read from the model once
+        self._stopwords: Dict[str, Set[str]] = {}
+
     def load(self) -> None:
         """Load the spaCy NLP model."""
         logger.debug(f"Loading SpaCy models: {self.models}")
@@ -101,6 +129,74 @@ class SpacyNlpEngine(NlpEngine):
         doc = self.nlp[language](text)
         return self._doc_to_nlp_artifact(doc, language)
 
+    def process_text_partial(
+        self, text: str, language: str, required_artifacts: Optional[Set[str]]
+    ) -> NlpArtifacts:
+        """
+        Execute only the pipeline components needed for the required artifacts.
+
+        If no artifacts are required, the text is only tokenized.
+
+        :param text: The text to process
+        :param language: The language of the text
+        :param required_artifacts: The artifacts needed by the caller
+        (e.g. NlpArtifacts.ENTITIES, NlpArtifacts.LEMMAS), or None for all artifacts.
+        """
+        if required_artifacts is None:
+            return self.process_text(text, language)
+
+        if not self.nlp:
+            raise ValueError("NLP engine is not loaded. Consider calling .load()")
+
+        disable = self._get_components_to_disable(language, required_artifacts)
+        doc = self.nlp[language](text, disable=disable)
+        return self._doc_to_nlp_artifact(doc, language, required_artifacts)
+
+    def process_batch_partial(
+        self,
+        texts: Iterable[str],
+        language: str,
+        required_artifacts: Optional[Set[str]],
+        batch_size: Optional[int] = None,
+        **kwargs,
+    ) -> Iterator[Tuple[str, NlpArtifacts]]:
+        """
+        Execute only the pipeline components needed, on a batch of texts.
+
+        See `process_text_partial`.
+        """
+        if required_artifacts is None:
+            yield from self.process_batch(
+                texts=texts, language=language, batch_size=batch_size, **kwargs
+            )
+            return
+
+        if not self.nlp:
+            raise ValueError("NLP engine is not loaded. Consider calling .load()")
+
+        disable = self._get_components_to_disable(language, required_artifacts)
+        texts = (str(text) for text in texts)
+        docs = self.nlp[language].pipe(texts, batch_size=batch_size, disable=disable)
+        for doc in docs:
+            yield doc.text, self._doc_to_nlp_artifact(
+                doc, language, required_artifacts
+            )
+
+    def _get_components_to_disable(
+        self, language: str, required_artifacts: Set[str]
+    ) -> List[str]:
+        """Return the pipeline components not needed for the required artifacts."""
+        pipe_names = self.nlp[language].pipe_names
+        if not required_artifacts:
+            return list(pipe_names)
+
+        to_disable = set(self.UNUSED_COMPONENTS)
+        for artifact, components in self.ARTIFACT_COMPONENTS.items():
+            if artifact not in required_artifacts:
+                to_disable.update(components)
+
+        return [name for name in pipe_names if name in to_disable]
+
     def process_batch(
         self,
         texts: Union[List[str], List[Tuple[str, object]]],
@@ -133,7 +229,12 @@ class SpacyNlpEngine(NlpEngine):
 
         (within the given language)
         """
-        return self.nlp[language].vocab[word].is_stop
+        stopwords = self._stopwords.get(language)
+        if stopwords is None:
+            stopwords = frozenset(self.nlp[language].Defaults.stop_words)
+            self._stopwords[language] = stopwords
+        # Same as spaCy's Lexeme.is_stop, without adding the word to the vocab
+        return word.lower() in stopwords
 
     def is_punct(self, word: str, language: str) -> bool:
         """
@@ -141,7 +242,8 @@ class SpacyNlpEngine(NlpEngine):
 
         (within the given language).
         """
-        return self.nlp[language].vocab[word].is_punct
+        # Same as spaCy's Lexeme.is_punct, without adding the word to the vocab
+        return bool(word) and lex_attrs.is_punct(word)
 
     def get_nlp(self, language: str) -> Language:
         """
@@ -152,15 +254,32 @@ class SpacyNlpEngine(NlpEngine):
         """
         return self.nlp[language]
 
-    def _doc_to_nlp_artifact(self, doc: Doc, language: str) -> NlpArtifacts:
+    def _doc_to_nlp_artifact(
+        self,
+        doc: Doc,
+        language: str,
+        required_artifacts: Optional[Set[str]] = None,
+    ) -> NlpArtifacts:
+        if required_artifacts is None or NlpArtifacts.ENTITIES in required_artifacts:
+            entities = self._get_entities(doc)
+            scores = self._get_scores_for_entities(doc)
+
+            entities, scores = self._get_updated_entities(entities, scores)
+        else:
+            entities, scores = [], []
+
+        if self.compact_artifacts:
+            return CompactNlpArtifacts.from_doc(
+                doc=doc,
+                entities=entities,
+                nlp_engine=self,
+                language=language,
+                scores=scores,
+            )
+
         lemmas = [token.lemma_ for token in doc]
         tokens_indices = [token.idx for token in doc]
 
-        entities = self._get_entities(doc)
-        scores = self._get_scores_for_entities(doc)
-
-        entities, scores = self._get_updated_entities(entities, scores)
-
         return NlpArtifacts(
             entities=entities,
             tokens=doc,
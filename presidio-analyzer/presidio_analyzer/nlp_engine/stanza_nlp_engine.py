@@ -24,6 +24,8 @@ class StanzaNlpEngine(SpacyNlpEngine):
     For example: models = [{"lang_code": "en", "model_name": "en"}]
     :param ner_model_configuration: Parameters for the NER model.
     See conf/stanza.yaml for an example
+    :param compact_artifacts: If True, return CompactNlpArtifacts,
+    which don't retain the spaCy Doc, to reduce memory usage.
 
     """
 
@@ -35,8 +37,11 @@ class StanzaNlpEngine(SpacyNlpEngine):
         models: Optional[List[Dict[str, str]]] = None,
         ner_model_configuration: Optional[NerModelConfiguration] = None,
         download_if_missing: bool = True,
+        compact_artifacts: bool = False,
     ):
-        super().__init__(models, ner_model_configuration)
+        super().__init__(
+            models, ner_model_configuration, compact_artifacts=compact_artifacts
+        )
         self.download_if_missing = download_if_missing
 
     def load(self) -> None:
@@ -38,6 +38,8 @@ class TransformersNlpEngine(SpacyNlpEngine):
     }]
     :param ner_model_configuration: Parameters for the NER model.
     See conf/transformers.yaml for an example
+    :param compact_artifacts: If True, return CompactNlpArtifacts,
+    which don't retain the spaCy Doc, to reduce memory usage.
 
 
     Note that since the spaCy model is not used for NER,
@@ -56,6 +58,7 @@ class TransformersNlpEngine(SpacyNlpEngine):
         self,
         models: Optional[List[Dict]] = None,
         ner_model_configuration: Optional[NerModelConfiguration] = None,
+        compact_artifacts: bool = False,
     ):
         if not models:
             models = [
@@ -67,7 +70,11 @@ class TransformersNlpEngine(SpacyNlpEngine):
                     },
                 }
             ]
-        super().__init__(models=models, ner_model_configuration=ner_model_configuration)
+        super().__init__(
+            models=models,
+            ner_model_configuration=ner_model_configuration,
+            compact_artifacts=compact_artifacts,
+        )
         self.entity_key = "bert-base-ner"
 
     def load(self) -> None:
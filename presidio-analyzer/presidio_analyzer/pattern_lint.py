@@ -0,0 +1,272 @@
+import logging
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger("presidio-analyzer")
+
+# Group prefixes of lookarounds, which don't consume text
+_LOOKAROUND_PREFIXES = ("(?=", "(?!", "(?<=", "(?<!")
+
+# Tokens which may match punctuation, preventing a group from being delimited
+_PUNCTUATION_TOKENS = (".", "|", "[^", "\\W", "\\S", "\\D", "\\p", "\\P", "\\X")
+
+_SPECIAL_CHARS = "()[]{}.*+?|^$\\"
+
+
+class _Group:
+    def __init__(self, start: int, atomic: bool = False, lookaround: bool = False):
+        self.start = start
+        self.body_start = start + 1
+        self.atomic = atomic
+        self.lookaround = lookaround
+        # Whether the group contains an unbounded quantifier which can backtrack
+        self.has_unbounded_quantifier = False
+        # Whether each repetition of the group starts with a delimiter
+        self.delimited = False
+
+
+def _skip_class(regex: str, index: int) -> int:
+    """Return the index after the character class starting at index."""
+    index += 1
+    if index < len(regex) and regex[index] == "^":
+        index += 1
+    if index < len(regex) and regex[index] == "]":
+        index += 1
+    depth = 1
+    while index < len(regex):
+        char = regex[index]
+        if char == "\\":
+            index += 2
+            continue
+        if char == "[":
+            # Nested sets, e.g. [[a-z]--[aeiou]]
+            depth += 1
+        elif char == "]":
+            depth -= 1
+            if depth == 0:
+                return index + 1
+        index += 1
+    return index
+
+
+def _is_delimited(body: str) -> bool:
+    r"""
+    Check if a group body starts with a delimiter not matched by the rest of it.
+
+    For example `[-.]\w+`: when the group is repeated, each repetition starts
+    at a delimiter, so the repetitions can't match the same text in several ways.
+
+    :param body: The regex inside the group
+    """
+    if body.startswith("["):
+        end = _skip_class(body, 0)
+        members = body[1 : end - 1]
+        if members.startswith("^"):
+            return False
+        delimiters = set()
+        index = 0
+        while index < len(members):
+            char = members[index]
+            if char == "\\" and index + 1 < len(members):
+                char = members[index + 1]
+                if char.isalnum():
+                    return False
+                index += 1
+            elif char == "-" and 0 < index < len(members) - 1:
+                # A range
+                return False
+            delimiters.add(char)
+            index += 1
+        rest = body[end:]
+    elif body.startswith("\\s"):
+        if "\\s" in body[2:]:
+            return False
+        delimiters = {" ", "\t", "\n", "\r"}
+        rest = body[2:]
+    elif body.startswith("\\") and len(body) > 1 and not body[1].isalnum():
+        delimiters = {body[1]}
+        rest = body[2:]
+    elif body and body[0] not in _SPECIAL_CHARS:
+        delimiters = {body[0]}
+        rest = body[1:]
+    else:
+        return False
+
+    if not delimiters or any(char.isalnum() or char == "_" for char in delimiters):
+        return False
+    if rest[:1] in ("*", "?", "{", "+"):
+        return False
+    return not any(char in rest for char in delimiters) and not any(
+        token in rest for token in _PUNCTUATION_TOKENS
+    )
+
+
+def _parse_quantifier(regex: str, index: int) -> Optional[Tuple[int, bool]]:
+    """
+    Parse the quantifier starting at index.
+
+    :return: The index after the quantifier and whether it is unbounded,
+    or None if there is no quantifier at index.
+    """
+    char = regex[index]
+    if char in "*+":
+        return index + 1, True
+    if char == "?":
+        return index + 1, False
+    if char != "{":
+        return None
+
+    end = regex.find("}", index)
+    if end == -1:
+        return None
+    bounds = regex[index + 1 : end].split(",")
+    if len(bounds) > 2 or not all(bound.strip().isdigit() for bound in bounds[:1]):
+        return None
+    if len(bounds) == 2 and bounds[1].strip() and not bounds[1].strip().isdigit():
+        return None
+    return end + 1, len(bounds) == 2 and not bounds[1].strip()
+
+
+def _parse_group_start(regex: str, index: int) -> Tuple[int, Optional[_Group]]:
+    """
+    Parse the group opening at index.
+
+    :return: The index after the group prefix, and the group,
+    or None if the parentheses don't open a group (e.g. inline flags or comments).
+    """
+    if not regex.startswith("(?", index):
+        return index + 1, _Group(index)
+
+    if regex.startswith(_LOOKAROUND_PREFIXES, index):
+        prefix_length = 4 if regex.startswith("(?<", index) else 3
+        group = _Group(index, lookaround=True)
+        end = index + prefix_length
+    elif regex.startswith("(?>", index):
+        group = _Group(index, atomic=True)
+        end = index + 3
+    elif regex.startswith(("(?P<", "(?<", "(?'"), index):
+        end = regex.find(">" if regex[index + 2] != "'" else "'", index + 3)
+        group = _Group(index)
+        end = end + 1 if end != -1 else len(regex)
+    elif regex.startswith(("(?#", "(?P="), index):
+        end = regex.find(")", index)
+        return (end + 1 if end != -1 else len(regex)), None
+    else:
+        # Non capturing groups, possibly with inline flags, e.g. (?:...), (?i:...)
+        # or flags applying to the rest of the regex, e.g. (?i)
+        end = index + 2
+        while end < len(regex) and regex[end] not in ":)":
+            end += 1
+        if end < len(regex) and regex[end] == ")":
+            return end + 1, None
+        group = _Group(index)
+        end += 1
+
+    group.body_start = end
+    return end, group
+
+
+def find_nested_quantifiers(regex: str) -> List[str]:
+    r"""
+    Find groups with an unbounded quantifier containing unbounded quantifiers.
+
+    Nested quantifiers, e.g. `(\w+\s?)*`, can match the same text in many ways,
+    and may cause catastrophic backtracking: matching time growing exponentially
+    with the length of the text when there is no match.
+    Atomic groups and possessive quantifiers, which don't backtrack, are ignored.
+    The check is static and approximate: it may miss some slow patterns,
+    and flag some patterns the regex engine handles efficiently.
+
+    :param regex: The regular expression to check
+    :return: The parts of the regex with nested quantifiers
+    """
+    return list(_find_nested_quantifiers(regex))
+
+
+@lru_cache(maxsize=4096)
+def _find_nested_quantifiers(regex: str) -> Tuple[str, ...]:
+    findings = []
+    stack = [_Group(0)]
+    # The last group closed, if it is the atom preceding the current position
+    last_group: Optional[_Group] = None
+    index = 0
+    while index < len(regex):
+        char = regex[index]
+
+        if char == "\\":
+            last_group = None
+            index += 2
+            continue
+
+        if char == "[":
+            last_group = None
+            index = _skip_class(regex, index)
+            continue
+
+        if char == "(":
+            last_group = None
+            index, group = _parse_group_start(regex, index)
+            if group:
+                stack.append(group)
+            continue
+
+        if char == ")":
+            if len(stack) > 1:
+                last_group = stack.pop()
+                last_group.delimited = _is_delimited(
+                    regex[last_group.body_start : index]
+                )
+                if last_group.has_unbounded_quantifier and not (
+                    last_group.atomic or last_group.lookaround
+                ):
+                    stack[-1].has_unbounded_quantifier = True
+            index += 1
+            continue
+
+        quantifier = _parse_quantifier(regex, index)
+        if quantifier is None:
+            last_group = None
+            index += 1
+            continue
+
+        end, unbounded = quantifier
+        possessive = end < len(regex) and regex[end] == "+"
+        if end < len(regex) and regex[end] in "?+":
+            end += 1
+
+        if unbounded and not possessive:
+            if (
+                last_group
+                and last_group.has_unbounded_quantifier
+                and not last_group.atomic
+                and not last_group.delimited
+            ):
+                findings.append(regex[last_group.start : end])
+            stack[-1].has_unbounded_quantifier = True
+
+        last_group = None
+        index = end
+
+    return tuple(findings)
+
+
+def lint_patterns(recognizers: List["EntityRecognizer"]) -> List[str]:  # noqa F821
+    """
+    Check the patterns of pattern recognizers, logging a warning for each issue.
+
+    :param recognizers: The recognizers to check, recognizers
+    without patterns are ignored
+    :return: A description of each issue found
+    """
+    issues = []
+    for recognizer in recognizers:
+        for pattern in getattr(recognizer, "patterns", None) or []:
+            for nested in find_nested_quantifiers(pattern.regex):
+                issue = (
+                    f"Pattern `{pattern.name}` of recognizer `{recognizer.name}` "
+                    f"contains nested quantifiers `{nested}`, "
+                    f"which may cause catastrophic backtracking"
+                )
+                logger.warning(issue)
+                issues.append(issue)
+    return issues
@@ -1,6 +1,7 @@
 import datetime
 import logging
-from typing import Dict, List, Optional
+import time
+from typing import Dict, FrozenSet, List, Optional
 
 import regex as re
 
@@ -11,7 +12,15 @@ from presidio_analyzer import (
     Pattern,
     RecognizerResult,
 )
+from presidio_analyzer.metrics_recorder import (
+    PATTERN_DURATION,
+    PATTERN_MATCHES,
+    PATTERN_TIMEOUTS,
+    PATTERN_VALIDATIONS,
+    get_metrics_recorder,
+)
 from presidio_analyzer.nlp_engine import NlpArtifacts
+from presidio_analyzer.regex_time_budget import RegexTimeout, get_regex_time_budget
 
 logger = logging.getLogger("presidio-analyzer")
 
@@ -28,8 +37,13 @@ class PatternRecognizer(LocalRecognizer):
     identified using a deny-list
     :param global_regex_flags: regex flags to be used in regex matching,
     including deny-lists.
+    :param regex_timeout: Maximum time in seconds for matching each pattern.
+    Patterns exceeding it are skipped. If None, the engine's default
+    (see `AnalyzerEngine`) applies, and matching is unlimited without one.
     """
 
+    regex_timeout: Optional[float] = None
+
     def __init__(
         self,
         supported_entity: str,
@@ -41,6 +55,7 @@ class PatternRecognizer(LocalRecognizer):
         deny_list_score: float = 1.0,
         global_regex_flags: Optional[int] = re.DOTALL | re.MULTILINE | re.IGNORECASE,
         version: str = "0.0.1",
+        regex_timeout: Optional[float] = None,
     ):
         if not supported_entity:
             raise ValueError("Pattern recognizer should be initialized with entity")
@@ -64,6 +79,7 @@ class PatternRecognizer(LocalRecognizer):
         self.context = context
         self.deny_list_score = deny_list_score
         self.global_regex_flags = global_regex_flags
+        self.regex_timeout = regex_timeout
 
         if deny_list:
             deny_list_pattern = self._deny_list_to_regex(deny_list)
@@ -72,6 +88,24 @@ class PatternRecognizer(LocalRecognizer):
         else:
             self.deny_list = []
 
+    @property
+    def required_nlp_artifacts(self) -> Optional[FrozenSet[str]]:
+        """
+        Return the NLP artifacts this recognizer reads (see `EntityRecognizer`).
+
+        Patterns only need the text. Subclasses overriding `analyze` or
+        `enhance_using_context` may read nlp_artifacts, so all artifacts
+        are computed for them, unless they set `required_nlp_artifacts`.
+        """
+        recognizer_class = type(self)
+        if (
+            recognizer_class.analyze is PatternRecognizer.analyze
+            and recognizer_class.enhance_using_context
+            is PatternRecognizer.enhance_using_context
+        ):
+            return frozenset()
+        return None
+
     def load(self):  # noqa D102
         pass
 
@@ -186,71 +220,206 @@ class PatternRecognizer(LocalRecognizer):
         flags = flags if flags else self.global_regex_flags
         results = []
         for pattern in self.patterns:
-            match_start_time = datetime.datetime.now()
-
-            # Compile regex if flags differ from flags the regex was compiled with
-            if not pattern.compiled_regex or pattern.compiled_with_flags != flags:
-                pattern.compiled_with_flags = flags
-                pattern.compiled_regex = re.compile(pattern.regex, flags=flags)
-
-            matches = pattern.compiled_regex.finditer(text)
-            match_time = datetime.datetime.now() - match_start_time
-            logger.debug(
-                "--- match_time[%s]: %s.%s seconds",
-                pattern.name,
-                match_time.seconds,
-                match_time.microseconds,
-            )
+            results.extend(self._analyze_pattern(text, pattern, flags))
+
+        results = EntityRecognizer.remove_duplicates(results)
+        return results
+
+    @staticmethod
+    def _get_compiled_regex(pattern: Pattern, flags: int) -> re.Pattern:
+        """
+        Return the compiled regex of a pattern, compiling it if needed.
+
+        The regex is recompiled if the flags differ from
+        the flags it was compiled with.
+
+        :param pattern: The pattern to compile
+        :param flags: regex flags
+        """
+        if not pattern.compiled_regex or pattern.compiled_with_flags != flags:
+            pattern.compiled_with_flags = flags
+            pattern.compiled_regex = re.compile(pattern.regex, flags=flags)
+        return pattern.compiled_regex
+
+    def _analyze_pattern(
+        self, text: str, pattern: Pattern, flags: int
+    ) -> List[RecognizerResult]:
+        """
+        Match a single pattern over the text and validate its matches.
+
+        Matching is limited by the recognizer's `regex_timeout` and by the
+        regex time budget of the running request, if any.
+        If the pattern exceeds its time budget, it is skipped:
+        no results are returned for it and the timeout is logged, recorded in
+        the request's budget (see `RegexTimeBudget`) and counted in the metrics.
+
+        :param text: text to analyze
+        :param pattern: The pattern to match
+        :param flags: regex flags
+        :return: A list of RecognizerResult, including duplicates
+        """
+        metrics = get_metrics_recorder()
+        if metrics.enabled:
+            pattern_start_time = time.perf_counter()
+            match_count = 0
+
+        timeout = self.regex_timeout
+        budget = get_regex_time_budget()
+        if budget is not None:
+            timeout = budget.get_timeout(timeout)
 
+        results = []
+        if timeout is not None and timeout <= 0:
+            # The request's time budget is exhausted
+            self._on_regex_timeout(text, pattern, 0)
+            return results
+
+        match_start_time = datetime.datetime.now()
+
+        compiled_regex = self._get_compiled_regex(pattern, flags)
+
+        matches = compiled_regex.finditer(text, timeout=timeout)
+        match_time = datetime.datetime.now() - match_start_time
+        logger.debug(
+            "--- match_time[%s]: %s.%s seconds",
+            pattern.name,
+            match_time.seconds,
+            match_time.microseconds,
+        )
+
+        try:
             for match in matches:
                 start, end = match.span()
-                current_match = text[start:end]
 
                 # Skip empty results
-                if current_match == "":
+                if start == end:
                     continue
 
-                score = pattern.score
+                if metrics.enabled:
+                    match_count += 1
 
-                validation_result = self.validate_result(current_match)
-                description = self.build_regex_explanation(
-                    self.name,
-                    pattern.name,
-                    pattern.regex,
-                    score,
-                    validation_result,
-                    flags,
+                pattern_result = self._create_pattern_result(
+                    text, pattern, start, end, flags
                 )
-                pattern_result = RecognizerResult(
-                    entity_type=self.supported_entities[0],
-                    start=start,
-                    end=end,
-                    score=score,
-                    analysis_explanation=description,
-                    recognition_metadata={
-                        RecognizerResult.RECOGNIZER_NAME_KEY: self.name,
-                        RecognizerResult.RECOGNIZER_IDENTIFIER_KEY: self.id,
-                    },
+                if pattern_result:
+                    results.append(pattern_result)
+        except TimeoutError:
+            self._on_regex_timeout(text, pattern, timeout)
+            results = []
+
+        if metrics.enabled:
+            labels = {"recognizer": self.name, "pattern": pattern.name}
+            metrics.record_duration(
+                PATTERN_DURATION, time.perf_counter() - pattern_start_time, labels
+            )
+            metrics.increment(PATTERN_MATCHES, match_count, labels)
+
+        return results
+
+    def _on_regex_timeout(self, text: str, pattern: Pattern, timeout: float) -> None:
+        """
+        Report a pattern which exceeded its time budget.
+
+        :param text: The text the pattern was matched against
+        :param pattern: The pattern which timed out
+        :param timeout: The time budget of the pattern in seconds
+        """
+        logger.warning(
+            "Pattern %s of recognizer %s exceeded its time budget of %s seconds "
+            "on a text of length %s, skipping it",
+            pattern.name,
+            self.name,
+            timeout,
+            len(text),
+        )
+
+        budget = get_regex_time_budget()
+        if budget is not None:
+            budget.add_timeout(
+                RegexTimeout(
+                    recognizer=self.name,
+                    pattern=pattern.name,
+                    timeout=timeout,
+                    text=text,
                 )
+            )
 
-                if validation_result is not None:
-                    if validation_result:
-                        pattern_result.score = EntityRecognizer.MAX_SCORE
-                    else:
-                        pattern_result.score = EntityRecognizer.MIN_SCORE
+        metrics = get_metrics_recorder()
+        if metrics.enabled:
+            metrics.increment(
+                PATTERN_TIMEOUTS,
+                labels={"recognizer": self.name, "pattern": pattern.name},
+            )
 
-                invalidation_result = self.invalidate_result(current_match)
-                if invalidation_result is not None and invalidation_result:
-                    pattern_result.score = EntityRecognizer.MIN_SCORE
+    def _create_pattern_result(
+        self, text: str, pattern: Pattern, start: int, end: int, flags: int
+    ) -> Optional[RecognizerResult]:
+        """
+        Create a result out of a single pattern match, after validating it.
+
+        :param text: The analyzed text
+        :param pattern: The pattern which matched
+        :param start: The start index of the match
+        :param end: The end index of the match
+        :param flags: regex flags used in the regex matching
+        :return: A RecognizerResult, or None if the match was invalidated
+        """
+        current_match = text[start:end]
+        score = pattern.score
+
+        validation_result = self.validate_result(current_match)
+        description = self.build_regex_explanation(
+            self.name,
+            pattern.name,
+            pattern.regex,
+            score,
+            validation_result,
+            flags,
+        )
+        pattern_result = RecognizerResult(
+            entity_type=self.supported_entities[0],
+            start=start,
+            end=end,
+            score=score,
+            analysis_explanation=description,
+            recognition_metadata={
+                RecognizerResult.RECOGNIZER_NAME_KEY: self.name,
+                RecognizerResult.RECOGNIZER_IDENTIFIER_KEY: self.id,
+            },
+        )
 
-                if pattern_result.score > EntityRecognizer.MIN_SCORE:
-                    results.append(pattern_result)
+        if validation_result is not None:
+            if validation_result:
+                pattern_result.score = EntityRecognizer.MAX_SCORE
+            else:
+                pattern_result.score = EntityRecognizer.MIN_SCORE
+
+        invalidation_result = self.invalidate_result(current_match)
+        if invalidation_result is not None and invalidation_result:
+            pattern_result.score = EntityRecognizer.MIN_SCORE
+
+        if validation_result is not None or invalidation_result:
+            metrics = get_metrics_recorder()
+            if metrics.enabled:
+                if invalidation_result:
+                    outcome = "invalidated"
+                else:
+                    outcome = "valid" if validation_result else "invalid"
+                metrics.increment(
+                    PATTERN_VALIDATIONS,
+                    labels={
+                        "recognizer": self.name,
+                        "pattern": pattern.name,
+                        "outcome": outcome,
+                    },
+                )
 
-                # Update analysis explanation score following validation or invalidation
-                description.score = pattern_result.score
+        # Update analysis explanation score following validation or invalidation
+        description.score = pattern_result.score
 
-        results = EntityRecognizer.remove_duplicates(results)
-        return results
+        if pattern_result.score > EntityRecognizer.MIN_SCORE:
+            return pattern_result
+        return None
 
     def to_dict(self) -> Dict:
         """Serialize instance into a dictionary."""
@@ -1,48 +1,56 @@
-"""Predefined recognizers package. Holds all the default recognizers."""
+"""
+Predefined recognizers package. Holds all the default recognizers.
 
-from presidio_analyzer.predefined_recognizers.transformers_recognizer import (
-    TransformersRecognizer,
-)
+Recognizer modules are imported on first access (PEP 562),
+so only the recognizers actually used are loaded.
+"""
 
-from .aba_routing_recognizer import AbaRoutingRecognizer
-from .au_abn_recognizer import AuAbnRecognizer
-from .au_acn_recognizer import AuAcnRecognizer
-from .au_medicare_recognizer import AuMedicareRecognizer
-from .au_tfn_recognizer import AuTfnRecognizer
-from .azure_ai_language import AzureAILanguageRecognizer
-from .credit_card_recognizer import CreditCardRecognizer
-from .crypto_recognizer import CryptoRecognizer
-from .date_recognizer import DateRecognizer
-from .email_recognizer import EmailRecognizer
-from .es_nie_recognizer import EsNieRecognizer
-from .es_nif_recognizer import EsNifRecognizer
-from .fi_personal_identity_code_recognizer import FiPersonalIdentityCodeRecognizer
-from .iban_recognizer import IbanRecognizer
-from .in_aadhaar_recognizer import InAadhaarRecognizer
-from .in_pan_recognizer import InPanRecognizer
-from .in_passport_recognizer import InPassportRecognizer
-from .in_vehicle_registration_recognizer import InVehicleRegistrationRecognizer
-from .in_voter_recognizer import InVoterRecognizer
-from .ip_recognizer import IpRecognizer
-from .it_driver_license_recognizer import ItDriverLicenseRecognizer
-from .it_fiscal_code_recognizer import ItFiscalCodeRecognizer
-from .it_identity_card_recognizer import ItIdentityCardRecognizer
-from .it_passport_recognizer import ItPassportRecognizer
-from .it_vat_code import ItVatCodeRecognizer
-from .medical_license_recognizer import MedicalLicenseRecognizer
-from .phone_recognizer import PhoneRecognizer
-from .pl_pesel_recognizer import PlPeselRecognizer
-from .sg_fin_recognizer import SgFinRecognizer
-from .sg_uen_recognizer import SgUenRecognizer
-from .spacy_recognizer import SpacyRecognizer
-from .stanza_recognizer import StanzaRecognizer
-from .uk_nhs_recognizer import NhsRecognizer
-from .url_recognizer import UrlRecognizer
-from .us_bank_recognizer import UsBankRecognizer
-from .us_driver_license_recognizer import UsLicenseRecognizer
-from .us_itin_recognizer import UsItinRecognizer
-from .us_passport_recognizer import UsPassportRecognizer
-from .us_ssn_recognizer import UsSsnRecognizer
+import importlib
+from typing import Any, List
+
+# Recognizer class name -> module defining it
+_RECOGNIZER_MODULES = {
+    "AbaRoutingRecognizer": "aba_routing_recognizer",
+    "AuAbnRecognizer": "au_abn_recognizer",
+    "AuAcnRecognizer": "au_acn_recognizer",
+    "AuMedicareRecognizer": "au_medicare_recognizer",
+    "AuTfnRecognizer": "au_tfn_recognizer",
+    "AzureAILanguageRecognizer": "azure_ai_language",
+    "CreditCardRecognizer": "credit_card_recognizer",
+    "CryptoRecognizer": "crypto_recognizer",
+    "DateRecognizer": "date_recognizer",
+    "EmailRecognizer": "email_recognizer",
+    "EsNieRecognizer": "es_nie_recognizer",
+    "EsNifRecognizer": "es_nif_recognizer",
+    "FiPersonalIdentityCodeRecognizer": "fi_personal_identity_code_recognizer",
+    "IbanRecognizer": "iban_recognizer",
+    "InAadhaarRecognizer": "in_aadhaar_recognizer",
+    "InPanRecognizer": "in_pan_recognizer",
+    "InPassportRecognizer": "in_passport_recognizer",
+    "InVehicleRegistrationRecognizer": "in_vehicle_registration_recognizer",
+    "InVoterRecognizer": "in_voter_recognizer",
+    "IpRecognizer": "ip_recognizer",
+    "ItDriverLicenseRecognizer": "it_driver_license_recognizer",
+    "ItFiscalCodeRecognizer": "it_fiscal_code_recognizer",
+    "ItIdentityCardRecognizer": "it_identity_card_recognizer",
+    "ItPassportRecognizer": "it_passport_recognizer",
+    "ItVatCodeRecognizer": "it_vat_code",
+    "MedicalLicenseRecognizer": "medical_license_recognizer",
+    "PhoneRecognizer": "phone_recognizer",
+    "PlPeselRecognizer": "pl_pesel_recognizer",
+    "SgFinRecognizer": "sg_fin_recognizer",
+    "SgUenRecognizer": "sg_uen_recognizer",
+    "SpacyRecognizer": "spacy_recognizer",
+    "StanzaRecognizer": "stanza_recognizer",
+    "TransformersRecognizer": "transformers_recognizer",
+    "NhsRecognizer": "uk_nhs_recognizer",
+    "UrlRecognizer": "url_recognizer",
+    "UsBankRecognizer": "us_bank_recognizer",
+    "UsLicenseRecognizer": "us_driver_license_recognizer",
+    "UsItinRecognizer": "us_itin_recognizer",
+    "UsPassportRecognizer": "us_passport_recognizer",
+    "UsSsnRecognizer": "us_ssn_recognizer",
+}
 
 PREDEFINED_RECOGNIZERS = [
     "PhoneRecognizer",
@@ -56,12 +64,33 @@ PREDEFINED_RECOGNIZERS = [
     "UrlRecognizer",
 ]
 
-NLP_RECOGNIZERS = {
-    "spacy": SpacyRecognizer,
-    "stanza": StanzaRecognizer,
-    "transformers": TransformersRecognizer,
+_NLP_RECOGNIZER_NAMES = {
+    "spacy": "SpacyRecognizer",
+    "stanza": "StanzaRecognizer",
+    "transformers": "TransformersRecognizer",
 }
 
+
+def __getattr__(name: str) -> Any:
+    if name in _RECOGNIZER_MODULES:
+        module = importlib.import_module(f".{_RECOGNIZER_MODULES[name]}", __name__)
+        value = getattr(module, name)
+    elif name == "NLP_RECOGNIZERS":
+        value = {
+            engine_name: __getattr__(recognizer_name)
+            for engine_name, recognizer_name in _NLP_RECOGNIZER_NAMES.items()
+        }
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
 __all__ = [
     "AbaRoutingRecognizer",
     "CreditCardRecognizer",
@@ -4,10 +4,14 @@ from typing import List, Optional
 
 try:
     from azure.ai.textanalytics import TextAnalyticsClient
+    from azure.ai.textanalytics.aio import (
+        TextAnalyticsClient as AsyncTextAnalyticsClient,
+    )
     from azure.core.credentials import AzureKeyCredential
 
 except ImportError:
     TextAnalyticsClient = None
+    AsyncTextAnalyticsClient = None
     AzureKeyCredential = None
 from presidio_analyzer import AnalysisExplanation, RecognizerResult, RemoteRecognizer
 from presidio_analyzer.nlp_engine import NlpArtifacts
@@ -18,6 +22,8 @@ logger = logging.getLogger("presidio-analyzer")
 class AzureAILanguageRecognizer(RemoteRecognizer):
     """Wrapper for PII detection using Azure AI Language."""
 
+    required_nlp_artifacts = frozenset()
+
     def __init__(
         self,
         supported_entities: Optional[List[str]] = None,
@@ -25,6 +31,7 @@ class AzureAILanguageRecognizer(RemoteRecognizer):
         ta_client: Optional["TextAnalyticsClient"] = None,
         azure_ai_key: Optional[str] = None,
         azure_ai_endpoint: Optional[str] = None,
+        ta_async_client: Optional["AsyncTextAnalyticsClient"] = None,
     ):
         """
         Wrap the PII detection in Azure AI Language.
@@ -36,6 +43,11 @@ class AzureAILanguageRecognizer(RemoteRecognizer):
         the client will be created using the key and endpoint.
         :param azure_ai_key: Azure AI for language key
         :param azure_ai_endpoint: Azure AI for language endpoint
+        :param ta_async_client: object of type
+        azure.ai.textanalytics.aio.TextAnalyticsClient, used by `analyze_async`.
+        If missing and ta_client is missing, the client will be created
+        using the key and endpoint. Otherwise, `analyze_async` runs `analyze`
+        in a thread.
 
         For more info, see https://learn.microsoft.com/en-us/azure/ai-services/language-service/personally-identifiable-information/overview
         """  # noqa E501
@@ -60,8 +72,15 @@ class AzureAILanguageRecognizer(RemoteRecognizer):
             self.supported_entities = self.__get_azure_ai_supported_entities()
 
         if not ta_client:
-            ta_client = self.__authenticate_client(azure_ai_key, azure_ai_endpoint)
+            ta_client = self.__authenticate_client(
+                azure_ai_key, azure_ai_endpoint, TextAnalyticsClient
+            )
+            if not ta_async_client and AsyncTextAnalyticsClient:
+                ta_async_client = self.__authenticate_client(
+                    azure_ai_key, azure_ai_endpoint, AsyncTextAnalyticsClient
+                )
         self.ta_client = ta_client
+        self.ta_async_client = ta_async_client
 
     def get_supported_entities(self) -> List[str]:
         """
@@ -79,11 +98,14 @@ class AzureAILanguageRecognizer(RemoteRecognizer):
         return [r.value.upper() for r in PiiEntityCategory]
 
     @staticmethod
-    def __authenticate_client(key: str, endpoint: str) -> TextAnalyticsClient:
+    def __authenticate_client(
+        key: str, endpoint: str, client_class: type
+    ) -> "TextAnalyticsClient":
         """Authenticate the client using the key and endpoint.
 
         :param key: Azure AI Language key
         :param endpoint: Azure AI Language endpoint
+        :param client_class: The (sync or async) TextAnalyticsClient class
         """
         key = key if key else os.getenv("AZURE_AI_KEY", None)
         endpoint = endpoint if endpoint else os.getenv("AZURE_AI_ENDPOINT", None)
@@ -100,7 +122,7 @@ class AzureAILanguageRecognizer(RemoteRecognizer):
             )
 
         ta_credential = AzureKeyCredential(key)
-        text_analytics_client = TextAnalyticsClient(
+        text_analytics_client = client_class(
             endpoint=endpoint, credential=ta_credential
         )
         return text_analytics_client
@@ -121,6 +143,37 @@ class AzureAILanguageRecognizer(RemoteRecognizer):
         response = self.ta_client.recognize_pii_entities(
             [text], language=self.supported_language
         )
+        return self._to_recognizer_results(response, entities)
+
+    async def analyze_async(
+        self, text: str, entities: List[str] = None, nlp_artifacts: NlpArtifacts = None
+    ) -> List[RecognizerResult]:
+        """
+        Analyze text using the async Azure AI Language client.
+
+        Falls back to running `analyze` in a thread if no async client exists.
+
+        :param text: Text to analyze
+        :param entities: List of entities to return
+        :param nlp_artifacts: Object of type NlpArtifacts, not used in this recognizer.
+        :return: A list of RecognizerResult, one per each entity found in the text.
+        """
+        if not self.ta_async_client:
+            return await super().analyze_async(
+                text=text, entities=entities, nlp_artifacts=nlp_artifacts
+            )
+
+        if not entities:
+            entities = self.supported_entities
+        response = await self.ta_async_client.recognize_pii_entities(
+            [text], language=self.supported_language
+        )
+        return self._to_recognizer_results(response, entities)
+
+    def _to_recognizer_results(
+        self, response: List, entities: List[str]
+    ) -> List[RecognizerResult]:
+        """Translate an Azure AI Language response into RecognizerResults."""
         results = [doc for doc in response if not doc.is_error]
         recognizer_results = []
         for res in results:
@@ -49,6 +49,9 @@ class IbanRecognizer(PatternRecognizer):
 
     CONTEXT = ["iban", "bank", "transaction"]
 
+    # analyze is overridden, but only reads the text
+    required_nlp_artifacts = frozenset()
+
     LETTERS: Dict[int, str] = {
         ord(d): str(i) for i, d in enumerate(string.digits + string.ascii_uppercase)
     }
@@ -27,6 +27,8 @@ class PhoneRecognizer(LocalRecognizer):
     CONTEXT = ["phone", "number", "telephone", "cell", "cellphone", "mobile", "call"]
     DEFAULT_SUPPORTED_REGIONS = ("US", "UK", "DE", "FE", "IL", "IN", "CA", "BR")
 
+    required_nlp_artifacts = frozenset()
+
     def __init__(
         self,
         context: Optional[List[str]] = None,
@@ -7,6 +7,7 @@ from presidio_analyzer import (
     LocalRecognizer,
     RecognizerResult,
 )
+from presidio_analyzer.nlp_engine import NlpArtifacts
 
 logger = logging.getLogger("presidio-analyzer")
 
@@ -23,6 +24,8 @@ class SpacyRecognizer(LocalRecognizer):
 
     ENTITIES = ["DATE_TIME", "NRP", "LOCATION", "PERSON", "ORGANIZATION"]
 
+    required_nlp_artifacts = frozenset({NlpArtifacts.ENTITIES})
+
     DEFAULT_EXPLANATION = "Identified as {} by Spacy's Named Entity Recognition"
 
     # deprecated, use MODEL_TO_PRESIDIO_MAPPING in NerModelConfiguration instead
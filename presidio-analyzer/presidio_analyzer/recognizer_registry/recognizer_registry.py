@@ -1,18 +1,16 @@
-import copy
 import logging
+import sys
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Type, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Type, Union
 
 import regex as re
 import yaml
 
 from presidio_analyzer import EntityRecognizer, PatternRecognizer
-from presidio_analyzer.nlp_engine import (
-    NlpEngine,
-    SpacyNlpEngine,
-    StanzaNlpEngine,
-    TransformersNlpEngine,
-)
+from presidio_analyzer.combined_pattern_matcher import CombinedPatternMatcher
+from presidio_analyzer.nlp_engine import NlpEngine
+from presidio_analyzer.pattern_lint import lint_patterns
 from presidio_analyzer.predefined_recognizers import (
     SpacyRecognizer,
     StanzaRecognizer,
@@ -26,6 +24,77 @@ from presidio_analyzer.recognizer_registry.recognizers_loader_utils import (
 logger = logging.getLogger("presidio-analyzer")
 
 
+def _is_nlp_engine_instance(
+    nlp_engine: Optional[NlpEngine], module_name: str, class_name: str
+) -> bool:
+    """
+    Check if the NLP engine is an instance of one of the engine classes.
+
+    The engine's module is not imported if it wasn't already,
+    as it imports an NLP package, and nlp_engine can't be its instance anyway.
+    """
+    module = sys.modules.get(f"presidio_analyzer.nlp_engine.{module_name}")
+    return module is not None and isinstance(nlp_engine, getattr(module, class_name))
+
+
+class _RecognizerIndex:
+    """
+    The recognizers of a registry indexed by language and entity.
+
+    :param recognizers: The registry's recognizers
+    :param key: Identifies the state of the registry the index was built for
+    """
+
+    # Maximal number of memoised entity selections
+    MAX_SELECTIONS = 1024
+
+    def __init__(self, recognizers: List[EntityRecognizer], key: Tuple):
+        self.key = key
+        self.by_language: Dict[str, List[EntityRecognizer]] = defaultdict(list)
+        self.by_entity: Dict[Tuple[str, str], List[EntityRecognizer]] = defaultdict(
+            list
+        )
+        for recognizer in recognizers:
+            language = recognizer.supported_language
+            self.by_language[language].append(recognizer)
+            for entity in set(recognizer.supported_entities):
+                self.by_entity[(language, entity)].append(recognizer)
+
+        self.supported_entities: Dict[str, List[str]] = {}
+        self.selections: Dict[Tuple, List[EntityRecognizer]] = {}
+
+    def select(self, language: str, entities: List[str]) -> List[EntityRecognizer]:
+        """Return the recognizers supporting any of the entities in the language."""
+        selection_key = (language, tuple(entities))
+        selection = self.selections.get(selection_key)
+        if selection is None:
+            selection = list(
+                dict.fromkeys(
+                    recognizer
+                    for entity in entities
+                    for recognizer in self.by_entity.get((language, entity), [])
+                )
+            )
+            if len(self.selections) >= self.MAX_SELECTIONS:
+                self.selections.clear()
+            self.selections[selection_key] = selection
+        return selection
+
+    def get_supported_entities(self, language: str) -> List[str]:
+        """Return the entities supported by the recognizers of the language."""
+        entities = self.supported_entities.get(language)
+        if entities is None:
+            entities = list(
+                dict.fromkeys(
+                    entity
+                    for recognizer in self.by_language.get(language, [])
+                    for entity in recognizer.get_supported_entities()
+                )
+            )
+            self.supported_entities[language] = entities
+        return entities
+
+
 class RecognizerRegistry:
     """
     Detect, register and hold all recognizers to be used by the analyzer.
@@ -35,6 +104,9 @@ class RecognizerRegistry:
     :param global_regex_flags : regex flags to be used in regex matching,
     including deny-lists
 
+    The patterns of the recognizers added to the registry are checked
+    for nested quantifiers, which may cause catastrophic backtracking
+    (see `find_nested_quantifiers`), and a warning is logged for each one found.
     """
 
     def __init__(
@@ -45,12 +117,61 @@ class RecognizerRegistry:
     ):
         if recognizers:
             self.recognizers = recognizers
+            lint_patterns(self.recognizers)
         else:
             self.recognizers = []
         self.global_regex_flags = global_regex_flags
         self.supported_languages = (
             supported_languages if supported_languages else ["en"]
         )
+        self._combined_pattern_matchers: Dict[Tuple, CombinedPatternMatcher] = {}
+        self._version = 0
+        self._index: Optional[_RecognizerIndex] = None
+
+    @property
+    def version(self) -> int:
+        """
+        Return a counter incremented whenever recognizers are added or removed.
+
+        Only changes made using the registry's methods are counted.
+        """
+        return self._version
+
+    @property
+    def recognizers_key(self) -> Tuple[int, int, int]:
+        """
+        Return a key changing whenever the recognizers change.
+
+        Besides the version, the key includes the identity and length of the
+        `recognizers` list, to also detect changes made to it directly.
+        """
+        return (self._version, id(self.recognizers), len(self.recognizers))
+
+    def _on_recognizers_changed(self) -> None:
+        """Invalidate state derived from the list of recognizers."""
+        self._combined_pattern_matchers.clear()
+        self._version += 1
+        self._index = None
+
+    def __getstate__(self) -> Dict:
+        """Return the state to pickle, without the state derived from recognizers."""
+        state = self.__dict__.copy()
+        state["_combined_pattern_matchers"] = {}
+        state["_index"] = None
+        return state
+
+    def _get_index(self) -> _RecognizerIndex:
+        """
+        Return the index of the recognizers, rebuilding it if they changed.
+
+        The index is checked against `recognizers_key`.
+        """
+        key = self.recognizers_key
+        index = self._index
+        if index is None or index.key != key:
+            index = _RecognizerIndex(self.recognizers, key)
+            self._index = index
+        return index
 
     def _create_nlp_recognizer(
         self, nlp_engine: NlpEngine = None, supported_language: str = None
@@ -86,6 +207,7 @@ class RecognizerRegistry:
                 for supported_language in supported_languages
             ]
         )
+        self._on_recognizers_changed()
 
     def load_predefined_recognizers(
         self, languages: Optional[List[str]] = None, nlp_engine: NlpEngine = None
@@ -106,8 +228,10 @@ class RecognizerRegistry:
             registry_configuration=registry_configuration
         )
         recognizers = RecognizerListLoader.get(**configuration)
+        lint_patterns(recognizers)
 
         self.recognizers.extend(recognizers)
+        self._on_recognizers_changed()
         self.add_nlp_recognizer(nlp_engine=nlp_engine)
 
     @staticmethod
@@ -116,11 +240,15 @@ class RecognizerRegistry:
     ) -> Type[SpacyRecognizer]:
         """Return the recognizer leveraging the selected NLP Engine."""
 
-        if isinstance(nlp_engine, StanzaNlpEngine):
+        if _is_nlp_engine_instance(nlp_engine, "stanza_nlp_engine", "StanzaNlpEngine"):
             return StanzaRecognizer
-        if isinstance(nlp_engine, TransformersNlpEngine):
+        if _is_nlp_engine_instance(
+            nlp_engine, "transformers_nlp_engine", "TransformersNlpEngine"
+        ):
             return TransformersRecognizer
-        if not nlp_engine or isinstance(nlp_engine, SpacyNlpEngine):
+        if not nlp_engine or _is_nlp_engine_instance(
+            nlp_engine, "spacy_nlp_engine", "SpacyNlpEngine"
+        ):
             return SpacyRecognizer
         else:
             logger.warning(
@@ -154,36 +282,36 @@ class RecognizerRegistry:
         if entities is None and all_fields is False:
             raise ValueError("No entities provided")
 
-        all_possible_recognizers = copy.copy(self.recognizers)
-        if ad_hoc_recognizers:
-            all_possible_recognizers.extend(ad_hoc_recognizers)
+        index = self._get_index()
+        ad_hoc_recognizers = [
+            rec
+            for rec in ad_hoc_recognizers or []
+            if language == rec.supported_language
+        ]
 
         # filter out unwanted recognizers
-        to_return = set()
         if all_fields:
-            to_return = [
-                rec
-                for rec in all_possible_recognizers
-                if language == rec.supported_language
-            ]
+            to_return = index.by_language.get(language, []) + ad_hoc_recognizers
         else:
-            for entity in entities:
-                subset = [
+            to_return = list(index.select(language, entities))
+            if ad_hoc_recognizers:
+                to_return.extend(
                     rec
-                    for rec in all_possible_recognizers
-                    if entity in rec.supported_entities
-                    and language == rec.supported_language
-                ]
+                    for rec in ad_hoc_recognizers
+                    if any(entity in rec.supported_entities for entity in entities)
+                    and rec not in to_return
+                )
 
-                if not subset:
+            for entity in entities:
+                if (language, entity) not in index.by_entity and not any(
+                    entity in rec.supported_entities for rec in ad_hoc_recognizers
+                ):
                     logger.warning(
                         "Entity %s doesn't have the corresponding"
                         " recognizer in language : %s",
                         entity,
                         language,
                     )
-                else:
-                    to_return.update(set(subset))
 
         logger.debug(
             "Returning a total of %s recognizers",
@@ -193,7 +321,48 @@ class RecognizerRegistry:
         if not to_return:
             raise ValueError("No matching recognizers were found to serve the request.")
 
-        return list(to_return)
+        return to_return
+
+    def get_combined_pattern_matcher(
+        self, recognizers: List[EntityRecognizer]
+    ) -> Optional[CombinedPatternMatcher]:
+        """
+        Return a matcher running the patterns of the given recognizers in one pass.
+
+        Only pattern recognizers held by this registry are combined,
+        ad-hoc recognizers and recognizers with custom `analyze` logic
+        should be called directly.
+        The matcher is compiled once per set of recognizers and cached.
+
+        :param recognizers: The recognizers selected for the current request
+        :return: A CombinedPatternMatcher, or None if no recognizer can be combined
+        """
+        registry_recognizer_ids = {rec.id for rec in self.recognizers}
+        combinable = [
+            rec
+            for rec in recognizers
+            if rec.id in registry_recognizer_ids
+            and CombinedPatternMatcher.is_combinable(rec)
+        ]
+        if not combinable:
+            return None
+
+        key = tuple(
+            (
+                rec.id,
+                rec.global_regex_flags,
+                tuple(pattern.regex for pattern in rec.patterns),
+            )
+            for rec in combinable
+        )
+        if key not in self._combined_pattern_matchers:
+            logger.debug(
+                "Creating a combined pattern matcher for %s recognizers",
+                len(combinable),
+            )
+            self._combined_pattern_matchers[key] = CombinedPatternMatcher(combinable)
+
+        return self._combined_pattern_matchers[key]
 
     def add_recognizer(self, recognizer: EntityRecognizer) -> None:
         """
@@ -204,7 +373,9 @@ class RecognizerRegistry:
         if not isinstance(recognizer, EntityRecognizer):
             raise ValueError("Input is not of type EntityRecognizer")
 
+        lint_patterns([recognizer])
         self.recognizers.append(recognizer)
+        self._on_recognizers_changed()
 
     def remove_recognizer(
         self, recognizer_name: str, language: Optional[str] = None
@@ -244,6 +415,7 @@ class RecognizerRegistry:
             )
 
         self.recognizers = new_recognizers
+        self._on_recognizers_changed()
 
     def add_pattern_recognizer_from_dict(self, recognizer_dict: Dict) -> None:
         """
@@ -324,11 +496,13 @@ class RecognizerRegistry:
         if not languages:
             languages = self._get_supported_languages()
 
+        index = self._get_index()
         supported_entities = []
         for language in languages:
-            recognizers = self.get_recognizers(language=language, all_fields=True)
-
-            for recognizer in recognizers:
-                supported_entities.extend(recognizer.get_supported_entities())
+            if not index.by_language.get(language):
+                raise ValueError(
+                    "No matching recognizers were found to serve the request."
+                )
+            supported_entities.extend(index.get_supported_entities(language))
 
         return list(set(supported_entities))
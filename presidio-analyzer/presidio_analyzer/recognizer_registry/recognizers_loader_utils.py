@@ -7,7 +7,11 @@ from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
 
 import yaml
 
-from presidio_analyzer import EntityRecognizer, PatternRecognizer
+from presidio_analyzer import (
+    EntityRecognizer,
+    PatternRecognizer,
+    predefined_recognizers,
+)
 
 logger = logging.getLogger("presidio-analyzer")
 
@@ -112,15 +116,16 @@ class RecognizerListLoader:
 
     @staticmethod
     def _is_language_supported_globally(
-        recognizer: EntityRecognizer,
+        recognizer_name: str,
+        language: str,
         supported_languages: Iterable[str],
     ) -> bool:
-        if recognizer.supported_language not in supported_languages:
+        if language not in supported_languages:
             logger.warning(
                 f"Recognizer not added to registry because "
                 f"language is not supported by registry - "
-                f"{recognizer.name} supported "
-                f"languages: {recognizer.supported_language}"
+                f"{recognizer_name} supported "
+                f"languages: {language}"
                 f", registry supported languages: "
                 f"{', '.join(supported_languages)}"
             )
@@ -184,6 +189,10 @@ class RecognizerListLoader:
 
         :param recognizer_name: The name of the recognizer.
         """
+        # Predefined recognizers are imported on demand
+        if recognizer_name in predefined_recognizers.__all__:
+            return getattr(predefined_recognizers, recognizer_name)
+
         all_existing_recognizers = RecognizerListLoader._get_all_existing_recognizers()
         for recognizer in all_existing_recognizers:
             if recognizer_name == recognizer.__name__:
@@ -208,25 +217,41 @@ class RecognizerListLoader:
         recognizer_instances = []
         predefined, custom = RecognizerListLoader._split_recognizers(recognizers)
         for recognizer_conf in predefined:
-            for language_conf in RecognizerListLoader._get_recognizer_languages(
-                recognizer_conf=recognizer_conf, supported_languages=supported_languages
-            ):
-                if RecognizerListLoader._is_recognizer_enabled(recognizer_conf):
-                    copied_recognizer_conf = {
-                        k: v
-                        for k, v in RecognizerListLoader._get_recognizer_items(
-                            recognizer_conf=recognizer_conf
-                        )
-                        if k not in ["enabled", "type", "supported_languages", "name"]
-                    }
-                    kwargs = {**copied_recognizer_conf, **language_conf}
-                    recognizer_name = RecognizerListLoader._get_recognizer_name(
+            if not RecognizerListLoader._is_recognizer_enabled(recognizer_conf):
+                continue
+
+            recognizer_name = RecognizerListLoader._get_recognizer_name(
+                recognizer_conf=recognizer_conf
+            )
+            # Only instantiate recognizers in the supported languages
+            language_confs = [
+                language_conf
+                for language_conf in RecognizerListLoader._get_recognizer_languages(
+                    recognizer_conf=recognizer_conf,
+                    supported_languages=supported_languages,
+                )
+                if RecognizerListLoader._is_language_supported_globally(
+                    recognizer_name=recognizer_name,
+                    language=language_conf["supported_language"],
+                    supported_languages=supported_languages,
+                )
+            ]
+            if not language_confs:
+                continue
+
+            recognizer_cls = RecognizerListLoader._get_existing_recognizer_cls(
+                recognizer_name=recognizer_name
+            )
+            for language_conf in language_confs:
+                copied_recognizer_conf = {
+                    k: v
+                    for k, v in RecognizerListLoader._get_recognizer_items(
                         recognizer_conf=recognizer_conf
                     )
-                    recognizer_cls = RecognizerListLoader._get_existing_recognizer_cls(
-                        recognizer_name=recognizer_name
-                    )
-                    recognizer_instances.append(recognizer_cls(**kwargs))
+                    if k not in ["enabled", "type", "supported_languages", "name"]
+                }
+                kwargs = {**copied_recognizer_conf, **language_conf}
+                recognizer_instances.append(recognizer_cls(**kwargs))
 
         for recognizer_conf in custom:
             if RecognizerListLoader._is_recognizer_enabled(recognizer_conf):
@@ -245,7 +270,9 @@ class RecognizerListLoader:
             recognizer
             for recognizer in recognizer_instances
             if RecognizerListLoader._is_language_supported_globally(
-                recognizer=recognizer, supported_languages=supported_languages
+                recognizer_name=recognizer.name,
+                language=recognizer.supported_language,
+                supported_languages=supported_languages,
             )
         ]
 
@@ -0,0 +1,99 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, NamedTuple, Optional
+
+
+class RegexTimeout(NamedTuple):
+    """
+    A pattern whose matching was stopped because it exceeded its time budget.
+
+    :param recognizer: Name of the recognizer of the pattern
+    :param pattern: Name of the pattern
+    :param timeout: The time budget in seconds the pattern exceeded
+    :param text: The text the pattern was matched against
+    """
+
+    recognizer: str
+    pattern: str
+    timeout: float
+    text: str
+
+
+class RegexTimeBudget:
+    """
+    Limits the time spent matching regex patterns during a single request.
+
+    Created by `AnalyzerEngine` for each request, and used by
+    `PatternRecognizer` to set the `timeout` of the regex matching.
+    Patterns exceeding their time budget are skipped and recorded in `timeouts`.
+
+    :param pattern_timeout: Maximum time in seconds for matching a single pattern,
+    for recognizers which don't define their own `regex_timeout`.
+    If None, patterns are only limited by the request timeout.
+    :param request_timeout: Maximum time in seconds, from the creation
+    of the budget, after which patterns are not matched anymore.
+    If None, the request time is unlimited.
+    """
+
+    def __init__(
+        self,
+        pattern_timeout: Optional[float] = None,
+        request_timeout: Optional[float] = None,
+    ):
+        self.pattern_timeout = pattern_timeout
+        self.deadline = None
+        if request_timeout is not None:
+            self.deadline = time.monotonic() + request_timeout
+        self.timeouts: List[RegexTimeout] = []
+
+    def get_timeout(self, pattern_timeout: Optional[float] = None) -> Optional[float]:
+        """
+        Return the time budget for matching a pattern.
+
+        :param pattern_timeout: The pattern's own timeout, if defined.
+        Overrides the budget's default pattern timeout.
+        :return: The timeout in seconds (zero or less if the request budget
+        is exhausted), or None if unlimited.
+        """
+        if pattern_timeout is None:
+            pattern_timeout = self.pattern_timeout
+        if self.deadline is None:
+            return pattern_timeout
+
+        remaining = self.deadline - time.monotonic()
+        if pattern_timeout is None:
+            return remaining
+        return min(pattern_timeout, remaining)
+
+    def add_timeout(self, timeout: RegexTimeout) -> None:
+        """
+        Record a pattern which exceeded its time budget.
+
+        :param timeout: The pattern timeout
+        """
+        self.timeouts.append(timeout)
+
+
+_current_regex_time_budget: ContextVar[Optional[RegexTimeBudget]] = ContextVar(
+    "presidio_regex_time_budget", default=None
+)
+
+
+def get_regex_time_budget() -> Optional[RegexTimeBudget]:
+    """Return the regex time budget of the `analyze` call currently running."""
+    return _current_regex_time_budget.get()
+
+
+@contextmanager
+def use_regex_time_budget(budget: Optional[RegexTimeBudget]) -> Iterator[None]:
+    """
+    Set the budget returned by `get_regex_time_budget` within the context.
+
+    :param budget: The regex time budget to use
+    """
+    token = _current_regex_time_budget.set(budget)
+    try:
+        yield
+    finally:
+        _current_regex_time_budget.reset(token)
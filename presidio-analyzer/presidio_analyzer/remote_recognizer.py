@@ -1,4 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
+from functools import partial
 from typing import List, Optional
 
 from presidio_analyzer import EntityRecognizer
@@ -49,6 +51,29 @@ class RemoteRecognizer(ABC, EntityRecognizer):
         # 2. Translate results into List[RecognizerResult]
         pass
 
+    async def analyze_async(
+        self, text: str, entities: List[str], nlp_artifacts: NlpArtifacts
+    ):  # noqa ANN201
+        """
+        Call an external service for PII detection without blocking the event loop.
+
+        Used by `AnalyzerEngine.analyze_async`. Override this method to call
+        the service using an async client. The default implementation
+        runs `analyze` in the event loop's default executor.
+
+        :param text: text to be analyzed
+        :param entities: Entities that should be looked for
+        :param nlp_artifacts: Additional metadata from the NLP engine
+        :return: List of identified PII entities
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            partial(
+                self.analyze, text=text, entities=entities, nlp_artifacts=nlp_artifacts
+            ),
+        )
+
     @abstractmethod
     def get_supported_entities(self) -> List[str]:  # noqa D102
         pass
@@ -30,9 +30,8 @@ class NlpEngineMock(NlpEngine):
     def process_batch(
         self, texts: Iterable[str], language: str, **kwargs
     ) -> Iterator[Tuple[str, NlpArtifacts]]:
-        texts = list(texts)
-        for i in range(len(texts)):
-            yield texts[i], self.nlp_artifacts
+        for text in texts:
+            yield text, self.nlp_artifacts
 
     def get_nlp_engine_configuration_as_dict(self) -> Dict:
         return {}
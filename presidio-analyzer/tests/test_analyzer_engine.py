@@ -1,4 +1,8 @@
+import asyncio
 import copy
+import pickle
+import threading
+import time
 from abc import ABC
 from contextlib import nullcontext
 from typing import List, Optional
@@ -8,12 +12,15 @@ import pytest
 
 from presidio_analyzer import (
     AnalyzerEngine,
+    AnalyzerResultCache,
     PatternRecognizer,
     Pattern,
     RecognizerRegistry,
     EntityRecognizer,
     RecognizerResult,
+    RemoteRecognizer,
 )
+from presidio_analyzer.analyzer_engine import _RecognizerDeadlines
 from presidio_analyzer.nlp_engine import (
     NlpArtifacts,
     SpacyNlpEngine,
@@ -935,3 +942,440 @@ def test_when_multiple_nameless_recognizers_context_is_correct(spacy_nlp_engine)
 
     for recognizer_result in recognizer_results:
         assert recognizer_result.score > 0.3
+
+
+def test_when_max_workers_then_results_identical_to_sequential(
+    loaded_registry, mock_nlp_engine
+):
+    text = (
+        "Credit card: 4095-2609-9393-4932, my phone is 425 8829090, "
+        "email is john@microsoft.com and my ip is 192.168.0.1"
+    )
+    sequential_engine = AnalyzerEngine(
+        registry=loaded_registry, nlp_engine=mock_nlp_engine
+    )
+    parallel_engine = AnalyzerEngine(
+        registry=loaded_registry, nlp_engine=mock_nlp_engine, max_workers=4
+    )
+
+    sequential_results = sequential_engine.analyze(text, language="en")
+    parallel_results = parallel_engine.analyze(text, language="en")
+
+    assert len(parallel_results) > 0
+    assert parallel_results == sequential_results
+
+
+def test_when_recognizer_times_out_then_its_results_are_dropped(mock_nlp_engine):
+    release = threading.Event()
+
+    class SlowRecognizer(EntityRecognizer, ABC):
+        def analyze(self, text: str, entities: List[str], nlp_artifacts: NlpArtifacts):
+            release.wait(timeout=5)
+            return [RecognizerResult("SLOW", 0, 4, 0.5)]
+
+    class FastRecognizer(EntityRecognizer, ABC):
+        def analyze(self, text: str, entities: List[str], nlp_artifacts: NlpArtifacts):
+            return [RecognizerResult("FAST", 5, 9, 0.5)]
+
+    registry = RecognizerRegistry(
+        recognizers=[
+            SlowRecognizer(supported_entities=["SLOW"]),
+            FastRecognizer(supported_entities=["FAST"]),
+        ]
+    )
+    analyzer_engine = AnalyzerEngine(
+        registry=registry,
+        nlp_engine=mock_nlp_engine,
+        max_workers=2,
+        recognizer_timeout=0.1,
+    )
+
+    try:
+        results = analyzer_engine.analyze("some text", language="en")
+    finally:
+        release.set()
+
+    assert [result.entity_type for result in results] == ["FAST"]
+
+
+class SleepingRecognizer(EntityRecognizer, ABC):
+    def __init__(self, entity: str, delay: float, release: threading.Event = None):
+        super().__init__(supported_entities=[entity], name=f"{entity} recognizer")
+        self.delay = delay
+        self.release = release
+
+    def analyze(self, text: str, entities: List[str], nlp_artifacts: NlpArtifacts):
+        if self.release is not None:
+            self.release.wait(timeout=self.delay)
+        else:
+            time.sleep(self.delay)
+        return [RecognizerResult(self.supported_entities[0], 0, 4, 0.5)]
+
+
+def test_when_recognizers_queued_then_timeout_measured_from_their_start(
+    mock_nlp_engine,
+):
+    # Together longer than the timeout, but each one within it
+    recognizers = [SleepingRecognizer(entity, 0.06) for entity in ("A", "B", "C")]
+    analyzer_engine = AnalyzerEngine(
+        registry=RecognizerRegistry(recognizers=recognizers),
+        nlp_engine=mock_nlp_engine,
+        max_workers=1,
+        recognizer_timeout=0.15,
+    )
+
+    results = analyzer_engine.analyze("some text", language="en")
+
+    assert sorted(result.entity_type for result in results) == ["A", "B", "C"]
+
+
+def test_when_workers_held_by_timed_out_recognizer_then_queued_recognizers_dropped(
+    mock_nlp_engine,
+):
+    release = threading.Event()
+    analyzer_engine = AnalyzerEngine(
+        registry=RecognizerRegistry(
+            recognizers=[
+                SleepingRecognizer("SLOW", 5, release),
+                SleepingRecognizer("FAST", 0),
+            ]
+        ),
+        nlp_engine=mock_nlp_engine,
+        max_workers=1,
+        recognizer_timeout=0.1,
+    )
+
+    start_time = time.monotonic()
+    try:
+        results = analyzer_engine.analyze("some text", language="en")
+    finally:
+        release.set()
+
+    assert results == []
+    assert time.monotonic() - start_time < 1
+
+
+def test_when_analyze_async_and_recognizers_queued_then_timeout_measured_from_start(
+    mock_nlp_engine,
+):
+    recognizers = [SleepingRecognizer(entity, 0.06) for entity in ("A", "B", "C")]
+    analyzer_engine = AnalyzerEngine(
+        registry=RecognizerRegistry(recognizers=recognizers),
+        nlp_engine=mock_nlp_engine,
+        max_workers=1,
+        recognizer_timeout=0.15,
+    )
+
+    results = asyncio.run(analyzer_engine.analyze_async("some text", language="en"))
+
+    assert sorted(result.entity_type for result in results) == ["A", "B", "C"]
+
+
+def test_when_engine_closed_then_thread_pool_shut_down(
+    loaded_registry, mock_nlp_engine
+):
+    text = "Credit card: 4095-2609-9393-4932, email is john@microsoft.com"
+    with AnalyzerEngine(
+        registry=loaded_registry, nlp_engine=mock_nlp_engine, max_workers=2
+    ) as analyzer_engine:
+        executor = analyzer_engine._executor
+        parallel_results = analyzer_engine.analyze(text, language="en")
+
+    assert executor._shutdown
+    assert analyzer_engine._executor is None
+    assert analyzer_engine.analyze(text, language="en") == parallel_results
+
+
+def test_when_engine_pickled_then_unpickled_engine_has_own_thread_pool(
+    loaded_registry, mock_nlp_engine
+):
+    text = "Credit card: 4095-2609-9393-4932, email is john@microsoft.com"
+    analyzer_engine = AnalyzerEngine(
+        registry=loaded_registry, nlp_engine=mock_nlp_engine, max_workers=2
+    )
+    loop = asyncio.new_event_loop()
+    analyzer_engine._remote_semaphores[loop] = asyncio.Semaphore(1)
+
+    unpickled_engine = pickle.loads(pickle.dumps(analyzer_engine))
+
+    assert unpickled_engine._executor is not None
+    assert unpickled_engine._executor is not analyzer_engine._executor
+    assert len(unpickled_engine._remote_semaphores) == 0
+    assert unpickled_engine.analyze(text, language="en") == analyzer_engine.analyze(
+        text, language="en"
+    )
+    loop.close()
+
+
+class AsyncRemoteRecognizerMock(RemoteRecognizer):
+    def __init__(self, entity: str, started: List[str], delay: float = 0.05):
+        super().__init__(
+            supported_entities=[entity],
+            name=f"{entity} remote recognizer",
+            supported_language="en",
+            version="1.0",
+        )
+        self.entity = entity
+        self.started = started
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+
+    def get_supported_entities(self) -> List[str]:
+        return self.supported_entities
+
+    def analyze(self, text: str, entities: List[str], nlp_artifacts: NlpArtifacts):
+        raise AssertionError("analyze_async should be awaited instead")
+
+    async def analyze_async(
+        self, text: str, entities: List[str], nlp_artifacts: NlpArtifacts
+    ):
+        self.started.append(self.entity)
+        await asyncio.sleep(self.delay)
+        return [RecognizerResult(self.entity, 0, 4, 0.5)]
+
+
+def test_when_analyze_async_then_results_identical_to_analyze(
+    loaded_registry, mock_nlp_engine
+):
+    text = (
+        "Credit card: 4095-2609-9393-4932, my phone is 425 8829090, "
+        "email is john@microsoft.com and my ip is 192.168.0.1"
+    )
+    for max_workers in (None, 4):
+        analyzer_engine = AnalyzerEngine(
+            registry=loaded_registry,
+            nlp_engine=mock_nlp_engine,
+            max_workers=max_workers,
+        )
+
+        sync_results = analyzer_engine.analyze(text, language="en")
+        async_results = asyncio.run(analyzer_engine.analyze_async(text, language="en"))
+
+        assert len(async_results) > 0
+        assert async_results == sync_results
+
+
+def test_when_analyze_async_then_remote_recognizers_limited_by_max_remote_requests(
+    mock_nlp_engine,
+):
+    started = []
+    remote_recognizers = [
+        AsyncRemoteRecognizerMock(entity, started) for entity in ("A", "B", "C")
+    ]
+    analyzer_engine = AnalyzerEngine(
+        registry=RecognizerRegistry(recognizers=remote_recognizers),
+        nlp_engine=mock_nlp_engine,
+        max_remote_requests=2,
+    )
+
+    async def analyze_and_count():
+        task = asyncio.ensure_future(
+            analyzer_engine.analyze_async("some text", language="en")
+        )
+        while len(started) < 2:
+            await asyncio.sleep(0.001)
+        in_flight = len(started)
+        return in_flight, await task
+
+    in_flight, results = asyncio.run(analyze_and_count())
+
+    assert in_flight == 2
+    assert sorted(result.entity_type for result in results) == ["A", "B", "C"]
+
+
+def test_when_analyze_async_and_recognizer_times_out_then_its_results_are_dropped(
+    mock_nlp_engine,
+):
+    started = []
+    analyzer_engine = AnalyzerEngine(
+        registry=RecognizerRegistry(
+            recognizers=[
+                AsyncRemoteRecognizerMock("SLOW", started, delay=5),
+                AsyncRemoteRecognizerMock("FAST", started, delay=0),
+            ]
+        ),
+        nlp_engine=mock_nlp_engine,
+        recognizer_timeout=0.1,
+    )
+
+    results = asyncio.run(analyzer_engine.analyze_async("some text", language="en"))
+
+    assert [result.entity_type for result in results] == ["FAST"]
+
+
+@pytest.mark.parametrize("max_remote_requests", [None, 2])
+def test_when_remote_recognizer_finishes_then_deadlines_progress_recorded(
+    mock_nlp_engine, max_remote_requests
+):
+    recognizer = AsyncRemoteRecognizerMock("A", [], delay=0.05)
+    analyzer_engine = AnalyzerEngine(
+        registry=RecognizerRegistry(recognizers=[recognizer]),
+        nlp_engine=mock_nlp_engine,
+        max_remote_requests=max_remote_requests,
+    )
+    deadlines = _RecognizerDeadlines(timeout=1)
+
+    asyncio.run(
+        analyzer_engine._analyze_remote_async(
+            recognizer,
+            text="some text",
+            entities=["A"],
+            nlp_artifacts=None,
+            deadlines=deadlines,
+        )
+    )
+
+    assert deadlines._last_progress >= deadlines._start_times[recognizer.id] + 0.04
+
+
+def test_when_get_required_nlp_artifacts_then_recognizer_requirements_combined(
+    mock_nlp_engine,
+):
+    from presidio_analyzer.predefined_recognizers import SpacyRecognizer
+
+    analyzer = AnalyzerEngine(
+        registry=RecognizerRegistryMock(), nlp_engine=mock_nlp_engine
+    )
+    no_context = PatternRecognizer(supported_entity="TITLE", deny_list=["Mr."])
+    with_context = PatternRecognizer(
+        supported_entity="TITLE", deny_list=["Mr."], context=["title"]
+    )
+
+    class CustomRecognizer(EntityRecognizer):
+        def load(self):
+            pass
+
+        def analyze(self, text, entities, nlp_artifacts=None):
+            return []
+
+    custom = CustomRecognizer(supported_entities=["CUSTOM"])
+
+    assert analyzer._get_required_nlp_artifacts([no_context]) == set()
+    assert analyzer._get_required_nlp_artifacts([no_context, with_context]) == {
+        NlpArtifacts.LEMMAS
+    }
+    assert analyzer._get_required_nlp_artifacts([SpacyRecognizer()]) == {
+        NlpArtifacts.ENTITIES
+    }
+    assert analyzer._get_required_nlp_artifacts([no_context, custom]) is None
+
+
+def test_when_snapshot_loaded_then_engine_identical(tmp_path):
+    registry = RecognizerRegistryMock()
+    registry.load_predefined_recognizers()
+    engine = AnalyzerEngine(
+        registry=registry,
+        nlp_engine=NlpEngineMock(),
+        default_score_threshold=0.3,
+        combined_pattern_matching=True,
+        result_cache=AnalyzerResultCache(max_size=5, ttl=60),
+    )
+    text = "Call 212-555-5555 or visit www.microsoft.com, card 4095-2609-9393-4932"
+    expected = engine.analyze(text, language="en")
+
+    snapshot_file = tmp_path / "analyzer.snapshot"
+    engine.save_snapshot(snapshot_file)
+    restored = AnalyzerEngine.load_snapshot(snapshot_file)
+
+    assert restored.analyze(text, language="en") == expected
+    assert restored.default_score_threshold == 0.3
+    assert restored.combined_pattern_matching
+    assert restored.result_cache.max_size == 5
+    assert restored.result_cache.ttl == 60
+    assert [rec.name for rec in restored.registry.recognizers] == [
+        rec.name for rec in registry.recognizers
+    ]
+
+
+def test_when_snapshot_fingerprint_differs_then_load_raises(tmp_path):
+    engine = AnalyzerEngine(
+        registry=RecognizerRegistryMock(), nlp_engine=NlpEngineMock()
+    )
+    snapshot_file = tmp_path / "analyzer.snapshot"
+    engine.save_snapshot(snapshot_file, fingerprint="conf-1")
+
+    assert AnalyzerEngine.load_snapshot(snapshot_file, fingerprint="conf-1")
+    assert AnalyzerEngine.load_snapshot(snapshot_file)
+    with pytest.raises(ValueError, match="fingerprint"):
+        AnalyzerEngine.load_snapshot(snapshot_file, fingerprint="conf-2")
+
+
+def test_when_snapshot_saved_by_other_version_then_load_raises(tmp_path, monkeypatch):
+    engine = AnalyzerEngine(
+        registry=RecognizerRegistryMock(), nlp_engine=NlpEngineMock()
+    )
+    snapshot_file = tmp_path / "analyzer.snapshot"
+    monkeypatch.setattr(
+        AnalyzerEngine, "_get_presidio_version", staticmethod(lambda: "0.0.1")
+    )
+    engine.save_snapshot(snapshot_file)
+    monkeypatch.undo()
+
+    with pytest.raises(ValueError, match="0.0.1"):
+        AnalyzerEngine.load_snapshot(snapshot_file)
+
+
+def test_when_warm_up_then_patterns_compiled(mock_nlp_engine):
+    registry = RecognizerRegistryMock()
+    registry.load_predefined_recognizers()
+    engine = AnalyzerEngine(registry=registry, nlp_engine=mock_nlp_engine)
+
+    engine.warm_up()
+
+    pattern_recognizers = [
+        rec for rec in registry.recognizers if isinstance(rec, PatternRecognizer)
+    ]
+    assert pattern_recognizers
+    for recognizer in pattern_recognizers:
+        for pattern in recognizer.patterns:
+            assert pattern.compiled_regex is not None
+            assert pattern.compiled_with_flags == re.DOTALL | re.MULTILINE | re.IGNORECASE
+
+
+def test_when_snapshot_without_nlp_models_then_models_loaded_on_restore(tmp_path):
+    import pickle
+
+    import spacy
+
+    model_path = tmp_path / "model"
+    spacy.blank("en").to_disk(model_path)
+    nlp_engine = SpacyNlpEngine(
+        models=[{"lang_code": "en", "model_name": str(model_path)}]
+    )
+    registry = RecognizerRegistryMock()
+    registry.load_predefined_recognizers()
+    engine = AnalyzerEngine(registry=registry, nlp_engine=nlp_engine)
+
+    snapshot_file = tmp_path / "analyzer.snapshot"
+    engine.save_snapshot(snapshot_file)
+
+    with open(snapshot_file, "rb") as f:
+        assert pickle.load(f)["nlp_engine"].nlp is None
+    assert engine.nlp_engine.nlp is not None
+
+    restored = AnalyzerEngine.load_snapshot(snapshot_file)
+    assert restored.nlp_engine.is_loaded()
+    assert len(restored.analyze("Call 212-555-5555", language="en")) == 1
+
+
+def test_when_snapshot_with_nlp_models_then_models_not_reloaded(tmp_path):
+    import shutil
+
+    import spacy
+
+    model_path = tmp_path / "model"
+    spacy.blank("en").to_disk(model_path)
+    nlp_engine = SpacyNlpEngine(
+        models=[{"lang_code": "en", "model_name": str(model_path)}]
+    )
+    registry = RecognizerRegistryMock()
+    registry.load_predefined_recognizers()
+    engine = AnalyzerEngine(registry=registry, nlp_engine=nlp_engine)
+
+    snapshot_file = tmp_path / "analyzer.snapshot"
+    engine.save_snapshot(snapshot_file, include_nlp_models=True)
+    shutil.rmtree(model_path)
+
+    restored = AnalyzerEngine.load_snapshot(snapshot_file)
+    assert len(restored.analyze("Call 212-555-5555", language="en")) == 1
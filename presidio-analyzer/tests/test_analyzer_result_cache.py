@@ -0,0 +1,225 @@
+import asyncio
+from itertools import islice
+
+import pytest
+
+from presidio_analyzer import (
+    AnalyzerEngine,
+    AnalyzerResultCache,
+    BatchAnalyzerEngine,
+    PatternRecognizer,
+    RecognizerResult,
+)
+from tests.mocks import AppTracerMock, NlpEngineMock, RecognizerRegistryMock
+
+
+class CountingNlpEngineMock(NlpEngineMock):
+    def __init__(self):
+        super().__init__()
+        self.processed_texts = []
+
+    def process_text(self, text, language):
+        self.processed_texts.append(text)
+        return super().process_text(text, language)
+
+    def process_batch(self, texts, language, **kwargs):
+        for text, nlp_artifacts in super().process_batch(texts, language, **kwargs):
+            self.processed_texts.append(text)
+            yield text, nlp_artifacts
+
+
+@pytest.fixture
+def nlp_engine():
+    return CountingNlpEngineMock()
+
+
+@pytest.fixture
+def cached_analyzer_engine(nlp_engine):
+    return AnalyzerEngine(
+        registry=RecognizerRegistryMock(),
+        nlp_engine=nlp_engine,
+        result_cache=AnalyzerResultCache(max_size=10),
+    )
+
+
+def test_when_cache_is_full_then_least_recently_used_is_evicted():
+    cache = AnalyzerResultCache(max_size=2)
+    cache.set("a", [])
+    cache.set("b", [])
+    cache.get("a")
+    cache.set("c", [])
+
+    assert cache.get("b") is None
+    assert cache.get("a") == []
+    assert cache.get("c") == []
+    assert cache.get_stats() == {"hits": 3, "misses": 1, "size": 2}
+
+
+def test_when_entry_expired_then_cache_misses(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(
+        "presidio_analyzer.analyzer_result_cache.time.monotonic", lambda: now[0]
+    )
+    cache = AnalyzerResultCache(ttl=10)
+    cache.set("a", [])
+
+    now[0] += 5
+    assert cache.get("a") == []
+
+    now[0] += 10
+    assert cache.get("a") is None
+    assert cache.get_stats()["size"] == 0
+
+
+def test_when_cached_results_modified_then_cache_unchanged():
+    cache = AnalyzerResultCache()
+    results = [RecognizerResult("PHONE_NUMBER", 0, 10, 0.4)]
+    cache.set("a", results)
+
+    results[0].score = 1.0
+    cache.get("a")[0].score = 1.0
+
+    assert cache.get("a") == [RecognizerResult("PHONE_NUMBER", 0, 10, 0.4)]
+
+
+def test_when_invalid_max_size_then_raises():
+    with pytest.raises(ValueError):
+        AnalyzerResultCache(max_size=0)
+
+
+def test_when_text_repeats_then_nlp_and_recognizers_run_once(
+    cached_analyzer_engine, nlp_engine
+):
+    text = "Call me at 2352351232"
+
+    first = cached_analyzer_engine.analyze(text, language="en")
+    second = cached_analyzer_engine.analyze(text, language="en")
+
+    assert first == second
+    assert len(first) == 1
+    assert first is not second
+    assert nlp_engine.processed_texts == [text]
+    assert cached_analyzer_engine.result_cache.hits == 1
+    assert cached_analyzer_engine.result_cache.misses == 1
+
+
+def test_when_parameters_differ_then_results_are_not_shared(cached_analyzer_engine):
+    text = "Call me at 2352351232"
+
+    assert len(cached_analyzer_engine.analyze(text, language="en")) == 1
+    assert cached_analyzer_engine.analyze(
+        text, language="en", score_threshold=0.9
+    ) == []
+    assert cached_analyzer_engine.analyze(
+        text, language="en", allow_list=["2352351232"]
+    ) == []
+    assert cached_analyzer_engine.result_cache.hits == 0
+
+
+def test_when_recognizer_added_then_cached_results_not_used(cached_analyzer_engine):
+    text = "Call me at 2352351232, Mr. Smith"
+    assert len(cached_analyzer_engine.analyze(text, language="en")) == 1
+
+    cached_analyzer_engine.registry.add_recognizer(
+        PatternRecognizer(supported_entity="TITLE", deny_list=["Mr."])
+    )
+
+    results = cached_analyzer_engine.analyze(text, language="en")
+    assert sorted(result.entity_type for result in results) == [
+        "PHONE_NUMBER",
+        "TITLE",
+    ]
+
+
+def test_when_recognizers_list_edited_then_cached_results_not_used(
+    cached_analyzer_engine,
+):
+    text = "Call me at 2352351232, Mr. Smith"
+    assert len(cached_analyzer_engine.analyze(text, language="en")) == 1
+
+    cached_analyzer_engine.registry.recognizers.append(
+        PatternRecognizer(supported_entity="TITLE", deny_list=["Mr."])
+    )
+
+    results = cached_analyzer_engine.analyze(text, language="en")
+    assert sorted(result.entity_type for result in results) == [
+        "PHONE_NUMBER",
+        "TITLE",
+    ]
+
+
+def test_when_decision_process_logged_then_requests_not_cached(nlp_engine):
+    app_tracer = AppTracerMock(enable_decision_process=True)
+    analyzer_engine = AnalyzerEngine(
+        registry=RecognizerRegistryMock(),
+        nlp_engine=nlp_engine,
+        app_tracer=app_tracer,
+        log_decision_process=True,
+        result_cache=AnalyzerResultCache(max_size=10),
+    )
+    text = "Call me at 2352351232"
+
+    analyzer_engine.analyze(text, language="en")
+    traces = app_tracer.get_msg_counter()
+    analyzer_engine.analyze(text, language="en")
+
+    assert app_tracer.get_msg_counter() == 2 * traces
+    assert nlp_engine.processed_texts == [text, text]
+    assert analyzer_engine.result_cache.get_stats()["size"] == 0
+
+
+def test_when_ad_hoc_recognizers_then_request_not_cached(cached_analyzer_engine):
+    title_recognizer = PatternRecognizer(supported_entity="TITLE", deny_list=["Mr."])
+
+    cached_analyzer_engine.analyze(
+        "Mr. Smith", language="en", ad_hoc_recognizers=[title_recognizer]
+    )
+
+    assert cached_analyzer_engine.result_cache.get_stats() == {
+        "hits": 0,
+        "misses": 0,
+        "size": 0,
+    }
+
+
+def test_when_analyze_async_then_cache_used(cached_analyzer_engine, nlp_engine):
+    text = "Call me at 2352351232"
+
+    sync_results = cached_analyzer_engine.analyze(text, language="en")
+    async_results = asyncio.run(
+        cached_analyzer_engine.analyze_async(text, language="en")
+    )
+
+    assert async_results == sync_results
+    assert nlp_engine.processed_texts == [text]
+
+
+def test_when_batch_texts_repeat_then_cached_texts_skip_nlp(
+    cached_analyzer_engine, nlp_engine
+):
+    texts = ["Call me at 2352351232", "Hi", "Call me at 2352351232", "Hi", "Bye"]
+    batch_analyzer = BatchAnalyzerEngine(analyzer_engine=cached_analyzer_engine)
+
+    results = batch_analyzer.analyze_iterator(texts, language="en", batch_size=1)
+
+    assert [len(result) for result in results] == [1, 0, 1, 0, 0]
+    assert nlp_engine.processed_texts == ["Call me at 2352351232", "Hi", "Bye"]
+
+
+def test_when_stream_texts_all_cached_then_results_yielded_with_bounded_look_ahead(
+    cached_analyzer_engine,
+):
+    text = "Call me at 2352351232"
+    cached_analyzer_engine.analyze(text, language="en")
+    read_texts = []
+
+    def endless_texts():
+        while True:
+            read_texts.append(text)
+            yield text
+
+    batch_analyzer = BatchAnalyzerEngine(analyzer_engine=cached_analyzer_engine)
+    results = batch_analyzer.analyze_stream(endless_texts(), language="en", batch_size=4)
+
+    assert [len(result) for result in islice(results, 10)] == [1] * 10
+    assert len(read_texts) <= 12
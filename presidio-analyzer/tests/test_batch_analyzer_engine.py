@@ -1,5 +1,24 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
 import pytest
-from presidio_analyzer import RecognizerResult, BatchAnalyzerEngine, DictAnalyzerResult
+from presidio_analyzer import (
+    AnalyzerEngine,
+    AnalyzerEngineProvider,
+    RecognizerResult,
+    BatchAnalyzerEngine,
+    DictAnalyzerResult,
+)
+from tests.mocks import NlpEngineMock, RecognizerRegistryMock
+
+
+class MockAnalyzerEngineProvider(AnalyzerEngineProvider):
+    """Creates the same engine as analyzer_engine_simple, in worker processes."""
+
+    def create_engine(self) -> AnalyzerEngine:
+        return AnalyzerEngine(
+            registry=RecognizerRegistryMock(), nlp_engine=NlpEngineMock()
+        )
 
 
 @pytest.fixture(scope="module")
@@ -42,6 +61,52 @@ def test_analyze_iterator_returns_list_of_recognizer_results(
 # fmt: on
 
 
+def test_analyze_iterator_async_returns_same_results_as_analyze_iterator(
+    batch_analyzer_engine_simple,
+):
+    texts = ["My name is David", "Call me at 2352351232", 1, 2121551234, ""]
+
+    results = asyncio.run(
+        batch_analyzer_engine_simple.analyze_iterator_async(
+            texts=texts, language="en", max_concurrency=2
+        )
+    )
+
+    assert results == batch_analyzer_engine_simple.analyze_iterator(
+        texts=texts, language="en"
+    )
+
+
+def test_analyze_iterator_async_reads_texts_as_they_are_analyzed(
+    batch_analyzer_engine_simple,
+):
+    read_texts = []
+    read_ahead = []
+
+    def generate_texts():
+        for i in range(10):
+            read_texts.append(i)
+            yield "x" * i + " Call me at 2352351232"
+
+    analyze_async = batch_analyzer_engine_simple.analyzer_engine.analyze_async
+
+    async def record_read_ahead(text, language, **kwargs):
+        read_ahead.append(len(read_texts))
+        await asyncio.sleep(0)
+        return await analyze_async(text=text, language=language, **kwargs)
+
+    batch_analyzer_engine_simple.analyzer_engine.analyze_async = record_read_ahead
+
+    results = asyncio.run(
+        batch_analyzer_engine_simple.analyze_iterator_async(
+            texts=generate_texts(), language="en", max_concurrency=2
+        )
+    )
+
+    assert [result[0].start for result in results] == [i + 12 for i in range(10)]
+    assert max(count - index for index, count in enumerate(read_ahead)) <= 2
+
+
 def test_analyze_dict_one_value_per_key(batch_analyzer_engine_simple):
 
     d = {
@@ -277,4 +342,85 @@ def test_batch_analyze_iterator_returns_list_of_recognizer_results(
 
     assert len(results) == len(expected_output)
     for result, expected_result in zip(results, expected_output):
-        assert result == expected_result
\ No newline at end of file
+        assert result == expected_result
+
+@pytest.mark.parametrize("n_process, batch_size", [(2, None), (2, 1), (3, 2)])
+def test_analyze_iterator_with_n_process_returns_results_in_order(
+    n_process, batch_size, batch_analyzer_engine_simple
+):
+    texts = ["My name is David", "Call me at 2352351232", 1, "", "202-555-1234"] * 5
+    expected_output = batch_analyzer_engine_simple.analyze_iterator(
+        texts=texts, language="en"
+    )
+
+    batch_analyzer = BatchAnalyzerEngine(
+        analyzer_engine_provider=MockAnalyzerEngineProvider()
+    )
+    results = batch_analyzer.analyze_iterator(
+        texts=iter(texts), language="en", batch_size=batch_size, n_process=n_process
+    )
+
+    assert results == expected_output
+
+
+def test_analyze_iterator_with_executor_returns_results_in_order(
+    batch_analyzer_engine_simple
+):
+    texts = ["Call me at 2352351232", "https://microsoft.com", "nothing here"] * 3
+    expected_output = batch_analyzer_engine_simple.analyze_iterator(
+        texts=texts, language="en"
+    )
+
+    batch_analyzer = BatchAnalyzerEngine(
+        analyzer_engine_provider=MockAnalyzerEngineProvider()
+    )
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = batch_analyzer.analyze_iterator(
+            texts=texts, language="en", batch_size=2, n_process=2, executor=executor
+        )
+
+    assert results == expected_output
+
+
+def test_analyze_iterator_with_n_process_without_provider_raises_error(
+    batch_analyzer_engine_simple
+):
+    with pytest.raises(ValueError):
+        batch_analyzer_engine_simple.analyze_iterator(
+            texts=["text"], language="en", n_process=2
+        )
+
+
+def test_analyze_stream_consumes_input_lazily(batch_analyzer_engine_simple):
+    consumed = []
+
+    def texts():
+        for i in range(1000):
+            consumed.append(i)
+            yield "Call me at 2352351232" if i % 2 else "Hi"
+
+    stream = batch_analyzer_engine_simple.analyze_stream(texts=texts(), language="en")
+
+    assert next(stream) == []
+    assert next(stream) == [
+        RecognizerResult(entity_type="PHONE_NUMBER", start=11, end=21, score=0.4)
+    ]
+    assert len(consumed) == 2
+
+
+def test_analyze_stream_with_n_process_returns_results_in_order(
+    batch_analyzer_engine_simple
+):
+    texts = ["Call me at 2352351232", "https://microsoft.com", "nothing here"] * 4
+    expected_output = batch_analyzer_engine_simple.analyze_iterator(
+        texts=texts, language="en"
+    )
+
+    batch_analyzer = BatchAnalyzerEngine(
+        analyzer_engine_provider=MockAnalyzerEngineProvider()
+    )
+    stream = batch_analyzer.analyze_stream(
+        texts=(text for text in texts), language="en", batch_size=3, n_process=2
+    )
+
+    assert list(stream) == expected_output
@@ -0,0 +1,181 @@
+from pathlib import Path
+
+import pytest
+import regex as re
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+from presidio_analyzer import (
+    AnalyzerEngine,
+    CombinedPatternMatcher,
+    Pattern,
+    PatternRecognizer,
+    RecognizerRegistry,
+)
+from presidio_analyzer import predefined_recognizers
+from tests.mocks import NlpEngineMock
+
+
+@pytest.fixture(scope="module")
+def pattern_recognizers():
+    recognizers = []
+    for name in predefined_recognizers.__all__:
+        recognizer_class = getattr(predefined_recognizers, name)
+        if isinstance(recognizer_class, type) and issubclass(
+            recognizer_class, PatternRecognizer
+        ):
+            recognizers.append(recognizer_class())
+    return recognizers
+
+
+@pytest.fixture(scope="module")
+def mixed_pii_text():
+    context_file = Path(Path(__file__).parent, "data", "context_sentences_tests.txt")
+    lines = [
+        line
+        for line in context_file.read_text().splitlines()
+        if line and not line.startswith("#")
+    ]
+    lines.extend(
+        [
+            "Contact me at john.smith@example.com or https://www.microsoft.com/about",
+            "Card 4095-2609-9393-4932 expires 11/2026, paid on 2023-01-15 10:30",
+            "Wallet 16Yeky6GMjeNkAiNcBY7ZhrLoMSgg1BoyZ from 192.168.0.1 and ::1",
+            "IBAN GB82 WEST 1234 5698 7654 32, SSN 078-05-1120 and ITIN 911-70-1234",
+            "Abn 51 824 753 556, nhs 401-023-2137, pesel 02070803628 ab12345cd",
+        ]
+    )
+    return "\n".join(lines)
+
+
+def _to_comparable(results):
+    return sorted(
+        (
+            r.entity_type,
+            r.start,
+            r.end,
+            r.score,
+            r.analysis_explanation.pattern_name,
+        )
+        for r in results
+    )
+
+
+def test_when_predefined_recognizers_combined_then_results_identical(
+    pattern_recognizers, mixed_pii_text
+):
+    combinable = [
+        rec for rec in pattern_recognizers if CombinedPatternMatcher.is_combinable(rec)
+    ]
+    matcher = CombinedPatternMatcher(combinable)
+
+    combined_results = matcher.analyze(mixed_pii_text)
+
+    assert set(combined_results.keys()) == {rec.id for rec in combinable}
+    for recognizer in combinable:
+        expected = recognizer.analyze(mixed_pii_text, recognizer.supported_entities)
+        actual = combined_results[recognizer.id]
+        assert _to_comparable(actual) == _to_comparable(expected), recognizer.name
+
+
+def test_when_recognizer_overrides_analyze_then_not_combinable(pattern_recognizers):
+    iban_recognizer = next(
+        rec for rec in pattern_recognizers if rec.name == "IbanRecognizer"
+    )
+    assert not CombinedPatternMatcher.is_combinable(iban_recognizer)
+
+
+@pytest.mark.parametrize(
+    "regex, flags, expected",
+    [
+        (r"\b\d{5}\b", 0, r"(?m)[\p{Nd}]{5}"),
+        (r"(?i)\b[A-Z]{2}\d{7}\b", 0, r"(?mi)[A-Z]{2}[\p{Nd}]{7}"),
+        (r"(?<=\W)abc(?!d(e))", re.DOTALL, r"(?ms)abc"),
+        (r"[\w@#-]+$", 0, r"(?m)[" + CombinedPatternMatcher.WORD_CHARACTERS + r"@#-]+(?m:$)"),
+        (r"[^\s]+", 0, r"(?m)(?s:.)+"),
+        (r"\S+\Z", 0, r"(?m)(?s:.)+\z"),
+        (r"\d{,3}", 0, None),
+        (r"(?x)\d{3}", 0, None),
+        (r"\d{3}", re.VERBOSE, None),
+        (r"[[a-z]--[aeiou]]", 0, None),
+    ],
+)
+def test_when_regex_translated_then_re2_regex_correct(regex, flags, expected):
+    assert CombinedPatternMatcher._to_re2_regex(regex, flags) == expected
+
+
+@pytest.mark.skipif(not re2, reason="google-re2 is not installed")
+@pytest.mark.parametrize(
+    "regex, text",
+    [
+        (r"\b\d{3}\b", "\u0663\u0664\u0665"),
+        (r"\b\w+\b", "\u05e9\u05dc\u05d5\u05dd"),
+        (r"a\sb", "a\u2003b"),
+        (r"(?i)k", "\u212a"),
+        (r"^abc$", "abc\n"),
+    ],
+)
+def test_when_unicode_text_then_prefilter_does_not_miss_matches(regex, text):
+    recognizer = PatternRecognizer(
+        supported_entity="TEST", patterns=[Pattern("test", regex, 0.5)]
+    )
+    matcher = CombinedPatternMatcher([recognizer])
+
+    assert matcher._prefilter_entries == [0]
+    expected = recognizer.analyze(text, ["TEST"])
+    assert expected
+    assert _to_comparable(matcher.analyze(text)[recognizer.id]) == _to_comparable(
+        expected
+    )
+
+
+@pytest.mark.skipif(not re2, reason="google-re2 is not installed")
+def test_when_no_pattern_matches_then_prefilter_skips_patterns(zip_code_recognizer):
+    matcher = CombinedPatternMatcher([zip_code_recognizer])
+
+    assert matcher._get_prefilter_matches("no numbers in this text") == []
+    assert matcher._get_prefilter_matches("zip code 12345") == [0]
+
+
+def test_when_combined_pattern_matching_then_analyzer_results_identical(
+    pattern_recognizers, mixed_pii_text
+):
+    def analyze(combined_pattern_matching):
+        registry = RecognizerRegistry(recognizers=list(pattern_recognizers))
+        analyzer = AnalyzerEngine(
+            registry=registry,
+            nlp_engine=NlpEngineMock(),
+            combined_pattern_matching=combined_pattern_matching,
+        )
+        return analyzer.analyze(
+            mixed_pii_text, language="en", return_decision_process=True
+        )
+
+    assert _to_comparable(analyze(True)) == _to_comparable(analyze(False))
+
+
+def test_when_recognizer_added_then_combined_matcher_recreated(zip_code_recognizer):
+    registry = RecognizerRegistry(recognizers=[zip_code_recognizer])
+    matcher = registry.get_combined_pattern_matcher([zip_code_recognizer])
+    assert registry.get_combined_pattern_matcher([zip_code_recognizer]) is matcher
+
+    registry.add_recognizer(
+        PatternRecognizer(supported_entity="TITLE", deny_list=["Mr.", "Mrs."])
+    )
+    assert registry.get_combined_pattern_matcher([zip_code_recognizer]) is not matcher
+
+
+def test_when_ad_hoc_recognizer_then_not_combined(zip_code_recognizer):
+    registry = RecognizerRegistry(recognizers=[zip_code_recognizer])
+    ad_hoc_recognizer = PatternRecognizer(
+        supported_entity="TITLE", deny_list=["Mr.", "Mrs."]
+    )
+
+    matcher = registry.get_combined_pattern_matcher(
+        [zip_code_recognizer, ad_hoc_recognizer]
+    )
+
+    assert matcher.recognizers == [zip_code_recognizer]
@@ -1,3 +1,7 @@
+import random
+
+import pytest
+
 from presidio_analyzer import EntityRecognizer, RecognizerResult, AnalysisExplanation
 
 
@@ -119,3 +123,48 @@ def test_when_remove_duplicates_contained_shorter_length_results_removed():
     ]
     results = EntityRecognizer.remove_duplicates(arr)
     assert len(results) == 1
+
+
+def _remove_duplicates_quadratic(results):
+    # The original implementation, used as a reference
+    results = sorted(set(results), key=lambda x: (-x.score, x.start, -(x.end - x.start)))
+    filtered_results = []
+    for result in results:
+        if result.score == 0:
+            continue
+        to_keep = result not in filtered_results
+        if to_keep:
+            for filtered in filtered_results:
+                if (
+                    result.contained_in(filtered)
+                    and result.entity_type == filtered.entity_type
+                ):
+                    to_keep = False
+                    break
+        if to_keep:
+            filtered_results.append(result)
+    return filtered_results
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_when_remove_duplicates_then_identical_to_quadratic_implementation(seed):
+    rng = random.Random(seed)
+    results = []
+    for _ in range(rng.randint(0, 200)):
+        start = rng.randint(0, 50)
+        results.append(
+            RecognizerResult(
+                entity_type=rng.choice(["A", "B", "C"]),
+                start=start,
+                end=start + rng.randint(1, 15),
+                score=rng.choice([0, 0.3, 0.5, 0.85, 1.0]),
+            )
+        )
+    # Duplicates of existing results
+    results.extend(rng.sample(results, len(results) // 4))
+    rng.shuffle(results)
+
+    actual = EntityRecognizer.remove_duplicates(list(results))
+    expected = _remove_duplicates_quadratic(list(results))
+
+    assert actual == expected
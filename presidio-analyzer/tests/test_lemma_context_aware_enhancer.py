@@ -1,15 +1,147 @@
-from presidio_analyzer import LemmaContextAwareEnhancer
+import random
+
+import pytest
+
+from presidio_analyzer import LemmaContextAwareEnhancer, Pattern, PatternRecognizer
+from presidio_analyzer.context_aware_enhancers.lemma_context_aware_enhancer import (
+    _ContextIndex,
+)
+from presidio_analyzer.nlp_engine import NlpArtifacts
+from tests.mocks import NlpEngineMock
 
 
 def test_when_index_finding_then_succeed():
     # This test uses a simulated recognize result for the following
     # text: "my phone number is:(425) 882-9090"
-    match = "(425) 882-9090"
-    # the start index of the match
+    # the start index of the match "(425) 882-9090"
     start = 19
     tokens = ["my", "phone", "number", "is:(425", ")", "882", "-", "9090"]
     tokens_indices = [0, 3, 9, 16, 23, 25, 28, 29]
-    index = LemmaContextAwareEnhancer._find_index_of_match_token(
-        match, start, tokens, tokens_indices
+    nlp_artifacts = NlpArtifacts(
+        entities=[],
+        tokens=tokens,
+        tokens_indices=tokens_indices,
+        lemmas=tokens,
+        nlp_engine=NlpEngineMock(),
+        language="en",
     )
+    index = _ContextIndex(nlp_artifacts).find_token(start)
     assert index == 3
+    assert _ContextIndex(nlp_artifacts).find_token(33) is None
+
+
+def _extract_surrounding_words_linear(enhancer, nlp_artifacts, start):
+    # The previous implementation, scanning the tokens for each match
+    for index, token in enumerate(nlp_artifacts.tokens):
+        token_start = nlp_artifacts.tokens_indices[index]
+        if token_start == start or start < token_start + len(token):
+            break
+    else:
+        raise ValueError("Did not find the token of the match")
+    keywords = nlp_artifacts.keywords
+
+    def add_n_words(n_words, is_backward):
+        i = index
+        context_words = []
+        remaining = n_words + 1
+        while 0 <= i < len(nlp_artifacts.lemmas) and remaining > 0:
+            lower_lemma = nlp_artifacts.lemmas[i].lower()
+            if lower_lemma in keywords:
+                context_words.append(lower_lemma)
+                remaining -= 1
+            i = i - 1 if is_backward else i + 1
+        return context_words
+
+    return set(
+        add_n_words(enhancer.context_prefix_count, True)
+        + add_n_words(enhancer.context_suffix_count, False)
+    )
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_when_extracting_surrounding_words_then_identical_to_linear_scan(seed):
+    rng = random.Random(seed)
+    words = ["my", "Phone", "number", "is", "the", "card", "-", "ssn", "of", "a"]
+    tokens = [rng.choice(words) for _ in range(rng.randint(1, 60))]
+    tokens_indices = []
+    offset = 0
+    for token in tokens:
+        tokens_indices.append(offset)
+        offset += len(token) + rng.randint(0, 1)
+
+    nlp_artifacts = NlpArtifacts(
+        entities=[],
+        tokens=tokens,
+        tokens_indices=tokens_indices,
+        lemmas=list(tokens),
+        nlp_engine=NlpEngineMock(stopwords=["the", "of", "a"], punct_words=["-"]),
+        language="en",
+    )
+    enhancer = LemmaContextAwareEnhancer(
+        context_prefix_count=rng.randint(0, 6), context_suffix_count=rng.randint(0, 3)
+    )
+
+    for start in range(offset + 1):
+        try:
+            expected = _extract_surrounding_words_linear(enhancer, nlp_artifacts, start)
+        except ValueError:
+            with pytest.raises(ValueError):
+                enhancer._extract_surrounding_words(nlp_artifacts, "", start)
+            continue
+        actual = enhancer._extract_surrounding_words(nlp_artifacts, "", start)
+        assert set(actual) == expected
+
+
+@pytest.mark.parametrize(
+    "context_list, recognizer_context, expected",
+    [
+        (["my", "phonenumber"], ["card", "phone"], "phone"),
+        (["my", "phone"], ["phone", "my"], "phone"),
+        (["my", "card"], ["phone"], ""),
+        ([], ["phone"], ""),
+        (["ph", "one"], ["phone"], ""),
+        (["ph", "one"], ["ph\x00one"], ""),
+        (None, ["phone"], ""),
+    ],
+)
+def test_when_finding_supportive_word_then_first_recognizer_word_returned(
+    context_list, recognizer_context, expected
+):
+    assert (
+        LemmaContextAwareEnhancer._find_supportive_word_in_context(
+            context_list, recognizer_context
+        )
+        == expected
+    )
+
+
+def test_when_score_enhanced_then_raw_results_not_modified():
+    recognizer = PatternRecognizer(
+        supported_entity="PHONE",
+        patterns=[Pattern("phone", r"\d{3}-\d{4}", 0.3)],
+        context=["phone"],
+    )
+    text = "my phone is 555-1234 and 555-4321"
+    tokens = ["my", "phone", "is", "555", "-", "1234", "and", "555", "-", "4321"]
+    tokens_indices = [0, 3, 9, 12, 15, 16, 21, 25, 28, 29]
+    nlp_artifacts = NlpArtifacts(
+        entities=[],
+        tokens=tokens,
+        tokens_indices=tokens_indices,
+        lemmas=list(tokens),
+        nlp_engine=NlpEngineMock(stopwords=["is", "my", "and"], punct_words=["-"]),
+        language="en",
+    )
+    raw_results = recognizer.analyze(text, ["PHONE"])
+    raw_scores = [result.score for result in raw_results]
+
+    results = LemmaContextAwareEnhancer(context_prefix_count=2).enhance_using_context(
+        text, raw_results, nlp_artifacts, [recognizer]
+    )
+
+    assert [result.score for result in raw_results] == raw_scores
+    assert all(r.analysis_explanation.supportive_context_word == "" for r in raw_results)
+    assert results[0].score == pytest.approx(0.65)
+    assert results[0].analysis_explanation.supportive_context_word == "phone"
+    # The second match is too far from the context word
+    assert results[1] is raw_results[1]
@@ -0,0 +1,236 @@
+import asyncio
+import threading
+
+import pytest
+
+from presidio_analyzer import (
+    AnalyzerEngine,
+    BatchAnalyzerEngine,
+    InMemoryMetricsRecorder,
+    MetricsRecorder,
+    Pattern,
+    PatternRecognizer,
+    RecognizerRegistry,
+)
+from presidio_analyzer.metrics_recorder import (
+    CONTEXT_ENHANCEMENT_DURATION,
+    NLP_DURATION,
+    PATTERN_DURATION,
+    PATTERN_MATCHES,
+    PATTERN_VALIDATIONS,
+    RECOGNIZER_DURATION,
+    RECOGNIZER_RESULTS,
+    REQUEST_DURATION,
+    get_metrics_recorder,
+)
+from presidio_analyzer.predefined_recognizers import CreditCardRecognizer
+from tests.mocks import NlpEngineMock, RecognizerRegistryMock
+
+TEXT = (
+    "My credit card is 4012888888881881, not 4012888888881882. "
+    "Call me at 2352351232 or visit microsoft.com"
+)
+
+
+@pytest.fixture
+def metrics():
+    return InMemoryMetricsRecorder()
+
+
+def _labels(durations):
+    return [duration["labels"] for duration in durations]
+
+
+def test_when_no_metrics_recorder_then_no_op_recorder_used():
+    analyzer = AnalyzerEngine(
+        registry=RecognizerRegistryMock(), nlp_engine=NlpEngineMock()
+    )
+
+    assert not analyzer.metrics.enabled
+    assert not get_metrics_recorder().enabled
+    assert len(analyzer.analyze(TEXT, language="en")) == 3
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_when_analyze_then_all_stages_recorded(metrics, max_workers):
+    analyzer = AnalyzerEngine(
+        registry=RecognizerRegistryMock(),
+        nlp_engine=NlpEngineMock(),
+        max_workers=max_workers,
+        metrics=metrics,
+    )
+
+    analyzer.analyze(TEXT, language="en")
+
+    assert _labels(metrics.get_durations(REQUEST_DURATION)) == [{"language": "en"}]
+    assert _labels(metrics.get_durations(NLP_DURATION)) == [
+        {"language": "en", "nlp_engine": "NlpEngineMock"}
+    ]
+    assert len(metrics.get_durations(CONTEXT_ENHANCEMENT_DURATION)) == 1
+    assert sorted(
+        labels["recognizer"]
+        for labels in _labels(metrics.get_durations(RECOGNIZER_DURATION))
+    ) == ["CreditCardRecognizer", "PhoneRecognizer", "UrlRecognizer"]
+    assert {
+        "recognizer": "CreditCardRecognizer",
+        "pattern": "All Credit Cards (weak)",
+    } in _labels(metrics.get_durations(PATTERN_DURATION))
+
+
+def test_when_patterns_match_then_matches_and_validations_counted(metrics):
+    analyzer = AnalyzerEngine(
+        registry=RecognizerRegistryMock(),
+        nlp_engine=NlpEngineMock(),
+        metrics=metrics,
+    )
+
+    analyzer.analyze(TEXT, language="en")
+
+    credit_card = {"recognizer": "CreditCardRecognizer"}
+    assert metrics.get_count(PATTERN_MATCHES, credit_card) == 2
+    assert metrics.get_count(PATTERN_VALIDATIONS, credit_card) == 2
+    assert (
+        metrics.get_count(PATTERN_VALIDATIONS, {**credit_card, "outcome": "valid"})
+        == 1
+    )
+    assert (
+        metrics.get_count(PATTERN_VALIDATIONS, {**credit_card, "outcome": "invalid"})
+        == 1
+    )
+    assert metrics.get_count(RECOGNIZER_RESULTS, credit_card) == 1
+    assert metrics.get_count(RECOGNIZER_RESULTS) == 3
+
+
+def test_when_combined_pattern_matching_then_pattern_metrics_recorded(metrics):
+    analyzer = AnalyzerEngine(
+        registry=RecognizerRegistry(recognizers=[CreditCardRecognizer()]),
+        nlp_engine=NlpEngineMock(),
+        combined_pattern_matching=True,
+        metrics=metrics,
+    )
+
+    analyzer.analyze(TEXT, language="en")
+
+    assert metrics.get_count(PATTERN_MATCHES) == 2
+    assert metrics.get_count(PATTERN_VALIDATIONS) == 2
+    assert metrics.get_count(RECOGNIZER_RESULTS) == 1
+    assert metrics.get_durations(PATTERN_DURATION)
+
+
+def test_when_custom_recognizer_then_it_can_record_metrics(metrics):
+    class CountingRecognizer(PatternRecognizer):
+        def analyze(self, text, entities, nlp_artifacts=None, regex_flags=None):
+            get_metrics_recorder().increment("custom_total", labels={"thread": "x"})
+            return super().analyze(text, entities, nlp_artifacts, regex_flags)
+
+    recognizer = CountingRecognizer(
+        supported_entity="TITLE", patterns=[Pattern("title", r"Mr\.", 0.5)]
+    )
+    analyzer = AnalyzerEngine(
+        registry=RecognizerRegistry(recognizers=[recognizer]),
+        nlp_engine=NlpEngineMock(),
+        max_workers=2,
+        metrics=metrics,
+    )
+
+    analyzer.analyze("Mr. Smith", language="en")
+    asyncio.run(analyzer.analyze_async("Mr. Smith", language="en"))
+
+    assert metrics.get_count("custom_total") == 2
+    assert not get_metrics_recorder().enabled
+
+
+def test_when_batch_analyzed_then_nlp_duration_recorded_per_text(metrics):
+    analyzer = AnalyzerEngine(
+        registry=RecognizerRegistryMock(),
+        nlp_engine=NlpEngineMock(),
+        metrics=metrics,
+    )
+    batch_analyzer = BatchAnalyzerEngine(analyzer_engine=analyzer)
+
+    batch_analyzer.analyze_iterator([TEXT, "Hi", "Bye"], language="en")
+
+    assert metrics.get_durations(NLP_DURATION)[0]["count"] == 3
+    assert metrics.get_durations(REQUEST_DURATION)[0]["count"] == 3
+
+
+def test_when_durations_recorded_concurrently_then_aggregated(metrics):
+    def record():
+        for _ in range(1000):
+            metrics.record_duration("duration", 0.5, {"name": "a"})
+            metrics.increment("count", labels={"name": "a"})
+
+    threads = [threading.Thread(target=record) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert metrics.get_durations("duration") == [
+        {"labels": {"name": "a"}, "count": 4000, "total": 2000.0, "max": 0.5}
+    ]
+    assert metrics.get_count("count") == 4000
+
+
+def test_when_base_recorder_then_metrics_discarded():
+    metrics = MetricsRecorder()
+    metrics.record_duration("duration", 1.0)
+    metrics.increment("count")
+    assert not metrics.enabled
+
+
+def test_when_prometheus_recorder_then_metrics_exported():
+    prometheus_client = pytest.importorskip("prometheus_client")
+    from presidio_analyzer import PrometheusMetricsRecorder
+
+    registry = prometheus_client.CollectorRegistry()
+    metrics = PrometheusMetricsRecorder(registry=registry)
+    analyzer = AnalyzerEngine(
+        registry=RecognizerRegistryMock(),
+        nlp_engine=NlpEngineMock(),
+        metrics=metrics,
+    )
+
+    analyzer.analyze(TEXT, language="en")
+
+    labels = {
+        "recognizer": "CreditCardRecognizer",
+        "pattern": "All Credit Cards (weak)",
+    }
+    assert (
+        registry.get_sample_value("presidio_analyzer_pattern_matches_total", labels)
+        == 2
+    )
+    assert (
+        registry.get_sample_value(
+            "presidio_analyzer_pattern_duration_seconds_count", labels
+        )
+        == 1
+    )
+
+
+def test_when_opentelemetry_recorder_then_metrics_exported():
+    pytest.importorskip("opentelemetry.sdk.metrics")
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+    from presidio_analyzer import OpenTelemetryMetricsRecorder
+
+    reader = InMemoryMetricReader()
+    meter = MeterProvider(metric_readers=[reader]).get_meter("test")
+    analyzer = AnalyzerEngine(
+        registry=RecognizerRegistryMock(),
+        nlp_engine=NlpEngineMock(),
+        metrics=OpenTelemetryMetricsRecorder(meter=meter),
+    )
+
+    analyzer.analyze(TEXT, language="en")
+
+    metric_names = {
+        metric.name
+        for resource_metrics in reader.get_metrics_data().resource_metrics
+        for scope_metrics in resource_metrics.scope_metrics
+        for metric in scope_metrics.metrics
+    }
+    assert "presidio.analyzer_pattern_matches_total" in metric_names
+    assert "presidio.analyzer_nlp_duration_seconds" in metric_names
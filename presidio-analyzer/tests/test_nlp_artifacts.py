@@ -0,0 +1,65 @@
+import json
+
+from presidio_analyzer.nlp_engine import NlpArtifacts
+from tests.mocks import NlpEngineMock
+
+
+class CountingNlpEngineMock(NlpEngineMock):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.lookups = 0
+
+    def is_stopword(self, word, language):
+        self.lookups += 1
+        return super().is_stopword(word, language)
+
+
+def create_nlp_artifacts(nlp_engine, lemmas):
+    return NlpArtifacts(
+        entities=[],
+        tokens=None,
+        tokens_indices=[],
+        lemmas=lemmas,
+        nlp_engine=nlp_engine,
+        language="en",
+    )
+
+
+def test_when_keywords_not_accessed_then_not_computed():
+    nlp_engine = CountingNlpEngineMock()
+    nlp_artifacts = create_nlp_artifacts(nlp_engine, ["my", "phone"])
+
+    assert nlp_engine.lookups == 0
+
+    assert nlp_artifacts.keywords == ["my", "phone"]
+    assert nlp_artifacts.keywords == ["my", "phone"]
+    assert nlp_engine.lookups == 2
+
+
+def test_when_keywords_computed_then_stopwords_and_punct_removed():
+    nlp_engine = NlpEngineMock(stopwords=["my", "is"], punct_words=[":"])
+    lemmas = ["My", "my", "phone", "be", "-PRON-", ":", "Tel:Number", "is", "555"]
+
+    nlp_artifacts = create_nlp_artifacts(nlp_engine, lemmas)
+
+    assert nlp_artifacts.keywords == ["my", "phone", "tel", "number", "555"]
+
+
+def test_when_keywords_set_then_not_computed():
+    nlp_engine = CountingNlpEngineMock()
+    nlp_artifacts = create_nlp_artifacts(nlp_engine, ["phone"])
+
+    nlp_artifacts.keywords = ["custom"]
+
+    assert nlp_artifacts.keywords == ["custom"]
+    assert nlp_engine.lookups == 0
+
+
+def test_when_to_json_then_keywords_included():
+    nlp_artifacts = create_nlp_artifacts(NlpEngineMock(), ["phone"])
+    nlp_artifacts.tokens = []
+
+    json_dict = json.loads(nlp_artifacts.to_json())
+
+    assert json_dict["keywords"] == ["phone"]
+    assert "_keywords" not in json_dict
@@ -0,0 +1,72 @@
+import logging
+
+import pytest
+
+from presidio_analyzer import (
+    Pattern,
+    PatternRecognizer,
+    RecognizerRegistry,
+    predefined_recognizers,
+)
+from presidio_analyzer.pattern_lint import find_nested_quantifiers, lint_patterns
+
+
+@pytest.mark.parametrize(
+    "regex, expected",
+    [
+        (r"(a+)+$", ["(a+)+"]),
+        (r"(\w+\s?)*x", [r"(\w+\s?)*"]),
+        (r"(?:\d+)*", [r"(?:\d+)*"]),
+        (r"(?i)(a+)+", ["(a+)+"]),
+        (r"(?P<name>a*b)+", ["(?P<name>a*b)+"]),
+        (r"(a{2,})+", ["(a{2,})+"]),
+        (r"((ab)*c)*", ["((ab)*c)*"]),
+        (r"((a+))+", ["((a+))+"]),
+        (r"(\w+)+ (\d+)*", [r"(\w+)+", r"(\d+)*"]),
+        # Atomic groups and possessive quantifiers don't backtrack
+        (r"(?>a+)+", []),
+        (r"(a++)+", []),
+        # Bounded quantifiers
+        (r"(a{1,3})+", []),
+        (r"(a+){2}", []),
+        # Quantifiers in character classes and escaped parentheses
+        (r"([a-z+]*)", []),
+        (r"\(a+\)+", []),
+        (r"(a|b)+", []),
+        # Repetitions starting with a delimiter can't overlap
+        (r"([-.]\w+)*", []),
+        (r"(\.\w+)*", []),
+        (r"(\s\w+)*", []),
+        (r"(-.+)+", ["(-.+)+"]),
+        (r"(-\w+-?)*", [r"(-\w+-?)*"]),
+    ],
+)
+def test_when_regex_has_nested_quantifiers_then_found(regex, expected):
+    assert find_nested_quantifiers(regex) == expected
+
+
+def test_when_predefined_recognizers_then_no_nested_quantifiers():
+    for name in predefined_recognizers.__all__:
+        recognizer_class = getattr(predefined_recognizers, name)
+        if not (
+            isinstance(recognizer_class, type)
+            and issubclass(recognizer_class, PatternRecognizer)
+        ):
+            continue
+
+        assert lint_patterns([recognizer_class()]) == [], name
+
+
+def test_when_recognizer_with_nested_quantifiers_added_then_warning_logged(caplog):
+    registry = RecognizerRegistry()
+    recognizer = PatternRecognizer(
+        supported_entity="WORDS",
+        name="WordsRecognizer",
+        patterns=[Pattern("words", r"(\w+\s?)*!", 0.5)],
+    )
+
+    with caplog.at_level(logging.WARNING, logger="presidio-analyzer"):
+        registry.add_recognizer(recognizer)
+
+    assert "Pattern `words` of recognizer `WordsRecognizer`" in caplog.text
+    assert registry.recognizers == [recognizer]
@@ -219,3 +219,33 @@ def test_global_regex_flag_deny_list_returns_right_result(global_flag, expected_
 
     results = recognizer_ignore_case.analyze(text=text, entities=["TITLE"])
     assert len(results) == expected_len
+
+
+class NlpArtifactsReadingRecognizer(PatternRecognizer):
+    def analyze(self, text, entities, nlp_artifacts=None, regex_flags=None):
+        results = super().analyze(text, entities, nlp_artifacts, regex_flags)
+        if nlp_artifacts and nlp_artifacts.entities:
+            return []
+        return results
+
+
+class ContextReadingRecognizer(PatternRecognizer):
+    def enhance_using_context(self, text, raw_recognizer_results, other_raw_recognizer_results, nlp_artifacts, context=None):
+        return raw_recognizer_results
+
+
+def test_when_pattern_recognizer_not_overridden_then_no_nlp_artifacts_required():
+    from presidio_analyzer.predefined_recognizers import IbanRecognizer
+
+    assert PatternRecognizer(supported_entity="TITLE", deny_list=["Mr."]).required_nlp_artifacts == frozenset()
+    patterns = [Pattern("p1", "someregex", 1.0)]
+    mock_recognizer = MockRecognizer(entity="ENTITY", patterns=patterns, deny_list=None, name=None, context=None)
+    assert mock_recognizer.required_nlp_artifacts == frozenset()
+    assert IbanRecognizer().required_nlp_artifacts == frozenset()
+
+
+@pytest.mark.parametrize("recognizer_class", [NlpArtifactsReadingRecognizer, ContextReadingRecognizer])
+def test_when_pattern_recognizer_reads_nlp_artifacts_then_all_artifacts_required(recognizer_class):
+    recognizer = recognizer_class(supported_entity="TITLE", deny_list=["Mr."])
+
+    assert recognizer.required_nlp_artifacts is None
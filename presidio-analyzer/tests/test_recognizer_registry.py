@@ -1,3 +1,5 @@
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -244,3 +246,109 @@ def test_remove_recognizer_when_multiple_instances_exist():
     assert len([rec for rec in registry.recognizers
                 if rec.name == "SpacyRecognizer"]) == 1
 
+
+
+def test_when_get_recognizers_repeatedly_then_index_reused(mock_recognizer_registry):
+    first = mock_recognizer_registry.get_recognizers(language="de", entities=["PERSON"])
+    index = mock_recognizer_registry._index
+    second = mock_recognizer_registry.get_recognizers(
+        language="de", entities=["PERSON"]
+    )
+
+    assert mock_recognizer_registry._index is index
+    assert first == second
+    assert first is not second
+    assert [rec.name for rec in first] == ["2"]
+
+
+def test_when_recognizers_changed_then_index_rebuilt(mock_recognizer_registry):
+    assert len(mock_recognizer_registry.get_recognizers("en", ["PERSON"])) == 1
+
+    mock_recognizer_registry.add_recognizer(
+        create_mock_pattern_recognizer("en", "PERSON", "6")
+    )
+    assert len(mock_recognizer_registry.get_recognizers("en", ["PERSON"])) == 2
+
+    # Changes made to the list directly are detected as well
+    mock_recognizer_registry.recognizers.append(
+        create_mock_pattern_recognizer("en", "PERSON", "7")
+    )
+    assert len(mock_recognizer_registry.get_recognizers("en", ["PERSON"])) == 3
+
+    mock_recognizer_registry.remove_recognizer("6")
+    assert [
+        rec.name for rec in mock_recognizer_registry.get_recognizers("en", ["PERSON"])
+    ] == ["1", "7"]
+
+
+def test_when_ad_hoc_recognizers_then_index_not_changed(mock_recognizer_registry):
+    ad_hoc = create_mock_pattern_recognizer("en", "TITLE", "ad_hoc")
+
+    recognizers = mock_recognizer_registry.get_recognizers(
+        "en", ["PERSON", "TITLE"], ad_hoc_recognizers=[ad_hoc]
+    )
+    assert [rec.name for rec in recognizers] == ["1", "ad_hoc"]
+
+    with pytest.raises(ValueError):
+        mock_recognizer_registry.get_recognizers("en", ["TITLE"])
+
+
+def test_when_entity_has_no_recognizer_then_warning_logged(
+    mock_recognizer_registry, caplog
+):
+    mock_recognizer_registry.get_recognizers("en", ["PERSON", "ADDRESS"])
+
+    assert "Entity ADDRESS doesn't have the corresponding recognizer" in caplog.text
+    assert "Entity PERSON" not in caplog.text
+
+
+def test_when_get_supported_entities_then_entities_of_languages_returned(
+    mock_recognizer_registry,
+):
+    assert sorted(mock_recognizer_registry.get_supported_entities(["he"])) == [
+        "ADDRESS",
+        "PERSON",
+    ]
+    assert sorted(mock_recognizer_registry.get_supported_entities()) == [
+        "ADDRESS",
+        "PERSON",
+    ]
+    with pytest.raises(ValueError):
+        mock_recognizer_registry.get_supported_entities(["fr"])
+
+
+def test_when_predefined_recognizers_loaded_then_only_used_modules_imported():
+    # Run in a new interpreter, as other tests already imported these modules
+    code = """
+import sys
+from presidio_analyzer import RecognizerRegistry
+
+registry = RecognizerRegistry(supported_languages=["en"])
+registry.load_predefined_recognizers()
+
+assert registry.recognizers
+assert "spacy" not in sys.modules
+modules = [name.rsplit(".", 1)[-1] for name in sys.modules]
+assert "credit_card_recognizer" in modules
+assert "es_nif_recognizer" not in modules
+assert "azure_ai_language" not in modules
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_when_predefined_recognizer_has_unsupported_language_then_not_created(
+    mocker,
+):
+    from presidio_analyzer.predefined_recognizers import CreditCardRecognizer
+
+    init = mocker.spy(CreditCardRecognizer, "__init__")
+
+    registry = RecognizerRegistry(supported_languages=["en"])
+    registry.load_predefined_recognizers(languages=["en"])
+
+    assert init.call_count == 1
+    assert [
+        rec.supported_language
+        for rec in registry.recognizers
+        if isinstance(rec, CreditCardRecognizer)
+    ] == ["en"]
@@ -0,0 +1,161 @@
+import json
+import logging
+import time
+
+import pytest
+
+from presidio_analyzer import (
+    AnalyzerEngine,
+    InMemoryMetricsRecorder,
+    Pattern,
+    PatternRecognizer,
+    RecognizerRegistry,
+)
+from presidio_analyzer.metrics_recorder import PATTERN_TIMEOUTS
+from presidio_analyzer.regex_time_budget import (
+    RegexTimeBudget,
+    RegexTimeout,
+    use_regex_time_budget,
+)
+from tests.mocks import AppTracerMock, NlpEngineMock
+
+# Exponential backtracking when the text doesn't match
+SLOW_PATTERN = Pattern("slow", r"^(a|aa)+$", 0.5)
+FAST_PATTERN = Pattern("fast", r"\bb\b", 0.5)
+TEXT = "a" * 40 + " b"
+
+
+@pytest.fixture
+def slow_recognizer():
+    return PatternRecognizer(
+        supported_entity="SLOW",
+        name="SlowRecognizer",
+        patterns=[SLOW_PATTERN, FAST_PATTERN],
+    )
+
+
+def _analyzer_engine(recognizer, **kwargs):
+    return AnalyzerEngine(
+        registry=RecognizerRegistry(recognizers=[recognizer]),
+        nlp_engine=NlpEngineMock(),
+        **kwargs,
+    )
+
+
+def test_when_pattern_exceeds_regex_timeout_then_pattern_skipped(caplog):
+    recognizer = PatternRecognizer(
+        supported_entity="SLOW",
+        name="SlowRecognizer",
+        patterns=[SLOW_PATTERN, FAST_PATTERN],
+        regex_timeout=0.05,
+    )
+
+    start = time.perf_counter()
+    with caplog.at_level(logging.WARNING, logger="presidio-analyzer"):
+        results = recognizer.analyze(TEXT, entities=["SLOW"])
+
+    assert time.perf_counter() - start < 1
+    assert [(result.start, result.end) for result in results] == [(41, 42)]
+    assert "Pattern slow of recognizer SlowRecognizer exceeded" in caplog.text
+
+
+def test_when_engine_regex_timeout_then_applied_to_recognizers(slow_recognizer):
+    metrics = InMemoryMetricsRecorder()
+    analyzer = _analyzer_engine(slow_recognizer, regex_timeout=0.05, metrics=metrics)
+
+    results = analyzer.analyze(TEXT, language="en")
+
+    assert [(result.start, result.end) for result in results] == [(41, 42)]
+    assert (
+        metrics.get_count(
+            PATTERN_TIMEOUTS, {"recognizer": "SlowRecognizer", "pattern": "slow"}
+        )
+        == 1
+    )
+
+
+def test_when_recognizer_regex_timeout_then_overrides_engine_default():
+    budget = RegexTimeBudget(pattern_timeout=10)
+    assert budget.get_timeout(0.5) == 0.5
+    assert budget.get_timeout() == 10
+    assert RegexTimeBudget().get_timeout() is None
+
+
+def test_when_request_budget_exhausted_then_patterns_skipped(slow_recognizer):
+    budget = RegexTimeBudget(request_timeout=0)
+
+    with use_regex_time_budget(budget):
+        results = slow_recognizer.analyze(TEXT, entities=["SLOW"])
+
+    assert results == []
+    assert [(timeout.recognizer, timeout.pattern) for timeout in budget.timeouts] == [
+        ("SlowRecognizer", "slow"),
+        ("SlowRecognizer", "fast"),
+    ]
+
+
+def test_when_request_timeout_then_remaining_time_shared_by_patterns():
+    budget = RegexTimeBudget(pattern_timeout=5, request_timeout=1)
+    assert 0 < budget.get_timeout() <= 1
+    assert budget.get_timeout(0.1) == 0.1
+
+
+class RecordingAppTracer(AppTracerMock):
+    def __init__(self):
+        super().__init__(enable_decision_process=True)
+        self.traces = []
+
+    def trace(self, request_id, trace_data):
+        self.traces.append((request_id, trace_data))
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_when_request_times_out_then_reported_in_decision_process(
+    slow_recognizer, max_workers
+):
+    app_tracer = RecordingAppTracer()
+    analyzer = _analyzer_engine(
+        slow_recognizer,
+        regex_request_timeout=0.1,
+        app_tracer=app_tracer,
+        log_decision_process=True,
+        max_workers=max_workers,
+    )
+
+    analyzer.analyze(TEXT, language="en", correlation_id="request-1")
+
+    timeouts = [
+        json.loads(trace_data[len("regex timeout: ") :])
+        for _, trace_data in app_tracer.traces
+        if trace_data.startswith("regex timeout: ")
+    ]
+    # The slow pattern exhausts the request's budget, so the fast one is skipped
+    assert [(timeout["pattern"], timeout["text"]) for timeout in timeouts] == [
+        ("slow", TEXT),
+        ("fast", TEXT),
+    ]
+    assert timeouts[0]["timeout"] == pytest.approx(0.1, abs=0.01)
+    assert timeouts[1]["timeout"] == 0
+    assert all(request_id == "request-1" for request_id, _ in app_tracer.traces)
+
+
+def test_when_combined_pattern_matching_then_timeouts_enforced(slow_recognizer):
+    analyzer = _analyzer_engine(
+        slow_recognizer, regex_timeout=0.05, combined_pattern_matching=True
+    )
+
+    results = analyzer.analyze(TEXT, language="en")
+
+    assert [(result.start, result.end) for result in results] == [(41, 42)]
+
+
+def test_when_no_timeouts_then_no_budget_created(slow_recognizer):
+    analyzer = _analyzer_engine(slow_recognizer)
+    assert analyzer._create_regex_time_budget() is None
+
+
+def test_when_timeout_recorded_then_offending_input_kept():
+    budget = RegexTimeBudget()
+    timeout = RegexTimeout("recognizer", "pattern", 0.1, "text")
+    budget.add_timeout(timeout)
+    assert budget.timeouts == [timeout]
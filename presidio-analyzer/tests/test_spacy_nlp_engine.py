@@ -67,3 +67,136 @@ def test_default_configuration_correct():
     )
 
     assert actual_config_json == expected_config_json
+
+
+def test_when_stopword_checked_then_same_as_vocab_and_vocab_unchanged():
+    import spacy
+
+    nlp = spacy.blank("en")
+    spacy_nlp_engine = SpacyNlpEngine()
+    spacy_nlp_engine.nlp = {"en": nlp}
+    words = ["the", "The", "THE", "john", ",", "...", "-", "a-b", "", "42"]
+    vocab_size = len(nlp.vocab.strings)
+
+    is_stopword = [spacy_nlp_engine.is_stopword(word, "en") for word in words]
+    is_punct = [spacy_nlp_engine.is_punct(word, "en") for word in words]
+
+    assert len(nlp.vocab.strings) == vocab_size
+    assert is_stopword == [nlp.vocab[word].is_stop for word in words]
+    assert is_punct == [nlp.vocab[word].is_punct for word in words]
+
+
+def test_when_compact_artifacts_then_doc_not_retained_and_artifacts_equivalent():
+    import spacy
+
+    from presidio_analyzer import AnalyzerEngine, RecognizerRegistry
+    from presidio_analyzer.nlp_engine import CompactNlpArtifacts, CompactTokens
+    from presidio_analyzer.predefined_recognizers import SpacyRecognizer
+
+    nlp = spacy.blank("en")
+    nlp.add_pipe("entity_ruler").add_patterns(
+        [{"label": "PERSON", "pattern": "John"}]
+    )
+    text = "My name is John and my phone number is 212-555-1234"
+
+    def analyze(compact_artifacts):
+        spacy_nlp_engine = SpacyNlpEngine(compact_artifacts=compact_artifacts)
+        spacy_nlp_engine.nlp = {"en": nlp}
+        registry = RecognizerRegistry(
+            recognizers=[SpacyRecognizer(supported_entities=["PERSON"])]
+        )
+        analyzer = AnalyzerEngine(registry=registry, nlp_engine=spacy_nlp_engine)
+        nlp_artifacts = spacy_nlp_engine.process_text(text, language="en")
+        results = analyzer.analyze(
+            text, language="en", context=["name"], nlp_artifacts=nlp_artifacts
+        )
+        return nlp_artifacts, results
+
+    nlp_artifacts, results = analyze(False)
+    compact_nlp_artifacts, compact_results = analyze(True)
+
+    assert isinstance(compact_nlp_artifacts, CompactNlpArtifacts)
+    assert isinstance(compact_nlp_artifacts.tokens, CompactTokens)
+    assert list(compact_nlp_artifacts.tokens) == [t.text for t in nlp_artifacts.tokens]
+    assert list(compact_nlp_artifacts.tokens_indices) == nlp_artifacts.tokens_indices
+    assert compact_nlp_artifacts.lemmas == nlp_artifacts.lemmas
+    assert [tuple(ent) for ent in compact_nlp_artifacts.entities] == [
+        (ent.label_, ent.start_char, ent.end_char, ent.text)
+        for ent in nlp_artifacts.entities
+    ]
+    assert compact_nlp_artifacts.to_json() == nlp_artifacts.to_json()
+
+    assert len(results) == 1
+    assert compact_results == results
+
+
+def test_when_compact_tokens_sliced_then_list_of_token_texts_returned():
+    from array import array
+
+    from presidio_analyzer.nlp_engine import CompactTokens
+
+    text = "My name is John"
+    tokens = CompactTokens(text, array("q", [0, 3, 8, 11]), array("q", [2, 7, 10, 15]))
+    token_texts = ["My", "name", "is", "John"]
+
+    assert tokens[1] == "name"
+    assert tokens[-1] == "John"
+    assert tokens[1:3] == token_texts[1:3]
+    assert tokens[::-2] == token_texts[::-2]
+    assert tokens[5:] == []
+
+
+@pytest.fixture(scope="module")
+def recording_spacy_nlp_engine():
+    import spacy
+    from spacy.language import Language
+
+    called_components = []
+
+    @Language.factory("presidio_recording_component")
+    def create_recording_component(nlp, name):
+        def record(doc):
+            called_components.append(name)
+            return doc
+
+        return record
+
+    nlp = spacy.blank("en")
+    for name in ("tok2vec", "tagger", "parser", "ner"):
+        nlp.add_pipe("presidio_recording_component", name=name)
+
+    spacy_nlp_engine = SpacyNlpEngine()
+    spacy_nlp_engine.nlp = {"en": nlp}
+    return spacy_nlp_engine, called_components
+
+
+@pytest.mark.parametrize(
+    "required_artifacts, expected_components",
+    [
+        (None, ["tok2vec", "tagger", "parser", "ner"]),
+        (set(), []),
+        ({"lemmas"}, ["tok2vec", "tagger"]),
+        ({"entities"}, ["tok2vec", "ner"]),
+        ({"entities", "lemmas"}, ["tok2vec", "tagger", "ner"]),
+    ],
+)
+def test_when_partial_processing_then_only_required_components_run(
+    recording_spacy_nlp_engine, required_artifacts, expected_components
+):
+    spacy_nlp_engine, called_components = recording_spacy_nlp_engine
+
+    called_components.clear()
+    nlp_artifacts = spacy_nlp_engine.process_text_partial(
+        "simple text", "en", required_artifacts
+    )
+    assert called_components == expected_components
+    assert [token.text for token in nlp_artifacts.tokens] == ["simple", "text"]
+
+    called_components.clear()
+    batch = list(
+        spacy_nlp_engine.process_batch_partial(
+            ["simple text"], "en", required_artifacts
+        )
+    )
+    assert called_components == expected_components
+    assert batch[0][0] == "simple text"
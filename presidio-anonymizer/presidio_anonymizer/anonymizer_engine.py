@@ -1,10 +1,18 @@
 """Handles the entire logic of the Presidio-anonymizer and text anonymizing."""
 
+import asyncio
+import heapq
 import logging
 import re
-from typing import Dict, List, Optional, Type
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from concurrent.futures import Executor
+from functools import partial
+from typing import Dict, List, Optional, Tuple, Type
 
 from presidio_anonymizer.core import EngineBase
+from presidio_anonymizer.core.metrics_recorder import CONFLICT_RESOLUTION_DURATION
 from presidio_anonymizer.entities import (
     ConflictResolutionStrategy,
     EngineResult,
@@ -18,12 +26,65 @@ DEFAULT = "replace"
 logger = logging.getLogger("presidio-anonymizer")
 
 
+class _ConflictIndex:
+    """
+    Index of results, finding whether a result conflicts with an indexed one.
+
+    A result conflicts with an indexed result containing it, or having the same
+    indices and a higher or equal score (see `RecognizerResult.has_conflict`).
+    Results starting before the result are searched using a Fenwick tree
+    of the maximal end by start, so adding and searching take O(log n).
+
+    :param starts: The start of all results which may be added to the index
+    """
+
+    def __init__(self, starts: List[int]):
+        self._starts = sorted(set(starts))
+        self._max_ends = [-1] * (len(self._starts) + 1)
+        self._max_end_by_start: Dict[int, int] = {}
+        self._max_score_by_indices: Dict[Tuple[int, int], float] = {}
+
+    def add(self, result: RecognizerResult) -> None:
+        """Add a result to the index."""
+        position = bisect_left(self._starts, result.start) + 1
+        while position < len(self._max_ends):
+            self._max_ends[position] = max(self._max_ends[position], result.end)
+            position += position & -position
+
+        self._max_end_by_start[result.start] = max(
+            self._max_end_by_start.get(result.start, -1), result.end
+        )
+        indices = (result.start, result.end)
+        max_score = self._max_score_by_indices.get(indices)
+        if max_score is None or result.score > max_score:
+            self._max_score_by_indices[indices] = result.score
+
+    def has_conflict(self, result: RecognizerResult) -> bool:
+        """Check if the result conflicts with any result in the index."""
+        max_score = self._max_score_by_indices.get((result.start, result.end))
+        if max_score is not None and result.score <= max_score:
+            return True
+        if self._max_end_by_start.get(result.start, -1) > result.end:
+            return True
+
+        # Maximal end of the results starting before the result
+        position = bisect_left(self._starts, result.start)
+        max_end = -1
+        while position > 0:
+            max_end = max(max_end, self._max_ends[position])
+            position -= position & -position
+        return max_end >= result.end
+
+
 class AnonymizerEngine(EngineBase):
     """
     AnonymizerEngine class.
 
     Handles the entire logic of the Presidio-anonymizer. Gets the original text
     and replaces the PII entities with the desired anonymizers.
+
+    :param metrics: instance of type MetricsRecorder, receiving the timings
+    of the conflict resolution and operators. If None, no metrics are recorded.
     """
 
     def anonymize(
@@ -83,10 +144,18 @@ class AnonymizerEngine(EngineBase):
 
 
         """
+        if self.metrics.enabled:
+            start_time = time.perf_counter()
+
         analyzer_results = self._remove_conflicts_and_get_text_manipulation_data(
             analyzer_results, conflict_resolution
         )
 
+        if self.metrics.enabled:
+            self.metrics.record_duration(
+                CONFLICT_RESOLUTION_DURATION, time.perf_counter() - start_time
+            )
+
         merged_results = self._merge_entities_with_whitespace_between(
             text, analyzer_results
         )
@@ -100,6 +169,44 @@ class AnonymizerEngine(EngineBase):
             operator_type=OperatorType.Anonymize,
         )
 
+    async def anonymize_async(
+        self,
+        text: str,
+        analyzer_results: List[RecognizerResult],
+        operators: Optional[Dict[str, OperatorConfig]] = None,
+        conflict_resolution: ConflictResolutionStrategy = (
+            ConflictResolutionStrategy.MERGE_SIMILAR_OR_CONTAINED
+        ),
+        executor: Optional[Executor] = None,
+    ) -> EngineResult:
+        """Anonymize the given text without blocking the event loop.
+
+        Same as `anonymize`, for use in asyncio applications.
+
+        :param text: the text we are anonymizing
+        :param analyzer_results: A list of RecognizerResult class -> The results we
+        received from the analyzer
+        :param operators: The configuration of the anonymizers we would like
+        to use for each entity e.g.: {"PHONE_NUMBER":OperatorConfig("redact", {})}
+        :param conflict_resolution: The configuration designed to handle conflicts
+        among entities
+        :param executor: The executor to run the anonymization on.
+        If None, the event loop's default executor is used.
+        :return: the anonymized text and a list of information about the
+        anonymized entities.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor,
+            partial(
+                self.anonymize,
+                text=text,
+                analyzer_results=analyzer_results,
+                operators=operators,
+                conflict_resolution=conflict_resolution,
+            ),
+        )
+
     def add_anonymizer(self, anonymizer_cls: Type[Operator]) -> None:
         """
         Add a new anonymizer to the engine.
@@ -129,81 +236,160 @@ class AnonymizerEngine(EngineBase):
         Only insert results which are:
         1. Indices are not contained in other result.
         2. Have the same indices as other results but with larger score.
+        Intersecting results of the same entity type are merged first.
+        Runs in O(n log n) for n results.
         :return: List
         """
-        tmp_analyzer_results = []
-        # This list contains all elements which we need to check a single result
-        # against. If a result is dropped, it can also be dropped from this list
-        # since it is intersecting with another result and we selected the other one.
-        other_elements = analyzer_results.copy()
-        for result in analyzer_results:
-            other_elements.remove(result)
-
-            is_merge_same_entity_type = False
-            for other_element in other_elements:
-                if other_element.entity_type != result.entity_type:
-                    continue
-                if result.intersects(other_element) == 0:
-                    continue
-
-                other_element.start = min(result.start, other_element.start)
-                other_element.end = max(result.end, other_element.end)
-                other_element.score = max(result.score, other_element.score)
-                is_merge_same_entity_type = True
-                break
-            if not is_merge_same_entity_type:
-                other_elements.append(result)
-                tmp_analyzer_results.append(result)
-            else:
+        merged_results = self._merge_results_of_same_entity_type(analyzer_results)
+        unique_text_metadata_elements = self._remove_conflicted_results(
+            merged_results
+        )
+
+        # This further improves the quality of handling the conflict between the
+        # various entities overlapping. This will not drop the results insted
+        # it adjust the start and end positions of overlapping results and removes
+        # All types of conflicts among entities as well as text.
+        if conflict_resolution == ConflictResolutionStrategy.REMOVE_INTERSECTIONS:
+            unique_text_metadata_elements = self._remove_intersections(
+                unique_text_metadata_elements
+            )
+        return unique_text_metadata_elements
+
+    def _merge_results_of_same_entity_type(
+        self, analyzer_results: List[RecognizerResult]
+    ) -> List[RecognizerResult]:
+        """
+        Merge intersecting results of the same entity type.
+
+        Results of the same entity type connected by intersections are merged
+        into the last of them in the list, which is extended to span all of them,
+        and gets their highest score. Empty results don't intersect any result.
+        The results are grouped in a single sweep over the results sorted by start.
+
+        :param analyzer_results: The results to merge
+        :return: The remaining results, in their original order
+        """
+        indexes_by_entity_type = defaultdict(list)
+        for index, result in enumerate(analyzer_results):
+            indexes_by_entity_type[result.entity_type].append(index)
+
+        remaining_indexes = []
+        for indexes in indexes_by_entity_type.values():
+            indexes.sort(key=lambda index: analyzer_results[index].start)
+            groups = []
+            group_end = 0
+            for index in indexes:
+                result = analyzer_results[index]
+                if result.start == result.end:
+                    remaining_indexes.append(index)
+                elif groups and result.start < group_end:
+                    groups[-1].append(index)
+                    group_end = max(group_end, result.end)
+                else:
+                    groups.append([index])
+                    group_end = result.end
+            remaining_indexes.extend(
+                self.__merge_group(analyzer_results, group) for group in groups
+            )
+
+        return [analyzer_results[index] for index in sorted(remaining_indexes)]
+
+    def __merge_group(
+        self, analyzer_results: List[RecognizerResult], group: List[int]
+    ) -> int:
+        """Merge a group of intersecting results and return the remaining index."""
+        remaining_index = max(group)
+        if len(group) == 1:
+            return remaining_index
+
+        group_results = [analyzer_results[index] for index in group]
+        start = min(result.start for result in group_results)
+        end = max(result.end for result in group_results)
+        score = max(result.score for result in group_results)
+        for index in group:
+            if index != remaining_index:
                 self.logger.debug(
-                    f"removing element {result} from " f"results list due to merge"
+                    f"removing element {analyzer_results[index]} from "
+                    f"results list due to merge"
                 )
 
-        unique_text_metadata_elements = []
-        # This list contains all elements which we need to check a single result
-        # against. If a result is dropped, it can also be dropped from this list
-        # since it is intersecting with another result and we selected the other one.
-        other_elements = tmp_analyzer_results.copy()
-        for result in tmp_analyzer_results:
-            other_elements.remove(result)
-            result_conflicted = self.__is_result_conflicted_with_other_elements(
-                other_elements, result
+        remaining_result = analyzer_results[remaining_index]
+        remaining_result.start = start
+        remaining_result.end = end
+        remaining_result.score = score
+        return remaining_index
+
+    def _remove_conflicted_results(
+        self, results: List[RecognizerResult]
+    ) -> List[RecognizerResult]:
+        """
+        Remove results conflicting with other results (see `has_conflict`).
+
+        A result is removed if it conflicts with a result after it in the list,
+        or with a result before it which wasn't removed.
+
+        :param results: The results to filter
+        :return: The remaining results, in their original order
+        """
+        starts = [result.start for result in results]
+
+        later_results = _ConflictIndex(starts)
+        conflicts_with_later_result = [False] * len(results)
+        for index in reversed(range(len(results))):
+            conflicts_with_later_result[index] = later_results.has_conflict(
+                results[index]
             )
-            if not result_conflicted:
-                other_elements.append(result)
-                unique_text_metadata_elements.append(result)
-            else:
+            later_results.add(results[index])
+
+        kept_results = _ConflictIndex(starts)
+        unique_results = []
+        for result, conflicted in zip(results, conflicts_with_later_result):
+            if conflicted or kept_results.has_conflict(result):
                 self.logger.debug(
                     f"removing element {result} from results list due to conflict"
                 )
+                continue
+            kept_results.add(result)
+            unique_results.append(result)
+        return unique_results
 
-        # This further improves the quality of handling the conflict between the
-        # various entities overlapping. This will not drop the results insted
-        # it adjust the start and end positions of overlapping results and removes
-        # All types of conflicts among entities as well as text.
-        if conflict_resolution == ConflictResolutionStrategy.REMOVE_INTERSECTIONS:
-            unique_text_metadata_elements.sort(key=lambda element: element.start)
-            elements_length = len(unique_text_metadata_elements)
-            index = 0
-            while index < elements_length - 1:
-                current_entity = unique_text_metadata_elements[index]
-                next_entity = unique_text_metadata_elements[index + 1]
-                if current_entity.end <= next_entity.start:
-                    index += 1
-                else:
-                    if current_entity.score >= next_entity.score:
-                        next_entity.start = current_entity.end
-                    else:
-                        current_entity.end = next_entity.start
-                    unique_text_metadata_elements.sort(
-                        key=lambda element: element.start
-                    )
-            unique_text_metadata_elements = [
-                element
-                for element in unique_text_metadata_elements
-                if element.start <= element.end
-            ]
-        return unique_text_metadata_elements
+    @staticmethod
+    def _remove_intersections(
+        results: List[RecognizerResult],
+    ) -> List[RecognizerResult]:
+        """
+        Adjust the start and end of intersecting results so they don't intersect.
+
+        Sweeps the results by start. When the current result intersects
+        the next one, the one with the lower score is shortened,
+        and the next result is moved back in the sweep if its start changed.
+        Results which become invalid (start after end) are removed.
+
+        :param results: The results to adjust
+        :return: The adjusted results, sorted by start
+        """
+        # (start, order, result): results with the same start are ordered
+        # by their position in the list, and a moved result comes first
+        queue = [(result.start, index, result) for index, result in enumerate(results)]
+        heapq.heapify(queue)
+        moved_order = 0
+
+        sorted_results = []
+        current = None
+        while queue:
+            next_result = queue[0][2]
+            if current is None or current.end <= next_result.start:
+                current = heapq.heappop(queue)[2]
+                sorted_results.append(current)
+            elif current.score >= next_result.score:
+                heapq.heappop(queue)
+                next_result.start = current.end
+                moved_order -= 1
+                heapq.heappush(queue, (next_result.start, moved_order, next_result))
+            else:
+                current.end = next_result.start
+
+        return [result for result in sorted_results if result.start <= result.end]
 
     def _merge_entities_with_whitespace_between(
         self, text: str, analyzer_results: List[RecognizerResult]
@@ -226,12 +412,6 @@ class AnonymizerEngine(EngineBase):
         names = [p for p in self.operators_factory.get_anonymizers().keys()]
         return names
 
-    @staticmethod
-    def __is_result_conflicted_with_other_elements(other_elements, result):
-        return any(
-            [result.has_conflict(other_element) for other_element in other_elements]
-        )
-
     @staticmethod
     def __check_or_add_default_operator(
         operators: Dict[str, OperatorConfig],
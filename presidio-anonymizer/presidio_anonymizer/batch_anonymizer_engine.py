@@ -1,3 +1,4 @@
+import asyncio
 import collections
 from typing import Any, Dict, Iterable, List, Optional, Union
 
@@ -45,6 +46,52 @@ class BatchAnonymizerEngine:
 
         return return_list
 
+    async def anonymize_list_async(
+        self,
+        texts: List[Optional[Union[str, bool, int, float]]],
+        recognizer_results_list: List[List[RecognizerResult]],
+        max_concurrency: Optional[int] = None,
+        **kwargs,
+    ) -> List[Union[str, Any]]:
+        """
+        Anonymize a list of strings concurrently, without blocking the event loop.
+
+        :param texts: List containing the texts to be anonymized (original texts).
+            Items with a `type` not in `(str, bool, int, float)` will not be anonymized.
+        :param recognizer_results_list: A list of lists of RecognizerResult,
+        the output of the AnalyzerEngine on each text in the list.
+        :param max_concurrency: Maximum number of texts anonymized at once.
+        If None, all texts are anonymized at once.
+        :param kwargs: Additional kwargs for the `AnonymizerEngine.anonymize_async`
+        method
+        """
+        if not recognizer_results_list:
+            recognizer_results_list = [[] for _ in range(len(texts))]
+        semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+        async def anonymize_text(text, recognizer_results):
+            if type(text) not in (str, bool, int, float):
+                return text
+            if not semaphore:
+                res = await self.anonymizer_engine.anonymize_async(
+                    text=str(text), analyzer_results=recognizer_results, **kwargs
+                )
+                return res.text
+            async with semaphore:
+                res = await self.anonymizer_engine.anonymize_async(
+                    text=str(text), analyzer_results=recognizer_results, **kwargs
+                )
+                return res.text
+
+        return list(
+            await asyncio.gather(
+                *[
+                    anonymize_text(text, recognizer_results)
+                    for text, recognizer_results in zip(texts, recognizer_results_list)
+                ]
+            )
+        )
+
     def anonymize_dict(
         self, analyzer_results: Iterable[DictRecognizerResult], **kwargs
     ) -> Dict[str, str]:
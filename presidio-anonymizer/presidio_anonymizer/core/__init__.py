@@ -1,6 +1,7 @@
 """The core text functionality."""
 
 from .engine_base import EngineBase
+from .metrics_recorder import MetricsRecorder
 from .text_replace_builder import TextReplaceBuilder
 
-__all__ = ["EngineBase", "TextReplaceBuilder"]
+__all__ = ["EngineBase", "MetricsRecorder", "TextReplaceBuilder"]
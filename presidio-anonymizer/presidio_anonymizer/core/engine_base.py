@@ -1,9 +1,16 @@
 """Handle the entire text operations using the operators."""
 
 import logging
+import time
 from abc import ABC
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
+from presidio_anonymizer.core.metrics_recorder import (
+    NO_OP_METRICS_RECORDER,
+    OPERATE_DURATION,
+    OPERATOR_DURATION,
+    MetricsRecorder,
+)
 from presidio_anonymizer.core.text_replace_builder import TextReplaceBuilder
 from presidio_anonymizer.entities import (
     EngineResult,
@@ -11,15 +18,21 @@ from presidio_anonymizer.entities import (
     OperatorResult,
     PIIEntity,
 )
-from presidio_anonymizer.operators import OperatorsFactory, OperatorType
+from presidio_anonymizer.operators import Operator, OperatorsFactory, OperatorType
 
 
 class EngineBase(ABC):
-    """Handle the logic of operations over the text using the operators."""
+    """
+    Handle the logic of operations over the text using the operators.
+
+    :param metrics: instance of type MetricsRecorder, receiving the timings
+    of the operators. If None, no metrics are recorded.
+    """
 
-    def __init__(self):
+    def __init__(self, metrics: Optional[MetricsRecorder] = None):
         self.logger = logging.getLogger("presidio-anonymizer")
         self.operators_factory = OperatorsFactory()
+        self.metrics = metrics if metrics is not None else NO_OP_METRICS_RECORDER
 
     def _operate(
         self,
@@ -39,9 +52,14 @@ class EngineBase(ABC):
         we want to perform over this entity_type.
         :return:
         """
+        if self.metrics.enabled:
+            start_time = time.perf_counter()
+
         text_replace_builder = TextReplaceBuilder(original_text=text)
         engine_result = EngineResult()
         sorted_pii_entities = sorted(pii_entities, reverse=True)
+        operated_entities = []
+        validated_operators = {}
         for entity in sorted_pii_entities:
             text_to_operate_on = text_replace_builder.get_text_in_position(
                 entity.start, entity.end
@@ -51,51 +69,81 @@ class EngineBase(ABC):
             operator_metadata = self.__get_entity_operator_metadata(
                 entity.entity_type, operators_metadata
             )
-            changed_text = self.__operate_on_text(
-                entity, text_to_operate_on, operator_metadata, operator_type
+            if self.metrics.enabled:
+                operator_start_time = time.perf_counter()
+            operator, params = self.__get_validated_operator(
+                entity.entity_type,
+                operator_metadata,
+                operator_type,
+                validated_operators,
             )
-            index_from_end = text_replace_builder.replace_text_get_insertion_index(
-                changed_text, entity.start, entity.end
+            self.logger.debug(f"operating on {entity.entity_type} with {operator}")
+            changed_text = operator.operate(params=params, text=text_to_operate_on)
+            if self.metrics.enabled:
+                self.metrics.record_duration(
+                    OPERATOR_DURATION,
+                    time.perf_counter() - operator_start_time,
+                    {
+                        "operator": operator_metadata.operator_name,
+                        "entity_type": entity.entity_type,
+                    },
+                )
+            text_replace_builder.replace_text(changed_text, entity.start, entity.end)
+            operated_entities.append(
+                (entity.entity_type, changed_text, operator_metadata.operator_name)
             )
 
-            # The following creates an intermediate list of result entities,
-            # ordered from end to start, and the indexes will be normalized
-            # from start to end once the loop ends and the text length is deterministic.
-            result_item = OperatorResult(
-                0,
-                index_from_end,
-                entity.entity_type,
-                changed_text,
-                operator_metadata.operator_name,
+        engine_result.set_text(text_replace_builder.output_text)
+        # Result items are ordered from end to start, like the replacements
+        for (entity_type, changed_text, operator_name), (start, end) in zip(
+            operated_entities, text_replace_builder.get_replacement_indexes()
+        ):
+            engine_result.add_item(
+                OperatorResult(start, end, entity_type, changed_text, operator_name)
             )
-            engine_result.add_item(result_item)
 
-        engine_result.set_text(text_replace_builder.output_text)
-        engine_result.normalize_item_indexes()
+        if self.metrics.enabled:
+            self.metrics.record_duration(
+                OPERATE_DURATION,
+                time.perf_counter() - start_time,
+                {"operator_type": operator_type.name.lower()},
+            )
         return engine_result
 
-    def __operate_on_text(
+    def __get_validated_operator(
         self,
-        text_metadata: PIIEntity,
-        text_to_operate_on: str,
+        entity_type: str,
         operator_metadata: OperatorConfig,
         operator_type: OperatorType,
-    ) -> str:
-        entity_type = text_metadata.entity_type
+        validated_operators: Dict[Tuple[int, str], Tuple[Operator, Dict]],
+    ) -> Tuple[Operator, Dict]:
+        """
+        Get the operator and the parameters to operate on an entity type with.
+
+        The operator is created and validated once per operator config
+        and entity type, and reused for the following entities.
+        The parameters are a copy of the config's parameters with the entity type,
+        so the caller's config isn't modified.
+
+        :param validated_operators: The operators validated in the current call
+        :return: The operator and its parameters
+        """
+        key = (id(operator_metadata), entity_type)
+        validated_operator = validated_operators.get(key)
+        if validated_operator:
+            return validated_operator
+
         self.logger.debug(f"getting operator for {entity_type}")
         operator = self.operators_factory.create_operator_class(
             operator_metadata.operator_name, operator_type
         )
         self.logger.debug(f"validating operator {operator} for {entity_type}")
-        params = operator_metadata.params
-        params["entity_type"] = entity_type
+        params = {**operator_metadata.params, "entity_type": entity_type}
 
         operator.validate(params=params)
 
-        self.logger.debug(f"operating on {entity_type} with {operator}")
-        operated_on_text = operator.operate(params=params, text=text_to_operate_on)
-
-        return operated_on_text
+        validated_operators[key] = (operator, params)
+        return operator, params
 
     @staticmethod
     def __get_entity_operator_metadata(
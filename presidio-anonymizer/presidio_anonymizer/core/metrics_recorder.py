@@ -0,0 +1,54 @@
+"""Metrics recorded by the anonymizer engines."""
+
+from typing import Dict, Optional
+
+# Metrics recorded by the engines and their labels
+# Time spent resolving conflicts between the analyzer results
+CONFLICT_RESOLUTION_DURATION = "anonymizer_conflict_resolution_duration_seconds"
+# Total time of operating on all entities of a text (operator_type)
+OPERATE_DURATION = "anonymizer_operate_duration_seconds"
+# Time spent validating and running an operator on an entity
+# (operator, entity_type)
+OPERATOR_DURATION = "anonymizer_operator_duration_seconds"
+
+
+class MetricsRecorder:
+    """
+    Receives the timings measured by the anonymizer engines.
+
+    This base class discards all metrics, and is the default recorder.
+    Subclasses set `enabled` to True and implement `record_duration`
+    and `increment`, e.g. to export the metrics to a monitoring system.
+    The recorders of `presidio_analyzer.metrics_recorder`
+    (e.g. `PrometheusMetricsRecorder`) implement the same interface,
+    so the analyzer and anonymizer can share a recorder.
+    Measurements are only taken when the recorder is enabled,
+    so the default recorder adds no timing overhead.
+    """
+
+    enabled = False
+
+    def record_duration(
+        self, name: str, seconds: float, labels: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Record the duration of an operation.
+
+        :param name: The metric name, e.g. OPERATOR_DURATION
+        :param seconds: The duration in seconds
+        :param labels: The labels of the measurement, e.g. the operator name
+        """
+
+    def increment(
+        self, name: str, value: int = 1, labels: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Increment a counter.
+
+        :param name: The metric name
+        :param value: The value to add to the counter
+        :param labels: The labels of the measurement
+        """
+
+
+NO_OP_METRICS_RECORDER = MetricsRecorder()
@@ -1,19 +1,38 @@
 """Handles the original text and creates a new one according to changes requests."""
 
 import logging
+from typing import List, Optional, Tuple
 
 from presidio_anonymizer.entities import InvalidParamError
 
 
 class TextReplaceBuilder:
-    """Creates new text according to users request."""
+    """
+    Creates new text according to users request.
+
+    Replacements are made from the end of the text to its start.
+    They are collected, and the output text is built in a single pass
+    when it is first accessed, so the time to replace N entities
+    is linear in the length of the text rather than N times the length.
+    """
 
     def __init__(self, original_text: str):
         self.logger = logging.getLogger("presidio-anonymizer")
-        self.output_text = original_text
         self.original_text = original_text
         self.text_len = len(original_text)
         self.last_replacement_index = self.text_len
+        # (replacement text, start, end) in the original text, from end to start
+        self._replacements: List[Tuple[str, int, int]] = []
+        self._output_len = self.text_len
+        self._output_text: Optional[str] = original_text
+        self._replacement_indexes: List[Tuple[int, int]] = []
+
+    @property
+    def output_text(self) -> str:
+        """The text with all replacements made so far."""
+        if self._output_text is None:
+            self.__build_output_text()
+        return self._output_text
 
     def get_text_in_position(self, start: int, end: int) -> str:
         """
@@ -26,27 +45,72 @@ class TextReplaceBuilder:
         self.__validate_position_in_text(start, end)
         return self.original_text[start:end]
 
-    def replace_text_get_insertion_index(
-        self, replacement_text: str, start: int, end: int
-    ) -> int:
+    def replace_text(self, replacement_text: str, start: int, end: int) -> None:
         """
         Replace text in a specific position with the text.
 
+        Replacements should be made from the end of the text to its start.
+        If the position overlaps a previous replacement,
+        the part of the text already replaced is kept.
+
         :param replacement_text: new text to replace the old text according to indices
         :param start: the startpoint to replace the text
         :param end: the endpoint to replace the text
-        :return: The index of inserted text
         """
         end_of_text_index = min(end, self.last_replacement_index)
         self.last_replacement_index = start
 
-        before_text = self.output_text[:start]
-        after_text = self.output_text[end_of_text_index:]
-        self.output_text = before_text + replacement_text + after_text
+        self._replacements.append((replacement_text, start, end_of_text_index))
+        self._output_len += start - end_of_text_index + len(replacement_text)
+        self._output_text = None
+
+    def replace_text_get_insertion_index(
+        self, replacement_text: str, start: int, end: int
+    ) -> int:
+        """
+        Replace text in a specific position with the text.
+
+        :param replacement_text: new text to replace the old text according to indices
+        :param start: the startpoint to replace the text
+        :param end: the endpoint to replace the text
+        :return: The index of inserted text, from the end of the output text
+        """
+        after_text_len = self._output_len - min(end, self.last_replacement_index)
+        self.replace_text(replacement_text, start, end)
 
         # The replace algorithm is replacing the text from end to start.
         # calculate and return the start point from the end.
-        return len(after_text) + len(replacement_text)
+        return after_text_len + len(replacement_text)
+
+    def get_replacement_indexes(self) -> List[Tuple[int, int]]:
+        """
+        Get the position of each replacement in the output text.
+
+        :return: The start and end index of each replacement in the output text,
+        in the order the replacements were made
+        """
+        if self._output_text is None:
+            self.__build_output_text()
+        return list(self._replacement_indexes)
+
+    def __build_output_text(self) -> None:
+        """Build the output text and the replacement indexes in a single pass."""
+        parts = []
+        indexes = []
+        original_index = 0
+        output_index = 0
+        for replacement_text, start, end in reversed(self._replacements):
+            parts.append(self.original_text[original_index:start])
+            parts.append(replacement_text)
+            output_index += start - original_index
+            indexes.append((output_index, output_index + len(replacement_text)))
+            output_index += len(replacement_text)
+            original_index = end
+        parts.append(self.original_text[original_index:])
+
+        indexes.reverse()
+        self._output_text = "".join(parts)
+        self._replacement_indexes = indexes
 
     def __validate_position_in_text(self, start: int, end: int):
         """Validate the start and end position match the text length."""
@@ -1,8 +1,9 @@
+import asyncio
 from typing import Dict, List
 
 import pytest
 
-from presidio_anonymizer import AnonymizerEngine
+from presidio_anonymizer import AnonymizerEngine, MetricsRecorder
 from presidio_anonymizer.entities import (
     InvalidParamError,
     RecognizerResult,
@@ -11,7 +12,7 @@ from presidio_anonymizer.entities import (
     OperatorResult,
     EngineResult,
 )
-from presidio_anonymizer.operators import OperatorType
+from presidio_anonymizer.operators import Operator, OperatorType
 
 
 def test_given_request_anonymizers_return_list():
@@ -36,6 +37,28 @@ def test_given_empty_anonymziers_list_then_we_fall_to_default():
     assert result == "please <SSN>."
 
 
+def test_given_anonymize_async_then_result_identical_to_anonymize():
+    engine = AnonymizerEngine()
+    text = "please REPLACE ME and ME TOO."
+    operators = {
+        "SSN": OperatorConfig(
+            "mask", {"masking_char": "*", "chars_to_mask": 4, "from_end": False}
+        )
+    }
+
+    def analyzer_results():
+        return [
+            RecognizerResult("SSN", 7, 17, 0.8),
+            RecognizerResult("PERSON", 22, 28, 0.8),
+        ]
+
+    result = asyncio.run(
+        engine.anonymize_async(text, analyzer_results(), operators=operators)
+    )
+
+    assert result == engine.anonymize(text, analyzer_results(), operators=operators)
+
+
 def test_given_custom_anonymizer_then_we_manage_to_anonymize_successfully():
     engine = AnonymizerEngine()
     text = (
@@ -236,6 +259,109 @@ def test_given_sorted_analyzer_results_merge_entities_separated_by_white_space(
     assert sorted(result.items) == sorted(expected.items)
 
 
+
+def test_given_metrics_recorder_then_operator_durations_recorded():
+    class RecordingMetricsRecorder(MetricsRecorder):
+        enabled = True
+
+        def __init__(self):
+            self.durations = []
+
+        def record_duration(self, name, seconds, labels=None):
+            assert seconds >= 0
+            self.durations.append((name, labels))
+
+    metrics = RecordingMetricsRecorder()
+    engine = AnonymizerEngine(metrics=metrics)
+
+    result = engine.anonymize(
+        "My name is Jane Doe, call 034453334",
+        [
+            RecognizerResult(start=11, end=19, entity_type="PERSON", score=0.8),
+            RecognizerResult(start=26, end=35, entity_type="PHONE_NUMBER", score=0.9),
+        ],
+        operators={
+            "PHONE_NUMBER": OperatorConfig(
+                "mask", {"masking_char": "*", "chars_to_mask": 4, "from_end": True}
+            )
+        },
+    )
+
+    assert result.text == "My name is <PERSON>, call 03445****"
+    assert metrics.durations == [
+        ("anonymizer_conflict_resolution_duration_seconds", None),
+        (
+            "anonymizer_operator_duration_seconds",
+            {"operator": "mask", "entity_type": "PHONE_NUMBER"},
+        ),
+        (
+            "anonymizer_operator_duration_seconds",
+            {"operator": "replace", "entity_type": "PERSON"},
+        ),
+        ("anonymizer_operate_duration_seconds", {"operator_type": "anonymize"}),
+    ]
+
+
+def test_given_no_metrics_recorder_then_no_op_recorder_used():
+    assert not AnonymizerEngine().metrics.enabled
+
+
+def test_given_many_entities_then_operator_validated_once_per_entity_type():
+    class CountingOperator(Operator):
+        instances = 0
+        validated_params = []
+
+        def __init__(self):
+            CountingOperator.instances += 1
+
+        def operate(self, text: str = None, params: Dict = None) -> str:
+            return f"<{params['entity_type']}>"
+
+        def validate(self, params: Dict = None) -> None:
+            CountingOperator.validated_params.append(params)
+
+        def operator_name(self) -> str:
+            return "counting"
+
+        def operator_type(self) -> OperatorType:
+            return OperatorType.Anonymize
+
+    engine = AnonymizerEngine()
+    engine.add_anonymizer(CountingOperator)
+    CountingOperator.instances = 0
+    text = "a b c d e f"
+    analyzer_results = [
+        RecognizerResult("PERSON" if index % 2 else "ID", index * 2, index * 2 + 1, 1)
+        for index in range(6)
+    ]
+
+    result = engine.anonymize(
+        text, analyzer_results, {"DEFAULT": OperatorConfig("counting", {"a": 1})}
+    )
+
+    assert result.text == "<ID> <PERSON> <ID> <PERSON> <ID> <PERSON>"
+    assert CountingOperator.instances == 2
+    assert sorted(
+        CountingOperator.validated_params, key=lambda params: params["entity_type"]
+    ) == [{"a": 1, "entity_type": "ID"}, {"a": 1, "entity_type": "PERSON"}]
+
+
+def test_given_operator_config_then_its_params_not_modified():
+    operator_config = OperatorConfig(
+        "mask", {"masking_char": "*", "chars_to_mask": 4, "from_end": True}
+    )
+    params = dict(operator_config.params)
+
+    result = AnonymizerEngine().anonymize(
+        "My number is 034453334",
+        [RecognizerResult("PHONE_NUMBER", 13, 22, 0.95)],
+        {"PHONE_NUMBER": operator_config},
+    )
+
+    assert result.text == "My number is 03445****"
+    assert operator_config.params == params
+
+
 def _operate(
     text: str,
     pii_entities: List[PIIEntity],
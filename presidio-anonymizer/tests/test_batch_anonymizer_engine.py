@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from presidio_anonymizer import BatchAnonymizerEngine
@@ -55,6 +57,23 @@ def test_given_analyzer_result_we_anonymize_list_correctly(
     ]
 
 
+def test_given_analyzer_result_we_anonymize_list_async_correctly(
+    engine, texts, recognizer_results_list
+):
+    new_texts = texts + [["random", 123, True]]
+    new_recognizer_results_list = recognizer_results_list + [[]]
+    anonymize_results = asyncio.run(
+        engine.anonymize_list_async(
+            texts=new_texts,
+            recognizer_results_list=new_recognizer_results_list,
+            max_concurrency=2,
+        )
+    )
+    assert anonymize_results == engine.anonymize_list(
+        texts=new_texts, recognizer_results_list=new_recognizer_results_list
+    )
+
+
 def test_given_empty_recognizers_than_we_return_text_unchanged(engine, texts):
     empty_analyzer_results = [
         DictRecognizerResult(key="name", value=texts, recognizer_results=[])
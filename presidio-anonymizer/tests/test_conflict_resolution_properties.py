@@ -0,0 +1,168 @@
+import copy
+
+import pytest
+from hypothesis import given, settings, strategies as st
+
+from presidio_anonymizer import AnonymizerEngine
+from presidio_anonymizer.entities import (
+    ConflictResolutionStrategy,
+    OperatorConfig,
+    RecognizerResult,
+)
+from presidio_anonymizer.operators import OperatorType
+
+TEXT = "".join(chr(ord("a") + index % 26) for index in range(50))
+
+
+def remove_conflicts_reference(analyzer_results, conflict_resolution):
+    """Previous quadratic implementation of the conflict resolution, for comparison."""
+    tmp_analyzer_results = []
+    other_elements = analyzer_results.copy()
+    for result in analyzer_results:
+        other_elements.remove(result)
+
+        is_merge_same_entity_type = False
+        for other_element in other_elements:
+            if other_element.entity_type != result.entity_type:
+                continue
+            if result.intersects(other_element) == 0:
+                continue
+
+            other_element.start = min(result.start, other_element.start)
+            other_element.end = max(result.end, other_element.end)
+            other_element.score = max(result.score, other_element.score)
+            is_merge_same_entity_type = True
+            break
+        if not is_merge_same_entity_type:
+            other_elements.append(result)
+            tmp_analyzer_results.append(result)
+
+    unique_text_metadata_elements = []
+    other_elements = tmp_analyzer_results.copy()
+    for result in tmp_analyzer_results:
+        other_elements.remove(result)
+        result_conflicted = any(
+            [result.has_conflict(other_element) for other_element in other_elements]
+        )
+        if not result_conflicted:
+            other_elements.append(result)
+            unique_text_metadata_elements.append(result)
+
+    if conflict_resolution == ConflictResolutionStrategy.REMOVE_INTERSECTIONS:
+        unique_text_metadata_elements.sort(key=lambda element: element.start)
+        elements_length = len(unique_text_metadata_elements)
+        index = 0
+        while index < elements_length - 1:
+            current_entity = unique_text_metadata_elements[index]
+            next_entity = unique_text_metadata_elements[index + 1]
+            if current_entity.end <= next_entity.start:
+                index += 1
+            else:
+                if current_entity.score >= next_entity.score:
+                    next_entity.start = current_entity.end
+                else:
+                    current_entity.end = next_entity.start
+                unique_text_metadata_elements.sort(key=lambda element: element.start)
+        unique_text_metadata_elements = [
+            element
+            for element in unique_text_metadata_elements
+            if element.start <= element.end
+        ]
+    return unique_text_metadata_elements
+
+
+@st.composite
+def analyzer_results(draw):
+    start = draw(st.integers(min_value=0, max_value=40))
+    end = start + draw(st.integers(min_value=0, max_value=10))
+    return RecognizerResult(
+        entity_type=draw(st.sampled_from(["PERSON", "DATE_TIME", "NUMBER"])),
+        start=start,
+        end=end,
+        score=draw(st.sampled_from([0.1, 0.5, 0.85, 1.0])),
+    )
+
+
+def _describe(results, inputs):
+    # The position of the returned objects in the input list, and their values
+    positions = {id(result): index for index, result in enumerate(inputs)}
+    return [
+        (
+            positions[id(result)],
+            result.entity_type,
+            result.start,
+            result.end,
+            result.score,
+        )
+        for result in results
+    ]
+
+
+@pytest.mark.parametrize(
+    "conflict_resolution",
+    [
+        ConflictResolutionStrategy.MERGE_SIMILAR_OR_CONTAINED,
+        ConflictResolutionStrategy.REMOVE_INTERSECTIONS,
+    ],
+)
+@settings(max_examples=500, deadline=None)
+@given(results=st.lists(analyzer_results(), max_size=30))
+def test_given_any_results_then_conflicts_resolved_as_reference_implementation(
+    conflict_resolution, results
+):
+    expected_inputs = copy.deepcopy(results)
+    expected = remove_conflicts_reference(expected_inputs, conflict_resolution)
+
+    actual = AnonymizerEngine()._remove_conflicts_and_get_text_manipulation_data(
+        results, conflict_resolution
+    )
+
+    assert _describe(actual, results) == _describe(expected, expected_inputs)
+
+
+@pytest.mark.parametrize(
+    "conflict_resolution",
+    [
+        ConflictResolutionStrategy.MERGE_SIMILAR_OR_CONTAINED,
+        ConflictResolutionStrategy.REMOVE_INTERSECTIONS,
+    ],
+)
+@settings(max_examples=200, deadline=None)
+@given(results=st.lists(analyzer_results(), max_size=30))
+def test_given_any_results_then_anonymized_text_is_as_reference_implementation(
+    conflict_resolution, results
+):
+    engine = AnonymizerEngine()
+    operators = {"DEFAULT": OperatorConfig("replace")}
+    expected_results = remove_conflicts_reference(
+        copy.deepcopy(results), conflict_resolution
+    )
+    expected = engine._operate(
+        text=TEXT,
+        pii_entities=engine._merge_entities_with_whitespace_between(
+            TEXT, expected_results
+        ),
+        operators_metadata=operators,
+        operator_type=OperatorType.Anonymize,
+    )
+
+    actual = engine.anonymize(TEXT, results, operators, conflict_resolution)
+
+    assert actual == expected
+
+
+def test_given_many_overlapping_results_then_results_merged_by_entity_type():
+    # Too many results for the previous quadratic implementation
+    results = [
+        RecognizerResult("DATE_TIME" if index % 2 else "NUMBER", index, index + 5, 0.5)
+        for index in range(20000)
+    ]
+
+    engine = AnonymizerEngine()
+    unique_results = engine._remove_conflicts_and_get_text_manipulation_data(
+        results, ConflictResolutionStrategy.REMOVE_INTERSECTIONS
+    )
+
+    assert [
+        (result.entity_type, result.start, result.end) for result in unique_results
+    ] == [("NUMBER", 0, 20003), ("DATE_TIME", 20003, 20004)]
@@ -1,3 +1,5 @@
+import random
+
 import pytest
 from presidio_anonymizer.entities import InvalidParamError
 from presidio_anonymizer.core import TextReplaceBuilder
@@ -62,3 +64,49 @@ def test_given_text_and_bad_indices_then_we_get_fail(original_text, start, end):
     )
     with pytest.raises(InvalidParamError, match=err_msg):
         text_replace_builder.get_text_in_position(start, end)
+
+
+def test_given_multiple_replacements_then_we_get_text_and_indexes_correctly():
+    text_replace_builder = TextReplaceBuilder("My name is John, call 555-1234")
+    text_replace_builder.replace_text("<PHONE>", 22, 30)
+    text_replace_builder.replace_text("<PERSON>", 11, 15)
+
+    assert text_replace_builder.output_text == "My name is <PERSON>, call <PHONE>"
+    assert text_replace_builder.get_replacement_indexes() == [(26, 33), (11, 19)]
+
+
+def test_given_overlapping_replacements_then_previous_replacement_is_kept():
+    text_replace_builder = TextReplaceBuilder("hello world")
+    assert text_replace_builder.replace_text_get_insertion_index("X", 6, 11) == 1
+    assert text_replace_builder.replace_text_get_insertion_index("Y", 4, 8) == 2
+
+    assert text_replace_builder.output_text == "hellYX"
+    assert text_replace_builder.get_replacement_indexes() == [(5, 6), (4, 5)]
+
+
+def test_given_many_replacements_then_result_matches_replacing_one_by_one():
+    rng = random.Random(42)
+    original_text = "".join(rng.choice("abc ") for _ in range(500))
+    spans = sorted(
+        (rng.randrange(500), rng.randint(0, 10), rng.choice(["", "<X>", "long one"]))
+        for _ in range(100)
+    )
+
+    text_replace_builder = TextReplaceBuilder(original_text)
+    expected_text = original_text
+    last_replacement_index = len(original_text)
+    for start, length, replacement in reversed(spans):
+        end = min(start + length, len(original_text))
+        index_from_end = text_replace_builder.replace_text_get_insertion_index(
+            replacement, start, end
+        )
+        end = min(end, last_replacement_index)
+        last_replacement_index = start
+        expected_text = expected_text[:start] + replacement + expected_text[end:]
+        assert index_from_end == len(expected_text) - start
+
+    assert text_replace_builder.output_text == expected_text
+    for (start, end), (_, _, replacement) in zip(
+        text_replace_builder.get_replacement_indexes(), reversed(spans)
+    ):
+        assert expected_text[start:end] == replacement
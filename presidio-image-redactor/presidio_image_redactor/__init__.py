@@ -8,6 +8,8 @@ from .tesseract_ocr import TesseractOCR
 from .document_intelligence_ocr import DocumentIntelligenceOCR
 from .bbox import BboxProcessor
 from .image_processing_engine import ImagePreprocessor
+from .ocr_result_cache import OcrResultCache
+from .ocr_region_templates import OcrRegionTemplates
 from .image_analyzer_engine import ImageAnalyzerEngine
 from .image_redactor_engine import ImageRedactorEngine
 from .image_pii_verify_engine import ImagePiiVerifyEngine
@@ -31,6 +33,8 @@ __all__ = [
     "ImageAnalyzerEngine",
     "ImageRedactorEngine",
     "ImagePreprocessor",
+    "OcrResultCache",
+    "OcrRegionTemplates",
     "ImagePiiVerifyEngine",
     "DicomImageRedactorEngine",
     "DicomImagePiiVerifyEngine",
@@ -1,10 +1,8 @@
-import tempfile
 from copy import deepcopy
 from typing import List, Optional, Tuple
 
 import PIL
 import pydicom
-from PIL import Image
 from presidio_analyzer import PatternRecognizer
 
 from presidio_image_redactor import (
@@ -81,16 +79,9 @@ class DicomImagePiiVerifyEngine(ImagePiiVerifyEngine, DicomImageRedactorEngine):
         except AttributeError:
             raise AttributeError("Provided DICOM instance lacks pixel data.")
 
-        # Load image for processing
-        with tempfile.TemporaryDirectory() as tmpdirname:
-            # Convert DICOM to PNG and add padding for OCR (during analysis)
-            is_greyscale = self._check_if_greyscale(instance_copy)
-            image = self._rescale_dcm_pixel_array(instance_copy, is_greyscale)
-            self._save_pixel_array_as_png(image, is_greyscale, "tmp_dcm", tmpdirname)
-
-            png_filepath = f"{tmpdirname}/tmp_dcm.png"
-            loaded_image = Image.open(png_filepath)
-            image = self._add_padding(loaded_image, is_greyscale, padding_width)
+        # Convert DICOM to image and add padding for OCR (during analysis)
+        loaded_image, is_greyscale = self._convert_dcm_to_image(instance_copy)
+        image = self._add_padding(loaded_image, is_greyscale, padding_width)
 
         # Get OCR results
         perform_ocr_kwargs, ocr_threshold = (
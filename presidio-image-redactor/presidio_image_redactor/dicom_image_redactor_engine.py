@@ -1,11 +1,14 @@
+import hashlib
 import json
+import logging
 import os
+import pickle
 import shutil
-import tempfile
-import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from copy import deepcopy
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 import png
@@ -15,12 +18,25 @@ from PIL import Image, ImageOps
 from presidio_analyzer import PatternRecognizer
 from pydicom.pixel_data_handlers.util import apply_voi_lut
 
+try:
+    from pydicom.pixels import iter_pixels
+    from pydicom.pixels import pixel_array as decode_pixel_array
+except ImportError:
+    # pydicom < 3.0 decodes all frames at once
+    iter_pixels = None
+    decode_pixel_array = None
+
 from presidio_image_redactor import (
-    ImageAnalyzerEngine,  # noqa: F401
+    ImageAnalyzerEngine,
     ImageRedactorEngine,
 )
 from presidio_image_redactor.entities import ImageRecognizerResult
 
+logger = logging.getLogger("presidio-image-redactor")
+
+# Engine of the current worker process, when redacting a directory in parallel
+_worker_engine: Optional["DicomImageRedactorEngine"] = None
+
 
 class DicomImageRedactorEngine(ImageRedactorEngine):
     """Performs OCR + PII detection + bounding box redaction.
@@ -28,6 +44,16 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
     :param image_analyzer_engine: Engine which performs OCR + PII detection.
     """
 
+    # Name of the manifest file written to the output directory
+    # when redacting a directory of DICOM files
+    MANIFEST_FILE_NAME = "redaction_manifest.jsonl"
+
+    def __init__(self, image_analyzer_engine: Optional[ImageAnalyzerEngine] = None):
+        super().__init__(image_analyzer_engine)
+        # Engines with the default configuration are created again by worker
+        # processes, instead of being pickled along with their NLP models
+        self._is_default_configuration = image_analyzer_engine is None
+
     def redact_and_return_bbox(
         self,
         image: pydicom.dataset.FileDataset,
@@ -37,6 +63,7 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         use_metadata: bool = True,
         ocr_kwargs: Optional[dict] = None,
         ad_hoc_recognizers: Optional[List[PatternRecognizer]] = None,
+        frame_sample_size: Optional[int] = None,
         **text_analyzer_kwargs,
     ) -> Tuple[pydicom.dataset.FileDataset, List[Dict[str, int]]]:
         """Redact method to redact the given DICOM image and return redacted bboxes.
@@ -54,6 +81,9 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         :param ocr_kwargs: Additional params for OCR methods.
         :param ad_hoc_recognizers: List of PatternRecognizer objects to use
         for ad-hoc recognizer.
+        :param frame_sample_size: Number of evenly spaced frames of multi-frame
+        instances to detect PII on, as burned-in text is usually the same on
+        all frames. By default, all distinct frames are analyzed.
         :param text_analyzer_kwargs: Additional values for the analyze method
         in AnalyzerEngine.
 
@@ -71,35 +101,21 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         except IsADirectoryError as e:
             raise IsADirectoryError(f"DICOM instance is a directory: {e}")
 
-        instance = deepcopy(image)
-
-        # Load image for processing
-        with tempfile.TemporaryDirectory() as tmpdirname:
-            # Convert DICOM to PNG and add padding for OCR (during analysis)
-            is_greyscale = self._check_if_greyscale(instance)
-            image = self._rescale_dcm_pixel_array(instance, is_greyscale)
-            image_name = str(uuid.uuid4())
-            self._save_pixel_array_as_png(image, is_greyscale, image_name, tmpdirname)
-
-            png_filepath = f"{tmpdirname}/{image_name}.png"
-            loaded_image = Image.open(png_filepath)
-            image = self._add_padding(loaded_image, is_greyscale, padding_width)
+        # Keep pixel data decoded during analysis off the caller's instance
+        instance = self._copy_instance_without_pixel_data(image)
 
-        # Detect PII
-        analyzer_results = self._get_analyzer_results(
-            image,
+        # Detect PII on each frame
+        bboxes = self._get_redaction_bboxes(
             instance,
+            padding_width,
             use_metadata,
             ocr_kwargs,
             ad_hoc_recognizers,
+            frame_sample_size,
             **text_analyzer_kwargs,
         )
 
         # Redact all bounding boxes from DICOM file
-        analyzer_bboxes = self.bbox_processor.get_bboxes_from_analyzer_results(
-            analyzer_results
-        )
-        bboxes = self.bbox_processor.remove_bbox_padding(analyzer_bboxes, padding_width)
         redacted_image = self._add_redact_box(instance, bboxes, crop_ratio, fill)
 
         return redacted_image, bboxes
@@ -112,6 +128,7 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         crop_ratio: float = 0.75,
         ocr_kwargs: Optional[dict] = None,
         ad_hoc_recognizers: Optional[List[PatternRecognizer]] = None,
+        frame_sample_size: Optional[int] = None,
         **text_analyzer_kwargs,
     ) -> pydicom.dataset.FileDataset:
         """Redact method to redact the given DICOM image.
@@ -127,6 +144,9 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         :param ocr_kwargs: Additional params for OCR methods.
         :param ad_hoc_recognizers: List of PatternRecognizer objects to use
         for ad-hoc recognizer.
+        :param frame_sample_size: Number of evenly spaced frames of multi-frame
+        instances to detect PII on, as burned-in text is usually the same on
+        all frames. By default, all distinct frames are analyzed.
         :param text_analyzer_kwargs: Additional values for the analyze method
         in AnalyzerEngine.
 
@@ -139,6 +159,7 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
             crop_ratio=crop_ratio,
             ocr_kwargs=ocr_kwargs,
             ad_hoc_recognizers=ad_hoc_recognizers,
+            frame_sample_size=frame_sample_size,
             **text_analyzer_kwargs,
         )
 
@@ -156,6 +177,7 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         verbose: bool = True,
         ocr_kwargs: Optional[dict] = None,
         ad_hoc_recognizers: Optional[List[PatternRecognizer]] = None,
+        frame_sample_size: Optional[int] = None,
         **text_analyzer_kwargs,
     ) -> None:
         """Redact method to redact from a given file.
@@ -175,6 +197,9 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         :param ocr_kwargs: Additional params for OCR methods.
         :param ad_hoc_recognizers: List of PatternRecognizer objects to use
         for ad-hoc recognizer.
+        :param frame_sample_size: Number of evenly spaced frames of multi-frame
+        instances to detect PII on, as burned-in text is usually the same on
+        all frames. By default, all distinct frames are analyzed.
         :param text_analyzer_kwargs: Additional values for the analyze method
         in AnalyzerEngine.
         """
@@ -203,6 +228,7 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
             save_bboxes=save_bboxes,
             ocr_kwargs=ocr_kwargs,
             ad_hoc_recognizers=ad_hoc_recognizers,
+            frame_sample_size=frame_sample_size,
             **text_analyzer_kwargs,
         )
 
@@ -222,13 +248,22 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         save_bboxes: bool = False,
         ocr_kwargs: Optional[dict] = None,
         ad_hoc_recognizers: Optional[List[PatternRecognizer]] = None,
+        frame_sample_size: Optional[int] = None,
+        max_workers: int = 1,
+        engine_factory: Optional[Callable[[], "DicomImageRedactorEngine"]] = None,
+        progress_callback: Optional[Callable[[int, int, dict], None]] = None,
+        resume: bool = False,
         **text_analyzer_kwargs,
-    ) -> None:
+    ) -> List[dict]:
         """Redact method to redact from a directory of files.
 
         Please notice, this method duplicates the files, creates
         new instances and manipulate them.
 
+        A failure to redact a file doesn't stop the processing of the others.
+        The outcome of each file is returned, and written to the
+        MANIFEST_FILE_NAME file of the output directory.
+
         :param input_dicom_path: String path to directory of DICOM images.
         :param output_dir: String path to parent output directory.
         :param padding_width : Padding width to use when running OCR.
@@ -242,8 +277,26 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         :param ocr_kwargs: Additional params for OCR methods.
         :param ad_hoc_recognizers: List of PatternRecognizer objects to use
         for ad-hoc recognizer.
+        :param frame_sample_size: Number of evenly spaced frames of multi-frame
+        instances to detect PII on, as burned-in text is usually the same on
+        all frames. By default, all distinct frames are analyzed.
+        :param max_workers: Number of worker processes redacting files in parallel.
+        :param engine_factory: Picklable callable creating the engine of each
+        worker process (e.g. a module level function). By default, engines with
+        the default configuration are created again by each worker process,
+        and other engines are pickled and sent to each worker process.
+        :param progress_callback: Called after each file is processed, with
+        the number of processed files, the total number of files,
+        and the manifest entry of the file.
+        :param resume: Whether to resume a previous run writing to the same
+        output directory, skipping the files it already redacted.
         :param text_analyzer_kwargs: Additional values for the analyze method
         in AnalyzerEngine.
+
+        :return: Manifest entries of the DICOM files, in processing order,
+        with the file path relative to the output directory ("file"),
+        the output path ("output"), the "status" ("redacted", "skipped"
+        or "failed") and the "error" message of failed files.
         """
         # Verify the given paths
         if Path(input_dicom_path).is_dir() is False:
@@ -256,10 +309,16 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
             )
 
         # Create duplicates
-        dst_path = self._copy_files_for_processing(input_dicom_path, output_dir)
+        previous_dst_path = Path(output_dir, Path(input_dicom_path).name)
+        if resume and previous_dst_path.is_dir():
+            dst_path = self._copy_files_for_resuming(
+                input_dicom_path, previous_dst_path
+            )
+        else:
+            dst_path = self._copy_files_for_processing(input_dicom_path, output_dir)
 
         # Process DICOM files
-        output_location = self._redact_multiple_dicom_images(
+        output_location, manifest = self._redact_multiple_dicom_images(
             dcm_dir=dst_path,
             crop_ratio=crop_ratio,
             fill=fill,
@@ -270,12 +329,24 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
             dst_parent_dir=".",
             save_bboxes=save_bboxes,
             ocr_kwargs=ocr_kwargs,
+            frame_sample_size=frame_sample_size,
+            max_workers=max_workers,
+            engine_factory=engine_factory,
+            progress_callback=progress_callback,
+            manifest_path=Path(dst_path, self.MANIFEST_FILE_NAME),
+            resume=resume,
             **text_analyzer_kwargs,
         )
 
         print(f"Output written to {output_location}")
+        failed = [entry for entry in manifest if entry["status"] == "failed"]
+        if failed:
+            print(
+                f"{len(failed)} file(s) could not be redacted, see "
+                f"{Path(output_location, self.MANIFEST_FILE_NAME)}"
+            )
 
-        return None
+        return manifest
 
     @staticmethod
     def _get_all_dcm_files(dcm_dir: Path) -> List[Path]:
@@ -315,24 +386,78 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         return is_greyscale
 
     @staticmethod
+    def _get_number_of_frames(instance: pydicom.dataset.FileDataset) -> int:
+        """Get the number of frames of a DICOM image.
+
+        :param instance: A single DICOM instance.
+
+        :return: Number of frames (1 if the image isn't multi-frame).
+        """
+        number_of_frames = instance.get("NumberOfFrames", 1)
+
+        return int(number_of_frames) if number_of_frames else 1
+
+    @classmethod
+    def _iter_frames(
+        cls,
+        instance: pydicom.dataset.FileDataset,
+        indices: Optional[List[int]] = None,
+    ) -> Iterator[np.ndarray]:
+        """Decode the frames of a DICOM image one at a time.
+
+        :param instance: A single DICOM instance.
+        :param indices: Indices of the frames to decode (all frames if None).
+        Ignored for single frame images.
+
+        :return: Generator of the pixel data of each frame.
+        """
+        number_of_frames = cls._get_number_of_frames(instance)
+        if number_of_frames <= 1:
+            yield instance.pixel_array
+        elif iter_pixels is not None:
+            yield from iter_pixels(instance, indices=indices)
+        else:
+            pixel_array = instance.pixel_array
+            for index in range(number_of_frames) if indices is None else indices:
+                yield pixel_array[index]
+
+    @classmethod
+    def _get_first_frame(cls, instance: pydicom.dataset.FileDataset) -> np.ndarray:
+        """Decode the first frame of a DICOM image.
+
+        :param instance: A single DICOM instance.
+
+        :return: Pixel data of the first frame.
+        """
+        return next(cls._iter_frames(instance, indices=[0]))
+
+    @classmethod
     def _rescale_dcm_pixel_array(
-        instance: pydicom.dataset.FileDataset, is_greyscale: bool
+        cls,
+        instance: pydicom.dataset.FileDataset,
+        is_greyscale: bool,
+        pixel_array: Optional[np.ndarray] = None,
     ) -> np.ndarray:
         """Rescale DICOM pixel_array.
 
         :param instance: A singe DICOM instance.
         :param is_greyscale: FALSE if the Photometric Interpretation is RGB.
+        :param pixel_array: Pixel data of a frame of the instance.
+        Defaults to the first frame.
 
         :return: Rescaled DICOM pixel_array.
         """
+        if pixel_array is None:
+            pixel_array = cls._get_first_frame(instance)
+
         # Normalize contrast
         if "WindowWidth" in instance:
             if is_greyscale:
-                image_2d = apply_voi_lut(instance.pixel_array, instance)
+                image_2d = apply_voi_lut(pixel_array, instance)
             else:
-                image_2d = instance.pixel_array
+                image_2d = pixel_array
         else:
-            image_2d = instance.pixel_array
+            image_2d = pixel_array
 
         # Convert to float to avoid overflow or underflow losses.
         image_2d_float = image_2d.astype(float)
@@ -382,6 +507,91 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
 
         return None
 
+    @staticmethod
+    def _convert_pixel_array_to_image(
+        pixel_array: np.ndarray, is_greyscale: bool
+    ) -> Image.Image:
+        """Convert the rescaled pixel data of a DICOM instance to a PIL image.
+
+        Gives the same image as saving the pixel data with
+        _save_pixel_array_as_png and opening the PNG file,
+        without writing to the filesystem or encoding the PNG.
+
+        :param pixel_array: Rescaled pixel data from the instance.
+        :param is_greyscale: True if image is greyscale.
+
+        :return: PIL image, in "L" mode if greyscale and "RGB" mode otherwise.
+        """
+        image = Image.fromarray(np.ascontiguousarray(pixel_array, dtype=np.uint8))
+        mode = "L" if is_greyscale else "RGB"
+        if image.mode != mode:
+            image = image.convert(mode)
+
+        return image
+
+    @classmethod
+    def _convert_dcm_to_image(
+        cls, instance: pydicom.dataset.FileDataset
+    ) -> Tuple[Image.Image, bool]:
+        """Convert the pixel data of a DICOM instance to a PIL image, in memory.
+
+        Only the first frame of multi-frame instances is converted.
+
+        :param instance: A single DICOM instance.
+
+        :return: PIL image and if image mode is greyscale.
+        """
+        # Check if image is grayscale using the Photometric Interpretation element
+        is_greyscale = cls._check_if_greyscale(instance)
+
+        # Rescale pixel array
+        pixel_array = cls._rescale_dcm_pixel_array(instance, is_greyscale)
+        image = cls._convert_pixel_array_to_image(pixel_array, is_greyscale)
+
+        return image, is_greyscale
+
+    @classmethod
+    def _iter_frame_images(
+        cls,
+        instance: pydicom.dataset.FileDataset,
+        frame_sample_size: Optional[int] = None,
+    ) -> Iterator[Tuple[Image.Image, bool]]:
+        """Convert the distinct frames of a DICOM instance to PIL images.
+
+        Frames are decoded one at a time, and frames identical to a previous
+        frame are skipped.
+
+        :param instance: A single DICOM instance.
+        :param frame_sample_size: Number of evenly spaced frames to convert
+        (all frames if None).
+
+        :return: Generator of the PIL image of each frame and if image mode
+        is greyscale.
+        """
+        is_greyscale = cls._check_if_greyscale(instance)
+        number_of_frames = cls._get_number_of_frames(instance)
+        if number_of_frames <= 1:
+            pixel_array = cls._rescale_dcm_pixel_array(instance, is_greyscale)
+            image = cls._convert_pixel_array_to_image(pixel_array, is_greyscale)
+            yield image, is_greyscale
+            return
+
+        indices = None
+        if frame_sample_size and frame_sample_size < number_of_frames:
+            sample = np.linspace(0, number_of_frames - 1, frame_sample_size)
+            indices = sorted(set(np.round(sample).astype(int).tolist()))
+
+        seen_frames = set()
+        for frame in cls._iter_frames(instance, indices):
+            pixel_array = cls._rescale_dcm_pixel_array(instance, is_greyscale, frame)
+            frame_hash = hashlib.blake2b(pixel_array.tobytes(), digest_size=16)
+            if frame_hash.digest() in seen_frames:
+                continue
+            seen_frames.add(frame_hash.digest())
+
+            image = cls._convert_pixel_array_to_image(pixel_array, is_greyscale)
+            yield image, is_greyscale
+
     @classmethod
     def _convert_dcm_to_png(cls, filepath: Path, output_dir: str = "temp_dir") -> tuple:
         """Convert DICOM image to PNG file.
@@ -498,8 +708,10 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
 
         :return: Most or least common pixel value (depending on fill).
         """
-        # Crop down to just only look at image corners
-        cropped_array = cls._get_array_corners(instance.pixel_array, crop_ratio)
+        # Crop down to just only look at image corners (of the first frame)
+        cropped_array = cls._get_array_corners(
+            cls._get_first_frame(instance), crop_ratio
+        )
 
         # Get flattened pixel array
         flat_pixel_array = np.array(cropped_array).flatten()
@@ -597,6 +809,60 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
 
         return dst_path
 
+    @classmethod
+    def _copy_files_for_resuming(cls, src_dir: str, dst_dir: Path) -> Path:
+        """Copy the files of a directory which a previous run didn't redact.
+
+        The DICOM files listed as redacted in the manifest of the previous run
+        are kept. The other files are copied again, as the previous run
+        may have stopped while writing them.
+
+        :param src_dir: String path to directory containing DICOM files.
+        :param dst_dir: pathlib Path to the output directory of the previous run.
+
+        :return: Output location of the files.
+        """
+        manifest_path = Path(dst_dir, cls.MANIFEST_FILE_NAME)
+        redacted = {
+            Path(dst_dir, entry["file"])
+            for entry in cls._load_manifest(manifest_path).values()
+            if entry["status"] in ["redacted", "skipped"]
+        }
+
+        def ignore_redacted(directory: str, names: List[str]) -> List[str]:
+            return [
+                name
+                for name in names
+                if Path(dst_dir, Path(directory).relative_to(src_dir), name) in redacted
+            ]
+
+        shutil.copytree(src_dir, dst_dir, ignore=ignore_redacted, dirs_exist_ok=True)
+
+        return dst_dir
+
+    @staticmethod
+    def _load_manifest(manifest_path: Path) -> Dict[str, dict]:
+        """Load the manifest of a previous run on a directory.
+
+        :param manifest_path: pathlib Path to the manifest file.
+
+        :return: Manifest entries by file path relative to the output directory.
+        """
+        if not manifest_path.is_file():
+            return {}
+
+        entries = {}
+        with open(manifest_path) as read_file:
+            for line in read_file:
+                # The last line is incomplete if the previous run was killed
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                entries[entry["file"]] = entry
+
+        return entries
+
     @staticmethod
     def _get_text_metadata(
         instance: pydicom.dataset.FileDataset,
@@ -790,15 +1056,9 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         else:
             raise ValueError("fill must be 'contrast' or 'background'")
 
-        # Temporarily save as PNG to get color
-        with tempfile.TemporaryDirectory() as tmpdirname:
-            dst_path = Path(f"{tmpdirname}/temp.dcm")
-            instance.save_as(dst_path)
-            _, is_greyscale = cls._convert_dcm_to_png(dst_path, output_dir=tmpdirname)
-
-            png_filepath = f"{tmpdirname}/{dst_path.stem}.png"
-            loaded_image = Image.open(png_filepath)
-            box_color = cls._get_bg_color(loaded_image, is_greyscale, invert_flag)
+        # Convert to image to get color
+        loaded_image, is_greyscale = cls._convert_dcm_to_image(instance)
+        box_color = cls._get_bg_color(loaded_image, is_greyscale, invert_flag)
 
         return box_color
 
@@ -870,6 +1130,30 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
 
         return has_image_icon_sequence
 
+    @staticmethod
+    def _copy_instance_without_pixel_data(
+        instance: pydicom.dataset.FileDataset,
+    ) -> pydicom.dataset.FileDataset:
+        """Copy a DICOM instance, without copying its decoded pixel data.
+
+        The pixel data bytes are shared with the copy, as they are replaced
+        rather than modified, and the decoded pixel array isn't copied.
+        Neither is the buffer the instance was read from.
+
+        :param instance: A single DICOM instance.
+
+        :return: Copy of the instance.
+        """
+        memo = {}
+        for shared_value in [
+            getattr(instance, "_pixel_array", None),
+            getattr(instance, "buffer", None),
+        ]:
+            if shared_value is not None:
+                memo[id(shared_value)] = None
+
+        return deepcopy(instance, memo)
+
     @classmethod
     def _add_redact_box(
         cls,
@@ -890,32 +1174,39 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
 
         :return: A new dicom instance with redaction bounding boxes.
         """
-        # Copy instance
-        redacted_instance = deepcopy(instance)
+        # Decode the pixel data once, into a writable copy
+        number_of_frames = cls._get_number_of_frames(instance)
+        if number_of_frames > 1 and decode_pixel_array is not None:
+            # Frames were decoded one at a time for analysis, so decode them
+            # without keeping a second copy of them on the instance
+            pixel_array = decode_pixel_array(instance)
+            if not pixel_array.flags.writeable:
+                pixel_array = pixel_array.copy()
+        else:
+            pixel_array = np.array(instance.pixel_array)
+
+        # Copy instance, except for its pixel data which is replaced
+        redacted_instance = cls._copy_instance_without_pixel_data(instance)
         is_compressed = cls._check_if_compressed(redacted_instance)
         has_image_icon_sequence = cls._check_if_has_image_icon_sequence(
             redacted_instance
         )
 
-        # Select masking box color
+        # Select masking box color (using the decoded pixel data of instance)
         is_greyscale = cls._check_if_greyscale(instance)
         if is_greyscale:
             box_color = cls._get_most_common_pixel_value(instance, crop_ratio, fill)
         else:
-            box_color = cls._set_bbox_color(redacted_instance, fill)
-
-        # Apply mask
-        for i in range(0, len(bounding_boxes_coordinates)):
-            bbox = bounding_boxes_coordinates[i]
-            top = bbox["top"]
-            left = bbox["left"]
-            width = bbox["width"]
-            height = bbox["height"]
-            redacted_instance.pixel_array[top : top + height, left : left + width] = (
-                box_color
-            )
+            box_color = cls._set_bbox_color(instance, fill)
+
+        # Apply mask, on all frames at once
+        frames = (slice(None),) if number_of_frames > 1 else ()
+        for bbox in bounding_boxes_coordinates:
+            rows = slice(bbox["top"], bbox["top"] + bbox["height"])
+            columns = slice(bbox["left"], bbox["left"] + bbox["width"])
+            pixel_array[(*frames, rows, columns)] = box_color
 
-        redacted_instance.PixelData = redacted_instance.pixel_array.tobytes()
+        redacted_instance.PixelData = pixel_array.tobytes()
 
         # If original pixel data is compressed, recompress after redaction
         if is_compressed or has_image_icon_sequence:
@@ -949,21 +1240,9 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
 
         :return: Analyzer results.
         """
-        # Check the ad-hoc recognizers list
-        self._check_ad_hoc_recognizer_list(ad_hoc_recognizers)
-
-        # Create custom recognizer using DICOM metadata
-        if use_metadata:
-            original_metadata, is_name, is_patient = self._get_text_metadata(instance)
-            phi_list = self._make_phi_list(original_metadata, is_name, is_patient)
-            deny_list_recognizer = PatternRecognizer(
-                supported_entity="PERSON", deny_list=phi_list
-            )
-
-            if ad_hoc_recognizers is None:
-                ad_hoc_recognizers = [deny_list_recognizer]
-            elif isinstance(ad_hoc_recognizers, list):
-                ad_hoc_recognizers.append(deny_list_recognizer)
+        ad_hoc_recognizers = self._get_ad_hoc_recognizers(
+            instance, use_metadata, ad_hoc_recognizers
+        )
 
         # Detect PII
         if ad_hoc_recognizers is None:
@@ -982,6 +1261,130 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
 
         return analyzer_results
 
+    def _get_ad_hoc_recognizers(
+        self,
+        instance: pydicom.dataset.FileDataset,
+        use_metadata: bool,
+        ad_hoc_recognizers: Optional[List[PatternRecognizer]],
+    ) -> Optional[List[PatternRecognizer]]:
+        """Get the ad-hoc recognizers to analyze the images of an instance with.
+
+        :param instance: DICOM instance (with metadata).
+        :param use_metadata: Whether to redact text in the image that
+        are present in the metadata.
+        :param ad_hoc_recognizers: List of PatternRecognizer objects to use
+        for ad-hoc recognizer.
+
+        :return: A new list of the ad-hoc recognizers and a deny-list recognizer
+        of the metadata if use_metadata is True, otherwise ad_hoc_recognizers.
+        """
+        # Check the ad-hoc recognizers list
+        self._check_ad_hoc_recognizer_list(ad_hoc_recognizers)
+        if not use_metadata:
+            return ad_hoc_recognizers
+
+        # Create custom recognizer using DICOM metadata
+        original_metadata, is_name, is_patient = self._get_text_metadata(instance)
+        phi_list = self._make_phi_list(original_metadata, is_name, is_patient)
+        deny_list_recognizer = PatternRecognizer(
+            supported_entity="PERSON", deny_list=phi_list
+        )
+
+        return [*(ad_hoc_recognizers or []), deny_list_recognizer]
+
+    def _get_redaction_bboxes(
+        self,
+        instance: pydicom.dataset.FileDataset,
+        padding_width: int,
+        use_metadata: bool,
+        ocr_kwargs: Optional[dict],
+        ad_hoc_recognizers: Optional[List[PatternRecognizer]],
+        frame_sample_size: Optional[int] = None,
+        **text_analyzer_kwargs,
+    ) -> List[Dict[str, int]]:
+        """Detect PII on the frames of a DICOM instance.
+
+        :param instance: A single DICOM instance.
+        :param padding_width: Pixel width of padding (uniform).
+        :param use_metadata: Whether to redact text in the image that
+        are present in the metadata.
+        :param ocr_kwargs: Additional params for OCR methods.
+        :param ad_hoc_recognizers: List of PatternRecognizer objects to use
+        for ad-hoc recognizer.
+        :param frame_sample_size: Number of evenly spaced frames of multi-frame
+        instances to detect PII on (all distinct frames if None).
+        :param text_analyzer_kwargs: Additional values for the analyze method
+        in AnalyzerEngine.
+
+        :return: Bounding boxes to redact, the union of the boxes of all frames.
+        """
+        # Instances of the same device model share the layout of their overlays
+        ocr_region_templates = self.image_analyzer_engine.ocr_region_templates
+        if ocr_region_templates is not None and "ocr_template" not in (
+            ocr_kwargs or {}
+        ):
+            ocr_template = self._get_ocr_template(instance)
+            # Without a known device, the images are OCR'd in full
+            if ocr_template is not None:
+                ocr_kwargs = {**(ocr_kwargs or {}), "ocr_template": ocr_template}
+
+        # The metadata is the same for all frames
+        ad_hoc_recognizers = self._get_ad_hoc_recognizers(
+            instance, use_metadata, ad_hoc_recognizers
+        )
+
+        frames_bboxes = []
+        for loaded_image, is_greyscale in self._iter_frame_images(
+            instance, frame_sample_size
+        ):
+            # Add padding for OCR (during analysis)
+            image = self._add_padding(loaded_image, is_greyscale, padding_width)
+
+            # Detect PII
+            analyzer_results = self._get_analyzer_results(
+                image,
+                instance,
+                False,
+                ocr_kwargs,
+                ad_hoc_recognizers,
+                **text_analyzer_kwargs,
+            )
+            analyzer_bboxes = self.bbox_processor.get_bboxes_from_analyzer_results(
+                analyzer_results
+            )
+            frames_bboxes.append(
+                self.bbox_processor.remove_bbox_padding(analyzer_bboxes, padding_width)
+            )
+
+        if len(frames_bboxes) == 1:
+            return frames_bboxes[0]
+
+        # Boxes found on several frames are only redacted once
+        bboxes = {}
+        for frame_bboxes in frames_bboxes:
+            for bbox in frame_bboxes:
+                bboxes.setdefault(tuple(sorted(bbox.items())), bbox)
+
+        return list(bboxes.values())
+
+    @staticmethod
+    def _get_ocr_template(instance: pydicom.dataset.FileDataset) -> Optional[str]:
+        """Get the name of the burned-in text layout of a DICOM instance.
+
+        :param instance: A single DICOM instance.
+
+        :return: Modality, manufacturer and model name of the device,
+        or None if any of them is missing, as unrelated devices would share it.
+        """
+        device = [
+            str(instance.get(keyword) or "").strip()
+            for keyword in ["Modality", "Manufacturer", "ManufacturerModelName"]
+        ]
+        if not all(device):
+            return None
+
+        return "/".join(device)
+
     @staticmethod
     def _save_bbox_json(output_dcm_path: str, bboxes: List[Dict[str, int]]) -> None:
         """Save the redacted bounding box info as a json file.
@@ -1007,6 +1410,7 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         save_bboxes: bool,
         ocr_kwargs: Optional[dict] = None,
         ad_hoc_recognizers: Optional[List[PatternRecognizer]] = None,
+        frame_sample_size: Optional[int] = None,
         **text_analyzer_kwargs,
     ) -> str:
         """Redact text PHI present on a DICOM image.
@@ -1026,6 +1430,9 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         :param ocr_kwargs: Additional params for OCR methods.
         :param ad_hoc_recognizers: List of PatternRecognizer objects to use
         for ad-hoc recognizer.
+        :param frame_sample_size: Number of evenly spaced frames of multi-frame
+        instances to detect PII on, as burned-in text is usually the same on
+        all frames. By default, all distinct frames are analyzed.
         :param text_analyzer_kwargs: Additional values for the analyze method
         in AnalyzerEngine.
 
@@ -1051,29 +1458,18 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         except AttributeError:
             raise AttributeError("Provided DICOM file lacks pixel data.")
 
-        # Load image for processing
-        with tempfile.TemporaryDirectory() as tmpdirname:
-            # Convert DICOM to PNG and add padding for OCR (during analysis)
-            _, is_greyscale = self._convert_dcm_to_png(dst_path, output_dir=tmpdirname)
-            png_filepath = f"{tmpdirname}/{dst_path.stem}.png"
-            loaded_image = Image.open(png_filepath)
-            image = self._add_padding(loaded_image, is_greyscale, padding_width)
-
-        # Detect PII
-        analyzer_results = self._get_analyzer_results(
-            image,
+        # Detect PII on each frame
+        bboxes = self._get_redaction_bboxes(
             instance,
+            padding_width,
             use_metadata,
             ocr_kwargs,
             ad_hoc_recognizers,
+            frame_sample_size,
             **text_analyzer_kwargs,
         )
 
         # Redact all bounding boxes from DICOM file
-        analyzer_bboxes = self.bbox_processor.get_bboxes_from_analyzer_results(
-            analyzer_results
-        )
-        bboxes = self.bbox_processor.remove_bbox_padding(analyzer_bboxes, padding_width)
         redacted_dicom_instance = self._add_redact_box(
             instance, bboxes, crop_ratio, fill
         )
@@ -1097,8 +1493,14 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         save_bboxes: bool,
         ocr_kwargs: Optional[dict] = None,
         ad_hoc_recognizers: Optional[List[PatternRecognizer]] = None,
+        frame_sample_size: Optional[int] = None,
+        max_workers: int = 1,
+        engine_factory: Optional[Callable[[], "DicomImageRedactorEngine"]] = None,
+        progress_callback: Optional[Callable[[int, int, dict], None]] = None,
+        manifest_path: Optional[Path] = None,
+        resume: bool = False,
         **text_analyzer_kwargs,
-    ) -> str:
+    ) -> Tuple[str, List[dict]]:
         """Redact text PHI present on all DICOM images in a directory.
 
         :param dcm_dir: String path to directory containing DICOM files (can be nested).
@@ -1116,11 +1518,24 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         :param ocr_kwargs: Additional params for OCR methods.
         :param ad_hoc_recognizers: List of PatternRecognizer objects to use
         for ad-hoc recognizer.
+        :param frame_sample_size: Number of evenly spaced frames of multi-frame
+        instances to detect PII on, as burned-in text is usually the same on
+        all frames. By default, all distinct frames are analyzed.
+        :param max_workers: Number of worker processes redacting files in parallel.
+        :param engine_factory: Picklable callable creating the engine of each
+        worker process. By default, see `_get_worker_engine_factory`.
+        :param progress_callback: Called after each file is processed, with
+        the number of processed files, the total number of files,
+        and the manifest entry of the file.
+        :param manifest_path: pathlib Path to the file to write the manifest to.
+        :param resume: Whether to skip the files listed as redacted
+        in the existing manifest file.
         :param text_analyzer_kwargs: Additional values for the analyze method
         in AnalyzerEngine.
 
         Return:
             dst_dir (str): Path to the output DICOM directory.
+            manifest (list): Manifest entries of the DICOM files, in processing order.
         """
         # Ensure we are working on a directory (can have sub-directories)
         if Path(dcm_dir).is_file():
@@ -1134,21 +1549,160 @@ class DicomImageRedactorEngine(ImageRedactorEngine):
         else:
             dst_dir = dcm_dir
 
-        # Process each DICOM file directly
-        all_dcm_files = self._get_all_dcm_files(Path(dst_dir))
-        for dst_path in all_dcm_files:
-            self._redact_single_dicom_image(
-                dst_path,
-                crop_ratio,
-                fill,
-                padding_width,
-                use_metadata,
-                overwrite,
-                dst_parent_dir,
-                save_bboxes,
-                ocr_kwargs=ocr_kwargs,
-                ad_hoc_recognizers=ad_hoc_recognizers,
-                **text_analyzer_kwargs,
-            )
+        # Skip the files redacted by a previous run
+        previous_manifest = {}
+        if resume and manifest_path:
+            previous_manifest = self._load_manifest(manifest_path)
+        manifest = []
+        dcm_files = []
+        for dst_path in self._get_all_dcm_files(Path(dst_dir)):
+            relative_path = Path(os.path.relpath(dst_path, dst_dir)).as_posix()
+            previous_entry = previous_manifest.get(relative_path)
+            if previous_entry and previous_entry["status"] in ["redacted", "skipped"]:
+                manifest.append({**previous_entry, "status": "skipped"})
+            else:
+                manifest.append({"file": relative_path})
+                dcm_files.append((len(manifest) - 1, dst_path))
 
-        return dst_dir
+        redact_kwargs = dict(
+            crop_ratio=crop_ratio,
+            fill=fill,
+            padding_width=padding_width,
+            use_metadata=use_metadata,
+            overwrite=overwrite,
+            dst_parent_dir=dst_parent_dir,
+            save_bboxes=save_bboxes,
+            ocr_kwargs=ocr_kwargs,
+            ad_hoc_recognizers=ad_hoc_recognizers,
+            frame_sample_size=frame_sample_size,
+            **text_analyzer_kwargs,
+        )
+
+        # Process each DICOM file directly, recording the outcomes as they complete,
+        # so that an interrupted run can be resumed
+        total = len(manifest)
+        processed = total - len(dcm_files)
+        manifest_file = None
+        if manifest_path:
+            manifest_file = open(manifest_path, "a" if resume else "w")
+        try:
+            for index, entry in self._redact_dicom_files(
+                dcm_files, max_workers, engine_factory, redact_kwargs
+            ):
+                manifest[index] = {"file": manifest[index]["file"], **entry}
+                if manifest_file:
+                    manifest_file.write(json.dumps(manifest[index]) + "\n")
+                    manifest_file.flush()
+                processed += 1
+                if progress_callback:
+                    progress_callback(processed, total, manifest[index])
+        finally:
+            if manifest_file:
+                manifest_file.close()
+
+        # Rewrite the manifest in processing order
+        if manifest_path:
+            tmp_manifest_path = Path(manifest_path).with_suffix(".tmp")
+            with open(tmp_manifest_path, "w") as tmp_manifest_file:
+                tmp_manifest_file.writelines(
+                    json.dumps(entry) + "\n" for entry in manifest
+                )
+            os.replace(tmp_manifest_path, manifest_path)
+
+        return dst_dir, manifest
+
+    def _redact_dicom_files(
+        self,
+        dcm_files: List[Tuple[int, Path]],
+        max_workers: int,
+        engine_factory: Optional[Callable[[], "DicomImageRedactorEngine"]],
+        redact_kwargs: dict,
+    ):
+        """Redact DICOM files, isolating the failures of each file.
+
+        :param dcm_files: Manifest index and path of each DICOM file.
+        :param max_workers: Number of worker processes redacting files in parallel.
+        With a single worker, files are redacted in the current process.
+        :param engine_factory: Picklable callable creating the engine of each
+        worker process. By default, see `_get_worker_engine_factory`.
+        :param redact_kwargs: Arguments of _redact_single_dicom_image.
+
+        :return: Generator of the manifest index and outcome of each file,
+        in completion order.
+        """
+        if max_workers <= 1:
+            for index, dcm_path in dcm_files:
+                yield index, _redact_file(self, dcm_path, redact_kwargs)
+            return
+
+        if engine_factory is None:
+            engine_factory = self._get_worker_engine_factory()
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker_engine,
+            initargs=(engine_factory,),
+        ) as executor:
+            futures = {
+                executor.submit(_redact_file_in_worker, dcm_path, redact_kwargs): index
+                for index, dcm_path in dcm_files
+            }
+            for future in as_completed(futures):
+                try:
+                    entry = future.result()
+                except Exception as e:
+                    # The worker process died, e.g. running out of memory
+                    entry = {"output": None, "status": "failed", "error": repr(e)}
+                yield futures[future], entry
+
+    def _get_worker_engine_factory(self) -> Callable[[], "DicomImageRedactorEngine"]:
+        """Return a picklable callable creating this engine in worker processes.
+
+        Engines with the default configuration are created again from it.
+        Other engines are pickled, including their NLP models,
+        as their configuration isn't known.
+
+        :return: Callable creating the engine of each worker process.
+        """
+        if getattr(self, "_is_default_configuration", False):
+            return type(self)
+
+        logger.warning(
+            "Pickling the engine to send it to the worker processes, "
+            "pass an engine_factory creating the engine of each worker process "
+            "to avoid sending its NLP models to every worker"
+        )
+        try:
+            return partial(pickle.loads, pickle.dumps(self))
+        except Exception as e:
+            raise ValueError(
+                "The engine can't be pickled to be sent to the worker "
+                "processes, pass a picklable engine_factory creating "
+                f"the engine of each worker process instead: {e!r}"
+            ) from e
+
+
+def _redact_file(
+    engine: DicomImageRedactorEngine, dcm_path: Path, redact_kwargs: dict
+) -> dict:
+    """Redact a DICOM file and return its manifest entry."""
+    try:
+        output_path = engine._redact_single_dicom_image(dcm_path, **redact_kwargs)
+    except Exception as e:
+        logger.warning(f"Failed to redact {dcm_path}: {e!r}")
+        return {"output": None, "status": "failed", "error": repr(e)}
+
+    return {"output": str(output_path), "status": "redacted", "error": None}
+
+
+def _init_worker_engine(
+    engine_factory: Callable[[], DicomImageRedactorEngine],
+) -> None:
+    """Create the engine of the current worker process."""
+    global _worker_engine
+    _worker_engine = engine_factory()
+
+
+def _redact_file_in_worker(dcm_path: Path, redact_kwargs: dict) -> dict:
+    """Redact a DICOM file using the engine of the current worker process."""
+    return _redact_file(_worker_engine, dcm_path, redact_kwargs)
@@ -8,7 +8,13 @@ import numpy as np
 from PIL import Image, ImageChops
 from presidio_analyzer import AnalyzerEngine, RecognizerResult
 
-from presidio_image_redactor import OCR, ImagePreprocessor, TesseractOCR
+from presidio_image_redactor import (
+    OCR,
+    ImagePreprocessor,
+    OcrRegionTemplates,
+    OcrResultCache,
+    TesseractOCR,
+)
 from presidio_image_redactor.entities import ImageRecognizerResult
 
 
@@ -20,6 +26,11 @@ class ImageAnalyzerEngine:
     :param ocr: the OCR object to be used to detect text in images.
     :param image_preprocessor: The ImagePreprocessor object to be
         used to preprocess the image
+    :param ocr_cache: The OcrResultCache object used to skip the OCR
+        of (preprocessed) images and regions identical to ones already processed
+    :param ocr_region_templates: The OcrRegionTemplates object used to
+        only OCR the regions containing text in images of the same template,
+        passed to `analyze` as the "ocr_template" OCR parameter
     """
 
     def __init__(
@@ -27,6 +38,8 @@ class ImageAnalyzerEngine:
         analyzer_engine: Optional[AnalyzerEngine] = None,
         ocr: Optional[OCR] = None,
         image_preprocessor: Optional[ImagePreprocessor] = None,
+        ocr_cache: Optional[OcrResultCache] = None,
+        ocr_region_templates: Optional[OcrRegionTemplates] = None,
     ):
         if not analyzer_engine:
             analyzer_engine = AnalyzerEngine()
@@ -40,13 +53,18 @@ class ImageAnalyzerEngine:
             image_preprocessor = ImagePreprocessor()
         self.image_preprocessor = image_preprocessor
 
+        self.ocr_cache = ocr_cache
+        self.ocr_region_templates = ocr_region_templates
+
     def analyze(
         self, image: object, ocr_kwargs: Optional[dict] = None, **text_analyzer_kwargs
     ) -> List[ImageRecognizerResult]:
         """Analyse method to analyse the given image.
 
         :param image: PIL Image/numpy array or file path(str) to be processed.
-        :param ocr_kwargs: Additional params for OCR methods.
+        :param ocr_kwargs: Additional params for OCR methods. "ocr_template"
+        names the layout of the image, to only OCR its learned text regions
+        (see `ocr_region_templates`).
         :param text_analyzer_kwargs: Additional values for the analyze method
         in AnalyzerEngine.
 
@@ -54,8 +72,15 @@ class ImageAnalyzerEngine:
         """
         # Perform OCR
         perform_ocr_kwargs, ocr_threshold = self._parse_ocr_kwargs(ocr_kwargs)
+        ocr_template = perform_ocr_kwargs.get("ocr_template")
+        if "ocr_template" in perform_ocr_kwargs:
+            perform_ocr_kwargs = {
+                key: value
+                for key, value in perform_ocr_kwargs.items()
+                if key != "ocr_template"
+            }
         image, preprocessing_metadata = self.image_preprocessor.preprocess_image(image)
-        ocr_result = self.ocr.perform_ocr(image, **perform_ocr_kwargs)
+        ocr_result = self._perform_ocr(image, perform_ocr_kwargs, ocr_template)
         ocr_result = self.remove_space_boxes(ocr_result)
 
         if preprocessing_metadata and ("scale_factor" in preprocessing_metadata):
@@ -83,6 +108,78 @@ class ImageAnalyzerEngine:
 
         return bboxes
 
+    def _perform_ocr(
+        self, image: object, perform_ocr_kwargs: dict, ocr_template: Optional[str]
+    ) -> dict:
+        """Perform OCR on the image, or on the learned text regions of its template.
+
+        :param image: PIL Image/numpy array or file path(str) to be processed.
+        :param perform_ocr_kwargs: Params for ocr.perform_ocr.
+        :param ocr_template: Name of the template of the image, if any.
+
+        :return: OCR results (raw).
+        """
+        if self.ocr_region_templates is None or ocr_template is None:
+            return self._perform_cached_ocr(image, perform_ocr_kwargs)
+
+        if isinstance(image, str):
+            image = Image.open(image)
+        if isinstance(image, np.ndarray):
+            image_size = (image.shape[1], image.shape[0])
+        else:
+            image_size = image.size
+
+        regions = self.ocr_region_templates.get_regions(ocr_template, image_size)
+        if regions is None:
+            ocr_result = self._perform_cached_ocr(image, perform_ocr_kwargs)
+            self.ocr_region_templates.learn(ocr_template, image_size, ocr_result)
+            return ocr_result
+
+        ocr_result = {key: [] for key in ["left", "top", "width", "height", "conf"]}
+        ocr_result["text"] = []
+        for region in regions:
+            left, top = region["left"], region["top"]
+            right, bottom = left + region["width"], top + region["height"]
+            if isinstance(image, np.ndarray):
+                region_image = image[top:bottom, left:right]
+            else:
+                region_image = image.crop((left, top, right, bottom))
+
+            region_result = self._perform_cached_ocr(region_image, perform_ocr_kwargs)
+            for key, values in region_result.items():
+                if key == "left":
+                    values = [value + left for value in values]
+                elif key == "top":
+                    values = [value + top for value in values]
+                ocr_result.setdefault(key, []).extend(values)
+
+        return ocr_result
+
+    def _perform_cached_ocr(self, image: object, perform_ocr_kwargs: dict) -> dict:
+        """Perform OCR on the image, unless its result is in the OCR cache.
+
+        :param image: PIL Image/numpy array or file path(str) to be processed.
+        :param perform_ocr_kwargs: Params for ocr.perform_ocr.
+
+        :return: OCR results (raw).
+        """
+        cache_key = None
+        if self.ocr_cache is not None:
+            cache_key = self.ocr_cache.get_key(
+                image, type(self.ocr).__qualname__, **perform_ocr_kwargs
+            )
+            if cache_key is not None:
+                ocr_result = self.ocr_cache.get(cache_key)
+                if ocr_result is not None:
+                    return ocr_result
+
+        ocr_result = self.ocr.perform_ocr(image, **perform_ocr_kwargs)
+
+        if cache_key is not None:
+            self.ocr_cache.set(cache_key, ocr_result)
+
+        return ocr_result
+
     @staticmethod
     def threshold_ocr_result(ocr_result: dict, ocr_threshold: float) -> dict:
         """Filter out OCR results below confidence threshold.
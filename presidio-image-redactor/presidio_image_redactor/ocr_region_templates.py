@@ -0,0 +1,211 @@
+import json
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+
+class OcrRegionTemplates:
+    """
+    Learn which regions of images sharing a template contain text.
+
+    Burned-in annotations of modality devices use fixed layouts.
+    The first `learning_samples` images of each template are OCR'd in full,
+    and the boxes of the words found are merged into text regions.
+    Once learned, `ImageAnalyzerEngine` only OCRs these regions.
+    Text outside the learned regions of a template is not detected,
+    so templates should identify a layout, e.g. device model and image size.
+    To re-check the learned regions, every `refresh_interval`-th image
+    of a learned template is also OCR'd in full and its words are learned.
+    The templates are thread safe.
+
+    :param learning_samples: Number of images of each template OCR'd in full
+    before only the learned regions are OCR'd.
+    :param margin: Number of pixels added around the words of learned regions.
+    :param refresh_interval: Number of images of a learned template between
+    two images OCR'd in full. If None, learned templates are never re-checked.
+    """
+
+    def __init__(
+        self,
+        learning_samples: int = 3,
+        margin: int = 10,
+        refresh_interval: Optional[int] = 100,
+    ):
+        if learning_samples <= 0:
+            raise ValueError("learning_samples must be a positive integer")
+        if margin < 0:
+            raise ValueError("margin must be a non-negative integer")
+        if refresh_interval is not None and refresh_interval <= 0:
+            raise ValueError("refresh_interval must be a positive integer or None")
+
+        self.learning_samples = learning_samples
+        self.margin = margin
+        self.refresh_interval = refresh_interval
+
+        # (template, width, height) -> {"samples": int, "regions": List[dict]}
+        self._templates: Dict[Tuple[str, int, int], dict] = {}
+        # (template, width, height) -> number of images since the last full OCR
+        self._uses: Dict[Tuple[str, int, int], int] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        """Return the state of the templates, without their lock."""
+        with self._lock:
+            state = self.__dict__.copy()
+            state["_templates"] = dict(self._templates)
+            state["_uses"] = dict(self._uses)
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore the templates, creating a new lock."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def get_regions(
+        self, template: str, image_size: Tuple[int, int]
+    ) -> Optional[List[Dict[str, int]]]:
+        """
+        Return the learned text regions of a template.
+
+        :param template: Name of the template of the image
+        :param image_size: Width and height of the image
+        :return: Text regions (left, top, width, height), or None if the image
+        should be OCR'd in full and learned: while the template is still learned,
+        and every `refresh_interval`-th image of a learned template.
+        """
+        key = (template, *image_size)
+        with self._lock:
+            learned = self._templates.get(key)
+            if learned is None or learned["samples"] < self.learning_samples:
+                return None
+
+            if self.refresh_interval is not None:
+                self._uses[key] = self._uses.get(key, 0) + 1
+                if self._uses[key] >= self.refresh_interval:
+                    self._uses[key] = 0
+                    return None
+
+            return [dict(region) for region in learned["regions"]]
+
+    def learn(
+        self, template: str, image_size: Tuple[int, int], ocr_result: dict
+    ) -> None:
+        """
+        Add the words of an image OCR'd in full to the regions of its template.
+
+        :param template: Name of the template of the image
+        :param image_size: Width and height of the image
+        :param ocr_result: OCR result of the full image
+        """
+        width, height = image_size
+        boxes = []
+        for index, text in enumerate(ocr_result.get("text", [])):
+            if not text or text.isspace():
+                continue
+            left = max(0, ocr_result["left"][index] - self.margin)
+            top = max(0, ocr_result["top"][index] - self.margin)
+            right = ocr_result["left"][index] + ocr_result["width"][index]
+            bottom = ocr_result["top"][index] + ocr_result["height"][index]
+            boxes.append(
+                (
+                    left,
+                    top,
+                    min(width, right + self.margin),
+                    min(height, bottom + self.margin),
+                )
+            )
+
+        with self._lock:
+            learned = self._templates.setdefault(
+                (template, width, height), {"samples": 0, "regions": []}
+            )
+            for region in learned["regions"]:
+                boxes.append(
+                    (
+                        region["left"],
+                        region["top"],
+                        region["left"] + region["width"],
+                        region["top"] + region["height"],
+                    )
+                )
+            learned["regions"] = [
+                {
+                    "left": left,
+                    "top": top,
+                    "width": right - left,
+                    "height": bottom - top,
+                }
+                for left, top, right, bottom in self._merge_boxes(boxes)
+            ]
+            learned["samples"] += 1
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Save the learned templates to a JSON file.
+
+        :param path: Path of the file
+        """
+        with self._lock:
+            templates = [
+                {"template": template, "width": width, "height": height, **learned}
+                for (template, width, height), learned in self._templates.items()
+            ]
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(templates, f)
+
+    def load(self, path: Union[str, Path]) -> None:
+        """
+        Load templates saved with `save`, replacing the learned templates.
+
+        :param path: Path of the file
+        """
+        with open(path, encoding="utf-8") as f:
+            templates = json.load(f)
+
+        with self._lock:
+            self._templates = {
+                (learned["template"], learned["width"], learned["height"]): {
+                    "samples": learned["samples"],
+                    "regions": learned["regions"],
+                }
+                for learned in templates
+            }
+            self._uses = {}
+
+    @staticmethod
+    def _merge_boxes(
+        boxes: List[Tuple[int, int, int, int]],
+    ) -> List[Tuple[int, int, int, int]]:
+        """Merge overlapping boxes (left, top, right, bottom) into their union.
+
+        :param boxes: Boxes to merge.
+
+        :return: Non-overlapping boxes, sorted by top and left.
+        """
+        merged = []
+        for box in sorted(boxes):
+            # A merged box may overlap the boxes merged before it
+            while True:
+                overlapping = [
+                    other
+                    for other in merged
+                    if box[0] <= other[2]
+                    and other[0] <= box[2]
+                    and box[1] <= other[3]
+                    and other[1] <= box[3]
+                ]
+                if not overlapping:
+                    break
+                for other in overlapping:
+                    merged.remove(other)
+                box = (
+                    min([box[0]] + [other[0] for other in overlapping]),
+                    min([box[1]] + [other[1] for other in overlapping]),
+                    max([box[2]] + [other[2] for other in overlapping]),
+                    max([box[3]] + [other[3] for other in overlapping]),
+                )
+            merged.append(box)
+
+        return sorted(merged, key=lambda box: (box[1], box[0]))
@@ -0,0 +1,184 @@
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+import numpy as np
+from PIL import Image
+
+logger = logging.getLogger("presidio-image-redactor")
+
+
+class OcrResultCache:
+    """
+    Bounded LRU cache of OCR results, keyed by the content of the OCR'd image.
+
+    Used by `ImageAnalyzerEngine` to skip the OCR of images (or image regions)
+    identical to ones already processed, such as frames and images sharing
+    the same burned-in overlay. Results are deep copied when stored and when
+    returned, so callers can modify them freely. The cache is thread safe.
+
+    :param max_size: Maximum number of entries kept in memory. When full,
+    the least recently used entry is evicted.
+    :param cache_dir: Directory where the results are also stored as JSON files,
+    so they are kept across runs and shared between processes.
+    If None, results are only kept in memory.
+    """
+
+    def __init__(
+        self, max_size: int = 1000, cache_dir: Optional[Union[str, Path]] = None
+    ):
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive integer")
+
+        self.max_size = max_size
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        """Return the state of the cache, without its lock."""
+        with self._lock:
+            state = self.__dict__.copy()
+            state["_entries"] = OrderedDict(self._entries)
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore the cache, creating a new lock."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(image: object, ocr_name: str = "", **ocr_kwargs) -> Optional[str]:
+        """
+        Return the cache key of an OCR request.
+
+        :param image: PIL Image/numpy array or file path(str) to be processed
+        :param ocr_name: Name of the OCR engine, as results differ between engines
+        :param ocr_kwargs: Additional values for the perform_ocr method
+        :return: Hash of the image pixels and parameters,
+        or None if the image type can't be hashed.
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(ocr_name.encode("utf-8"))
+        hasher.update(json.dumps(ocr_kwargs, sort_keys=True, default=str).encode())
+
+        if isinstance(image, Image.Image):
+            hasher.update(f"{image.mode}{image.size}".encode())
+            hasher.update(image.tobytes())
+        elif isinstance(image, np.ndarray):
+            hasher.update(f"{image.dtype.str}{image.shape}".encode())
+            hasher.update(np.ascontiguousarray(image).data)
+        elif isinstance(image, (str, Path)):
+            with open(image, "rb") as f:
+                hasher.update(f.read())
+        else:
+            return None
+
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Return a copy of the OCR result cached for the key, or None on a miss.
+
+        :param key: The cache key
+        """
+        with self._lock:
+            ocr_result = self._entries.get(key)
+            if ocr_result is not None:
+                self._entries.move_to_end(key)
+
+        if ocr_result is None:
+            ocr_result = self._read(key)
+            if ocr_result is not None:
+                self._store(key, ocr_result)
+
+        with self._lock:
+            if ocr_result is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        return copy.deepcopy(ocr_result)
+
+    def set(self, key: str, ocr_result: dict) -> None:
+        """
+        Store a copy of the OCR result for the key.
+
+        :param key: The cache key
+        :param ocr_result: The OCR result to cache
+        """
+        ocr_result = copy.deepcopy(ocr_result)
+        self._store(key, ocr_result)
+        self._write(key, ocr_result)
+
+    def clear(self) -> None:
+        """Remove all entries kept in memory and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return the number of hits, misses and in-memory entries of the cache."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+            }
+
+    def _store(self, key: str, ocr_result: dict) -> None:
+        with self._lock:
+            self._entries[key] = ocr_result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def _get_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _read(self, key: str) -> Optional[dict]:
+        if self.cache_dir is None:
+            return None
+
+        try:
+            with open(self._get_path(key), encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read cached OCR result {key}: {e}")
+            return None
+
+    def _write(self, key: str, ocr_result: dict) -> None:
+        if self.cache_dir is None:
+            return
+
+        path = self._get_path(key)
+        # Written to a temporary file first, so readers never see partial files
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(ocr_result, f, default=self._to_json)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not write cached OCR result {key}: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _to_json(value: object) -> object:
+        # numpy scalars, as returned by some OCR engines
+        if isinstance(value, np.generic):
+            return value.item()
+        raise TypeError(f"{type(value).__name__} is not JSON serializable")
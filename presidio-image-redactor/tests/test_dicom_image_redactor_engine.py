@@ -8,7 +8,8 @@ import numpy as np
 from PIL import Image
 import pydicom
 from presidio_image_redactor.dicom_image_redactor_engine import DicomImageRedactorEngine
-from presidio_analyzer import PatternRecognizer
+from presidio_analyzer import AnalyzerEngine, PatternRecognizer
+from presidio_image_redactor import ImageAnalyzerEngine, OcrRegionTemplates
 from typing import Union, List, Tuple, Dict, TypeVar, Optional
 import pytest
 
@@ -23,6 +24,29 @@ TEST_NUMPY_DIR = f"{SCRIPT_DIR}/test_data/numpy_arrays"
 TEST_PNG_DIR = f"{SCRIPT_DIR}/test_data/png_images"
 
 
+def get_multiframe_instance(number_of_frames: int = 12, is_rgb: bool = False) -> pydicom.dataset.FileDataset:
+    """Multi-frame DICOM instance, with a rectangle whose color changes every 3 frames"""
+    file_meta = pydicom.dataset.FileMetaDataset()
+    file_meta.TransferSyntaxUID = pydicom.uid.ExplicitVRLittleEndian
+    file_meta.MediaStorageSOPClassUID = "1.2.840.10008.5.1.4.1.1.3.1"
+    file_meta.MediaStorageSOPInstanceUID = pydicom.uid.generate_uid()
+    instance = pydicom.dataset.FileDataset("multiframe.dcm", {}, file_meta=file_meta, preamble=b"\0" * 128)
+    instance.SOPInstanceUID = file_meta.MediaStorageSOPInstanceUID
+    instance.Rows, instance.Columns, instance.NumberOfFrames = 64, 80, number_of_frames
+    instance.SamplesPerPixel = 3 if is_rgb else 1
+    instance.PhotometricInterpretation = "RGB" if is_rgb else "MONOCHROME2"
+    if is_rgb:
+        instance.PlanarConfiguration = 0
+    instance.BitsAllocated, instance.BitsStored, instance.HighBit, instance.PixelRepresentation = 8, 8, 7, 0
+
+    pixel_array = np.zeros((number_of_frames, 64, 80, 3) if is_rgb else (number_of_frames, 64, 80), dtype=np.uint8)
+    for frame in range(number_of_frames):
+        pixel_array[frame, 20:40, 20:60] = 50 + (frame // 3) * 10
+    instance.PixelData = pixel_array.tobytes()
+
+    return instance
+
+
 @pytest.fixture(scope="module")
 def mock_engine():
     """Instance of the DicomImageRedactorEngine"""
@@ -259,6 +283,143 @@ def test_convert_dcm_to_png_happy_path(mocker):
         assert mock_save_array_as_png.call_count == 1
 
 
+# ------------------------------------------------------
+# DicomImageRedactorEngine._convert_pixel_array_to_image()
+# ------------------------------------------------------
+@pytest.mark.parametrize(
+    "dcm_file",
+    [
+        (Path(TEST_DICOM_PARENT_DIR, "0_ORIGINAL.dcm")),
+        (Path(TEST_DICOM_PARENT_DIR, "RGB_ORIGINAL.dcm")),
+        (Path(TEST_DICOM_DIR_2, "1_ORIGINAL.DCM")),
+        (Path(TEST_DICOM_DIR_2, "2_ORIGINAL.dicom")),
+        (Path(TEST_DICOM_DIR_3, "3_ORIGINAL.DICOM")),
+    ],
+)
+def test_convert_pixel_array_to_image_same_as_png_file(
+    mock_engine: DicomImageRedactorEngine,
+    dcm_file: Path,
+):
+    """Test DicomImageRedactorEngine._convert_pixel_array_to_image gives the PNG image
+
+    Args:
+        dcm_file (pathlib.Path): Path to a DICOM file.
+    """
+    # Arrange
+    test_instance = pydicom.dcmread(dcm_file)
+    is_greyscale = mock_engine._check_if_greyscale(test_instance)
+    test_pixel_array = mock_engine._rescale_dcm_pixel_array(test_instance, is_greyscale)
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        mock_engine._save_pixel_array_as_png(test_pixel_array, is_greyscale, "test", tmpdirname)
+        with Image.open(f"{tmpdirname}/test.png") as png_image:
+            png_image.load()
+            expected_mode = png_image.mode
+            expected_pixels = np.asarray(png_image)
+
+    # Act
+    test_image = mock_engine._convert_pixel_array_to_image(test_pixel_array, is_greyscale)
+
+    # Assert
+    assert test_image.mode == expected_mode
+    assert np.array_equal(np.asarray(test_image), expected_pixels)
+
+
+# ------------------------------------------------------
+# DicomImageRedactorEngine._convert_dcm_to_image()
+# ------------------------------------------------------
+@pytest.mark.parametrize(
+    "dcm_file, expected_mode",
+    [
+        (Path(TEST_DICOM_PARENT_DIR, "0_ORIGINAL.dcm"), "L"),
+        (Path(TEST_DICOM_PARENT_DIR, "RGB_ORIGINAL.dcm"), "RGB"),
+    ],
+)
+def test_convert_dcm_to_image_happy_path(
+    mocker,
+    mock_engine: DicomImageRedactorEngine,
+    dcm_file: Path,
+    expected_mode: str,
+):
+    """Test happy path for DicomImageRedactorEngine._convert_dcm_to_image
+
+    Args:
+        dcm_file (pathlib.Path): Path to a DICOM file.
+        expected_mode (str): Expected PIL image mode.
+    """
+    # Arrange
+    test_instance = pydicom.dcmread(dcm_file)
+    mock_save_array_as_png = mocker.patch.object(
+        DicomImageRedactorEngine, "_save_pixel_array_as_png", return_value=None
+    )
+    mock_image_open = mocker.patch(
+        "presidio_image_redactor.dicom_image_redactor_engine.Image.open",
+        return_value=None,
+    )
+
+    # Act
+    test_image, test_is_greyscale = mock_engine._convert_dcm_to_image(test_instance)
+
+    # Assert
+    assert test_image.mode == expected_mode
+    assert test_image.size == (test_instance.Columns, test_instance.Rows)
+    assert test_is_greyscale == (expected_mode == "L")
+    assert mock_save_array_as_png.call_count == 0
+    assert mock_image_open.call_count == 0
+
+
+# ------------------------------------------------------
+# DicomImageRedactorEngine._iter_frame_images()
+# ------------------------------------------------------
+@pytest.mark.parametrize(
+    "is_rgb, frame_sample_size, expected_number_of_images",
+    [
+        (True, None, 4),
+        (True, 2, 2),
+        (True, 100, 4),
+        # Frames only differing by their brightness are identical once rescaled
+        (False, None, 1),
+    ],
+)
+def test_iter_frame_images_skips_identical_frames(
+    is_rgb: bool,
+    frame_sample_size: Optional[int],
+    expected_number_of_images: int,
+):
+    """Test DicomImageRedactorEngine._iter_frame_images on a multi-frame instance
+
+    Args:
+        is_rgb (bool): Whether the instance is in RGB.
+        frame_sample_size (int): Number of frames to sample.
+        expected_number_of_images (int): Number of expected frame images.
+    """
+    # Arrange
+    test_instance = get_multiframe_instance(is_rgb=is_rgb)
+
+    # Act
+    test_images = list(DicomImageRedactorEngine._iter_frame_images(test_instance, frame_sample_size))
+
+    # Assert
+    assert len(test_images) == expected_number_of_images
+    for test_image, test_is_greyscale in test_images:
+        assert test_image.size == (80, 64)
+        assert test_image.mode == ("RGB" if is_rgb else "L")
+        assert test_is_greyscale is not is_rgb
+
+
+def test_iter_frame_images_single_frame():
+    """Test DicomImageRedactorEngine._iter_frame_images on a single frame instance"""
+    # Arrange
+    test_instance = pydicom.dcmread(Path(TEST_DICOM_PARENT_DIR, "RGB_ORIGINAL.dcm"))
+    expected_image, _ = DicomImageRedactorEngine._convert_dcm_to_image(test_instance)
+
+    # Act
+    test_images = list(DicomImageRedactorEngine._iter_frame_images(test_instance, frame_sample_size=5))
+
+    # Assert
+    assert len(test_images) == 1
+    assert np.array_equal(np.asarray(test_images[0][0]), np.asarray(expected_image))
+
+
 # ------------------------------------------------------
 # DicomImageRedactorEngine._get_bg_color()
 # ------------------------------------------------------
@@ -893,12 +1054,8 @@ def test_set_bbox_color_happy_path(
     # Arrange
     test_instance = pydicom.dcmread(Path(TEST_DICOM_PARENT_DIR, "0_ORIGINAL.dcm"))
 
-    mock_convert_dcm_to_png = mocker.patch.object(
-        DicomImageRedactorEngine, "_convert_dcm_to_png", return_value=[None, True]
-    )
-    mock_Image_open = mocker.patch(
-        "presidio_image_redactor.dicom_image_redactor_engine.Image.open",
-        return_value=None,
+    mock_convert_dcm_to_image = mocker.patch.object(
+        DicomImageRedactorEngine, "_convert_dcm_to_image", return_value=[None, True]
     )
     mock_get_bg_color = mocker.patch.object(
         DicomImageRedactorEngine,
@@ -911,8 +1068,7 @@ def test_set_bbox_color_happy_path(
     test_box_color = mock_engine._set_bbox_color(test_instance, fill)
 
     # Assert
-    assert mock_convert_dcm_to_png.call_count == 1
-    assert mock_Image_open.call_count == 1
+    assert mock_convert_dcm_to_image.call_count == 1
     assert mock_get_bg_color.call_count == 1
     assert test_box_color == mock_box_color
 
@@ -1162,6 +1318,277 @@ def test_add_redact_box_happy_path(
     assert box_color_pixels_redacted > box_color_pixels_original
 
 
+@pytest.mark.parametrize(
+    "dcm_path, box_color",
+    [
+        (Path(TEST_DICOM_PARENT_DIR, "0_ORIGINAL_compressed.dcm"), 0),
+        (Path(TEST_DICOM_PARENT_DIR, "RGB_ORIGINAL.dcm"), (0, 0, 0)),
+    ],
+)
+def test_add_redact_box_does_not_modify_instance(
+    mocker,
+    dcm_path: Path,
+    box_color: Union[int, Tuple[int, int, int]],
+):
+    """Test DicomImageRedactorEngine._add_redact_box leaves the original instance unchanged
+
+    Args:
+        dcm_path (pathlib.Path): Path to DICOM file.
+        box_color (int or Tuple of int): Color value to assign to mocker.
+    """
+    # Arrange
+    test_instance = pydicom.dcmread(dcm_path)
+    original_instance = pydicom.dcmread(dcm_path)
+    original_pixel_array = np.array(original_instance.pixel_array)
+    mocker.patch.object(DicomImageRedactorEngine, "_get_most_common_pixel_value", return_value=box_color)
+    mocker.patch.object(DicomImageRedactorEngine, "_set_bbox_color", return_value=box_color)
+    mock_compress = mocker.patch.object(
+        DicomImageRedactorEngine, "_compress_pixel_data", side_effect=lambda instance: instance
+    )
+    bounding_boxes_coordinates = [
+        {"top": 0, "left": 0, "width": 100, "height": 100},
+        {"top": 24, "left": 0, "width": 75, "height": 51},
+    ]
+
+    # Act
+    test_redacted_instance = DicomImageRedactorEngine._add_redact_box(
+        test_instance, bounding_boxes_coordinates, 0.75
+    )
+
+    # Assert
+    assert test_redacted_instance is not test_instance
+    assert test_instance == original_instance
+    assert test_instance.file_meta == original_instance.file_meta
+    assert np.array_equal(test_instance.pixel_array, original_pixel_array)
+    assert mock_compress.call_count == int(DicomImageRedactorEngine._check_if_compressed(test_instance))
+    redacted_pixel_array = np.frombuffer(
+        test_redacted_instance.PixelData, dtype=original_pixel_array.dtype
+    ).reshape(original_pixel_array.shape)
+    assert np.all(redacted_pixel_array[0:100, 0:100] == box_color)
+    assert np.array_equal(redacted_pixel_array[100:, 100:], original_pixel_array[100:, 100:])
+
+
+@pytest.mark.parametrize("is_rgb", [False, True])
+def test_add_redact_box_multiframe_redacts_all_frames(is_rgb: bool):
+    """Test DicomImageRedactorEngine._add_redact_box redacts the boxes on every frame
+
+    Args:
+        is_rgb (bool): Whether the instance is in RGB.
+    """
+    # Arrange
+    test_instance = get_multiframe_instance(is_rgb=is_rgb)
+    original_pixel_array = np.array(test_instance.pixel_array)
+    bounding_boxes_coordinates = [
+        {"top": 25, "left": 25, "width": 10, "height": 5},
+        {"top": 0, "left": 70, "width": 10, "height": 10},
+    ]
+
+    # Act
+    test_redacted_instance = DicomImageRedactorEngine._add_redact_box(
+        test_instance, bounding_boxes_coordinates, 0.75, "background"
+    )
+
+    # Assert
+    redacted_pixel_array = test_redacted_instance.pixel_array
+    assert redacted_pixel_array.shape == original_pixel_array.shape
+    box_color = redacted_pixel_array[0, 25, 25]
+    assert np.all(redacted_pixel_array[:, 25:30, 25:35] == box_color)
+    assert np.all(redacted_pixel_array[:, 0:10, 70:80] == box_color)
+    assert not np.array_equal(redacted_pixel_array[:, 25:30, 25:35], original_pixel_array[:, 25:30, 25:35])
+    assert np.array_equal(redacted_pixel_array[:, 30:, :], original_pixel_array[:, 30:, :])
+    assert np.array_equal(test_instance.pixel_array, original_pixel_array)
+
+
+def test_copy_instance_without_pixel_data_shares_pixel_data():
+    """Test DicomImageRedactorEngine._copy_instance_without_pixel_data"""
+    # Arrange
+    test_instance = pydicom.dcmread(Path(TEST_DICOM_PARENT_DIR, "RGB_ORIGINAL.dcm"))
+    _ = test_instance.pixel_array
+
+    # Act
+    test_copy = DicomImageRedactorEngine._copy_instance_without_pixel_data(test_instance)
+
+    # Assert
+    assert test_copy.PixelData is test_instance.PixelData
+    assert np.array_equal(test_copy.pixel_array, test_instance.pixel_array)
+    assert test_copy.pixel_array is not test_instance.pixel_array
+    test_copy.PatientName = "Redacted"
+    test_copy.file_meta.TransferSyntaxUID = pydicom.uid.RLELossless
+    assert test_instance.PatientName != "Redacted"
+    assert test_instance.file_meta.TransferSyntaxUID != pydicom.uid.RLELossless
+
+
+# ------------------------------------------------------
+# DicomImageRedactorEngine._get_redaction_bboxes()
+# ------------------------------------------------------
+def test_get_redaction_bboxes_returns_union_of_frame_bboxes(
+    mocker,
+    mock_engine: DicomImageRedactorEngine,
+):
+    """Test DicomImageRedactorEngine._get_redaction_bboxes combines the boxes of all frames
+
+    Args:
+        mock_engine (DicomImageRedactorEngine): DicomImageRedactorEngine object.
+    """
+    # Arrange
+    test_instance = get_multiframe_instance(is_rgb=True)
+    frames_bboxes = [
+        [{"top": 0, "left": 0, "width": 10, "height": 10}],
+        [{"top": 0, "left": 0, "width": 10, "height": 10}, {"top": 5, "left": 5, "width": 20, "height": 10}],
+        [],
+        [{"top": 40, "left": 0, "width": 10, "height": 10}],
+    ]
+    mock_analyze = mocker.patch.object(DicomImageRedactorEngine, "_get_analyzer_results", return_value=[])
+    mocker.patch(
+        "presidio_image_redactor.image_redactor_engine.BboxProcessor.get_bboxes_from_analyzer_results",
+        return_value=[],
+    )
+    mocker.patch(
+        "presidio_image_redactor.image_redactor_engine.BboxProcessor.remove_bbox_padding",
+        side_effect=frames_bboxes,
+    )
+
+    # Act
+    test_bboxes = mock_engine._get_redaction_bboxes(test_instance, 25, False, None, None)
+
+    # Assert
+    assert mock_analyze.call_count == 4
+    assert test_bboxes == [
+        {"top": 0, "left": 0, "width": 10, "height": 10},
+        {"top": 5, "left": 5, "width": 20, "height": 10},
+        {"top": 40, "left": 0, "width": 10, "height": 10},
+    ]
+
+
+def test_get_redaction_bboxes_builds_metadata_recognizer_once(
+    mocker,
+    get_dummy_nlp_engine,
+):
+    """Test DicomImageRedactorEngine._get_redaction_bboxes adds one metadata recognizer
+
+    Args:
+        get_dummy_nlp_engine (NlpEngine): Dummy NLP engine.
+    """
+    # Arrange
+    test_engine = DicomImageRedactorEngine(
+        image_analyzer_engine=ImageAnalyzerEngine(
+            analyzer_engine=AnalyzerEngine(nlp_engine=get_dummy_nlp_engine)
+        )
+    )
+    test_instance = get_multiframe_instance(number_of_frames=9, is_rgb=True)
+    test_instance.PatientName = "Doe^John"
+    ad_hoc_recognizer = PatternRecognizer(supported_entity="PERSON", deny_list=["1"])
+    ad_hoc_recognizers = [ad_hoc_recognizer]
+    mock_get_text_metadata = mocker.spy(DicomImageRedactorEngine, "_get_text_metadata")
+    mock_analyze = mocker.patch.object(ImageAnalyzerEngine, "analyze", return_value=[])
+
+    # Act
+    test_engine._get_redaction_bboxes(test_instance, 25, True, None, ad_hoc_recognizers)
+
+    # Assert
+    assert ad_hoc_recognizers == [ad_hoc_recognizer]
+    assert mock_get_text_metadata.call_count == 1
+    assert mock_analyze.call_count == 3
+    frames_recognizers = [call.kwargs["ad_hoc_recognizers"] for call in mock_analyze.call_args_list]
+    assert all(recognizers == frames_recognizers[0] for recognizers in frames_recognizers)
+    assert len(frames_recognizers[0]) == 2
+    assert frames_recognizers[0][0] is ad_hoc_recognizer
+    assert "John" in frames_recognizers[0][1].deny_list
+
+
+@pytest.mark.parametrize(
+    "ocr_kwargs, expected_ocr_kwargs",
+    [
+        (None, {"ocr_template": "US/ACME/Sono 5"}),
+        ({"ocr_threshold": 50}, {"ocr_threshold": 50, "ocr_template": "US/ACME/Sono 5"}),
+        ({"ocr_template": "custom"}, {"ocr_template": "custom"}),
+    ],
+)
+def test_get_redaction_bboxes_passes_ocr_template(
+    mocker,
+    get_dummy_nlp_engine,
+    ocr_kwargs: Optional[dict],
+    expected_ocr_kwargs: dict,
+):
+    """Test DicomImageRedactorEngine._get_redaction_bboxes passes the device as OCR template
+
+    Args:
+        get_dummy_nlp_engine (NlpEngine): Dummy NLP engine.
+        ocr_kwargs (dict): OCR parameters.
+        expected_ocr_kwargs (dict): Expected OCR parameters passed to the analyzer.
+    """
+    # Arrange
+    test_engine = DicomImageRedactorEngine(
+        image_analyzer_engine=ImageAnalyzerEngine(
+            analyzer_engine=AnalyzerEngine(nlp_engine=get_dummy_nlp_engine),
+            ocr_region_templates=OcrRegionTemplates(),
+        )
+    )
+    test_instance = get_multiframe_instance(number_of_frames=1)
+    test_instance.Modality, test_instance.Manufacturer = "US", "ACME"
+    test_instance.ManufacturerModelName = "Sono 5"
+    mock_analyze = mocker.patch.object(DicomImageRedactorEngine, "_get_analyzer_results", return_value=[])
+
+    # Act
+    test_engine._get_redaction_bboxes(test_instance, 25, False, ocr_kwargs, None)
+
+    # Assert
+    assert mock_analyze.call_args[0][3] == expected_ocr_kwargs
+
+
+def test_get_redaction_bboxes_unknown_device_passes_no_ocr_template(
+    mocker,
+    get_dummy_nlp_engine,
+):
+    """Test DicomImageRedactorEngine._get_redaction_bboxes OCRs unknown devices in full
+
+    Args:
+        get_dummy_nlp_engine (NlpEngine): Dummy NLP engine.
+    """
+    # Arrange
+    test_engine = DicomImageRedactorEngine(
+        image_analyzer_engine=ImageAnalyzerEngine(
+            analyzer_engine=AnalyzerEngine(nlp_engine=get_dummy_nlp_engine),
+            ocr_region_templates=OcrRegionTemplates(),
+        )
+    )
+    test_instance = get_multiframe_instance(number_of_frames=1)
+    mock_analyze = mocker.patch.object(DicomImageRedactorEngine, "_get_analyzer_results", return_value=[])
+
+    # Act
+    test_engine._get_redaction_bboxes(test_instance, 25, False, {"ocr_threshold": 50}, None)
+
+    # Assert
+    assert mock_analyze.call_args[0][3] == {"ocr_threshold": 50}
+
+
+@pytest.mark.parametrize(
+    "device",
+    [
+        {},
+        {"Modality": "US"},
+        {"Modality": "US", "Manufacturer": "ACME"},
+        {"Modality": "US", "Manufacturer": " ", "ManufacturerModelName": "Sono 5"},
+    ],
+)
+def test_get_ocr_template_missing_attributes(device: dict):
+    """Test DicomImageRedactorEngine._get_ocr_template with missing device attributes
+
+    Args:
+        device (dict): Device attributes of the instance.
+    """
+    # Arrange
+    test_instance = get_multiframe_instance(number_of_frames=1)
+    for keyword, value in device.items():
+        setattr(test_instance, keyword, value)
+
+    # Act
+    test_template = DicomImageRedactorEngine._get_ocr_template(test_instance)
+
+    # Assert
+    assert test_template is None
+
+
 # ------------------------------------------------------
 # DicomImageRedactorEngine._get_analyzer_results()
 # ------------------------------------------------------
@@ -1318,12 +1745,8 @@ def test_DicomImageRedactorEngine_redact_and_return_bbox(
         "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._rescale_dcm_pixel_array",
         return_value=None,
     )
-    mock_save_pixel_array = mocker.patch(
-        "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._save_pixel_array_as_png",
-        return_value=None,
-    )
-    mock_image_open = mocker.patch(
-        "presidio_image_redactor.dicom_image_redactor_engine.Image.open",
+    mock_convert_array = mocker.patch(
+        "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._convert_pixel_array_to_image",
         return_value=None,
     )
     mock_add_padding = mocker.patch(
@@ -1358,8 +1781,7 @@ def test_DicomImageRedactorEngine_redact_and_return_bbox(
     # assertions for test_bboxes type causes silent failures/hangups for Python 3.11
     mock_check_greyscale.assert_called_once()
     mock_rescale_dcm.assert_called_once()
-    mock_save_pixel_array.assert_called_once()
-    mock_image_open.assert_called_once()
+    mock_convert_array.assert_called_once()
     mock_add_padding.assert_called_once()
     mock_analyze.assert_called_once()
     mock_get_analyze_bbox.assert_called_once()
@@ -1367,6 +1789,36 @@ def test_DicomImageRedactorEngine_redact_and_return_bbox(
     mock_add_redact_box.assert_called_once()
 
 
+def test_DicomImageRedactorEngine_redact_and_return_bbox_shares_pixel_data(
+    mocker,
+    mock_engine: DicomImageRedactorEngine,
+):
+    """Test redact_and_return_bbox() analyzes a copy sharing the original pixel data
+
+    Args:
+        mock_engine (DicomImageRedactorEngine): DicomImageRedactorEngine object.
+    """
+    # Arrange
+    test_image = pydicom.dcmread(Path(TEST_DICOM_PARENT_DIR, "RGB_ORIGINAL.dcm"))
+    original_image = pydicom.dcmread(Path(TEST_DICOM_PARENT_DIR, "RGB_ORIGINAL.dcm"))
+    mock_get_analyzer_results = mocker.patch.object(
+        DicomImageRedactorEngine, "_get_analyzer_results", return_value=[]
+    )
+    mock_add_redact_box = mocker.patch.object(
+        DicomImageRedactorEngine, "_add_redact_box", return_value=test_image
+    )
+
+    # Act
+    mock_engine.redact_and_return_bbox(test_image, use_metadata=True)
+
+    # Assert
+    analyzed_instance = mock_get_analyzer_results.call_args[0][1]
+    assert analyzed_instance is not test_image
+    assert analyzed_instance.PixelData is test_image.PixelData
+    assert mock_add_redact_box.call_args[0][0] is analyzed_instance
+    assert test_image == original_image
+
+
 @pytest.mark.parametrize(
     "image, load_file, expected_error_type",
     [
@@ -1531,13 +1983,9 @@ def test_DicomImageRedactorEngine_redact_single_dicom_image_happy_path(
         "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._copy_files_for_processing",
         return_value=dcm_path,
     )
-    mock_convert_dcm_to_png = mocker.patch(
-        "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._convert_dcm_to_png",
-        return_value=[None, None],
-    )
-    mock_image_open = mocker.patch(
-        "presidio_image_redactor.dicom_image_redactor_engine.Image.open",
-        return_value=None,
+    mock_iter_frame_images = mocker.patch(
+        "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._iter_frame_images",
+        return_value=[(None, None)],
     )
     mock_add_padding = mocker.patch(
         "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._add_padding",
@@ -1585,8 +2033,7 @@ def test_DicomImageRedactorEngine_redact_single_dicom_image_happy_path(
         assert mock_copy_files.call_count == 0
     else:
         assert mock_copy_files.call_count == 1
-    assert mock_convert_dcm_to_png.call_count == 1
-    assert mock_image_open.call_count == 1
+    assert mock_iter_frame_images.call_count == 1
     assert mock_add_padding.call_count == 1
     assert mock_analyze.call_count == 1
     assert mock_get_analyze_bbox.call_count == 1
@@ -1735,6 +2182,280 @@ def test_DicomImageRedactorEngine_redact_multiple_dicom_images_exceptions(
     assert expected_error_type == exc_info.typename
 
 
+def test_DicomImageRedactorEngine_redact_multiple_dicom_images_failures_are_isolated(
+    mocker,
+    mock_engine: DicomImageRedactorEngine,
+    tmp_path: Path,
+):
+    """Test a failing file doesn't stop DicomImageRedactorEngine _redact_multiple_dicom_images()
+
+    Args:
+        mock_engine (DicomImageRedactorEngine): DicomImageRedactorEngine object.
+        tmp_path (pathlib.Path): Temporary directory.
+    """
+    # Arrange
+    mock_dcm_files = [
+        Path(tmp_path, "file1.dcm"),
+        Path(tmp_path, "dir1/file2.dcm"),
+        Path(tmp_path, "dir1/file3.dcm"),
+    ]
+    mocker.patch(
+        "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._get_all_dcm_files",
+        return_value=mock_dcm_files,
+    )
+    mock_redact_single = mocker.patch(
+        "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._redact_single_dicom_image",
+        side_effect=[mock_dcm_files[0], AttributeError("No pixel data"), mock_dcm_files[2]],
+    )
+    manifest_path = Path(tmp_path, "manifest.jsonl")
+    progress = []
+
+    # Act
+    _, test_manifest = mock_engine._redact_multiple_dicom_images(
+        dcm_dir=tmp_path,
+        crop_ratio=0.75,
+        fill="contrast",
+        padding_width=25,
+        use_metadata=True,
+        overwrite=True,
+        dst_parent_dir=".",
+        save_bboxes=False,
+        progress_callback=lambda processed, total, entry: progress.append(
+            (processed, total, entry["file"])
+        ),
+        manifest_path=manifest_path,
+    )
+
+    # Assert
+    assert mock_redact_single.call_count == len(mock_dcm_files)
+    assert [(entry["file"], entry["status"]) for entry in test_manifest] == [
+        ("file1.dcm", "redacted"),
+        ("dir1/file2.dcm", "failed"),
+        ("dir1/file3.dcm", "redacted"),
+    ]
+    assert "No pixel data" in test_manifest[1]["error"]
+    assert test_manifest[2]["output"] == str(mock_dcm_files[2])
+    assert progress == [
+        (1, 3, "file1.dcm"),
+        (2, 3, "dir1/file2.dcm"),
+        (3, 3, "dir1/file3.dcm"),
+    ]
+    with open(manifest_path) as f:
+        assert [json.loads(line) for line in f] == test_manifest
+
+
+def test_DicomImageRedactorEngine_redact_multiple_dicom_images_resume_skips_redacted_files(
+    mocker,
+    mock_engine: DicomImageRedactorEngine,
+    tmp_path: Path,
+):
+    """Test resuming DicomImageRedactorEngine _redact_multiple_dicom_images()
+
+    Args:
+        mock_engine (DicomImageRedactorEngine): DicomImageRedactorEngine object.
+        tmp_path (pathlib.Path): Temporary directory.
+    """
+    # Arrange
+    mock_dcm_files = [
+        Path(tmp_path, "file1.dcm"),
+        Path(tmp_path, "file2.dcm"),
+        Path(tmp_path, "file3.dcm"),
+    ]
+    mocker.patch(
+        "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._get_all_dcm_files",
+        return_value=mock_dcm_files,
+    )
+    mock_redact_single = mocker.patch(
+        "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._redact_single_dicom_image",
+        side_effect=lambda dcm_path, **kwargs: dcm_path,
+    )
+    manifest_path = Path(tmp_path, "manifest.jsonl")
+    with open(manifest_path, "w") as f:
+        f.write(json.dumps({"file": "file1.dcm", "output": "out", "status": "redacted", "error": None}) + "\n")
+        f.write(json.dumps({"file": "file2.dcm", "output": None, "status": "failed", "error": "Error()"}) + "\n")
+        # Partially written entry of an interrupted run
+        f.write('{"file": "file3.dcm", "out')
+
+    # Act
+    _, test_manifest = mock_engine._redact_multiple_dicom_images(
+        dcm_dir=tmp_path,
+        crop_ratio=0.75,
+        fill="contrast",
+        padding_width=25,
+        use_metadata=True,
+        overwrite=True,
+        dst_parent_dir=".",
+        save_bboxes=False,
+        manifest_path=manifest_path,
+        resume=True,
+    )
+
+    # Assert
+    assert [call.args[0] for call in mock_redact_single.call_args_list] == mock_dcm_files[1:]
+    assert [(entry["file"], entry["status"]) for entry in test_manifest] == [
+        ("file1.dcm", "skipped"),
+        ("file2.dcm", "redacted"),
+        ("file3.dcm", "redacted"),
+    ]
+    with open(manifest_path) as f:
+        assert [json.loads(line) for line in f] == test_manifest
+
+
+class MockWorkerEngine:
+    """Engine of the worker processes, redacting files named 'fail*' with an error"""
+
+    def _redact_single_dicom_image(self, dcm_path: Path, **kwargs) -> Path:
+        if dcm_path.name.startswith("fail"):
+            raise ValueError(f"Cannot redact {dcm_path.name}")
+        return dcm_path
+
+
+def test_DicomImageRedactorEngine_redact_multiple_dicom_images_in_worker_processes(
+    mocker,
+    mock_engine: DicomImageRedactorEngine,
+    tmp_path: Path,
+):
+    """Test DicomImageRedactorEngine _redact_multiple_dicom_images() with max_workers
+
+    Args:
+        mock_engine (DicomImageRedactorEngine): DicomImageRedactorEngine object.
+        tmp_path (pathlib.Path): Temporary directory.
+    """
+    # Arrange
+    mock_dcm_files = [
+        Path(tmp_path, f"{'fail' if i % 3 == 0 else 'file'}{i}.dcm") for i in range(10)
+    ]
+    mocker.patch(
+        "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._get_all_dcm_files",
+        return_value=mock_dcm_files,
+    )
+    progress = []
+
+    # Act
+    _, test_manifest = mock_engine._redact_multiple_dicom_images(
+        dcm_dir=tmp_path,
+        crop_ratio=0.75,
+        fill="contrast",
+        padding_width=25,
+        use_metadata=True,
+        overwrite=True,
+        dst_parent_dir=".",
+        save_bboxes=False,
+        max_workers=2,
+        engine_factory=MockWorkerEngine,
+        progress_callback=lambda processed, total, entry: progress.append(processed),
+    )
+
+    # Assert
+    assert [entry["file"] for entry in test_manifest] == [path.name for path in mock_dcm_files]
+    assert [entry["status"] for entry in test_manifest] == [
+        "failed" if path.name.startswith("fail") else "redacted" for path in mock_dcm_files
+    ]
+    assert progress == list(range(1, len(mock_dcm_files) + 1))
+
+
+class ConfiguredWorkerEngine(DicomImageRedactorEngine):
+    """Engine sent to the worker processes, adding its configured suffix to paths"""
+
+    def __init__(self, suffix: str):
+        self.suffix = suffix
+
+    def _redact_single_dicom_image(self, dcm_path: Path, **kwargs) -> Path:
+        return Path(f"{dcm_path}{self.suffix}")
+
+
+def test_redact_dicom_files_sends_configured_engine_to_worker_processes(
+    caplog,
+    tmp_path: Path,
+):
+    """Test DicomImageRedactorEngine _redact_dicom_files() without engine_factory
+
+    Args:
+        tmp_path (pathlib.Path): Temporary directory.
+    """
+    # Arrange
+    dcm_files = [(i, Path(tmp_path, f"file{i}.dcm")) for i in range(4)]
+
+    # Act
+    test_results = list(
+        ConfiguredWorkerEngine(".configured")._redact_dicom_files(dcm_files, 2, None, {})
+    )
+
+    # Assert
+    assert sorted(
+        (index, entry["output"]) for index, entry in test_results
+    ) == [(index, f"{path}.configured") for index, path in dcm_files]
+    assert "engine_factory" in caplog.text
+
+
+def test_get_worker_engine_factory_default_configuration_creates_engine(mocker):
+    """Test DicomImageRedactorEngine _get_worker_engine_factory() of a default engine"""
+    # Arrange
+    mocker.patch("presidio_image_redactor.image_redactor_engine.ImageAnalyzerEngine")
+    mock_dumps = mocker.patch(
+        "presidio_image_redactor.dicom_image_redactor_engine.pickle.dumps"
+    )
+    engine = DicomImageRedactorEngine()
+
+    # Act
+    test_factory = engine._get_worker_engine_factory()
+
+    # Assert
+    assert test_factory is DicomImageRedactorEngine
+    mock_dumps.assert_not_called()
+
+
+def test_redact_dicom_files_unpicklable_engine_raises_error(tmp_path: Path):
+    """Test DicomImageRedactorEngine _redact_dicom_files() with an unpicklable engine
+
+    Args:
+        tmp_path (pathlib.Path): Temporary directory.
+    """
+    # Arrange
+    engine = ConfiguredWorkerEngine(".configured")
+    engine.callback = lambda: None
+    dcm_files = [(0, Path(tmp_path, "file0.dcm"))]
+
+    # Act
+    with pytest.raises(ValueError, match="engine_factory"):
+        list(engine._redact_dicom_files(dcm_files, 2, None, {}))
+
+
+# ------------------------------------------------------
+# DicomImageRedactorEngine _copy_files_for_resuming()
+# ------------------------------------------------------
+def test_copy_files_for_resuming_keeps_redacted_files(
+    mock_engine: DicomImageRedactorEngine,
+    tmp_path: Path,
+):
+    """Test happy path for DicomImageRedactorEngine._copy_files_for_resuming
+
+    Args:
+        mock_engine (DicomImageRedactorEngine): DicomImageRedactorEngine object.
+        tmp_path (pathlib.Path): Temporary directory.
+    """
+    # Arrange
+    src_dir = Path(tmp_path, "src")
+    Path(src_dir, "subdir").mkdir(parents=True)
+    for name in ["file1.dcm", "subdir/file2.dcm", "subdir/file3.dcm"]:
+        Path(src_dir, name).write_text("original")
+    dst_dir = Path(tmp_path, "dst")
+    Path(dst_dir, "subdir").mkdir(parents=True)
+    for name in ["file1.dcm", "subdir/file2.dcm"]:
+        Path(dst_dir, name).write_text("redacted")
+    with open(Path(dst_dir, DicomImageRedactorEngine.MANIFEST_FILE_NAME), "w") as f:
+        f.write(json.dumps({"file": "subdir/file2.dcm", "output": None, "status": "redacted", "error": None}) + "\n")
+
+    # Act
+    test_dst_dir = mock_engine._copy_files_for_resuming(str(src_dir), dst_dir)
+
+    # Assert
+    assert test_dst_dir == dst_dir
+    assert Path(dst_dir, "file1.dcm").read_text() == "original"
+    assert Path(dst_dir, "subdir/file2.dcm").read_text() == "redacted"
+    assert Path(dst_dir, "subdir/file3.dcm").read_text() == "original"
+
+
 # ------------------------------------------------------
 # DicomImageRedactorEngine redact_from_file()
 # ------------------------------------------------------
@@ -1863,7 +2584,7 @@ def test_DicomImageRedactorEngine_redact_from_directory_happy_path(
     )
     mock_redact_multiple = mocker.patch(
         "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._redact_multiple_dicom_images",
-        return_value=None,
+        return_value=(mock_dst_path, []),
     )
 
     # Act
@@ -1874,6 +2595,46 @@ def test_DicomImageRedactorEngine_redact_from_directory_happy_path(
     assert mock_redact_multiple.call_count == 1
 
 
+def test_DicomImageRedactorEngine_redact_from_directory_resume_copies_only_missing_files(
+    mocker,
+    mock_engine: DicomImageRedactorEngine,
+    tmp_path: Path,
+):
+    """Test resuming DicomImageRedactorEngine redact_from_directory() on a previous output
+
+    Args:
+        mock_engine (DicomImageRedactorEngine): DicomImageRedactorEngine object.
+        tmp_path (pathlib.Path): Temporary directory.
+    """
+    # Arrange
+    mock_copy_files = mocker.patch(
+        "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._copy_files_for_processing",
+        return_value=None,
+    )
+    mock_copy_files_for_resuming = mocker.patch(
+        "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._copy_files_for_resuming",
+        return_value=Path(tmp_path, "dicom_dir_1"),
+    )
+    manifest = [{"file": "0.dcm", "output": None, "status": "failed", "error": "Error()"}]
+    mock_redact_multiple = mocker.patch(
+        "presidio_image_redactor.dicom_image_redactor_engine.DicomImageRedactorEngine._redact_multiple_dicom_images",
+        return_value=(Path(tmp_path, "dicom_dir_1"), manifest),
+    )
+    Path(tmp_path, "dicom_dir_1").mkdir()
+
+    # Act
+    test_manifest = mock_engine.redact_from_directory(TEST_DICOM_DIR_1, tmp_path, resume=True)
+
+    # Assert
+    assert mock_copy_files.call_count == 0
+    assert mock_copy_files_for_resuming.call_count == 1
+    assert mock_redact_multiple.call_args.kwargs["resume"] is True
+    assert mock_redact_multiple.call_args.kwargs["manifest_path"] == Path(
+        tmp_path, "dicom_dir_1", DicomImageRedactorEngine.MANIFEST_FILE_NAME
+    )
+    assert test_manifest == manifest
+
+
 @pytest.mark.parametrize(
     "input_path, output_path, expected_error_type",
     [
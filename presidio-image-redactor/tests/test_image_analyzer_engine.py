@@ -2,7 +2,7 @@ import pytest
 from presidio_analyzer import RecognizerResult, AnalyzerEngine, PatternRecognizer, Pattern
 from presidio_analyzer.recognizer_registry import RecognizerRegistry
 
-from presidio_image_redactor import ImageAnalyzerEngine
+from presidio_image_redactor import OCR, ImageAnalyzerEngine, OcrRegionTemplates, OcrResultCache
 from presidio_image_redactor.entities import ImageRecognizerResult
 
 import PIL
@@ -375,3 +375,89 @@ def test_use_other_language_in_analyze(get_dummy_nlp_engine, get_mock_png):
     )
     # There aren't the dummy pattern in the image, so the redacted should be empty
     assert len(redacted) == 0
+
+
+class PixelValueOCR(OCR):
+    """OCR reading one word per pixel value, boxed by the pixels of that value"""
+
+    WORDS = {100: "Patient", 150: "John", 200: "Smith"}
+
+    def __init__(self):
+        self.image_sizes = []
+        self.kwargs = []
+
+    def perform_ocr(self, image: object, **kwargs) -> dict:
+        self.image_sizes.append(image.size)
+        self.kwargs.append(kwargs)
+        pixels = np.asarray(image)
+        ocr_result = {"left": [], "top": [], "width": [], "height": [], "conf": [], "text": []}
+        for value, word in self.WORDS.items():
+            rows, columns = np.nonzero(pixels == value)
+            if len(rows):
+                ocr_result["left"].append(int(columns.min()))
+                ocr_result["top"].append(int(rows.min()))
+                ocr_result["width"].append(int(columns.max() - columns.min() + 1))
+                ocr_result["height"].append(int(rows.max() - rows.min() + 1))
+                ocr_result["conf"].append(95)
+                ocr_result["text"].append(word)
+        return ocr_result
+
+
+def get_overlay_image(name_top: int = 30) -> PIL.Image.Image:
+    pixels = np.zeros((200, 300), dtype=np.uint8)
+    pixels[10:20, 10:60] = 100
+    pixels[name_top : name_top + 10, 10:40] = 150
+    pixels[name_top : name_top + 10, 50:90] = 200
+    return PIL.Image.fromarray(pixels)
+
+
+@pytest.fixture(scope="function")
+def get_deny_list_analyzer_engine(get_dummy_nlp_engine):
+    recognizer = PatternRecognizer("PERSON", deny_list=["John", "Smith"])
+    registry = RecognizerRegistry(recognizers=[recognizer])
+    return AnalyzerEngine(nlp_engine=get_dummy_nlp_engine, registry=registry)
+
+
+def test_given_ocr_cache_then_identical_images_ocr_once(get_deny_list_analyzer_engine):
+    ocr = PixelValueOCR()
+    engine = ImageAnalyzerEngine(
+        analyzer_engine=get_deny_list_analyzer_engine, ocr=ocr, ocr_cache=OcrResultCache()
+    )
+
+    first_results = engine.analyze(get_overlay_image())
+    second_results = engine.analyze(get_overlay_image())
+    engine.analyze(get_overlay_image(name_top=50))
+
+    assert len(ocr.image_sizes) == 2
+    assert first_results == second_results
+    assert [(result.left, result.top) for result in first_results] == [(10, 30), (50, 30)]
+    assert engine.ocr_cache.get_stats()["hits"] == 1
+
+
+def test_given_ocr_region_templates_then_only_learned_regions_ocr(get_deny_list_analyzer_engine):
+    ocr = PixelValueOCR()
+    engine = ImageAnalyzerEngine(
+        analyzer_engine=get_deny_list_analyzer_engine,
+        ocr=ocr,
+        ocr_region_templates=OcrRegionTemplates(learning_samples=1, margin=2),
+    )
+
+    learned_results = engine.analyze(get_overlay_image(), ocr_kwargs={"ocr_template": "US/ACME"})
+    template_results = engine.analyze(get_overlay_image(), ocr_kwargs={"ocr_template": "US/ACME"})
+    engine.analyze(get_overlay_image(), ocr_kwargs={"ocr_template": "CT/ACME"})
+
+    assert ocr.image_sizes == [(300, 200), (54, 14), (34, 14), (44, 14), (300, 200)]
+    assert [result.to_dict() for result in template_results] == [result.to_dict() for result in learned_results]
+    assert len(template_results) == 2
+
+
+def test_given_ocr_template_without_region_templates_then_template_ignored(get_deny_list_analyzer_engine):
+    ocr = PixelValueOCR()
+    engine = ImageAnalyzerEngine(analyzer_engine=get_deny_list_analyzer_engine, ocr=ocr)
+
+    ocr_kwargs = {"ocr_template": "US/ACME"}
+    results = engine.analyze(get_overlay_image(), ocr_kwargs=ocr_kwargs)
+
+    assert len(results) == 2
+    assert ocr.kwargs == [{}]
+    assert ocr_kwargs == {"ocr_template": "US/ACME"}
@@ -0,0 +1,93 @@
+import pickle
+
+import pytest
+
+from presidio_image_redactor import OcrRegionTemplates
+
+
+def get_ocr_result(words):
+    return {
+        "left": [word[0] for word in words],
+        "top": [word[1] for word in words],
+        "width": [word[2] for word in words],
+        "height": [word[3] for word in words],
+        "text": [word[4] for word in words],
+    }
+
+
+def test_given_template_learned_then_regions_returned():
+    templates = OcrRegionTemplates(learning_samples=2, margin=5)
+    ocr_result = get_ocr_result([(10, 10, 40, 10, "John"), (200, 300, 40, 10, "MRN")])
+
+    templates.learn("US/ACME", (640, 480), ocr_result)
+    assert templates.get_regions("US/ACME", (640, 480)) is None
+
+    templates.learn("US/ACME", (640, 480), ocr_result)
+    assert templates.get_regions("US/ACME", (640, 480)) == [
+        {"left": 5, "top": 5, "width": 50, "height": 20},
+        {"left": 195, "top": 295, "width": 50, "height": 20},
+    ]
+    assert templates.get_regions("US/ACME", (800, 600)) is None
+    assert templates.get_regions("CT/ACME", (640, 480)) is None
+
+
+def test_given_overlapping_words_then_regions_merged():
+    templates = OcrRegionTemplates(learning_samples=2, margin=2)
+
+    templates.learn(
+        "US/ACME",
+        (100, 100),
+        get_ocr_result([(0, 0, 20, 10, "John"), (24, 0, 20, 10, "Smith"), (0, 90, 30, 10, " ")]),
+    )
+    templates.learn("US/ACME", (100, 100), get_ocr_result([(40, 8, 20, 10, "1990"), (0, 50, 10, 10, "")]))
+
+    assert templates.get_regions("US/ACME", (100, 100)) == [{"left": 0, "top": 0, "width": 62, "height": 20}]
+
+
+def test_given_saved_templates_then_loaded_templates_equal(tmp_path):
+    templates = OcrRegionTemplates(learning_samples=1)
+    templates.learn("US/ACME", (640, 480), get_ocr_result([(10, 10, 40, 10, "John")]))
+    templates.save(tmp_path / "templates.json")
+
+    loaded_templates = OcrRegionTemplates(learning_samples=1)
+    loaded_templates.load(tmp_path / "templates.json")
+
+    assert loaded_templates.get_regions("US/ACME", (640, 480)) == templates.get_regions("US/ACME", (640, 480))
+
+
+def test_given_refresh_interval_then_learned_template_periodically_relearned():
+    templates = OcrRegionTemplates(learning_samples=1, margin=0, refresh_interval=3)
+    templates.learn("US/ACME", (640, 480), get_ocr_result([(10, 10, 40, 10, "John")]))
+
+    regions = [templates.get_regions("US/ACME", (640, 480)) for _ in range(6)]
+    assert [region is None for region in regions] == [False, False, True] * 2
+
+    templates.learn("US/ACME", (640, 480), get_ocr_result([(200, 300, 40, 10, "MRN")]))
+    assert templates.get_regions("US/ACME", (640, 480)) == [
+        {"left": 10, "top": 10, "width": 40, "height": 10},
+        {"left": 200, "top": 300, "width": 40, "height": 10},
+    ]
+
+
+def test_given_no_refresh_interval_then_learned_template_never_relearned():
+    templates = OcrRegionTemplates(learning_samples=1, refresh_interval=None)
+    templates.learn("US/ACME", (640, 480), get_ocr_result([(10, 10, 40, 10, "John")]))
+
+    assert all(templates.get_regions("US/ACME", (640, 480)) is not None for _ in range(200))
+
+
+def test_given_pickled_templates_then_unpickled_templates_equal():
+    templates = OcrRegionTemplates(learning_samples=1)
+    templates.learn("US/ACME", (640, 480), get_ocr_result([(10, 10, 40, 10, "John")]))
+
+    unpickled_templates = pickle.loads(pickle.dumps(templates))
+
+    assert unpickled_templates.get_regions("US/ACME", (640, 480)) == templates.get_regions("US/ACME", (640, 480))
+
+
+@pytest.mark.parametrize(
+    "learning_samples, margin, refresh_interval", [(0, 10, None), (1, -1, None), (1, 10, 0)]
+)
+def test_given_invalid_params_then_error(learning_samples, margin, refresh_interval):
+    with pytest.raises(ValueError):
+        OcrRegionTemplates(learning_samples=learning_samples, margin=margin, refresh_interval=refresh_interval)
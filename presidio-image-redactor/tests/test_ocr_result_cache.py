@@ -0,0 +1,117 @@
+import json
+import pickle
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from presidio_image_redactor import OcrResultCache
+
+OCR_RESULT = {
+    "left": [10, 50],
+    "top": [5, 5],
+    "width": [30, 40],
+    "height": [12, 12],
+    "conf": [96.5, 91.0],
+    "text": ["John", "Smith"],
+}
+
+
+def test_given_same_image_content_then_keys_are_equal():
+    image = Image.new("L", (20, 10), 0)
+
+    key = OcrResultCache.get_key(image, "TesseractOCR", lang="eng")
+
+    assert key == OcrResultCache.get_key(image.copy(), "TesseractOCR", lang="eng")
+    assert key == OcrResultCache.get_key(image.convert("L"), "TesseractOCR", lang="eng")
+
+
+@pytest.mark.parametrize(
+    "other_image, other_ocr_name, other_kwargs",
+    [
+        (Image.new("L", (20, 10), 1), "TesseractOCR", {"lang": "eng"}),
+        (Image.new("L", (10, 20), 0), "TesseractOCR", {"lang": "eng"}),
+        (Image.new("RGB", (20, 10), 0), "TesseractOCR", {"lang": "eng"}),
+        (Image.new("L", (20, 10), 0), "DocumentIntelligenceOCR", {"lang": "eng"}),
+        (Image.new("L", (20, 10), 0), "TesseractOCR", {"lang": "deu"}),
+        (Image.new("L", (20, 10), 0), "TesseractOCR", {}),
+    ],
+)
+def test_given_different_image_or_params_then_keys_are_different(
+    other_image, other_ocr_name, other_kwargs
+):
+    key = OcrResultCache.get_key(Image.new("L", (20, 10), 0), "TesseractOCR", lang="eng")
+
+    assert key != OcrResultCache.get_key(other_image, other_ocr_name, **other_kwargs)
+
+
+def test_given_numpy_array_or_file_then_key_is_content_hash(tmp_path):
+    array = np.zeros((10, 20), dtype=np.uint8)
+    path = tmp_path / "image.png"
+    Image.fromarray(array).save(path)
+
+    assert OcrResultCache.get_key(array) == OcrResultCache.get_key(array.copy())
+    assert OcrResultCache.get_key(array) != OcrResultCache.get_key(array.astype(np.uint16))
+    assert OcrResultCache.get_key(str(path)) == OcrResultCache.get_key(path)
+    assert OcrResultCache.get_key(object()) is None
+
+
+def test_given_cached_result_then_copy_returned_and_hits_counted():
+    cache = OcrResultCache()
+    assert cache.get("key") is None
+
+    cache.set("key", OCR_RESULT)
+    cached_result = cache.get("key")
+    cached_result["text"].append("modified")
+
+    assert cache.get("key") == OCR_RESULT
+    assert cache.get_stats() == {"hits": 2, "misses": 1, "size": 1}
+
+
+def test_given_full_cache_then_least_recently_used_evicted():
+    cache = OcrResultCache(max_size=2)
+    cache.set("first", OCR_RESULT)
+    cache.set("second", OCR_RESULT)
+    cache.get("first")
+    cache.set("third", OCR_RESULT)
+
+    assert cache.get("second") is None
+    assert cache.get("first") is not None
+    assert cache.get("third") is not None
+
+
+def test_given_cache_dir_then_results_shared_between_caches(tmp_path):
+    OcrResultCache(cache_dir=tmp_path).set("abcdef", OCR_RESULT)
+
+    cache = OcrResultCache(cache_dir=tmp_path)
+
+    assert cache.get("abcdef") == OCR_RESULT
+    assert cache.get_stats() == {"hits": 1, "misses": 0, "size": 1}
+    assert json.loads((tmp_path / "ab" / "abcdef.json").read_text()) == OCR_RESULT
+
+
+def test_given_corrupt_cache_file_then_miss(tmp_path):
+    (tmp_path / "ab").mkdir()
+    (tmp_path / "ab" / "abcdef.json").write_text('{"text": [')
+
+    assert OcrResultCache(cache_dir=tmp_path).get("abcdef") is None
+
+
+def test_given_numpy_values_then_result_written_to_cache_dir(tmp_path):
+    OcrResultCache(cache_dir=tmp_path).set("abcdef", {"left": [np.int64(3)], "text": ["a"]})
+
+    assert OcrResultCache(cache_dir=tmp_path).get("abcdef") == {"left": [3], "text": ["a"]}
+
+
+def test_given_pickled_cache_then_entries_kept():
+    cache = OcrResultCache()
+    cache.set("key", OCR_RESULT)
+
+    unpickled_cache = pickle.loads(pickle.dumps(cache))
+
+    assert unpickled_cache.get("key") == OCR_RESULT
+
+
+def test_given_invalid_max_size_then_error():
+    with pytest.raises(ValueError):
+        OcrResultCache(max_size=0)